@@ -39,6 +39,8 @@ __all__ = [
     "ValidationError",
     "config",
     "convert",
+    "clear_caches",
+    "docstring_cache_info",
     "default_name_transform",
     "edit",
     "env_var_split",
@@ -75,7 +77,7 @@ from cyclopts.panel import CycloptsPanel
 from cyclopts.parameter import Parameter
 from cyclopts.protocols import Dispatcher
 from cyclopts.token import Token
-from cyclopts.utils import UNSET, default_name_transform
+from cyclopts.utils import UNSET, clear_caches, default_name_transform, docstring_cache_info
 
 # Lazy imports for opt-in features (saves ~6ms on import)
 # These modules are only loaded when explicitly accessed by user code
@@ -33,6 +33,8 @@ from cyclopts.parameter import Parameter as Parameter
 from cyclopts.protocols import Dispatcher as Dispatcher
 from cyclopts.token import Token as Token
 from cyclopts.utils import UNSET as UNSET
+from cyclopts.utils import clear_caches as clear_caches
 from cyclopts.utils import default_name_transform as default_name_transform
+from cyclopts.utils import docstring_cache_info as docstring_cache_info
 
 __version__: str
@@ -0,0 +1,77 @@
+"""Location of, and atomic writes into, Cyclopts' on-disk caches."""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import IO, Any
+
+RACY_NS = 2_000_000_000
+"""Files and directories modified this recently (nanoseconds) may still change without changing their mtime.
+
+Their contents are not cached (similar to git's "racy" index entries).
+"""
+
+
+def cache_root() -> Path:
+    """``$XDG_CACHE_HOME/cyclopts`` (default ``~/.cache/cyclopts``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "cyclopts"
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = "w", *, file_mode: int = 0o666) -> Iterator[IO[Any]]:
+    """Stream into a temporary file next to ``path``; replace ``path`` with it once the block completes.
+
+    Readers never see a partial file. If the block (or writing) raises, the temporary file is
+    removed, ``path`` is left untouched, and the exception is propagated.
+
+    Parameters
+    ----------
+    path: Path
+        File to write. Its directory must exist.
+    mode: str
+        ``"w"`` for UTF-8 text, ``"wb"`` for bytes.
+    file_mode: int
+        Permissions of ``path`` (further restricted by the umask).
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, file_mode)
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        tmp.replace(path)
+    except BaseException:
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write(path: Path, data: str | bytes, *, mode: int = 0o777, file_mode: int = 0o666) -> bool:
+    """Replace ``path`` with ``data`` via :func:`atomic_open`, creating its directory if needed.
+
+    Failures are silently ignored.
+
+    Parameters
+    ----------
+    path: Path
+        File to write.
+    data: str | bytes
+        Content; strings are UTF-8 encoded.
+    mode: int
+        Permissions of ``path``'s directory, if it has to be created.
+    file_mode: int
+        Permissions of ``path`` (further restricted by the umask).
+
+    Returns
+    -------
+    bool
+        Whether ``path`` was written.
+    """
+    try:
+        path.parent.mkdir(mode=mode, parents=True, exist_ok=True)
+        with atomic_open(path, "wb", file_mode=file_mode) as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+    except OSError:
+        return False
+    return True
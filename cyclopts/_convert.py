@@ -293,49 +293,6 @@ _converters: dict[Any, Callable] = {
 }
 
 
-def _convert_tuple(
-    type_: type[Any],
-    *tokens: "Token",
-    converter: Callable[[type, str], Any] | None,
-    name_transform: Callable[[str], str],
-) -> tuple:
-    convert = partial(_convert, converter=converter, name_transform=name_transform)
-    inner_types = tuple(x for x in get_args(type_) if x is not ...)
-    inner_token_count, consume_all = token_count(type_)
-    # Elements like boolean-flags will have an inner_token_count of 0.
-    inner_token_count = max(inner_token_count, 1)
-    if consume_all:
-        # variable-length tuple (list-like)
-        remainder = len(tokens) % inner_token_count
-        if remainder:
-            raise CoercionError(
-                msg=f"Incorrect number of arguments: expected multiple of {inner_token_count} but got {len(tokens)}."
-            )
-        if len(inner_types) == 1:
-            inner_type = inner_types[0]
-        elif len(inner_types) == 0:
-            inner_type = str
-        else:
-            raise ValueError("A tuple must have 0 or 1 inner-types.")
-
-        return tuple(
-            convert(inner_type, chunk[0] if inner_token_count == 1 else chunk)
-            for chunk in grouper(tokens, inner_token_count)
-        )
-    else:
-        # Fixed-length tuple
-        if inner_token_count != len(tokens):
-            raise CoercionError(
-                msg=f"Incorrect number of arguments: expected {inner_token_count} but got {len(tokens)}."
-            )
-        args_per_convert = [token_count(x)[0] for x in inner_types]
-        it = iter(tokens)
-        batched = [[next(it) for _ in range(size)] for size in args_per_convert]
-        batched = [elem[0] if len(elem) == 1 else elem for elem in batched]
-        out = tuple(convert(inner_type, arg) for inner_type, arg in zip(inner_types, batched, strict=False))
-    return out
-
-
 def _validate_json_extra_keys(
     data: dict,
     type_: type,
@@ -602,200 +559,7 @@ def _convert(
     converter: Callable
     name_transform: Callable
     """
-    from cyclopts.argument import Token
-    from cyclopts.parameter import Parameter
-
-    converter_needs_token = False
-    if is_annotated(type_):
-        from cyclopts.parameter import Parameter
-
-        type_, cparam = Parameter.from_annotation(type_)
-        if cparam.converter:
-            converter_needs_token = True
-
-            def converter_with_token(t_, value):
-                assert cparam.converter
-
-                # Resolve string converters to methods on the type
-                resolved_converter = cparam.converter
-                if isinstance(resolved_converter, str):
-                    resolved_converter = getattr(t_, resolved_converter)
-
-                # Detect bound methods (classmethods/instance methods)
-                # Bound methods already have their first parameter bound
-                if inspect.ismethod(resolved_converter):
-                    # Call with just tokens - cls/self already bound
-                    return resolved_converter((value,))
-                else:
-                    # Regular function - pass type and tokens
-                    return resolved_converter(t_, (value,))
-
-            converter = converter_with_token
-
-        if cparam.name_transform:
-            name_transform = cparam.name_transform
-    else:
-        cparam = None
-
-    convert = partial(_convert, converter=converter, name_transform=name_transform)
-    convert_tuple = partial(_convert_tuple, converter=converter, name_transform=name_transform)
-
-    origin_type = get_origin(type_)
-    # Normalize abstract origin types to concrete types early
-    # (e.g., collections.abc.Set -> set) so we only check ITERABLE_TYPES later
-    if origin_type in _abstract_to_concrete_type_mapping:
-        origin_type = _abstract_to_concrete_type_mapping[origin_type]
-    # Inner types **may** be ``Annotated``
-    inner_types = get_args(type_)
-
-    if type_ is dict:
-        out = convert(dict[str, str], token)
-    elif type_ in _implicit_iterable_type_mapping:
-        out = convert(_implicit_iterable_type_mapping[type_], token)
-    elif type_ in _abstract_to_concrete_type_mapping:
-        # Bare abstract type (e.g., collections.abc.Set with no [T])
-        # Convert to default parameterized concrete type
-        concrete_type = _abstract_to_concrete_type_mapping[type_]
-        default_param = _implicit_iterable_type_mapping.get(concrete_type, concrete_type)
-        out = convert(default_param, token)
-    elif TypeAliasType is not None and isinstance(type_, TypeAliasType):
-        out = convert(type_.__value__, token)
-    elif is_union(origin_type):
-        for t in inner_types:
-            if is_nonetype(t):
-                continue
-            try:
-                out = convert(t, token)
-                break
-            except Exception:
-                pass
-        else:
-            if isinstance(token, Sequence):
-                raise ValueError  # noqa: TRY004
-            raise CoercionError(token=token, target_type=type_)
-    elif origin_type is Literal:
-        # Try coercing the token into each allowed Literal value (left-to-right).
-        last_coercion_error = None
-        for choice in get_args(type_):
-            try:
-                res = convert(type(choice), token)
-            except CoercionError as e:
-                last_coercion_error = e
-                continue
-            if res == choice:
-                out = res
-                break
-        else:
-            if last_coercion_error:
-                last_coercion_error.target_type = type_
-                raise last_coercion_error
-            else:
-                raise CoercionError(token=token[0] if isinstance(token, Sequence) else token, target_type=type_)
-    elif origin_type is tuple:
-        if isinstance(token, Token):
-            # E.g. Tuple[str] (Annotation: tuple containing a single string)
-            out = convert_tuple(type_, token, converter=converter)
-        else:
-            out = convert_tuple(type_, *token, converter=converter)
-    elif origin_type in ITERABLE_TYPES:
-        # NOT including tuple; handled in ``origin_type is tuple`` body above.
-        # Note: origin_type has already been normalized from abstract to concrete
-        count, _ = token_count(inner_types[0])
-        if not isinstance(token, Sequence):
-            raise ValueError
-
-        # Check if tokens are JSON strings
-        inner_type = inner_types[0]
-        if (
-            count > 1
-            and any(isinstance(t, Token) and t.value.strip().startswith("{") for t in token)
-            and inner_type is not str
-        ):
-            # Each token is a complete JSON representation of the dataclass
-            gen = token
-        elif count > 1:
-            gen = zip(*[iter(token)] * count, strict=False)
-        else:
-            gen = token
-        out = origin_type(convert(inner_types[0], e) for e in gen)
-    elif is_class_and_subclass(type_, Flag):
-        # TODO: this might never execute since enum.Flag is now handled in ``convert``.
-        out = convert_enum_flag(type_, token if isinstance(token, Sequence) else [token], name_transform)
-    elif is_class_and_subclass(type_, Enum):
-        if isinstance(token, Sequence):
-            raise ValueError
-
-        if converter is None:
-            out = get_enum_member(type_, token, name_transform)
-        else:
-            out = converter(type_, token.value)
-    else:
-        field_infos = get_field_infos(type_)
-        # Hope that if there is no field_info, that it takes `*args` and would be happy with a single ``str`` input.
-        # This is common for many types, such as libraries that try to mimic pathlib.Path interface.
-        # TODO: This doesn't respect the type-annotation of ``*args``.
-        if is_builtin(type_) or not field_infos:
-            assert isinstance(token, Token)
-            try:
-                if token.implicit_value is not UNSET:
-                    out = token.implicit_value
-                elif converter is None:
-                    out = _converters.get(type_, type_)(token.value)  # pyright: ignore[reportOptionalCall]
-                elif converter_needs_token:
-                    out = converter(type_, token)  # pyright: ignore[reportArgumentType]
-                else:
-                    out = converter(type_, token.value)
-            except CoercionError as e:
-                if e.target_type is None:
-                    e.target_type = type_
-                if e.token is None:
-                    e.token = token
-                raise
-            except ValueError:
-                raise CoercionError(token=token, target_type=type_) from None
-        else:
-            # Convert it into a user-supplied class.
-            # First check if we have a single token that's a JSON string
-            if isinstance(token, Token) and token.value.strip().startswith("{") and type_ is not str:
-                try:
-                    data = json.loads(token.value)
-                    if not isinstance(data, dict):
-                        # JSON was valid but didn't produce a dict (e.g., it was an array or scalar)
-                        raise TypeError  # noqa: TRY301
-                    # Convert dict to dataclass with proper type conversion
-                    out = _convert_json(type_, data, field_infos, converter, name_transform)
-                except json.JSONDecodeError as e:
-                    # Create helpful error message for invalid JSON
-                    msg = _create_json_decode_error_message(token, type_, e)
-                    raise CoercionError(msg=msg, token=token, target_type=type_) from e
-                except TypeError:
-                    # Fall back to positional argument parsing
-                    if not isinstance(token, Sequence):
-                        token = [token]
-                    out = _convert_structured_type(type_, token, field_infos, convert)
-            else:
-                # Standard positional argument parsing
-                if not isinstance(token, Sequence):
-                    token = [token]
-                out = _convert_structured_type(type_, token, field_infos, convert)
-
-    if cparam:
-        # An inner type may have an independent Parameter annotation;
-        # e.g.:
-        #    Uint8 = Annotated[int, ...]
-        #    rgb: tuple[Uint8, Uint8, Uint8]
-        try:
-            for validator in cparam.validator:  # pyright: ignore
-                if isinstance(validator, str):
-                    validator = getattr(type_, validator)
-                if inspect.ismethod(validator):
-                    validator(out)
-                else:
-                    validator(type_, out)
-        except (AssertionError, ValueError, TypeError) as e:
-            raise ValidationError(exception_message=e.args[0] if e.args else "", value=out) from e
-
-    return out
+    return _compile(type_, converter, name_transform)(token)
 
 
 def convert(
@@ -856,77 +620,7 @@ def convert(
     Any
         Coerced version of input ``*args``.
     """
-    from cyclopts.argument import Token
-
-    if not tokens:
-        raise ValueError
-
-    if not isinstance(tokens, dict) and isinstance(tokens[0], str):
-        tokens = tuple(Token(value=str(x)) for x in tokens)
-
-    if name_transform is None:
-        name_transform = default_name_transform
-
-    convert_priv = partial(_convert, converter=converter, name_transform=name_transform)
-    convert_tuple = partial(_convert_tuple, converter=converter, name_transform=name_transform)
-    # ``_convert`` applies a type's own ``Parameter`` metadata (converter/validator), but
-    # ``resolve`` discards it. Stash the metadata so it can be re-attached to the
-    # *normalized* type for the scalar dispatch below; this is what lets a container's
-    # value type carry its own ``Parameter``, e.g. ``dict[str, PositiveInt]``.
-    annotations_ = get_args(type_)[1:] if is_annotated(type_) else ()
-    type_ = resolve(type_)
-
-    if type_ is Any:
-        type_ = str
-
-    type_ = _implicit_iterable_type_mapping.get(type_, type_)
-
-    # Handle bare abstract types (e.g., collections.abc.Set without [T])
-    # Convert to their default parameterized concrete versions
-    if type_ in _abstract_to_concrete_type_mapping:
-        concrete_type = _abstract_to_concrete_type_mapping[type_]
-        type_ = _implicit_iterable_type_mapping.get(concrete_type, concrete_type)
-
-    origin_type = get_origin(type_)
-    # Normalize abstract origin types to concrete types early
-    if origin_type in _abstract_to_concrete_type_mapping:
-        origin_type = _abstract_to_concrete_type_mapping[origin_type]
-    maybe_origin_type = origin_type or type_
-
-    if origin_type is tuple:
-        return convert_tuple(type_, *tokens)  # pyright: ignore
-    elif maybe_origin_type in ITERABLE_TYPES:
-        return convert_priv(type_, tokens)  # pyright: ignore
-    elif maybe_origin_type is dict:
-        if not isinstance(tokens, dict):
-            raise ValueError  # Programming error
-        try:
-            value_type = get_args(type_)[1]
-        except IndexError:
-            value_type = str
-        dict_converted = {
-            k: convert(value_type, v, converter=converter, name_transform=name_transform) for k, v in tokens.items()
-        }
-        return _converters.get(maybe_origin_type, maybe_origin_type)(**dict_converted)
-    elif isinstance(tokens, dict):
-        raise ValueError(f"Dictionary of tokens provided for unknown {type_!r}.")  # Programming error
-    elif is_enum_flag(maybe_origin_type):
-        # Unlike other types that can accept multiple tokens, the result is not a sequence, it's a single
-        # enum.Flag object.
-        return convert_enum_flag(maybe_origin_type, tokens, name_transform)
-    else:
-        tokens_per_element, consume_all = token_count(type_)
-        annotated_type_ = Annotated[(type_, *annotations_)] if annotations_ else type_
-        if consume_all:
-            return convert_priv(annotated_type_, tokens)  # pyright: ignore
-        elif len(tokens) == 1:
-            return convert_priv(annotated_type_, tokens[0])  # pyright: ignore
-        elif tokens_per_element == 1:
-            return [convert_priv(annotated_type_, item) for item in tokens]  # pyright: ignore
-        elif len(tokens) == tokens_per_element:
-            return convert_priv(annotated_type_, tokens)  # pyright: ignore
-        else:
-            raise NotImplementedError("Unreachable?")
+    return compile_converter(type_, converter, name_transform)(tokens)
 
 
 def token_count(type_: Any, skip_converter_params: bool = False) -> tuple[int, bool]:
@@ -1036,3 +730,431 @@ def token_count(type_: Any, skip_converter_params: bool = False) -> tuple[int, b
             return 1, False
 
         return count, consume_all
+
+
+_CACHE_SIZE = 1024
+_compiled_nodes: dict[tuple, tuple[Any, Callable]] = {}
+_compiled_converters: dict[tuple, tuple[Any, Callable]] = {}
+
+
+def _cached(cache: dict, build: Callable, type_, converter: Callable | None, name_transform: Callable[[str], str]):
+    """``build(type_, converter, name_transform)``, cached by the identity of ``type_``.
+
+    Type hints are compared by identity rather than equality because equal hints may
+    order their arguments differently (``Union[int, str] == Union[str, int]``), while
+    conversion tries union members and ``Literal`` choices in order.
+    """
+    try:
+        key = (id(type_), converter, name_transform)
+        hit = cache.get(key)
+    except TypeError:  # Unhashable converter.
+        return build(type_, converter, name_transform)
+    if hit is not None and hit[0] is type_:
+        return hit[1]
+    node = build(type_, converter, name_transform)
+    if len(cache) >= _CACHE_SIZE:
+        cache.clear()
+    cache[key] = (type_, node)  # Keeping ``type_`` alive also keeps its ``id`` unique.
+    return node
+
+
+def _compile(type_, converter: Callable | None, name_transform: Callable[[str], str]) -> Callable:
+    """Compile ``type_`` into a node ``node(token) -> Any``; the single type-hint dispatch behind :func:`_convert`.
+
+    All of the type-hint analysis happens here, once; the node only handles the runtime token(s).
+    """
+    return _cached(_compiled_nodes, _compile_unchecked, type_, converter, name_transform)
+
+
+def _compile_unchecked(type_, converter: Callable | None, name_transform: Callable[[str], str]) -> Callable:
+    """Uncached :func:`_compile`."""
+    from cyclopts.argument import Token
+    from cyclopts.parameter import Parameter
+
+    converter_needs_token = False
+    if is_annotated(type_):
+        type_, cparam = Parameter.from_annotation(type_)
+        if cparam.converter:
+            converter_needs_token = True
+            resolved_converter = cparam.converter
+            converter_is_str = isinstance(resolved_converter, str)
+
+            def converter_with_token(t_, value):
+                # Resolve string converters to methods on the type
+                resolved = getattr(t_, resolved_converter) if converter_is_str else resolved_converter
+                # Bound methods (classmethods/instance methods) already have their first parameter bound.
+                if inspect.ismethod(resolved):
+                    return resolved((value,))
+                else:
+                    return resolved(t_, (value,))
+
+            converter = converter_with_token
+
+        if cparam.name_transform:
+            name_transform = cparam.name_transform
+        validators = tuple(cparam.validator or ())  # pyright: ignore[reportArgumentType]
+    else:
+        validators = ()
+
+    node = _compile_dispatch(type_, converter, converter_needs_token, name_transform, Token)
+
+    if not validators:
+        return node
+
+    def validated_node(token):
+        out = node(token)
+        try:
+            for validator in validators:
+                if isinstance(validator, str):
+                    validator = getattr(type_, validator)
+                if inspect.ismethod(validator):
+                    validator(out)
+                else:
+                    validator(type_, out)
+        except (AssertionError, ValueError, TypeError) as e:
+            raise ValidationError(exception_message=e.args[0] if e.args else "", value=out) from e
+        return out
+
+    return validated_node
+
+
+def _compile_dispatch(
+    type_,
+    converter: Callable | None,
+    converter_needs_token: bool,
+    name_transform: Callable[[str], str],
+    Token: type,  # noqa: N803
+) -> Callable:
+    compile_ = partial(_compile, converter=converter, name_transform=name_transform)
+
+    origin_type = get_origin(type_)
+    if origin_type in _abstract_to_concrete_type_mapping:
+        origin_type = _abstract_to_concrete_type_mapping[origin_type]
+    inner_types = get_args(type_)
+
+    if type_ is dict:
+        return compile_(dict[str, str])
+    elif type_ in _implicit_iterable_type_mapping:
+        return compile_(_implicit_iterable_type_mapping[type_])
+    elif type_ in _abstract_to_concrete_type_mapping:
+        concrete_type = _abstract_to_concrete_type_mapping[type_]
+        return compile_(_implicit_iterable_type_mapping.get(concrete_type, concrete_type))
+    elif TypeAliasType is not None and isinstance(type_, TypeAliasType):
+        # Compiled on first use; type aliases may be recursive.
+        alias_node = None
+
+        def alias(token):
+            nonlocal alias_node
+            if alias_node is None:
+                alias_node = compile_(type_.__value__)
+            return alias_node(token)
+
+        return alias
+    elif is_union(origin_type):
+        candidates = tuple(compile_(t) for t in inner_types if not is_nonetype(t))
+
+        def union(token):
+            for candidate in candidates:
+                try:
+                    return candidate(token)
+                except Exception:
+                    pass
+            if isinstance(token, Sequence):
+                raise ValueError  # noqa: TRY004
+            raise CoercionError(token=token, target_type=type_)
+
+        return union
+    elif origin_type is Literal:
+        return _compile_literal(type_, converter, compile_, Token)
+    elif origin_type is tuple:
+        tuple_node = _compile_tuple(type_, compile_)
+
+        def tuple_(token):
+            return tuple_node((token,) if isinstance(token, Token) else token)
+
+        return tuple_
+    elif origin_type in ITERABLE_TYPES:
+        inner_type = inner_types[0]
+        count, _ = token_count(inner_type)
+        element = compile_(inner_type)
+        maybe_json = count > 1 and inner_type is not str
+
+        def iterable(token):
+            if not isinstance(token, Sequence):
+                raise ValueError  # noqa: TRY004
+            if maybe_json and any(isinstance(t, Token) and t.value.strip().startswith("{") for t in token):
+                # Each token is a complete JSON representation of the dataclass
+                gen = token
+            elif count > 1:
+                gen = zip(*[iter(token)] * count, strict=False)
+            else:
+                gen = token
+            return origin_type(map(element, gen))
+
+        return iterable
+    elif is_class_and_subclass(type_, Flag):
+        return lambda token: convert_enum_flag(type_, token if isinstance(token, Sequence) else [token], name_transform)
+    elif is_class_and_subclass(type_, Enum):
+        if converter is not None:
+
+            def enum_converter(token):
+                if isinstance(token, Sequence):
+                    raise ValueError  # noqa: TRY004
+                return converter(type_, token.value)
+
+            return enum_converter
+
+        # First member wins, same as the linear scan in ``get_enum_member``.
+        members = {}
+        for name, member in type_.__members__.items():
+            members.setdefault(name_transform(name), member)
+
+        def enum(token):
+            if isinstance(token, Sequence):
+                raise ValueError  # noqa: TRY004
+            try:
+                return members[name_transform(token.value)]
+            except KeyError:
+                raise CoercionError(token=token, target_type=type_) from None
+
+        return enum
+
+    field_infos = get_field_infos(type_)
+    if is_builtin(type_) or not field_infos:
+        leaf_converter = _converters.get(type_, type_) if converter is None else partial(converter, type_)
+
+        def leaf(token):
+            assert isinstance(token, Token)
+            try:
+                if token.implicit_value is not UNSET:
+                    return token.implicit_value
+                return leaf_converter(token if converter_needs_token else token.value)
+            except CoercionError as e:
+                if e.target_type is None:
+                    e.target_type = type_
+                if e.token is None:
+                    e.token = token
+                raise
+            except ValueError:
+                raise CoercionError(token=token, target_type=type_) from None
+
+        return leaf
+
+    # Convert it into a user-supplied class.
+    convert_field = partial(_convert, converter=converter, name_transform=name_transform)
+
+    def structured(token):
+        # First check if we have a single token that's a JSON string
+        if isinstance(token, Token) and token.value.strip().startswith("{") and type_ is not str:
+            try:
+                data = json.loads(token.value)
+                if not isinstance(data, dict):
+                    # JSON was valid but didn't produce a dict (e.g., it was an array or scalar)
+                    raise TypeError  # noqa: TRY301
+                # Convert dict to dataclass with proper type conversion
+                return _convert_json(type_, data, field_infos, converter, name_transform)
+            except json.JSONDecodeError as e:
+                # Create helpful error message for invalid JSON
+                msg = _create_json_decode_error_message(token, type_, e)
+                raise CoercionError(msg=msg, token=token, target_type=type_) from e
+            except TypeError:
+                # Fall back to positional argument parsing
+                pass
+        return _convert_structured_type(
+            type_, token if isinstance(token, Sequence) else [token], field_infos, convert_field
+        )
+
+    return structured
+
+
+def _compile_literal(type_, converter: Callable | None, compile_: Callable, Token: type) -> Callable:  # noqa: N803
+    choices = get_args(type_)
+    choice_nodes = {}
+    for choice in choices:
+        if type(choice) not in choice_nodes:
+            choice_nodes[type(choice)] = compile_(type(choice))
+    plan = tuple((choice, choice_nodes[type(choice)]) for choice in choices)
+
+    # ``str`` choices compare equal only to the identical token value, so an all-``str``
+    # Literal resolves with a single table lookup.
+    table = (
+        {choice: choice for choice in choices} if converter is None and all(type(c) is str for c in choices) else None
+    )
+
+    def literal(token):
+        if table is not None and isinstance(token, Token) and token.implicit_value is UNSET:
+            try:
+                return table[token.value]
+            except KeyError:
+                raise CoercionError(token=token, target_type=type_) from None
+
+        last_coercion_error = None
+        for choice, node in plan:
+            try:
+                res = node(token)
+            except CoercionError as e:
+                last_coercion_error = e
+                continue
+            if res == choice:
+                return res
+        if last_coercion_error:
+            last_coercion_error.target_type = type_
+            raise last_coercion_error
+        raise CoercionError(token=token[0] if isinstance(token, Sequence) else token, target_type=type_)
+
+    return literal
+
+
+def _compile_tuple(type_, compile_: Callable) -> Callable:
+    """Compile a ``tuple`` hint; the node takes a sequence of tokens."""
+    inner_types = tuple(x for x in get_args(type_) if x is not ...)
+    inner_token_count, consume_all = token_count(type_)
+    # Elements like boolean-flags will have an inner_token_count of 0.
+    inner_token_count = max(inner_token_count, 1)
+
+    if consume_all:
+        if len(inner_types) == 1:
+            element = compile_(inner_types[0])
+        elif len(inner_types) == 0:
+            element = compile_(str)
+        else:
+
+            def element(_):
+                raise ValueError("A tuple must have 0 or 1 inner-types.")
+
+        def variable_length(tokens):
+            if len(tokens) % inner_token_count:
+                raise CoercionError(
+                    msg=f"Incorrect number of arguments: expected multiple of {inner_token_count} but got {len(tokens)}."
+                )
+            if inner_token_count == 1:
+                return tuple(map(element, tokens))
+            return tuple(element(chunk) for chunk in grouper(tokens, inner_token_count))
+
+        return variable_length
+
+    elements = tuple(zip((token_count(x)[0] for x in inner_types), map(compile_, inner_types), strict=True))
+
+    def fixed_length(tokens):
+        if inner_token_count != len(tokens):
+            raise CoercionError(
+                msg=f"Incorrect number of arguments: expected {inner_token_count} but got {len(tokens)}."
+            )
+        it = iter(tokens)
+        out = []
+        for size, element in elements:
+            batch = [next(it) for _ in range(size)]
+            out.append(element(batch[0] if len(batch) == 1 else batch))
+        return tuple(out)
+
+    return fixed_length
+
+
+def compile_converter(
+    type_: Any,
+    converter: Callable[[type, str], Any] | None = None,
+    name_transform: Callable[[str], str] | None = None,
+) -> Callable[[Sequence[str] | Sequence["Token"] | NestedCliArgs], Any]:
+    """Compile ``type_`` into a reusable converter.
+
+    ``compile_converter(type_, converter, name_transform)(tokens)`` is equivalent to
+    ``convert(type_, tokens, converter, name_transform)``, but all type-hint analysis
+    (``Annotated`` metadata, union members, ``Literal`` choices, element converters, ...)
+    happens once, up front. Useful when the same hint is converted many times.
+
+    Parameters
+    ----------
+    type_: Type
+        A type hint/annotation to coerce tokens into.
+    converter: Optional[Callable[[Type, str], Any]]
+        See :func:`convert`.
+    name_transform: Optional[Callable[[str], str]]
+        See :func:`convert`.
+
+    Returns
+    -------
+    Callable
+        Function that takes ``tokens`` (same as :func:`convert`) and returns the coerced value.
+    """
+    if name_transform is None:
+        name_transform = default_name_transform
+    return _cached(_compiled_converters, _compile_converter, type_, converter, name_transform)
+
+
+def _compile_converter(type_: Any, converter: Callable | None, name_transform: Callable[[str], str]) -> Callable:
+    """Uncached :func:`compile_converter`."""
+    from cyclopts.argument import Token
+
+    compile_ = partial(_compile, converter=converter, name_transform=name_transform)
+
+    annotations_ = get_args(type_)[1:] if is_annotated(type_) else ()
+    type_ = resolve(type_)
+
+    if type_ is Any:
+        type_ = str
+
+    type_ = _implicit_iterable_type_mapping.get(type_, type_)
+
+    if type_ in _abstract_to_concrete_type_mapping:
+        concrete_type = _abstract_to_concrete_type_mapping[type_]
+        type_ = _implicit_iterable_type_mapping.get(concrete_type, concrete_type)
+
+    origin_type = get_origin(type_)
+    if origin_type in _abstract_to_concrete_type_mapping:
+        origin_type = _abstract_to_concrete_type_mapping[origin_type]
+    maybe_origin_type = origin_type or type_
+
+    if origin_type is tuple:
+        run = _compile_tuple(type_, compile_)
+    elif maybe_origin_type in ITERABLE_TYPES:
+        run = compile_(type_)
+    elif maybe_origin_type is dict:
+        try:
+            value_type = get_args(type_)[1]
+        except IndexError:
+            value_type = str
+        value_converter = compile_converter(value_type, converter, name_transform)
+        dict_type = _converters.get(maybe_origin_type, maybe_origin_type)
+
+        def run(tokens):
+            if not isinstance(tokens, dict):
+                raise ValueError  # noqa: TRY004 # Programming error
+            return dict_type(**{k: value_converter(v) for k, v in tokens.items()})
+    elif is_enum_flag(maybe_origin_type):
+
+        def run(tokens):
+            if isinstance(tokens, dict):
+                raise ValueError(f"Dictionary of tokens provided for unknown {type_!r}.")  # noqa: TRY004 # Programming error
+            return convert_enum_flag(maybe_origin_type, tokens, name_transform)  # pyright: ignore[reportArgumentType]
+    else:
+        tokens_per_element, consume_all = token_count(type_)
+        element = compile_(Annotated[(type_, *annotations_)] if annotations_ else type_)
+
+        def run(tokens):
+            if isinstance(tokens, dict):
+                raise ValueError(f"Dictionary of tokens provided for unknown {type_!r}.")  # noqa: TRY004 # Programming error
+            if consume_all:
+                return element(tokens)
+            elif len(tokens) == 1:
+                return element(tokens[0])
+            elif tokens_per_element == 1:
+                return [element(item) for item in tokens]
+            elif len(tokens) == tokens_per_element:
+                return element(tokens)
+            else:
+                raise NotImplementedError("Unreachable?")
+
+    def compiled(tokens):
+        if not tokens:
+            raise ValueError
+        if not isinstance(tokens, dict) and isinstance(tokens[0], str):
+            tokens = tuple(Token(value=str(x)) for x in tokens)
+        return run(tokens)
+
+    return compiled
+
+
+def clear() -> None:
+    """Forget all compiled converters."""
+    _compiled_nodes.clear()
+    _compiled_converters.clear()
@@ -0,0 +1,186 @@
+"""Per-process index of parsed docstrings.
+
+Help pages, completion scripts and documentation all need the parsed docstrings
+of the same commands and parameter types. Parsed docstrings are indexed by their
+text, and the parameter descriptions extracted from an object by the object's
+identity, validated against its ``__doc__`` (and those of its base classes).
+
+Parsing a class's attribute docstrings requires reading and parsing its source
+code. With ``CYCLOPTS_DOCSTRING_CACHE=1``, these results are also persisted in
+``$XDG_CACHE_HOME/cyclopts/docstrings.json`` (saved at exit), keyed by the
+docstrings and the modification time and size of the defining source files.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+from weakref import WeakKeyDictionary
+
+from cyclopts._cache import atomic_write, cache_root
+
+T = TypeVar("T")
+
+CACHE_ENV_VAR = "CYCLOPTS_DOCSTRING_CACHE"
+"""Set to ``"1"`` to persist the parameter descriptions extracted from classes across processes."""
+
+_FORMAT = 1
+_MAX_DISK_ENTRIES = 4096
+_MAX_TEXTS = 1024
+"""Parsed docstrings kept in memory; the least recently used are dropped first."""
+
+ParamDocs = list[tuple[tuple[str, ...], str | None]]
+"""Parameter path (e.g. ``("user", "name")``) and description of each documented parameter."""
+
+
+class DocstringCacheInfo(NamedTuple):
+    """Statistics of the docstring index; see :func:`cyclopts.docstring_cache_info`."""
+
+    hits: int
+    """Lookups answered from memory."""
+
+    misses: int
+    """Lookups that required parsing (or loading from disk)."""
+
+    disk_hits: int
+    """Misses answered from the on-disk cache."""
+
+    currsize: int
+    """Number of indexed docstrings (at most 1024) and live objects."""
+
+
+_texts: "OrderedDict[str, Any]" = OrderedDict()
+_objects: "WeakKeyDictionary[Any, tuple[tuple, ParamDocs]]" = WeakKeyDictionary()
+_hits = _misses = _disk_hits = 0
+
+_disk: dict[str, ParamDocs] | None = None
+_save_registered = False
+_disk_dirty = False
+
+
+def cache_info() -> DocstringCacheInfo:
+    return DocstringCacheInfo(_hits, _misses, _disk_hits, len(_texts) + len(_objects))
+
+
+def clear() -> None:
+    """Forget all indexed docstrings and reset the statistics."""
+    global _hits, _misses, _disk_hits, _disk, _disk_dirty
+    _texts.clear()
+    _objects.clear()
+    _hits = _misses = _disk_hits = 0
+    _disk, _disk_dirty = None, False
+
+
+def parsed_text(doc: str, parse: Callable[[str], T]) -> T:
+    """``parse(doc)``, memoized by ``doc``."""
+    global _hits, _misses
+    try:
+        out = _texts[doc]
+    except KeyError:
+        _misses += 1
+        out = _texts[doc] = parse(doc)
+        if len(_texts) > _MAX_TEXTS:
+            _texts.popitem(last=False)
+    else:
+        _hits += 1
+        _texts.move_to_end(doc)
+    return out
+
+
+def _docs(obj: Any) -> tuple:
+    """The docstrings that the parameter descriptions of ``obj`` are parsed from."""
+    if mro := getattr(obj, "__mro__", None):
+        return tuple(getattr(cls, "__doc__", None) for cls in mro)
+    return (getattr(obj, "__doc__", None),)
+
+
+def object_params(obj: Any, parse: Callable[[Any], ParamDocs]) -> ParamDocs:
+    """``parse(obj)``, memoized by the identity and docstrings of ``obj``.
+
+    Bound methods are indexed by their function. The returned list must not be mutated.
+    """
+    global _hits, _misses, _disk_hits
+    key = getattr(obj, "__func__", obj)
+    docs = _docs(obj)
+    try:
+        cached = _objects.get(key)
+    except TypeError:  # Not weak-referenceable.
+        _misses += 1
+        return parse(obj)
+    if cached is not None and cached[0] == docs:
+        _hits += 1
+        return cached[1]
+
+    _misses += 1
+    disk_key = _disk_key(obj, docs) if os.environ.get(CACHE_ENV_VAR) == "1" else None
+    if disk_key is not None and (out := _disk_lookup(disk_key)) is not None:
+        _disk_hits += 1
+    else:
+        out = parse(obj)
+        if disk_key is not None:
+            _disk_store(disk_key, out)
+    _objects[key] = (docs, out)
+    return out
+
+
+def cache_path() -> Path:
+    return cache_root() / "docstrings.json"
+
+
+def _disk_key(obj: Any, docs: tuple) -> str | None:
+    """Key of ``obj`` in the on-disk cache; :obj:`None` for objects not defined in a source file."""
+    classes = getattr(obj, "__mro__", None)
+    if not classes:
+        return None  # Functions are parsed from ``__doc__`` alone; that's cheap.
+    files = []
+    for cls in classes[:-1]:  # Exclude 'object'
+        module = sys.modules.get(cls.__module__)
+        path = getattr(module, "__file__", None)
+        if not path:
+            return None
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        files.append([path, stat.st_mtime_ns, stat.st_size])
+    identity = [_FORMAT, [f"{cls.__module__}.{cls.__qualname__}" for cls in classes], docs, files]
+    return hashlib.sha256(json.dumps(identity).encode()).hexdigest()[:32]
+
+
+def _disk_lookup(key: str) -> ParamDocs | None:
+    global _disk, _save_registered
+    if _disk is None:
+        try:
+            _disk = json.loads(cache_path().read_text(encoding="utf-8"))
+            assert isinstance(_disk, dict)
+        except (OSError, ValueError, AssertionError):
+            _disk = {}
+        if not _save_registered:  # ``clear()`` drops ``_disk``; it's reloaded, but saved once.
+            atexit.register(save)
+            _save_registered = True
+    value = _disk.get(key)
+    if value is None:
+        return None
+    return [(tuple(path), description) for path, description in value]
+
+
+def _disk_store(key: str, value: ParamDocs) -> None:
+    global _disk_dirty
+    if _disk is not None:
+        _disk[key] = value
+        _disk_dirty = True
+
+
+def save() -> None:
+    """Write the on-disk cache if it changed. Failures are silently ignored."""
+    global _disk_dirty
+    if _disk is None or not _disk_dirty:
+        return
+    _disk_dirty = False
+    entries = list(_disk.items())[-_MAX_DISK_ENTRIES:]  # Oldest entries first.
+    atomic_write(cache_path(), json.dumps(dict(entries)))
@@ -0,0 +1,393 @@
+"""Help pages and error messages built as plain strings, without importing rich.
+
+Used when the output isn't a terminal, or when :attr:`App.help_formatter` is
+``"plain"``, and no :class:`~rich.console.Console` was configured. The output
+matches :class:`~cyclopts.help.PlainFormatter` and
+:func:`~cyclopts.panel.CycloptsPanel` rendered by rich. Content that only rich
+can render faithfully (reStructuredText, markdown beyond paragraphs and bullet
+lists, rich emoji codes, wide characters) raises :class:`_UnsupportedError`, and the
+caller falls back to rich.
+"""
+
+import os
+import re
+import sys
+import textwrap
+import unicodedata
+from typing import TYPE_CHECKING, Any, TextIO
+
+if TYPE_CHECKING:
+    from cyclopts.core import App, _CommandResolution
+    from cyclopts.exceptions import CycloptsError
+    from cyclopts.help import HelpPanel
+    from cyclopts.help.formatters import PlainFormatter
+
+
+class _UnsupportedError(Exception):
+    """Content that needs rich to be rendered faithfully."""
+
+
+# Same as ``rich.markup.RE_TAGS``.
+_RE_TAGS = re.compile(r"((\\*)\[([a-z#/@][^[]*?)])")
+_RE_EMOJI_CODE = re.compile(r":\S*?:")
+_RE_WORD = re.compile(r"\s*\S+\s*")
+_RE_CONTROL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+# Characters without a special meaning in markdown paragraphs; only such lines skip the markdown parser.
+_RE_MARKDOWN_PLAIN_LINE = re.compile(r"(?![ \t]*(?:[-+*>#|=]|\d+[.)]|    ))[^\\`*\[\]<>&!~|#]*(?<!  )")
+_RE_MARKDOWN_UNDERSCORE = re.compile(r"(?<![A-Za-z0-9])_|_(?![A-Za-z0-9])")
+
+
+def _rich_environment() -> bool:
+    """Whether output is displayed by something other than a text stream (Jupyter, IDLE)."""
+    return (
+        "ipykernel" in sys.modules
+        or "google.colab" in sys.modules
+        or getattr(sys.stdin, "__module__", "").startswith("idlelib")
+    )
+
+
+def is_terminal(stream: TextIO) -> bool:
+    """Whether rich would treat ``stream`` as a terminal; mirrors :attr:`rich.console.Console.is_terminal`."""
+    tty_compatible = os.environ.get("TTY_COMPATIBLE", "")
+    if tty_compatible in ("0", "1"):
+        return tty_compatible == "1"
+    force_color = os.environ.get("FORCE_COLOR")
+    if force_color is not None:
+        return force_color != ""
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def console_width(stream: TextIO) -> int:
+    """Width of a default :class:`~rich.console.Console` writing to ``stream``."""
+    columns = os.environ.get("COLUMNS")
+    if columns is not None and columns.isdigit():
+        return int(columns)
+    if os.environ.get("TERM", "").lower() in ("dumb", "unknown") and is_terminal(stream):
+        return 80
+    for fd in (0, 1, 2):
+        try:
+            width = os.get_terminal_size(fd).columns
+        except (AttributeError, ValueError, OSError):
+            continue
+        return width or 80
+    return 80
+
+
+def _check_narrow(text: str) -> None:
+    """Raise :class:`_UnsupportedError` unless each character of ``text`` takes up one cell."""
+    if text.isascii():
+        if _RE_CONTROL.search(text):
+            raise _UnsupportedError
+        return
+    for char in text:
+        if char == "\n":
+            continue
+        if (
+            unicodedata.east_asian_width(char) in "WF"
+            or unicodedata.combining(char)
+            or unicodedata.category(char) in ("Cc", "Cf")
+        ):
+            raise _UnsupportedError
+
+
+def _divide(text: str, width: int) -> int | None:
+    """Offset of the first line break when rich wraps ``text`` to ``width``; see ``rich._wrap.divide_line``."""
+    offset = 0
+    for match in _RE_WORD.finditer(text):
+        start, word = match.start(), match.group()
+        word_length = len(word.rstrip())
+        if width - offset >= word_length:
+            offset += len(word)
+        elif word_length > width:
+            return start or width  # Folded across lines.
+        elif offset and start:
+            return start
+    return None
+
+
+def _wrap(line: str, width: int) -> list[str]:
+    """Wrap ``line`` like rich."""
+    line = line.expandtabs(8)
+    if len(line) <= width:
+        return [line]
+    _check_narrow(line)
+    out = []
+    while (end := _divide(line, width)) is not None:
+        out.append(line[:end].rstrip())
+        line = line[end:]
+    out.append(line.rstrip())
+    return out
+
+
+def _fill(text: str, width: int) -> str:
+    """Wrap each line of ``text`` like a :class:`rich.text.Text` rendered ``width`` cells wide."""
+    return "\n".join(wrapped for line in text.split("\n") for wrapped in _wrap(line, width))
+
+
+def _strip_markup(content: str) -> str:
+    """Text of rich console markup, as :meth:`rich.text.Text.from_markup` renders it."""
+    if _RE_EMOJI_CODE.search(content):
+        raise _UnsupportedError
+    out, position = [], 0
+    for match in _RE_TAGS.finditer(content):
+        full_text, escapes, _ = match.groups()
+        start, end = match.span()
+        out.append(content[position:start])
+        position = end
+        backslashes, escaped = divmod(len(escapes), 2)
+        out.append("\\" * backslashes)
+        if escaped:
+            out.append(full_text[len(escapes) :])
+    out.append(content[position:])
+    return "".join(out)
+
+
+def _markdown(content: str, width: int) -> str:
+    """Text of markdown ``content``, as :class:`rich.markdown.Markdown` renders it ``width`` cells wide."""
+    lines = content.splitlines()
+    if not _RE_MARKDOWN_UNDERSCORE.search(content) and all(_RE_MARKDOWN_PLAIN_LINE.fullmatch(x) for x in lines):
+        paragraphs = re.split(r"\n[ \t]*\n", content.strip())
+        return "\n\n".join(
+            _fill(" ".join(x.strip() for x in p.splitlines() if x.strip()), width) for p in paragraphs if p.strip()
+        )
+
+    from markdown_it import MarkdownIt
+
+    blocks: list[str] = []
+    bullet = None  # Items of the bullet list being read.
+    tokens = MarkdownIt().enable("strikethrough").enable("table").parse(content)
+    for token in tokens:
+        if token.type == "bullet_list_open":
+            if bullet is not None:
+                raise _UnsupportedError  # Nested lists.
+            bullet = []
+        elif token.type == "bullet_list_close":
+            assert bullet is not None
+            blocks.append("\n".join(bullet))
+            bullet = None
+        elif token.type in ("list_item_open", "list_item_close", "paragraph_close"):
+            pass
+        elif token.type == "paragraph_open":
+            if bullet is not None and not token.hidden:
+                raise _UnsupportedError  # Loose lists.
+        elif token.type == "inline":
+            text = _markdown_inline(token.children or [])
+            if bullet is None:
+                blocks.append(_fill(text, width))
+            else:
+                bullet.append(textwrap.indent(_fill(text, width - 3), "   ").replace("   ", " • ", 1))
+        else:
+            raise _UnsupportedError  # Headings, code blocks, block quotes, tables, HTML, ...
+    text = "\n\n".join(blocks)
+    if tokens[0].type == "bullet_list_open":
+        text = "\n" + text  # rich starts a leading list with a blank line.
+    return text
+
+
+def _markdown_inline(children: list) -> str:
+    out = []
+    for child in children:
+        if child.type in ("text", "code_inline"):
+            out.append(child.content)
+        elif child.type == "softbreak":
+            out.append(" ")
+        elif child.type == "hardbreak":
+            out.append("\n")
+        elif child.type.endswith(("_open", "_close")) and child.type.startswith(("em", "strong", "s_", "link")):
+            pass
+        else:
+            raise _UnsupportedError  # Images, inline HTML, ...
+    return "".join(out)
+
+
+def _markup_to_text(content: str | None, format: str, width: int) -> str:
+    """Text of ``content`` in the markup language ``format`` (see :attr:`App.help_format`), wrapped to ``width``."""
+    if content is None:
+        return ""
+    if format == "plaintext":
+        return _fill(content.rstrip(), width)
+    elif format in ("markdown", "md"):
+        return _markdown(content, width)
+    elif format == "rich":
+        return _fill(_strip_markup(content).rstrip(), width)
+    raise _UnsupportedError  # reStructuredText
+
+
+def _description(obj: Any, width: int) -> str:
+    """Counterpart of ``cyclopts.help.formatters.plain._to_plain_text``."""
+    from cyclopts.help import InlineText
+
+    if obj is None:
+        return ""
+    if isinstance(obj, InlineText):
+        if obj.texts or obj.format is None:
+            raise _UnsupportedError
+        return _markup_to_text(obj.content, obj.format, width).rstrip()
+    if hasattr(obj, "plain"):
+        return obj.plain.rstrip()
+    if isinstance(obj, str):
+        return obj.rstrip()
+    raise _UnsupportedError
+
+
+def _panel_lines(formatter: "PlainFormatter", panel: "HelpPanel", width: int) -> list[str]:
+    """Lines of :meth:`PlainFormatter.__call__ <cyclopts.help.PlainFormatter.__call__>`."""
+    if not panel.entries:
+        return []
+    if not isinstance(panel.title, str):
+        raise _UnsupportedError
+    lines = [f"{panel.title}:"] if panel.title else []
+    for entry in panel.entries:
+        if not entry.all_options:
+            continue
+        desc = _description(entry.description, width)
+        if panel.format == "parameter":
+            parts = [desc] if desc else []
+            if entry.choices:
+                parts.append(f"[choices: {', '.join(entry.choices)}]")
+            if entry.env_var:
+                parts.append(f"[env var: {', '.join(entry.env_var)}]")
+            if entry.default is not None:
+                parts.append(f"[default: {entry.default}]")
+            if entry.required:
+                parts.append("[required]")
+            full_desc = " ".join(parts)
+            options = ", ".join(entry.all_options)
+            texts = [f"{options}: {full_desc}" if full_desc else options]
+        elif entry.positive_names:
+            first = entry.positive_names[0]
+            if entry.positive_shorts:
+                first += ", " + " ".join(entry.positive_shorts)
+            texts = [f"{first}: {desc}" if desc else first, *entry.positive_names[1:]]
+        else:
+            shorts = " ".join(entry.positive_shorts)
+            texts = [f"{shorts}: {desc}" if desc else shorts]
+        for text in texts:
+            lines.extend(textwrap.indent(text, formatter.indent).splitlines())
+    lines.append("")
+    return lines
+
+
+def _help_lines(
+    app: "App",
+    resolution: "_CommandResolution",
+    help_format: str,
+    formatter: "PlainFormatter",
+    width: int,
+) -> list[str]:
+    """Lines of the help page, as :meth:`App._render_help` prints them with a :class:`PlainFormatter`.
+
+    Descriptions are wrapped to ``width``, but lines aren't.
+    """
+    from cyclopts.help.formatters import PlainFormatter
+    from cyclopts.help.help import _doc_string, _usage_string
+
+    command_chain, apps = resolution.context_chain, resolution.context_path
+    executing_app = apps[-1]
+
+    if executing_app.usage is None:
+        usage = _usage_string(app, command_chain, execution_path=apps)
+    elif isinstance(executing_app.usage, str):
+        usage = executing_app.usage.rstrip()
+    else:
+        raise _UnsupportedError
+    description = _markup_to_text(_doc_string(executing_app, help_format), help_format, width).rstrip()
+    panels = app._assemble_help_panels(resolution.tokens, help_format, _resolution=resolution, _plain=True)
+
+    lines = []
+    if help_prologue := executing_app.app_stack.resolve("help_prologue"):
+        lines.extend(_markup_to_text(help_prologue, help_format, width).splitlines())
+        lines.append("")
+    if usage:
+        lines.append(usage if usage.strip().startswith("Usage:") else f"Usage: {usage}")
+        lines.append("")
+    if description:
+        lines.extend(description.splitlines())
+        lines.append("")
+    for group, panel in panels:
+        group_formatter = group.help_formatter if group else None
+        if group_formatter is None:
+            group_formatter = formatter
+        elif type(group_formatter) is not PlainFormatter:
+            raise _UnsupportedError
+        lines.extend(_panel_lines(group_formatter, panel, width))
+    if help_epilogue := executing_app.app_stack.resolve("help_epilogue"):
+        lines.append("")
+        lines.extend(_markup_to_text(help_epilogue, help_format, width).splitlines())
+    return lines
+
+
+def help_page(app: "App", resolution: "_CommandResolution", stream: TextIO) -> str | None:
+    """Plain-text help page of ``resolution`` for ``stream``; :obj:`None` if rich must render it.
+
+    Must be called within the app stack of the command.
+    The page is plain if no console is configured and either :attr:`App.help_formatter`
+    is ``"plain"``, or it isn't set and ``stream`` isn't a terminal.
+    """
+    from cyclopts.core import DEFAULT_FORMAT
+    from cyclopts.help.formatters import PlainFormatter
+
+    executing_app = resolution.context_path[-1]
+    stack = executing_app.app_stack
+    if stack.resolve("_console") is not None or _rich_environment():
+        return None
+    formatter = stack.resolve("help_formatter")
+    if formatter is None:
+        if is_terminal(stream):
+            return None
+        formatter = PlainFormatter()
+    elif type(formatter) is not PlainFormatter:
+        return None
+
+    help_format = stack.resolve("help_format", fallback=DEFAULT_FORMAT)
+    width = console_width(stream)
+    try:
+        out = []
+        for line in _help_lines(app, resolution, help_format, formatter, width):
+            out.extend(f"{wrapped.rstrip()}\n" for wrapped in _wrap(line, width))
+        return "".join(out)
+    except _UnsupportedError:
+        return None
+
+
+def errors_enabled(app: "App") -> bool:
+    """Whether errors of ``app`` are printed with :func:`error_panel`; must be called within its app stack."""
+    from cyclopts.help.formatters import PlainFormatter
+
+    stack = app.app_stack
+    if (
+        stack.resolve("_error_console") is not None
+        or stack.resolve("_console") is not None
+        or stack.resolve("error_formatter") is not None
+        or _rich_environment()
+    ):
+        return False
+    return type(stack.resolve("help_formatter")) is PlainFormatter or not is_terminal(sys.stderr)
+
+
+def error_panel(error: "CycloptsError") -> str | None:
+    """``CycloptsPanel(error)`` for stderr as a string; :obj:`None` if rich must render it."""
+    width = console_width(sys.stderr)
+    inner = width - 4
+    if inner < 1 or not (getattr(sys.stderr, "encoding", None) or "").lower().startswith("utf"):
+        return None
+
+    parts = []
+    for item in error._segments():
+        if not isinstance(item, tuple):
+            return None  # User-supplied rich Text.
+        parts.append(item[0])
+    try:
+        _check_narrow("".join(parts))
+        body = [line for text in "".join(parts).split("\n") for line in _wrap(text, inner)]
+    except _UnsupportedError:
+        return None
+
+    title = " Error "
+    lines = [f"╭─{title}{'─' * (width - 3 - len(title))}╮"]
+    lines.extend(f"│ {line.ljust(inner)} │" for line in body)
+    lines.append(f"╰{'─' * (width - 2)}╯")
+    return "".join(f"{line}\n" for line in lines)
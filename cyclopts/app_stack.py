@@ -1,5 +1,6 @@
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from contextlib import contextmanager
+from contextvars import ContextVar
 from itertools import chain
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
@@ -13,29 +14,63 @@ if TYPE_CHECKING:
 V = TypeVar("V")
 
 
+_Frames = tuple[list["App"], ...]
+_Overrides = tuple[dict[str, Any], ...]
+_State = tuple[_Frames, _Overrides, dict[str, Any] | None]
+
+# Per-invocation state of every :class:`AppStack` that currently has something pushed.
+# Scoping it to a ContextVar (rather than mutating lists on the AppStack itself) means
+# concurrent threads/asyncio-tasks parsing with the same App each see only their own frames.
+# The mapping is never mutated in-place; pushing builds a new one.
+# The third element memoizes derived properties for the duration of a single push.
+_state: ContextVar[dict["AppStack", _State] | None] = ContextVar("cyclopts_app_stack", default=None)
+
+
 class AppStack:
+    """Apps and overrides in effect for an :class:`.App` during parsing.
+
+    Frames are pushed by calling the stack as a context manager. :attr:`stack` and
+    :attr:`overrides_stack` are read-only tuples describing the current context (thread or
+    asyncio task); unlike the lists they used to be, they can't be modified in-place.
+    """
+
     def __init__(self, app):
         # the ``stack`` is guaranteed to have the self-referencing app at the top of the stack.
-        self.stack: list[list[App]] = [[app]]
-        # Stack of overrides passed to parse_args/call that should be propagated
-        self.overrides_stack: list[dict[str, Any]] = [{}]
+        self._base: _State = (([app],), ({},), None)
+
+    def _get_state(self) -> _State:
+        state = _state.get()
+        if state is None:
+            return self._base
+        return state.get(self, self._base)
+
+    @property
+    def stack(self) -> _Frames:
+        """Frames of resolved apps for the current context; the last frame is the active one. Read-only."""
+        return self._get_state()[0]
+
+    @property
+    def overrides_stack(self) -> _Overrides:
+        """Overrides passed to parse_args/call that should be propagated, for the current context. Read-only."""
+        return self._get_state()[1]
 
     @contextmanager
     def __call__(self, apps: Sequence["App"] | Sequence[str], overrides: dict[str, Any] | None = None):
         # set `overrides` default-values with current overrides so that they properly propagate down the call-stack.
         overrides = self.overrides | (overrides or {})
 
-        self.overrides_stack.append(overrides or {})
+        state = dict(_state.get() or {})
 
-        if not apps:
-            try:
-                yield
-            finally:
-                self.overrides_stack.pop()
-            return
+        def push(app_stack: AppStack, frame: list["App"] | None):
+            frames, overrides_frames, _ = state.get(app_stack, app_stack._base)
+            if frame is not None:
+                frames += (frame,)
+            state[app_stack] = (frames, overrides_frames + (overrides,), {})
+
+        push(self, None)
 
         # Convert strings to Apps if needed
-        if isinstance(apps[0], str):
+        if apps and isinstance(apps[0], str):
             str_apps = cast(Sequence[str], apps)
             _, apps_tuple, _ = self.stack[0][0].parse_commands(str_apps, include_parent_meta=True)
             resolved_apps: list[App] = list(apps_tuple)
@@ -43,13 +78,6 @@ class AppStack:
             resolved_apps = cast(list["App"], list(apps))
         del apps
 
-        if not resolved_apps:
-            try:
-                yield
-            finally:
-                self.overrides_stack.pop()
-            return
-
         so_far = []
         app_ids = {id(app) for app in resolved_apps}
         for app in resolved_apps:
@@ -59,9 +87,7 @@ class AppStack:
                     so_far.pop()
 
             so_far.append(app)
-            app.app_stack.stack.append(so_far.copy())
-            # Also push the overrides onto this app's stack
-            app.app_stack.overrides_stack.append(overrides or {})
+            push(app.app_stack, so_far.copy())
 
             # Also traverse the app's meta app
             meta_app = app
@@ -71,24 +97,13 @@ class AppStack:
                     continue
                 meta_subapps = so_far.copy()
                 meta_subapps.append(meta_app)
-                meta_app.app_stack.stack.append(meta_subapps)
-                # Also push the overrides onto the meta app's stack
-                meta_app.app_stack.overrides_stack.append(overrides or {})
+                push(meta_app.app_stack, meta_subapps)
+
+        token = _state.set(state)
         try:
             yield
         finally:
-            for app in resolved_apps:
-                app.app_stack.stack.pop()
-                app.app_stack.overrides_stack.pop()
-                # Also pop from meta apps
-                meta_app = app
-                while (meta_app := meta_app._meta) is not None:
-                    if id(meta_app) in app_ids:
-                        continue
-                    meta_app.app_stack.stack.pop()
-                    meta_app.app_stack.overrides_stack.pop()
-            # Pop overrides from stack
-            self.overrides_stack.pop()
+            _state.reset(token)
 
     @property
     def overrides(self) -> dict:
@@ -99,9 +114,22 @@ class AppStack:
                     out.setdefault(key, value)
         return out
 
+    def _memoized(self, name: str, func: Callable[[], V]) -> V:
+        memo = self._get_state()[2]
+        if memo is None:
+            return func()
+        try:
+            return memo[name]
+        except KeyError:
+            memo[name] = value = func()
+            return value
+
     @property
     def default_parameter(self) -> Parameter:
         """default_parameter has special resolution since it needs to include the command groups in the derivation."""
+        return self._memoized("default_parameter", self._default_parameter)
+
+    def _default_parameter(self) -> Parameter:
         cparams = []
         for child_app in chain.from_iterable(self.stack):
             if child_app._meta_parent:
@@ -159,6 +187,9 @@ class AppStack:
 
     @property
     def command_groups(self) -> list:
+        return self._memoized("command_groups", self._command_groups)
+
+    def _command_groups(self) -> list:
         command_app = self.current_frame[-1]
         try:
             current_app: App | None = self.current_frame[-2]
@@ -13,8 +13,9 @@ from typing import TYPE_CHECKING, Any, get_args, get_origin
 from attrs import define, field
 
 from cyclopts._convert import (
+    _cached,
     _validate_json_extra_keys,
-    convert,
+    compile_converter,
     create_empty_instance,
     instantiate_from_dict,
     token_count,
@@ -68,6 +69,22 @@ if TYPE_CHECKING:
     from cyclopts.argument._collection import ArgumentCollection
 
 
+class _ConverterPlans(dict):
+    """Compiled converters; closures can't be pickled, so they're dropped and recompiled on demand."""
+
+    def __reduce__(self):
+        return type(self), ()
+
+
+def _convert_compiled(plans: _ConverterPlans, name_transform: Callable[[str], str] | None, hint: Any, tokens):
+    """Drop-in for :func:`.convert` that reuses a compiled converter per ``(hint, name_transform)``."""
+    return _compile_plan(plans, name_transform, hint)(tokens)
+
+
+def _compile_plan(plans: _ConverterPlans, name_transform: Callable[[str], str] | None, hint: Any) -> Callable:
+    return _cached(plans, compile_converter, hint, None, name_transform)
+
+
 @define(kw_only=True)
 class Argument:
     """Encapsulates functionality and additional contextual information for parsing a parameter.
@@ -166,6 +183,13 @@ class Argument:
 
     _internal_converter: Callable | None = field(default=None, init=False, repr=False)
 
+    _converter_plans: _ConverterPlans = field(factory=_ConverterPlans, init=False, repr=False)
+    """Compiled converters (see :func:`.compile_converter`) per ``(hint, name_transform)``.
+
+    Filled when the argument is assembled, and shared by shallow copies, so an assembled
+    (and cached) argument compiles each hint once.
+    """
+
     _enum_flag_type: Any | None = field(default=None, init=False, repr=False)
 
     _union_branches: "list[tuple[Any, dict[str, FieldInfo]]]" = field(factory=list, init=False, repr=False)
@@ -410,17 +434,18 @@ class Argument:
             tokens = self.tokens
         if not tokens:
             return False
-        _, consume_all = self.token_count(keys)
-        if not consume_all:
-            return False
         if isinstance(tokens, Token):
             value = tokens.value
         elif isinstance(tokens, str):
             value = tokens
         else:
             value = tokens[0].value if isinstance(tokens[0], Token) else tokens[0]
+        # Cheap textual check first; this runs for every token during conversion.
         if not value.strip().startswith("["):
             return False
+        _, consume_all = self.token_count(keys)
+        if not consume_all:
+            return False
         if self.parameter.json_list is not None:
             return self.parameter.json_list
         for arg in get_args(self.hint) or (str,):
@@ -680,6 +705,27 @@ class Argument:
         else:
             return UNSET
 
+    def _compile_converters(self) -> None:
+        """Compile the converters :meth:`convert` will use, so that parsing doesn't have to."""
+        if not self.parse or self.parameter.converter or self.parameter.count:
+            return
+        if self._enum_flag_type:
+            hint = self._enum_flag_type
+        elif self.children:
+            return
+        elif self.field_info.kind is self.field_info.VAR_POSITIONAL:
+            hint = next(iter(get_args(self.hint)), None)
+        elif self.field_info.kind is self.field_info.VAR_KEYWORD and not self.keys:
+            hint = get_args(self.hint)[1] if len(get_args(self.hint)) == 2 else None
+        else:
+            hint = self.hint
+        if hint is None:
+            return
+        try:
+            _compile_plan(self._converter_plans, self.parameter.name_transform, hint)
+        except (TypeError, ValueError):  # Reported, with context, when the argument is converted.
+            pass
+
     def _convert(self, converter: Callable | None = None):
         from cyclopts.argument._collection import update_argument_collection
 
@@ -690,7 +736,7 @@ class Argument:
             else:
                 converter = self.parameter.converter
         elif converter is None:
-            converter = partial(convert, name_transform=self.parameter.name_transform)
+            converter = partial(_convert_compiled, self._converter_plans, self.parameter.name_transform)
 
         assert converter is not None  # Ensure converter is set at this point
 
@@ -748,8 +794,8 @@ class Argument:
                         yield token
 
             expanded_tokens = list(expand_tokens(self.tokens))
+            resolved_hint = resolve_optional(self.hint)
             for token in expanded_tokens:
-                resolved_hint = resolve_optional(self.hint)
                 if token.implicit_value is not UNSET and isinstance(
                     token.implicit_value, get_origin(resolved_hint) or resolved_hint
                 ):
@@ -4,6 +4,7 @@ import inspect
 import itertools
 import json
 from collections.abc import Callable, Iterable, Sequence
+from copy import copy
 from typing import TYPE_CHECKING, Any, SupportsIndex, TypeVar, overload
 
 if TYPE_CHECKING:
@@ -37,15 +38,197 @@ from .utils import (
 T = TypeVar("T")
 
 
+def _normalize_keyword(keyword: str) -> str:
+    # Mirrors ``utils.startswith``, which treats "_" and "-" as equivalent.
+    return keyword.replace("_", "-")
+
+
+def _fresh(implicit_value: Any) -> Any:
+    # Negatives like ``--empty-*`` imply an empty container; each match gets its own instance.
+    if implicit_value is UNSET or implicit_value is None or isinstance(implicit_value, bool):
+        return implicit_value
+    return type(implicit_value)()
+
+
+class _KeywordIndex:
+    """Resolves CLI keywords and positional indices to an :class:`Argument` of a collection.
+
+    Every positive name, alias, negative (e.g. ``--no-*``, ``--empty-*``) and short flag
+    is hashed in its normalized form, along with the implicit value it implies.
+    A keyword with dotted sub-keys (``--foo.bar.baz``) is resolved by probing each
+    ``"."``-delimited prefix, so a lookup costs ``O(len(term))``.
+    ``**kwargs`` dictionaries accept any keyword.
+
+    The index describes the arguments as they were when it was built;
+    :class:`ArgumentCollection` drops it whenever the collection is modified.
+    """
+
+    __slots__ = ("keywords", "catch_all", "indices", "var_positional")
+
+    def __init__(self, arguments: Sequence[Argument]):
+        # Normalized name -> (position, implicit value), in collection order.
+        self.keywords: dict[str, list[tuple[int, Any]]] = {}
+        self.catch_all: int | None = None
+        self.indices: dict[int, int] = {}
+        # (position, first index) of ``*args`` arguments.
+        self.var_positional: list[tuple[int, int]] = []
+
+        for position, argument in enumerate(arguments):
+            if not argument.parse:
+                continue
+
+            if argument.index is not None:
+                if argument.field_info.kind is argument.field_info.VAR_POSITIONAL:
+                    self.var_positional.append((position, argument.index))
+                else:
+                    self.indices.setdefault(argument.index, position)
+
+            if argument.field_info.kind is argument.field_info.VAR_KEYWORD and argument._accepts_arbitrary_keywords:
+                if self.catch_all is None:
+                    self.catch_all = position
+            elif argument.parameter.name:
+                for name in argument.names:
+                    try:
+                        _, implicit_value = argument.match(name)
+                    except ValueError:  # Shadowed by another name of this argument.
+                        continue
+                    entries = self.keywords.setdefault(_normalize_keyword(name), [])
+                    if not entries or entries[-1][0] != position:
+                        entries.append((position, implicit_value))
+
+    def match(self, arguments: Sequence[Argument], term: str | int) -> tuple[Argument, tuple[str, ...], Any]:
+        """:meth:`ArgumentCollection.match` of ``arguments`` (the indexed ones, or a clone) with default options."""
+        if isinstance(term, int):
+            return self._match_index(arguments, term)
+
+        normalized = _normalize_keyword(term)
+        if entries := self.keywords.get(normalized):
+            position, implicit_value = entries[0]
+            return arguments[position], (), _fresh(implicit_value)
+
+        # The longest dotted prefix leaves the fewest keys.
+        delimiter_index = normalized.rfind(".")
+        while delimiter_index > 0:
+            for position, implicit_value in self.keywords.get(normalized[:delimiter_index], ()):
+                argument = arguments[position]
+                if argument._accepts_arbitrary_keywords:
+                    keys = argument._normalize_trailing_keys(tuple(term[delimiter_index + 1 :].split(".")))
+                    return argument, keys, _fresh(implicit_value)
+            delimiter_index = normalized.rfind(".", 0, delimiter_index)
+
+        if self.catch_all is not None:
+            argument = arguments[self.catch_all]
+            return argument, argument._normalize_trailing_keys(tuple(term.lstrip("-").split("."))), UNSET
+
+        raise ValueError(f"No Argument matches {term!r}")
+
+    def _match_index(self, arguments: Sequence[Argument], term: int) -> tuple[Argument, tuple[str, ...], Any]:
+        positions = [position for position, first in self.var_positional if term >= first]
+        if (position := self.indices.get(term)) is not None:
+            positions.append(position)
+        if not positions:
+            raise ValueError(f"No Argument matches {term!r}")
+        return arguments[min(positions)], (), UNSET
+
+
 class ArgumentCollection(list[Argument]):
     """A list-like container for :class:`Argument`."""
 
     def __init__(self, *args):
         super().__init__(*args)
+        self._keyword_index: _KeywordIndex | None = None
+
+    @property
+    def _index(self) -> _KeywordIndex:
+        """Keyword index of the current arguments; built on first use and dropped by any modification."""
+        index = self._keyword_index
+        if index is None:
+            index = self._keyword_index = _KeywordIndex(self)
+        return index
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._keyword_index = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._keyword_index = None
+
+    def __iadd__(self, other):
+        self._keyword_index = None
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._keyword_index = None
+        return super().__imul__(other)
+
+    def append(self, argument: Argument):
+        super().append(argument)
+        self._keyword_index = None
+
+    def extend(self, arguments: Iterable[Argument]):
+        super().extend(arguments)
+        self._keyword_index = None
+
+    def insert(self, index: SupportsIndex, argument: Argument):
+        super().insert(index, argument)
+        self._keyword_index = None
+
+    def pop(self, index: SupportsIndex = -1) -> Argument:
+        self._keyword_index = None
+        return super().pop(index)
+
+    def remove(self, argument: Argument):
+        super().remove(argument)
+        self._keyword_index = None
+
+    def clear(self):
+        super().clear()
+        self._keyword_index = None
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._keyword_index = None
+
+    def reverse(self):
+        super().reverse()
+        self._keyword_index = None
 
     def copy(self) -> "ArgumentCollection":
         """Returns a shallow copy of the :class:`ArgumentCollection`."""
-        return type(self)(self)
+        out = type(self)(self)
+        out._keyword_index = self._keyword_index
+        return out
+
+    def _clone(self) -> "ArgumentCollection":
+        """Copy every :class:`Argument` with fresh per-parse state.
+
+        Static assembly data (``field_info``, ``parameter``, ``hint``, lookups) is shared;
+        ``tokens``, ``value`` and conversion marks are reset. ``children`` are remapped
+        onto the cloned arguments so the tree structure is preserved.
+        """
+        cls = type(self)
+        memo: dict[int, Argument] = {}
+
+        def clone(argument: Argument) -> Argument:
+            try:
+                return memo[id(argument)]
+            except KeyError:
+                pass
+            new = copy(argument)
+            memo[id(argument)] = new
+            new.tokens = []
+            new._value = UNSET
+            new._marked_converted = False
+            new._mark_converted_override = False
+            new.children = cls(clone(child) for child in argument.children)
+            new.children._keyword_index = argument.children._keyword_index
+            return new
+
+        out = cls(clone(argument) for argument in self)
+        # Positions are preserved, so the keyword index can be shared.
+        out._keyword_index = self._keyword_index
+        return out
 
     @overload
     def __getitem__(self, term: SupportsIndex, /) -> Argument: ...
@@ -201,8 +384,19 @@ class ArgumentCollection(list[Argument]):
         Any
             Implicit value (if a flag). :obj:`~.UNSET` otherwise.
         """
+        if transform is None and delimiter == ".":
+            return self._index.match(self, term)
+        return self._match(self, term, transform, delimiter)
+
+    @staticmethod
+    def _match(
+        arguments: Iterable[Argument],
+        term: str | int,
+        transform: Callable[[str], str] | None,
+        delimiter: str,
+    ) -> tuple[Argument, tuple[str, ...], Any]:
         best_match_argument, best_match_keys, best_implicit_value = None, None, UNSET
-        for argument in self:
+        for argument in arguments:
             try:
                 match_keys, implicit_value = argument.match(term, transform=transform, delimiter=delimiter)
             except ValueError:
@@ -520,6 +714,10 @@ class ArgumentCollection(list[Argument]):
                     argument.parameter, Parameter(name=argument.parameter.name + shorts)
                 )
 
+        out._keyword_index = _KeywordIndex(out)
+        for argument in out:
+            argument.children._keyword_index = None  # Short flags were added after children were collected.
+            argument._compile_converters()
         return out
 
     @property
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
 
 F = TypeVar("F", bound=Flag)
 
+from cyclopts import _docstring_index
 from cyclopts._convert import convert_enum_flag
 from cyclopts.annotations import (
     ITERABLE_TYPES,
@@ -293,11 +294,15 @@ def generate_short_alias(
 
 
 def extract_docstring_help(f: Callable) -> dict[tuple[str, ...], Parameter]:
-    from docstring_parser import parse_from_object
-
     with suppress(AttributeError):
         f = f.func  # pyright: ignore[reportFunctionMemberAccess]
 
+    return {path: Parameter(help=description) for path, description in _docstring_index.object_params(f, _param_docs)}
+
+
+def _param_docs(f: Callable) -> "_docstring_index.ParamDocs":
+    from docstring_parser import parse_from_object
+
     result = {}
 
     # For classes, walk through MRO  to include base class fields.
@@ -315,7 +320,7 @@ def extract_docstring_help(f: Callable) -> dict[tuple[str, ...], Parameter]:
             try:
                 parsed = parse_from_object(base_class)
                 for dparam in parsed.params:
-                    result[tuple(dparam.arg_name.split("."))] = Parameter(help=dparam.description)
+                    result[tuple(dparam.arg_name.split("."))] = dparam.description
             except (TypeError, AttributeError):
                 # Some base classes may not have parseable docstrings (e.g., built-in classes)
                 continue
@@ -324,12 +329,12 @@ def extract_docstring_help(f: Callable) -> dict[tuple[str, ...], Parameter]:
         try:
             parsed = parse_from_object(f)
             for dparam in parsed.params:
-                result[tuple(dparam.arg_name.split("."))] = Parameter(help=dparam.description)
+                result[tuple(dparam.arg_name.split("."))] = dparam.description
         except (TypeError, AttributeError):
             # parse_from_object may fail for some callables
             pass
 
-    return result
+    return list(result.items())
 
 
 def resolve_parameter_name_helper(elem):
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, NamedTuple
 from cyclopts._convert import _bool, create_empty_instance
 from cyclopts.annotations import resolve_optional
 from cyclopts.argument import Argument, ArgumentCollection
+from cyclopts.config._search import session as config_search_session
 from cyclopts.exceptions import (
     ArgumentOrderError,
     CoercionError,
@@ -24,6 +25,7 @@ from cyclopts.exceptions import (
 )
 from cyclopts.field_info import POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD
 from cyclopts.token import Token
+from cyclopts.tracing import span
 from cyclopts.utils import UNSET, is_option_like
 
 if sys.version_info < (3, 11):  # pragma: no cover
@@ -584,9 +586,12 @@ def _bind(
 
 
 def _parse_configs(argument_collection: ArgumentCollection, configs):
-    for config in configs:
-        # Each ``config`` is a partial that already has apps and commands provided.
-        config(argument_collection)
+    # Config files searched for by multiple sources share directory listings.
+    with config_search_session():
+        for config in configs:
+            # Each ``config`` is a partial that already has apps and commands provided.
+            with span("config", config=getattr(config, "func", config)):
+                config(argument_collection)
 
 
 def _sort_group(argument_collection) -> list[tuple["Group", ArgumentCollection]]:
@@ -636,27 +641,32 @@ def create_bound_arguments(
     unused_tokens = tokens
 
     try:
-        unused_tokens, contiguous_positional_count = _parse_kw_and_flags(
-            argument_collection, unused_tokens, end_of_options_delimiter=end_of_options_delimiter
-        )
-        unused_tokens = _parse_pos(
-            argument_collection,
-            unused_tokens,
-            end_of_options_delimiter=end_of_options_delimiter,
-            contiguous_positional_count=contiguous_positional_count,
-        )
-
-        _parse_env(argument_collection)
+        with span("parse_kw_and_flags"):
+            unused_tokens, contiguous_positional_count = _parse_kw_and_flags(
+                argument_collection, unused_tokens, end_of_options_delimiter=end_of_options_delimiter
+            )
+        with span("parse_pos"):
+            unused_tokens = _parse_pos(
+                argument_collection,
+                unused_tokens,
+                end_of_options_delimiter=end_of_options_delimiter,
+                contiguous_positional_count=contiguous_positional_count,
+            )
+
+        with span("parse_env"):
+            _parse_env(argument_collection)
         _parse_configs(argument_collection, configs)
 
-        argument_collection._convert()
-        groups_with_arguments = _sort_group(argument_collection)
-        try:
-            for group, group_arguments in groups_with_arguments:
-                for validator in group.validator:  # pyright: ignore
-                    validator(group_arguments)  # pyright: ignore[reportOptionalCall]
-        except (AssertionError, ValueError, TypeError) as e:
-            raise ValidationError(exception_message=e.args[0] if e.args else "", group=group) from e  # pyright: ignore
+        with span("convert"):
+            argument_collection._convert()
+        with span("group_validators"):
+            groups_with_arguments = _sort_group(argument_collection)
+            try:
+                for group, group_arguments in groups_with_arguments:
+                    for validator in group.validator:  # pyright: ignore
+                        validator(group_arguments)  # pyright: ignore[reportOptionalCall]
+            except (AssertionError, ValueError, TypeError) as e:
+                raise ValidationError(exception_message=e.args[0] if e.args else "", group=group) from e  # pyright: ignore
 
         for argument in argument_collection:
             # if a dict-like argument is missing, raise a MissingArgumentError on the first
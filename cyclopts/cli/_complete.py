@@ -1,7 +1,11 @@
 """Hidden completion helper command for dynamic shell completion."""
 
+import socket
+import sys
+from collections.abc import Iterator
+from contextlib import suppress
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 from cyclopts.cli import app
 from cyclopts.loader import load_app_from_script
@@ -35,8 +39,8 @@ def _extract_short_description(help_text: str | None) -> str:
         return str(help_text or "").split("\n")[0]
 
 
-def _print_subcommand_completions(app_obj: "App") -> None:
-    """Print completions for subcommands of the given app.
+def _iter_subcommand_completions(app_obj: "App") -> Iterator[str]:
+    """Yield completions for subcommands of the given app.
 
     Parameters
     ----------
@@ -52,14 +56,34 @@ def _print_subcommand_completions(app_obj: "App") -> None:
                     if not name.startswith("-"):
                         short_desc = _extract_short_description(registered_command.app.help)
 
-                        if short_desc:
-                            print(f"{name}:{short_desc}")
-                        else:
-                            print(name)
+                        yield f"{name}:{short_desc}" if short_desc else name
 
 
-def _print_option_completions(app_obj: "App") -> None:
-    """Print completions for options of the given app's default command.
+def _iter_manifest_completions(entry: dict[str, Any]) -> Iterator[str]:
+    """Yield subcommand and option completions from a manifest entry.
+
+    Parameters
+    ----------
+    entry : dict
+        Manifest entry of the current command; see :meth:`App.export_manifest`.
+    """
+    for command in entry["commands"].values():
+        if command["show"]:
+            short_desc = _extract_short_description(command["help"])
+            for name in command["names"]:
+                yield f"{name}:{short_desc}" if short_desc else name
+
+    for parameter in entry["parameters"]:
+        if parameter["positional_only"] or not parameter["show"]:
+            continue
+        desc = parameter["help"].split("\n")[0][:MAX_DESCRIPTION_LENGTH]
+        for name in parameter["names"] + parameter["negatives"]:
+            if name.startswith("-"):
+                yield f"{name}:{desc}" if desc else name
+
+
+def _iter_option_completions(app_obj: "App") -> Iterator[str]:
+    """Yield completions for options of the given app's default command.
 
     Parameters
     ----------
@@ -71,18 +95,164 @@ def _print_option_completions(app_obj: "App") -> None:
 
     try:
         arguments = app_obj.assemble_argument_collection(parse_docstring=True)
-        for argument in arguments:
-            if not argument.is_positional_only() and argument.show:
-                for name in argument.names:
-                    if name.startswith("-"):
-                        desc = argument.parameter.help or ""
-                        desc = desc.split("\n")[0][:MAX_DESCRIPTION_LENGTH]
-                        if desc:
-                            print(f"{name}:{desc}")
-                        else:
-                            print(name)
     except Exception:
-        pass
+        return
+    for argument in arguments:
+        if not argument.is_positional_only() and argument.show:
+            for name in argument.names:
+                if name.startswith("-"):
+                    desc = argument.parameter.help or ""
+                    desc = desc.split("\n")[0][:MAX_DESCRIPTION_LENGTH]
+                    yield f"{name}:{desc}" if desc else name
+
+
+def get_completions(app_obj: "App", words: list[str]) -> list[str]:
+    """Completion lines for the command line ``words`` of ``app_obj``.
+
+    Each line is either ``name`` or ``name:description``; the values of a
+    :attr:`.Parameter.completer` are returned with ``:`` escaped by a backslash.
+    Errors while resolving ``words`` yield no completions.
+
+    Parameters
+    ----------
+    app_obj : App
+        Loaded application object.
+    words : list[str]
+        Current command line words (excluding the script).
+
+    Returns
+    -------
+    list[str]
+        Completion lines.
+    """
+    # Complete from root app if no words or only empty string (initial completion)
+    if not words or (len(words) == 1 and not words[0]):
+        return _dynamic_completions(app_obj, words) or _app_completions(app_obj)
+
+    from cyclopts.manifest import find_manifest_entry
+
+    try:
+        entry = find_manifest_entry(app_obj, words)
+        # Completers are only available from the imported command.
+        if (entry is None or _manifest_has_completer(entry)) and (
+            values := _dynamic_completions(app_obj, words)
+        ) is not None:
+            return values
+        if entry is not None:
+            return list(_iter_manifest_completions(entry))
+        _, execution_path, _ = app_obj.parse_commands(words)
+        return _app_completions(execution_path[-1])
+    except Exception:
+        return []
+
+
+def _dynamic_completions(app_obj: "App", words: list[str]) -> list[str] | None:
+    """Values of the :attr:`.Parameter.completer` responsible for the last word, ``:``-escaped."""
+    from cyclopts.completion.completer import complete_value
+
+    with suppress(Exception):
+        if words and (values := complete_value(app_obj, words)) is not None:
+            return [value.replace(":", "\\:") for value in values]
+    return None
+
+
+def _manifest_has_completer(entry: dict[str, Any]) -> bool:
+    return any(parameter.get("completer") for parameter in entry["parameters"])
+
+
+def _app_completions(app_obj: "App") -> list[str]:
+    return [*_iter_subcommand_completions(app_obj), *_iter_option_completions(app_obj)]
+
+
+class _UncacheableError(Exception):
+    pass
+
+
+def _completion_tree(app_obj: "App") -> list[dict[str, Any]] | None:
+    """Completion lines of every command path of ``app_obj``, for :mod:`cyclopts.completion.cache`.
+
+    Lazy commands covered by a loaded manifest are described from the manifest; other
+    unresolved lazy commands are marked ``"unresolved"`` and filled in once a completion
+    request resolves them. Either way, nothing is imported. Apps registered under several
+    names are visited once. Returns :obj:`None` if the command resolution can't be
+    replayed from a plain name lookup (meta apps).
+    """
+    from cyclopts.command_spec import CommandSpec
+    from cyclopts.core import _resolve_command
+
+    nodes: list[dict[str, Any]] = []
+    visited: dict[int, int] = {}
+    empty: int | None = None
+
+    def add(node: dict[str, Any]) -> int:
+        nodes.append(node)
+        return len(nodes) - 1
+
+    def visit_entry(entry: dict[str, Any]) -> int:
+        index = add({"lines": list(_iter_manifest_completions(entry)), "commands": {}, "fuzzy": False})
+        if _manifest_has_completer(entry):
+            nodes[index]["dynamic"] = True
+        for child in entry["commands"].values():
+            child_index = visit_entry(child)
+            for name in child["names"]:
+                nodes[index]["commands"][name] = child_index
+        return index
+
+    def visit(app: "App") -> int:
+        nonlocal empty
+        if app._meta is not None or app._meta_parent is not None:
+            raise _UncacheableError
+        if (index := visited.get(id(app))) is not None:
+            return index
+        index = visited[id(app)] = add({"lines": _app_completions(app), "commands": {}})
+        if _has_completer(app):
+            nodes[index]["dynamic"] = True
+        for name, app_or_spec in app._command_lookup().mapping.items():
+            if isinstance(app_or_spec, CommandSpec) and not app_or_spec.is_resolved:
+                if (child_index := visited.get(id(app_or_spec))) is None:
+                    if app_or_spec._manifest is not None:
+                        child_index = visit_entry(app_or_spec._manifest)
+                    else:
+                        child_index = add({"lines": [], "commands": {}, "unresolved": True})
+                    visited[id(app_or_spec)] = child_index
+            else:
+                try:
+                    child_index = visit(_resolve_command(app_or_spec, app))
+                except _UncacheableError:
+                    raise
+                except Exception:
+                    # Unimportable command; in-process completion yields nothing either.
+                    if empty is None:
+                        empty = add({"lines": [], "commands": {}})
+                    child_index = empty
+            nodes[index]["commands"][name] = child_index
+        return index
+
+    try:
+        visit(app_obj)
+    except _UncacheableError:
+        return None
+    return nodes
+
+
+def _has_completer(app_obj: "App") -> bool:
+    """Whether any parameter of ``app_obj``'s default command has a :attr:`.Parameter.completer`."""
+    if not app_obj.default_command:
+        return False
+    try:
+        arguments = app_obj.assemble_argument_collection()
+    except Exception:
+        return False
+    return any(argument.parameter.completer is not None for argument in arguments)
+
+
+def _absolute_script(script: Path) -> str:
+    """``script`` with an absolute file part; ``':app_object'`` notation is kept."""
+    script_str = str(script)
+    if ":" in script_str and not script.exists():
+        file_part, app_name = script_str.rsplit(":", 1)
+        return f"{Path(file_part).absolute()}:{app_name}"
+    return str(script.absolute())
 
 
 @app.command(name="_complete", show=False)
@@ -109,22 +279,62 @@ def complete(
     if subcommand != "run":
         return
 
-    try:
-        app_obj, _ = load_app_from_script(script)
-    except (ImportError, SyntaxError, AttributeError, FileNotFoundError):
-        return
+    from cyclopts.completion import cache
 
     words_list = list(words) if words else []
+    script_str = _absolute_script(script)
 
-    # Complete from root app if no words or only empty string (initial completion)
-    if not words_list or (len(words_list) == 1 and not words_list[0]):
-        _print_subcommand_completions(app_obj)
-        _print_option_completions(app_obj)
-    else:
+    lines = None
+    if hasattr(socket, "AF_UNIX"):
+        from cyclopts.completion.daemon import request_completions
+
+        lines = request_completions(script_str, words_list)
+
+    if lines is None and cache.cache_enabled():
+        lines = cache.lookup(script_str, words_list)
+
+    if lines is None:
+        preexisting_modules = set(sys.modules)
         try:
-            _, execution_path, _ = app_obj.parse_commands(words_list)
-            current_app = execution_path[-1]
-            _print_subcommand_completions(current_app)
-            _print_option_completions(current_app)
-        except Exception:
-            pass
+            app_obj, _ = load_app_from_script(script)
+        except (ImportError, SyntaxError, AttributeError, FileNotFoundError):
+            return
+        lines = get_completions(app_obj, words_list)
+        if (
+            cache.cache_enabled()
+            and (not cache.is_valid(script_str) or cache.is_unresolved(script_str, words_list))
+            and (nodes := _completion_tree(app_obj)) is not None
+        ):
+            cache.store(script_str, nodes, preexisting_modules)
+
+    for line in lines:
+        print(line)
+
+
+@app.command(name="_complete_server", show=False)
+def complete_server(
+    *,
+    socket_file: Annotated[Path | None, Parameter(name="--socket")] = None,
+    idle_timeout: float = 900.0,
+) -> None:
+    """Resident completion daemon (hidden from users).
+
+    Keeps loaded scripts in memory and answers ``_complete run`` requests over a
+    Unix socket, so completion doesn't re-import the script on every TAB press.
+    Started automatically by ``_complete`` when ``CYCLOPTS_COMPLETE_DAEMON=1`` is set.
+
+    Parameters
+    ----------
+    socket_file : Path | None
+        Socket path. Defaults to ``$CYCLOPTS_COMPLETE_SOCKET`` or
+        ``cyclopts-<uid>/complete.sock`` in ``$XDG_RUNTIME_DIR``/``$TMPDIR``/``/tmp``.
+    idle_timeout : float
+        Exit after this many seconds without a request. ``0`` disables the timeout.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the completion daemon requires Unix domain sockets.", file=sys.stderr)
+        sys.exit(1)
+
+    from cyclopts.completion.daemon import serve
+
+    serve(socket_file, idle_timeout=idle_timeout or None)
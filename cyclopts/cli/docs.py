@@ -1,8 +1,11 @@
 """Generate documentation for Cyclopts applications."""
 
+import sys
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Annotated
 
+from cyclopts._cache import atomic_open
 from cyclopts.cli import app
 from cyclopts.docs.types import (
     FORMAT_ALIASES,
@@ -71,6 +74,8 @@ def generate_docs(
     include_hidden: bool = False,
     heading_level: int = 1,
     usage_name: str | None = None,
+    workers: int | None = None,
+    output_dir: Path | None = None,
 ):
     """Generate documentation for a Cyclopts application.
 
@@ -93,19 +98,41 @@ def generate_docs(
         Replace the app name shown in ``Usage:`` lines with this string. For
         example, ``"uv run cli"`` for an app whose runtime name is ``"cli"``.
         Headings and anchors are unaffected. Default is None.
+    workers : Optional[int]
+        Number of processes rendering the top-level commands in parallel.
+        Default is None (render in a single process).
+    output_dir : Optional[Path]
+        Write one file per command into this directory, along with a manifest
+        of content hashes. Subsequent runs only rewrite the files of commands
+        that changed. Mutually exclusive with ``output``.
     """
     if format is None:  # Handled by _format_group_validator
         raise ValueError("Must specify format.")
     format = normalize_format(format)
+    if output and output_dir:
+        raise ValueError('"--output" and "--output-dir" are mutually exclusive.')
     app_obj, _ = load_app_from_script(script)
-    docs_content = app_obj.generate_docs(
-        output_format=format,
-        include_hidden=include_hidden,
-        heading_level=heading_level,
-        usage_name=usage_name,
-    )
-
-    if output:
-        output.write_text(docs_content)
-    else:
-        print(docs_content)
+    if output_dir:
+        app_obj.write_docs(
+            output_dir,
+            format,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            usage_name=usage_name,
+            workers=workers,
+        )
+        return
+
+    # Stream sections to the destination as they are rendered.
+    # A file is written under a temporary name, so a failed build leaves the previous one intact.
+    with atomic_open(output) if output else nullcontext(sys.stdout) as f:
+        app_obj.generate_docs(
+            output_format=format,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            usage_name=usage_name,
+            workers=workers,
+            file=f,
+        )
+    if not output:
+        print()
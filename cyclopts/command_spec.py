@@ -1,6 +1,7 @@
 """Lazy-loadable command specification for deferred imports."""
 
 import importlib
+import threading
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
     from cyclopts.core import App
     from cyclopts.group import Group
 
+_resolve_lock = threading.RLock()
+
 
 @define
 class CommandSpec:
@@ -43,14 +46,53 @@ class CommandSpec:
     import_path: str
     name: str | tuple[str, ...] | None = None
     app_kwargs: dict[str, Any] = Factory(dict)
-    help: str | None = None
-    sort_key: Any = None
-    group: "Group | str | tuple[Group | str, ...] | None" = None
+    _help: str | None = field(default=None, alias="help")
+    _sort_key: Any = field(default=None, alias="sort_key")
+    _group: "Group | str | tuple[Group | str, ...] | None" = field(default=None, alias="group")
     _show: bool | None = field(default=None, alias="show")
 
+    _manifest: dict[str, Any] | None = field(init=False, default=None, repr=False)
+    """Manifest entry for this command; see :meth:`.App.load_manifest`.
+
+    Supplies ``help``, ``sort_key``, ``group`` and ``show`` when they were not
+    provided at registration, so that they are available without importing the command.
+    """
+
+    @property
+    def help(self) -> str | None:
+        if self._help is None and self._manifest is not None:
+            return self._manifest.get("help")
+        return self._help
+
+    @help.setter
+    def help(self, value: str | None):
+        self._help = value
+
+    @property
+    def sort_key(self) -> Any:
+        if self._sort_key is None and self._manifest is not None:
+            return self._manifest.get("sort_key")
+        return self._sort_key
+
+    @sort_key.setter
+    def sort_key(self, value: Any):
+        self._sort_key = value
+
+    @property
+    def group(self) -> "Group | str | tuple[Group | str, ...] | None":
+        if self._group is None and self._manifest is not None:
+            return tuple(self._manifest.get("group", ())) or None
+        return self._group
+
+    @group.setter
+    def group(self, value: "Group | str | tuple[Group | str, ...] | None"):
+        self._group = value
+
     @property
     def show(self) -> bool:
         if self._show is None:
+            if self._manifest is not None:
+                return self._manifest.get("show", True)
             return True
         return self._show
 
@@ -95,78 +137,85 @@ class CommandSpec:
         except ImportError as e:
             raise ImportError(f"Cannot import module {module_path!r} from {self.import_path!r}") from e
 
-        try:
-            target = getattr(module, attr_name)
-        except AttributeError as e:
-            raise AttributeError(
-                f"Module {module_path!r} has no attribute {attr_name!r} (from import path {self.import_path!r})"
-            ) from e
-
-        # Wrap in App if needed
-        from cyclopts.core import App
-
-        if isinstance(target, App):
-            # Validate that no kwargs were provided for App imports
-            if self.app_kwargs:
-                raise ValueError(
-                    f"Cannot apply configuration to imported App. "
-                    f"Import path {self.import_path!r} resolves to an App, "
-                    f"but kwargs were specified: {self.app_kwargs!r}. "
-                    f"Configure the App in its definition instead."
-                )
-
-            # Validate that the App's name matches the expected CLI command name
-            # The name used for CLI registration is stored in self.name
-            if self.name is not None and target.name[0] != self.name:
-                raise ValueError(
-                    f"Imported App name mismatch. "
-                    f"Import path {self.import_path!r} resolves to an App with name={target.name[0]!r}, "
-                    f"but it was registered with CLI command name={self.name!r}. "
-                    f"Either use app.command('{self.import_path}', name='{target.name[0]}') "
-                    f"or change the App's name to match."
-                )
-
-            # Copy parent groups if not set (matches direct App registration behavior)
-            from cyclopts.core import _apply_parent_defaults_to_app
-
-            _apply_parent_defaults_to_app(target, parent_app)
-
-            self._resolved = target
-        else:
-            # It's a function - wrap it in an App with parent defaults
-            # Match the behavior of direct function registration
-            app_kwargs = dict(self.app_kwargs)  # Copy to avoid mutating
-
-            from cyclopts.core import _apply_parent_groups_to_kwargs
-
-            app_kwargs.setdefault("help_flags", parent_app.help_flags)
-            app_kwargs.setdefault("version_flags", parent_app.version_flags)
-            if "version" not in app_kwargs and parent_app.version is not None:
-                app_kwargs["version"] = parent_app.version
-
-            _apply_parent_groups_to_kwargs(app_kwargs, parent_app)
-
-            self._resolved = App(name=self.name, **app_kwargs)
-            self._resolved.default(target)
-
-        # Apply registration-time overrides to the resolved App
-        if self.help is not None:
-            self._resolved.help = self.help
-        if self.sort_key is not None:
-            self._resolved.sort_key = self.sort_key
-        if self.group is not None:
-            self._resolved.group = self.group
-        if self._show is not None:
-            self._resolved.show = self._show
-        if self._resolved._name_transform is None:
-            self._resolved.name_transform = parent_app.name_transform
-
-        # Hide help and version flags from subapp help output
-        # This matches the behavior of direct App/function registration in core.py
-        for flag in chain(self._resolved.help_flags, self._resolved.version_flags):
-            self._resolved[flag].show = False
-
-        return self._resolved
+        # Imports are thread-safe on their own; the lock makes the App wiring below happen once,
+        # and publishes ``_resolved`` only when it is fully configured.
+        with _resolve_lock:
+            if self._resolved is not None:
+                return self._resolved
+
+            try:
+                target = getattr(module, attr_name)
+            except AttributeError as e:
+                raise AttributeError(
+                    f"Module {module_path!r} has no attribute {attr_name!r} (from import path {self.import_path!r})"
+                ) from e
+
+            # Wrap in App if needed
+            from cyclopts.core import App
+
+            if isinstance(target, App):
+                # Validate that no kwargs were provided for App imports
+                if self.app_kwargs:
+                    raise ValueError(
+                        f"Cannot apply configuration to imported App. "
+                        f"Import path {self.import_path!r} resolves to an App, "
+                        f"but kwargs were specified: {self.app_kwargs!r}. "
+                        f"Configure the App in its definition instead."
+                    )
+
+                # Validate that the App's name matches the expected CLI command name
+                # The name used for CLI registration is stored in self.name
+                if self.name is not None and target.name[0] != self.name:
+                    raise ValueError(
+                        f"Imported App name mismatch. "
+                        f"Import path {self.import_path!r} resolves to an App with name={target.name[0]!r}, "
+                        f"but it was registered with CLI command name={self.name!r}. "
+                        f"Either use app.command('{self.import_path}', name='{target.name[0]}') "
+                        f"or change the App's name to match."
+                    )
+
+                # Copy parent groups if not set (matches direct App registration behavior)
+                from cyclopts.core import _apply_parent_defaults_to_app
+
+                _apply_parent_defaults_to_app(target, parent_app)
+
+                resolved = target
+            else:
+                # It's a function - wrap it in an App with parent defaults
+                # Match the behavior of direct function registration
+                app_kwargs = dict(self.app_kwargs)  # Copy to avoid mutating
+
+                from cyclopts.core import _apply_parent_groups_to_kwargs
+
+                app_kwargs.setdefault("help_flags", parent_app.help_flags)
+                app_kwargs.setdefault("version_flags", parent_app.version_flags)
+                if "version" not in app_kwargs and parent_app.version is not None:
+                    app_kwargs["version"] = parent_app.version
+
+                _apply_parent_groups_to_kwargs(app_kwargs, parent_app)
+
+                resolved = App(name=self.name, **app_kwargs)
+                resolved.default(target)
+
+            # Apply registration-time overrides to the resolved App
+            if self._help is not None:
+                resolved.help = self._help
+            if self._sort_key is not None:
+                resolved.sort_key = self._sort_key
+            if self._group is not None:
+                resolved.group = self._group
+            if self._show is not None:
+                resolved.show = self._show
+            if resolved._name_transform is None:
+                resolved.name_transform = parent_app.name_transform
+
+            # Hide help and version flags from subapp help output
+            # This matches the behavior of direct App/function registration in core.py
+            for flag in chain(resolved.help_flags, resolved.version_flags):
+                resolved[flag].show = False
+
+            self._resolved = resolved
+        return resolved
 
     @property
     def is_resolved(self) -> bool:
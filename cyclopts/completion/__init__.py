@@ -1,9 +1,11 @@
 """Shell completion generation for Cyclopts applications."""
 
+from cyclopts.completion.completer import Completer
 from cyclopts.completion.detect import ShellDetectionError, detect_shell
 from cyclopts.completion.install import add_to_rc_file, get_default_completion_path
 
 __all__ = [
+    "Completer",
     "detect_shell",
     "ShellDetectionError",
     "get_default_completion_path",
@@ -3,24 +3,30 @@
 Provides data extraction, type analysis, and text processing utilities.
 """
 
+import hashlib
 import os
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, get_args, get_origin
 
-from attrs import field
+from attrs import evolve, field
 
-from cyclopts.annotations import ITERABLE_TYPES, is_annotated, is_union
+from cyclopts.annotations import ITERABLE_TYPES, is_annotated, is_iterable_type, is_union
 from cyclopts.argument import ArgumentCollection
+from cyclopts.command_spec import CommandSpec
 from cyclopts.exceptions import CycloptsError
 from cyclopts.field_info import VAR_KEYWORD
 from cyclopts.group_extractors import RegisteredCommand, groups_from_app
+from cyclopts.help.cache import _stable_repr
 from cyclopts.utils import frozen, is_class_and_subclass
 
 if TYPE_CHECKING:
     from cyclopts import App
+    from cyclopts.argument import Argument
 
 
 class CompletionAction(Enum):
@@ -29,6 +35,8 @@ class CompletionAction(Enum):
     NONE = "none"
     FILES = "files"
     DIRECTORIES = "directories"
+    CALLBACK = "callback"
+    """Ask the program for the values of a :attr:`.Parameter.completer` (see :mod:`.completer`)."""
 
 
 @frozen
@@ -62,64 +70,62 @@ class CompletionData:
     own_arguments: "ArgumentCollection" = field(factory=ArgumentCollection)
 
 
-def extract_completion_data(app: "App") -> dict[tuple[str, ...], CompletionData]:
+def extract_completion_data(
+    app: "App",
+    *,
+    workers: int | None = None,
+    cache: dict[tuple[str, ...], tuple[str, CompletionData]] | None = None,
+) -> dict[tuple[str, ...], CompletionData]:
     """Recursively extract completion data for app and all subcommands.
 
+    The command tree is descended once; each command's execution path is derived
+    from its parent's instead of re-parsing the command path from the root.
+
     Parameters
     ----------
     app : App
         The Cyclopts application to extract completion data from.
+    workers : int | None
+        If set, the unresolved lazy commands of each command are imported
+        concurrently by a thread pool of this many workers.
+    cache : dict | None
+        Result of a previous extraction of ``app``; updated in-place. Maps each
+        command path to ``(fingerprint, data)``. The fingerprint hashes the
+        definitions of the command and its ancestors and the names/help of its
+        subcommands. Command paths with an unchanged fingerprint reuse their
+        cached data, so after changing one command only its subtree is re-extracted.
 
     Returns
     -------
     dict[tuple[str, ...], CompletionData]
         Mapping from command path tuples to their completion data.
     """
+    from cyclopts.core import _meta_parents, _resolve_command
+
     completion_data: dict[tuple[str, ...], CompletionData] = {}
+    previous = {} if cache is None else dict(cache)
+    if cache is not None:
+        cache.clear()
+    executor = ThreadPoolExecutor(max_workers=workers) if workers else None
+
+    def _failed(command_path: tuple[str, ...], e: Exception):
+        if os.environ.get("CYCLOPTS_COMPLETION_DEBUG"):
+            raise
+        warnings.warn(f"Failed to extract completion data for command path {command_path!r}: {e}", stacklevel=3)
+        help_format = app.app_stack.resolve("help_format", fallback="markdown")
+        completion_data[command_path] = CompletionData(
+            arguments=ArgumentCollection(), commands=[], help_format=help_format
+        )
 
-    def _extract(command_path: tuple[str, ...] = ()):
-        """Recursively extract completion data for command and subcommands."""
-        try:
-            _, execution_path, _ = app.parse_commands(list(command_path))
-            command_app = execution_path[-1]
-        except (CycloptsError, ValueError, TypeError) as e:
-            if os.environ.get("CYCLOPTS_COMPLETION_DEBUG"):
-                raise
-            warnings.warn(f"Failed to extract completion data for command path {command_path!r}: {e}", stacklevel=2)
-            help_format = app.app_stack.resolve("help_format", fallback="markdown")
-            completion_data[command_path] = CompletionData(
-                arguments=ArgumentCollection(), commands=[], help_format=help_format
-            )
-            return
-
-        from cyclopts.core import _iter_resolution_argument_collections, _walk_metas
-
-        # Classify each contributing app's arguments by provenance (see
-        # ``CompletionData`` for what ``launcher_arguments``/``own_arguments``
-        # mean to the shell generators):
-        #   * inherited -- an ancestor path's meta launcher; already consumed, skip.
-        #   * launcher  -- this path's own meta-app default (``_meta_parent`` set).
-        #   * own       -- this path's plain ``@app.default``.
-        current = list(_walk_metas(command_app))
-        arguments = ArgumentCollection()
-        launcher_arguments = ArgumentCollection()
-        own_arguments = ArgumentCollection()
-        with app.app_stack(execution_path):
-            for subapp, app_arguments in _iter_resolution_argument_collections(execution_path, parse_docstring=True):
-                # ``**kwargs`` accepts arbitrary option names, so no per-option spec can
-                # represent it; its ``--[KEYWORD]`` placeholder name is invalid shell
-                # syntax (zsh's ``_arguments`` aborts on it, breaking completion for the
-                # entire command).
-                app_arguments = ArgumentCollection(
-                    argument for argument in app_arguments if argument.field_info.kind is not VAR_KEYWORD
-                )
-                arguments.extend(app_arguments)
-                if not any(subapp is a for a in current):
-                    continue  # inherited (ancestor meta launcher)
-                if subapp._meta_parent is not None:
-                    launcher_arguments.extend(app_arguments)  # this path's meta launcher
-                else:
-                    own_arguments.extend(app_arguments)  # plain @app.default
+    def _extract(command_path: tuple[str, ...], execution_path: tuple["App", ...], parent_fingerprint: str):
+        """Extract completion data for ``command_path``, then descend into its subcommands.
+
+        ``parent_fingerprint`` covers the definitions of every ancestor; a node's cache
+        key additionally covers its own definition and its subcommand listing.
+        """
+        command_app = execution_path[-1]
+        if executor is not None:
+            _resolve_lazy_commands(command_app, executor)
 
         commands = []
         for group, registered_commands in groups_from_app(command_app, resolve_lazy=True):
@@ -128,25 +134,323 @@ def extract_completion_data(app: "App") -> dict[tuple[str, ...], CompletionData]
                     if registered_command.app.show and registered_command not in commands:
                         commands.append(registered_command)
 
-        help_format = command_app.app_stack.resolve("help_format", fallback="markdown")
-
-        completion_data[command_path] = CompletionData(
-            arguments=arguments,
-            commands=commands,
-            help_format=help_format,
-            launcher_arguments=launcher_arguments,
-            own_arguments=own_arguments,
-        )
+        fingerprint = ""
+        if cache is None:
+            data = _extract_command(app, execution_path, commands)
+        else:
+            fingerprint = _fingerprint(parent_fingerprint, _definition(execution_path))
+            key = _fingerprint(fingerprint, _listing(commands))
+            cached = previous.get(command_path)
+            if cached is not None and cached[0] == key:
+                data = evolve(cached[1], commands=commands)
+            else:
+                data = _extract_command(app, execution_path, commands)
+            cache[command_path] = (key, data)
+        completion_data[command_path] = data
 
         for registered_command in commands:
             for cmd_name in registered_command.names:
-                if not cmd_name.startswith("-"):
-                    _extract(command_path + (cmd_name,))
-
-    _extract()
+                if cmd_name.startswith("-"):
+                    continue
+                child_path = command_path + (cmd_name,)
+                app_or_spec = command_app._command_lookup().match(cmd_name)
+                if app_or_spec is None:  # pragma: no cover
+                    continue
+                try:
+                    child = _resolve_command(app_or_spec, command_app)
+                except (CycloptsError, ValueError, TypeError) as e:
+                    _failed(child_path, e)
+                    continue
+                _extract(child_path, (*execution_path, *_meta_parents(child), child), fingerprint)
+
+    try:
+        try:
+            _, root_path, _ = app.parse_commands([])
+        except (CycloptsError, ValueError, TypeError) as e:
+            _failed((), e)
+        else:
+            _extract((), root_path, "")
+    finally:
+        if executor is not None:
+            executor.shutdown()
     return completion_data
 
 
+def _resolve_lazy_commands(app: "App", executor: ThreadPoolExecutor):
+    """Resolve (import) the unresolved lazy commands of ``app`` concurrently.
+
+    Failures are left for :func:`.groups_from_app` to raise in the calling thread.
+    """
+    names = {}
+    for name in app:
+        cmd = app._get_item(name)
+        if isinstance(cmd, CommandSpec) and not cmd.is_resolved:
+            names.setdefault(id(cmd), name)
+    if len(names) < 2:
+        return
+
+    def resolve(name: str):
+        with suppress(Exception):
+            app[name]
+
+    list(executor.map(resolve, names.values()))
+
+
+def _callable_fingerprint(command: Any) -> tuple:
+    code = getattr(command, "__code__", None)
+    if code is None:
+        return (_stable_repr(command),)
+    return (
+        command.__module__,
+        command.__qualname__,
+        code.co_code,
+        code.co_consts,
+        code.co_names,
+        command.__doc__,
+        command.__defaults__,
+        command.__kwdefaults__,
+        command.__annotations__,
+    )
+
+
+def _definition(execution_path: tuple["App", ...]) -> list[tuple]:
+    """Definition of each app contributing parameters to the command at the end of ``execution_path``."""
+    return [
+        (
+            _callable_fingerprint(subapp.default_command) if subapp.default_command else None,
+            subapp.help,
+            subapp.help_format,
+            subapp.default_parameter,
+            subapp.group_arguments,
+            subapp.group_parameters,
+            subapp.help_flags,
+            subapp.version_flags,
+        )
+        for subapp in execution_path[-1]._get_resolution_context(execution_path)
+    ]
+
+
+def _listing(commands: list[RegisteredCommand]) -> list[tuple]:
+    """Names, help and groups of the subcommands offered at a command path."""
+    return [(cmd.names, cmd.app.help, cmd.app.group) for cmd in commands]
+
+
+def _fingerprint(parent: str, content: Any) -> str:
+    return hashlib.sha256(f"{parent}\0{_stable_repr(content)}".encode()).hexdigest()
+
+
+def _extract_command(
+    app: "App",
+    execution_path: tuple["App", ...],
+    commands: list[RegisteredCommand],
+) -> CompletionData:
+    from cyclopts.core import _iter_resolution_argument_collections, _walk_metas
+
+    command_app = execution_path[-1]
+
+    # Classify each contributing app's arguments by provenance (see
+    # ``CompletionData`` for what ``launcher_arguments``/``own_arguments``
+    # mean to the shell generators):
+    #   * inherited -- an ancestor path's meta launcher; already consumed, skip.
+    #   * launcher  -- this path's own meta-app default (``_meta_parent`` set).
+    #   * own       -- this path's plain ``@app.default``.
+    current = list(_walk_metas(command_app))
+    arguments = ArgumentCollection()
+    launcher_arguments = ArgumentCollection()
+    own_arguments = ArgumentCollection()
+    with app.app_stack(execution_path):
+        for subapp, app_arguments in _iter_resolution_argument_collections(execution_path, parse_docstring=True):
+            # ``**kwargs`` accepts arbitrary option names, so no per-option spec can
+            # represent it; its ``--[KEYWORD]`` placeholder name is invalid shell
+            # syntax (zsh's ``_arguments`` aborts on it, breaking completion for the
+            # entire command).
+            app_arguments = ArgumentCollection(
+                argument for argument in app_arguments if argument.field_info.kind is not VAR_KEYWORD
+            )
+            arguments.extend(app_arguments)
+            if not any(subapp is a for a in current):
+                continue  # inherited (ancestor meta launcher)
+            if subapp._meta_parent is not None:
+                launcher_arguments.extend(app_arguments)  # this path's meta launcher
+            else:
+                own_arguments.extend(app_arguments)  # plain @app.default
+
+    help_format = command_app.app_stack.resolve("help_format", fallback="markdown")
+
+    return CompletionData(
+        arguments=arguments,
+        commands=commands,
+        help_format=help_format,
+        launcher_arguments=launcher_arguments,
+        own_arguments=own_arguments,
+    )
+
+
+@frozen
+class ValueCompletion:
+    """How to complete a single value (an option's argument or a positional slot).
+
+    Attributes
+    ----------
+    action : CompletionAction
+        Shell completion action; only used when ``choices`` is empty.
+    choices : tuple[str, ...]
+        Cleaned (not shell-escaped) choice strings.
+    """
+
+    action: CompletionAction = CompletionAction.NONE
+    choices: tuple[str, ...] = ()
+
+
+@frozen
+class CompletionNode:
+    """A single command path of a :func:`build_completion_table` table.
+
+    All text is plain (not shell-escaped).
+
+    Attributes
+    ----------
+    commands : dict[str, int]
+        Subcommand name to node index. Option-like commands are in ``options`` instead.
+    command_help : dict[str, str]
+        Subcommand name to short description.
+    options : dict[str, str]
+        Option name (including negatives, help/version flags and option-like
+        commands) to short description.
+    option_values : dict[str, ValueCompletion]
+        Options that consume a value.
+    positionals : tuple[ValueCompletion, ...]
+        Completion of each positional slot, in order.
+    rest : ValueCompletion | None
+        Completion of every slot past ``positionals`` (iterable or ``*args`` positional).
+    """
+
+    commands: dict[str, int]
+    command_help: dict[str, str]
+    options: dict[str, str]
+    option_values: dict[str, ValueCompletion]
+    positionals: tuple[ValueCompletion, ...] = ()
+    rest: ValueCompletion | None = None
+
+
+def encode_value_completion(value: ValueCompletion) -> str:
+    """Encode a :class:`ValueCompletion` as a single table string.
+
+    ``"f"`` (files), ``"d"`` (directories), ``"c"`` (call back into the
+    program), ``"n"`` (nothing), or ``"w"`` followed by the newline-separated choices.
+    """
+    if value.choices:
+        return "w" + "\n".join(value.choices)
+    if value.action == CompletionAction.FILES:
+        return "f"
+    if value.action == CompletionAction.DIRECTORIES:
+        return "d"
+    if value.action == CompletionAction.CALLBACK:
+        return "c"
+    return "n"
+
+
+def _value_completion(argument) -> ValueCompletion:
+    choices = completion_choices(argument)
+    if choices:
+        return ValueCompletion(choices=tuple(clean_choice_text(c) for c in choices))
+    return ValueCompletion(action=completion_action(argument))
+
+
+def _app_description(cmd_app, help_format: str) -> str:
+    from cyclopts.help.help import docstring_parse
+
+    try:
+        text = docstring_parse(cmd_app.help, "plaintext").short_description or ""
+    except Exception:
+        text = str(cmd_app.help or "")
+    return strip_markup(text, format=help_format)
+
+
+def build_completion_table(
+    completion_data: dict[tuple[str, ...], CompletionData],
+    help_flags: tuple[str, ...] = (),
+    version_flags: tuple[str, ...] = (),
+) -> list[CompletionNode]:
+    """Flatten extracted completion data into an indexed command tree.
+
+    Table-driven completion scripts store every node in shell lookup tables
+    keyed by ``"<node index> <word>"``, so resolving the command path on each
+    TAB press costs one lookup per typed word, independent of the number of
+    commands.
+
+    Parameters
+    ----------
+    completion_data : dict[tuple[str, ...], CompletionData]
+        Output of :func:`extract_completion_data`.
+    help_flags : tuple[str, ...]
+        Help flag names, offered at every node.
+    version_flags : tuple[str, ...]
+        Version flag names, offered at every node.
+
+    Returns
+    -------
+    list[CompletionNode]
+        Nodes; the root command is at index 0.
+    """
+    index = {path: i for i, path in enumerate(completion_data)}
+    nodes = []
+    for path, data in completion_data.items():
+        commands, command_help, options = {}, {}, {}
+        for argument in data.arguments:
+            if argument.is_positional_only() or not argument.show:
+                continue
+            description = strip_markup(argument.parameter.help or "", format=data.help_format)
+            for name in (*(argument.parameter.name or ()), *argument.negatives):
+                if name.startswith("-"):
+                    options.setdefault(name, description)
+        for registered_command in data.commands:
+            description = _app_description(registered_command.app, data.help_format)
+            for name in registered_command.names:
+                if name.startswith("-"):
+                    options.setdefault(name, description)
+                elif path + (name,) in index:
+                    commands[name] = index[path + (name,)]
+                    command_help[name] = description
+        for flag in help_flags:
+            if flag.startswith("-"):
+                options.setdefault(flag, "Display this message and exit.")
+        for flag in version_flags:
+            if flag.startswith("-"):
+                options.setdefault(flag, "Display application version.")
+
+        option_values = {}
+        for argument in data.arguments:
+            if argument.is_flag():
+                continue
+            for name in argument.parameter.name or ():
+                if name.startswith("-"):
+                    option_values.setdefault(name, _value_completion(argument))
+
+        # Inherited (ancestor-meta) positionals were consumed before this path's command name.
+        positional_args = sorted(
+            (arg for arg in (*data.launcher_arguments, *data.own_arguments) if arg.index is not None and arg.show),
+            key=lambda a: a.index or 0,
+        )
+        # An iterable positional greedily consumes every remaining slot; prefer the actual ``*args``.
+        rest_idx = next((i for i, arg in enumerate(positional_args) if arg.is_var_positional()), None)
+        if rest_idx is None:
+            rest_idx = next((i for i, arg in enumerate(positional_args) if is_iterable_type(arg.hint)), None)
+        head = positional_args if rest_idx is None else positional_args[:rest_idx]
+
+        nodes.append(
+            CompletionNode(
+                commands=commands,
+                command_help=command_help,
+                options=options,
+                option_values=option_values,
+                positionals=tuple(_value_completion(arg) for arg in head),
+                rest=None if rest_idx is None else _value_completion(positional_args[rest_idx]),
+            )
+        )
+    return nodes
+
+
 def get_completion_action(type_hint: Any) -> CompletionAction:
     """Get completion action from type hint.
 
@@ -188,6 +492,24 @@ def get_completion_action(type_hint: Any) -> CompletionAction:
     return CompletionAction.NONE
 
 
+def completion_action(argument: "Argument") -> CompletionAction:
+    """Completion action for the values of ``argument``.
+
+    :attr:`~CompletionAction.CALLBACK` if it has a :attr:`.Parameter.completer`,
+    otherwise derived from its type hint by :func:`get_completion_action`.
+    """
+    if argument.parameter.completer is not None:
+        return CompletionAction.CALLBACK
+    return get_completion_action(argument.hint)
+
+
+def completion_choices(argument: "Argument") -> tuple[str, ...] | None:
+    """Static choices for the values of ``argument``; :obj:`None` if it has a :attr:`.Parameter.completer`."""
+    if argument.parameter.completer is not None:
+        return None
+    return argument.get_choices(force=True)
+
+
 def clean_choice_text(text: str) -> str:
     """Clean choice text without shell-specific escaping.
 
@@ -1,7 +1,8 @@
 """Bash completion script generator.
 
 Generates static bash completion scripts using COMPREPLY and compgen.
-Targets bash 3.2+ with no external dependencies.
+Targets bash 3.2+ with no external dependencies; table-driven scripts
+(``table=True``) need bash 4.2+ for global associative arrays.
 """
 
 import re
@@ -11,17 +12,29 @@ from cyclopts.annotations import is_iterable_type
 from cyclopts.completion._base import (
     CompletionAction,
     CompletionData,
+    build_completion_table,
     clean_choice_text,
+    completion_action,
+    completion_choices,
+    encode_value_completion,
     escape_for_shell_pattern,
     extract_completion_data,
-    get_completion_action,
 )
 
 if TYPE_CHECKING:
     from cyclopts import App
 
+# Re-runs the program to print the values of a ``Parameter.completer``; see :mod:`.completer`.
+_CALLBACK = '_CYCLOPTS_COMPLETE=bash "${COMP_WORDS[0]}" "${COMP_WORDS[@]:1:COMP_CWORD}"'
 
-def generate_completion_script(app: "App", prog_name: str) -> str:
+
+def generate_completion_script(
+    app: "App",
+    prog_name: str,
+    *,
+    table: bool = False,
+    workers: int | None = None,
+) -> str:
     """Generate bash completion script.
 
     Parameters
@@ -30,6 +43,10 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
         The Cyclopts application to generate completion for.
     prog_name : str
         Program name (alphanumeric with hyphens/underscores).
+    table : bool
+        Emit a table-driven script (see :func:`_generate_table_script`).
+    workers : int | None
+        Import lazy commands with a thread pool of this size; see :func:`.extract_completion_data`.
 
     Returns
     -------
@@ -45,7 +62,10 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
         raise ValueError(f"Invalid prog_name: {prog_name!r}. Must be alphanumeric with hyphens/underscores.")
 
     func_name = prog_name.replace("-", "_")
-    completion_data = extract_completion_data(app)
+    completion_data = extract_completion_data(app, workers=workers, cache=app._completion_cache)
+
+    if table:
+        return _generate_table_script(app, completion_data, prog_name, func_name)
 
     lines = [
         f"# Bash completion for {prog_name}",
@@ -118,6 +138,36 @@ def _escape_bash_description(text: str) -> str:
     return text
 
 
+def _emit_action_completion(action: CompletionAction, indent: str) -> list[str]:
+    """Emit bash that completes ``$cur`` according to ``action``.
+
+    :attr:`~.CompletionAction.CALLBACK` re-runs the program with the words typed so
+    far and the ``_CYCLOPTS_COMPLETE`` environment variable set; the program prints
+    the values of the responsible :attr:`.Parameter.completer`, one per line.
+
+    Parameters
+    ----------
+    action : CompletionAction
+        Completion action type.
+    indent : str
+        Indentation prefix.
+
+    Returns
+    -------
+    list[str]
+        Bash code lines.
+    """
+    if action == CompletionAction.CALLBACK:
+        return [
+            f"{indent}COMPREPLY=()",
+            f'{indent}while IFS= read -r _x; do COMPREPLY+=("$_x"); done < <({_CALLBACK} 2>/dev/null)',
+        ]
+    compgen_flag = _map_completion_action_to_bash(action)
+    if compgen_flag:
+        return [f'{indent}COMPREPLY=( $(compgen {compgen_flag} -- "${{cur}}") )']
+    return [f"{indent}COMPREPLY=()"]
+
+
 def _map_completion_action_to_bash(action: CompletionAction) -> str:
     """Map completion action to bash compgen flags.
 
@@ -464,14 +514,11 @@ def _generate_positional_completion(positional_args, indent: str) -> list[str]:
     lines = []
 
     def _emit_one(argument, body_indent: str) -> list[str]:
-        choices = argument.get_choices(force=True)
+        choices = completion_choices(argument)
         if choices:
             cleaned = [clean_choice_text(c) for c in choices]
             return _emit_choice_completion(cleaned, body_indent)
-        compgen_flag = _map_completion_action_to_bash(get_completion_action(argument.hint))
-        if compgen_flag:
-            return [f'{body_indent}COMPREPLY=( $(compgen {compgen_flag} -- "${{cur}}") )']
-        return [f"{body_indent}COMPREPLY=()"]
+        return _emit_action_completion(completion_action(argument), body_indent)
 
     # An iterable positional (``list[X]``, ``set[X]``, or ``*args``) greedily
     # consumes all remaining positions starting at its index. The args that
@@ -579,8 +626,8 @@ def _generate_value_completion_for_prev(arguments, commands: list[str], position
             continue
 
         has_cases = True
-        choices = argument.get_choices(force=True)
-        action = get_completion_action(argument.hint)
+        choices = completion_choices(argument)
+        action = completion_action(argument)
 
         for name in names:
             lines.append(f"{indent}  {name})")
@@ -589,11 +636,7 @@ def _generate_value_completion_for_prev(arguments, commands: list[str], position
                 cleaned = [clean_choice_text(c) for c in choices]
                 lines.extend(_emit_choice_completion(cleaned, f"{indent}    "))
             else:
-                compgen_flag = _map_completion_action_to_bash(action)
-                if compgen_flag:
-                    lines.append(f'{indent}    COMPREPLY=( $(compgen {compgen_flag} -- "${{cur}}") )')
-                else:
-                    lines.append(f"{indent}    COMPREPLY=()")
+                lines.extend(_emit_action_completion(action, f"{indent}    "))
 
             lines.append(f"{indent}    ;;")
 
@@ -617,3 +660,140 @@ def _generate_value_completion_for_prev(arguments, commands: list[str], position
             lines.append(f"{indent}COMPREPLY=()")
 
     return lines
+
+
+def _ansi_c_quote(text: str) -> str:
+    r"""Quote ``text`` as a bash ``$'...'`` string, encoding newlines as ``\n``."""
+    text = text.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+    return f"$'{text}'"
+
+
+def _generate_table_script(
+    app: "App",
+    completion_data: dict[tuple[str, ...], CompletionData],
+    prog_name: str,
+    func_name: str,
+) -> str:
+    """Generate a table-driven bash completion script.
+
+    The command tree is stored in global associative arrays indexed by node
+    number (see :func:`.build_completion_table`):
+
+    * ``_cy_<prog>_t["<node> <command>"]`` - child node.
+    * ``_cy_<prog>_v["<node> <option>"]`` - value completion of an option that takes a value;
+      ``"<node> @<slot>"`` and ``"<node> @*"`` for positionals.
+    * ``_cy_<prog>_o[<node>]`` / ``_cy_<prog>_c[<node>]`` - newline-separated options / commands.
+
+    Each TAB press does one lookup per typed word, so its cost does not grow
+    with the number of commands.
+    """
+    nodes = build_completion_table(
+        completion_data,
+        tuple(app.help_flags) if app.help_flags else (),
+        tuple(app.version_flags) if app.version_flags else (),
+    )
+    prefix = f"_cy_{func_name}"
+
+    transitions, values, options, commands = [], [], [], []
+    for i, node in enumerate(nodes):
+        transitions.extend(f"  [{_ansi_c_quote(f'{i} {name}')}]={child}" for name, child in node.commands.items())
+        values.extend(
+            f"  [{_ansi_c_quote(f'{i} {name}')}]={_ansi_c_quote(encode_value_completion(value))}"
+            for name, value in node.option_values.items()
+        )
+        values.extend(
+            f"  [{_ansi_c_quote(f'{i} @{slot}')}]={_ansi_c_quote(encode_value_completion(value))}"
+            for slot, value in enumerate(node.positionals)
+        )
+        if node.rest is not None:
+            values.append(f"  [{_ansi_c_quote(f'{i} @*')}]={_ansi_c_quote(encode_value_completion(node.rest))}")
+        if node.options:
+            options.append(f"  [{i}]=" + _ansi_c_quote("\n".join(node.options)))
+        if node.commands:
+            commands.append(f"  [{i}]=" + _ansi_c_quote("\n".join(node.commands)))
+
+    lines = [
+        f"# Bash completion for {prog_name}",
+        "# Generated by Cyclopts (table-driven; requires bash 4.2+)",
+        "",
+        "if ((BASH_VERSINFO[0] < 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] < 2))); then",
+        f'  echo "{prog_name}: table-driven completion requires bash 4.2+; regenerate without table=True." >&2',
+        "  return 1 2>/dev/null || exit 1",
+        "fi",
+        "",
+        f"declare -gA {prefix}_t=(",
+        *transitions,
+        ")",
+        f"declare -gA {prefix}_v=(",
+        *values,
+        ")",
+        f"declare -ga {prefix}_o=(",
+        *options,
+        ")",
+        f"declare -ga {prefix}_c=(",
+        *commands,
+        ")",
+        "",
+        f"{prefix}_reply() {{",
+        "  local -a _c",
+        "  local _x",
+        "  COMPREPLY=()",
+        '  [[ -n "$1" ]] || return 0',
+        '  mapfile -t _c <<< "$1"',
+        '  for _x in "${_c[@]}"; do',
+        '    [[ "$_x" == "${cur}"* ]] && COMPREPLY+=("$_x")',
+        "  done",
+        "}",
+        "",
+        f"_{func_name}() {{",
+        '  local cur="${COMP_WORDS[COMP_CWORD]}"',
+        "  local node=0 pos=0 skip=0 opt='' word next spec i",
+        "",
+        "  # Walk the typed words: one table lookup per word.",
+        "  for ((i=1; i<COMP_CWORD; i++)); do",
+        '    word="${COMP_WORDS[i]}"',
+        "    if [[ $skip -eq 1 ]]; then",
+        "      # COMP_WORDBREAKS splits --opt=value into: --opt = value",
+        '      [[ "$word" == "=" ]] || skip=0',
+        "      continue",
+        "    fi",
+        '    if [[ "$word" == -* ]]; then',
+        f'      if [[ -n "${{{prefix}_v["$node $word"]+x}}" ]]; then',
+        '        skip=1 opt="$word"',
+        "      fi",
+        "      continue",
+        "    fi",
+        f'    next="${{{prefix}_t["$node $word"]-}}"',
+        '    if [[ $pos -eq 0 && -n "$next" ]]; then',
+        "      node=$next",
+        "    else",
+        "      pos=$((pos + 1))",
+        "    fi",
+        "  done",
+        "",
+        "  if [[ $skip -eq 1 ]]; then",
+        '    [[ "$cur" == "=" ]] && cur=""',
+        f'    spec="${{{prefix}_v["$node $opt"]}}"',
+        '  elif [[ "$cur" == -* ]]; then',
+        f'    {prefix}_reply "${{{prefix}_o[node]-}}"',
+        "    return",
+        f'  elif [[ $pos -eq 0 && -n "${{{prefix}_c[node]-}}" ]]; then',
+        f'    {prefix}_reply "${{{prefix}_c[node]}}"',
+        "    return",
+        "  else",
+        f'    spec="${{{prefix}_v["$node @$pos"]-${{{prefix}_v["$node @*"]-}}}}"',
+        "  fi",
+        "",
+        '  case "$spec" in',
+        '    f) COMPREPLY=( $(compgen -f -- "${cur}") ) ;;',
+        '    d) COMPREPLY=( $(compgen -d -- "${cur}") ) ;;',
+        f'    w*) {prefix}_reply "${{spec:1}}" ;;',
+        f"    c) mapfile -t COMPREPLY < <({_CALLBACK} 2>/dev/null) ;;",
+        "    *) COMPREPLY=() ;;",
+        "  esac",
+        "}",
+        "",
+        f"complete -F _{func_name} {prog_name}",
+        "",
+    ]
+    return "\n".join(lines)
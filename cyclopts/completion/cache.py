@@ -0,0 +1,190 @@
+"""On-disk cache of ``cyclopts _complete`` results for scripts.
+
+When no completion daemon (see :mod:`cyclopts.completion.daemon`) is running,
+``cyclopts _complete run <script>`` would otherwise import the script on every
+TAB press. Instead, the completion lines of every command path are computed once
+and stored in a JSON file under ``$XDG_CACHE_HOME/cyclopts/complete``. The cache
+is keyed by the script and interpreter, and stays valid while the script and every
+module it imported keep their ``(mtime_ns, size)``.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from cyclopts._cache import atomic_write, cache_root
+
+CACHE_ENV_VAR = "CYCLOPTS_COMPLETE_CACHE"
+"""Set to ``"0"`` to disable the completion cache."""
+
+_FORMAT = 1
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, "1") != "0"
+
+
+def cache_dir() -> Path:
+    """Directory holding completion caches: ``$XDG_CACHE_HOME/cyclopts/complete`` (default ``~/.cache``)."""
+    return cache_root() / "complete"
+
+
+def _cache_file(script: str) -> Path:
+    key = hashlib.sha256(f"{sys.executable}\0{script}".encode()).hexdigest()[:32]
+    return cache_dir() / f"{key}.json"
+
+
+def _fingerprint(path: str) -> list[int] | None:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _version() -> str:
+    from cyclopts import __version__
+
+    return __version__
+
+
+def _read(script: str) -> dict[str, Any] | None:
+    try:
+        with _cache_file(script).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if data["format"] != _FORMAT or data["script"] != script or data["cyclopts"] != _version():
+            return None
+        for path, fingerprint in data["files"].items():
+            if _fingerprint(path) != fingerprint:
+                return None
+    except (KeyError, TypeError, AttributeError):
+        return None
+    return data
+
+
+def _match(commands: dict[str, int], word: str, fuzzy: bool) -> int | None:
+    """Mirror of ``_CommandLookup.match``: exact name, then fuzzy (camelCase) name."""
+    from cyclopts.core import _normalize_for_matching
+
+    exact = commands.get(word)
+    if exact is not None or not fuzzy or word.startswith("-"):
+        return exact
+    normalized = _normalize_for_matching(word)
+    matches = [
+        index
+        for name, index in commands.items()
+        if not name.startswith("-") and _normalize_for_matching(name) == normalized
+    ]
+    if len(matches) > 1:
+        raise ValueError(f"Ambiguous command '{word}'.")
+    return matches[0] if matches else None
+
+
+def _walk(nodes: list[dict[str, Any]], words: list[str]) -> dict[str, Any]:
+    """Node of the deepest command in ``words``. Raises :exc:`ValueError` on an ambiguous command."""
+    node = nodes[0]
+    for word in words:
+        index = _match(node["commands"], word, node.get("fuzzy", True))
+        if index is None:
+            break
+        node = nodes[index]
+    return node
+
+
+def is_valid(script: str) -> bool:
+    """Whether the completion cache of ``script`` exists and is up to date."""
+    return _read(script) is not None
+
+
+def is_unresolved(script: str, words: list[str]) -> bool:
+    """Whether completing ``words`` reaches a lazy command the cache doesn't describe yet."""
+    if (data := _read(script)) is None:
+        return False
+    try:
+        return bool(_walk(data["nodes"], words).get("unresolved"))
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return False
+
+
+def lookup(script: str, words: list[str]) -> list[str] | None:
+    """Cached completion lines for ``words``.
+
+    Parameters
+    ----------
+    script : str
+        Absolute script path, optionally with ``':app_object'`` notation.
+    words : list[str]
+        Current command line words (excluding the script).
+
+    Returns
+    -------
+    list[str] | None
+        Completion lines, or :obj:`None` on a cache miss (missing, stale or corrupt cache),
+        inside lazy commands that haven't been resolved yet, and for values of commands
+        with a :attr:`.Parameter.completer`.
+    """
+    if (data := _read(script)) is None:
+        return None
+
+    try:
+        try:
+            node = _walk(data["nodes"], words)
+        except ValueError:
+            return []
+        if node.get("unresolved"):
+            return None
+        if node.get("dynamic") and words and not (words[-1].startswith("-") and "=" not in words[-1]):
+            return None
+        return list(node["lines"])
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def store(script: str, nodes: list[dict[str, Any]], preexisting_modules: Iterable[str]) -> None:
+    """Write the completion cache for ``script``.
+
+    Failures are silently ignored; completion then keeps working in-process.
+
+    Parameters
+    ----------
+    script : str
+        Absolute script path, optionally with ``':app_object'`` notation.
+    nodes : list[dict]
+        Command tree; the root first. Each node is
+        ``{"lines": [...], "commands": {name: node_index}}`` and may set
+        ``"fuzzy": False`` to only match command names exactly,
+        ``"dynamic": True`` to not answer value completions from the cache, and
+        ``"unresolved": True`` to not answer anything from the cache.
+    preexisting_modules : Iterable[str]
+        Names in :data:`sys.modules` before ``script`` was loaded. Every module
+        imported since (the script, its imports and lazily-resolved commands)
+        invalidates the cache when it changes.
+    """
+    preexisting = set(preexisting_modules)
+    # The script itself is recorded even if a module of the same name was already loaded.
+    script_file = script.rsplit(":", 1)[0] if ":" in script and not Path(script).exists() else script
+    files = {script_file: _fingerprint(script_file)}
+    for name, module in list(sys.modules.items()):
+        if name in preexisting:
+            continue
+        path = getattr(module, "__file__", None)
+        if path and (fingerprint := _fingerprint(path)) is not None:
+            files[path] = fingerprint
+
+    data = {
+        "format": _FORMAT,
+        "cyclopts": _version(),
+        "script": script,
+        "files": files,
+        "nodes": nodes,
+    }
+
+    atomic_write(_cache_file(script), json.dumps(data, separators=(",", ":")))
@@ -0,0 +1,310 @@
+"""Dynamic value completion through ``Parameter(completer=...)``.
+
+Values that can't be listed when the completion script is generated (cluster
+names, git refs, dataset IDs, ...) are computed by calling back into the
+program. Generated scripts run the program with the :data:`COMPLETE_ENV_VAR`
+environment variable set and the words typed so far as arguments;
+:meth:`App.__call__ <cyclopts.App.__call__>` then prints the values of the
+completer responsible for the last word instead of running a command.
+
+Completer results are cached on disk for :attr:`Completer.ttl` seconds, and a
+completer that doesn't return within :attr:`Completer.timeout` seconds is
+abandoned so a slow backend can't freeze the shell.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from attrs import field
+
+from cyclopts._cache import atomic_write
+from cyclopts.utils import frozen
+
+if TYPE_CHECKING:
+    from cyclopts import App
+    from cyclopts.argument import Argument, ArgumentCollection
+
+COMPLETE_ENV_VAR = "_CYCLOPTS_COMPLETE"
+"""Set by generated completion scripts when calling back into the program for dynamic values."""
+
+
+@frozen
+class Completer:
+    """Computes completion values for a parameter; see :attr:`Parameter.completer`.
+
+    A plain callable passed to :attr:`Parameter.completer` is wrapped with the default settings.
+
+    Attributes
+    ----------
+    func : Callable[[str, dict[str, Any]], Iterable[str]]
+        Called with the partially typed word and a dictionary mapping the Python names
+        of already supplied parameters to their converted values.
+        Returns candidate values; values not starting with the partial word are dropped.
+    ttl : float
+        Seconds to reuse the results of ``func`` for the same command line.
+        ``0`` disables caching.
+    timeout : float
+        Seconds to wait for ``func``. On timeout, expired cached results are
+        returned if available, otherwise no values.
+    """
+
+    func: Callable[[str, dict[str, Any]], Iterable[str]]
+    ttl: float = field(default=60.0, kw_only=True)
+    timeout: float = field(default=2.0, kw_only=True)
+
+    def __call__(self, incomplete: str, context: dict[str, Any], key: Any = None) -> list[str]:
+        """Completion values for ``incomplete``.
+
+        Parameters
+        ----------
+        incomplete : str
+            Partially typed word.
+        context : dict[str, Any]
+            Converted values of the already supplied parameters.
+        key : Any
+            JSON-serializable description of the command line, used as the cache key.
+            Defaults to ``incomplete`` and ``context``.
+
+        Returns
+        -------
+        list[str]
+            Values starting with ``incomplete``.
+        """
+        if key is None:
+            key = [incomplete, sorted((k, repr(v)) for k, v in context.items())]
+        cache_file = _cache_file(self.func, key) if self.ttl > 0 and _cache_enabled() else None
+
+        stale = None
+        if cache_file is not None and (cached := _read(cache_file)) is not None:
+            created, values = cached
+            if time.time() - created < self.ttl:
+                return _matching(values, incomplete)
+            stale = values
+
+        values = _call_with_timeout(self.func, (incomplete, context), self.timeout)
+        if values is None:
+            return _matching(stale or [], incomplete)
+        if cache_file is not None:
+            _write(cache_file, values)
+        return _matching(values, incomplete)
+
+
+def _matching(values: Iterable[str], incomplete: str) -> list[str]:
+    return [value for value in values if value.startswith(incomplete) and "\n" not in value]
+
+
+def _cache_enabled() -> bool:
+    from cyclopts.completion.cache import cache_enabled
+
+    return cache_enabled()
+
+
+def _cache_file(func: Callable, key: Any) -> Path:
+    from cyclopts.completion.cache import cache_dir
+
+    identity = [getattr(func, "__module__", None), getattr(func, "__qualname__", repr(func)), key]
+    digest = hashlib.sha256(json.dumps(identity, default=repr).encode()).hexdigest()[:32]
+    return cache_dir() / "values" / f"{digest}.json"
+
+
+def _read(path: Path) -> tuple[float, list[str]] | None:
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+        created, values = float(data["time"]), data["values"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        return None
+    return created, values
+
+
+def _write(path: Path, values: list[str]) -> None:
+    atomic_write(path, json.dumps({"time": time.time(), "values": values}))
+
+
+# Completer functions with a call still running, e.g. abandoned after a timeout.
+_in_flight: set[Callable] = set()
+_in_flight_lock = threading.Lock()
+
+
+def _call_with_timeout(func: Callable, args: tuple, timeout: float) -> list[str] | None:
+    """Call ``func(*args)`` in a daemon thread; :obj:`None` if it raises or exceeds ``timeout``.
+
+    The thread is abandoned on timeout; being a daemon, it doesn't delay interpreter exit.
+    While it runs, ``func`` isn't called again (:obj:`None` is returned right away),
+    so a hung completer holds at most one thread of a long-lived process like the completion daemon.
+    """
+    with _in_flight_lock:
+        if func in _in_flight:
+            return None
+        _in_flight.add(func)
+
+    result: list[list[str]] = []
+
+    def target():
+        try:
+            with suppress(Exception):
+                result.append([str(value) for value in func(*args)])
+        finally:
+            with _in_flight_lock:
+                _in_flight.discard(func)
+
+    thread = threading.Thread(target=target, name="cyclopts-completer", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0] if result else None
+
+
+def _join_equals(words: Sequence[str]) -> list[str]:
+    """Undo bash's word-splitting of ``--opt=value`` into ``--opt``, ``=``, ``value``."""
+    tokens: list[str] = []
+    for word in words:
+        if tokens and (word == "=" or tokens[-1].endswith("=")) and tokens[-1].startswith("-"):
+            tokens[-1] += word
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _match(arguments: "ArgumentCollection", name: str) -> "Argument | None":
+    try:
+        return arguments.match(name)[0]
+    except ValueError:
+        return None
+
+
+def _positional_target(arguments: "ArgumentCollection", index: int) -> "Argument | None":
+    """The positional argument receiving the ``index``-th positional token."""
+    from cyclopts.annotations import is_iterable_type
+
+    positionals = sorted((a for a in arguments if a.index is not None and not a.keys), key=lambda a: a.index or 0)
+    rest = next((a for a in positionals if a.is_var_positional()), None)
+    if rest is None:
+        rest = next((a for a in positionals if is_iterable_type(a.hint)), None)
+    if rest is not None and rest.index is not None and index >= rest.index:
+        return rest
+    return next((a for a in positionals if a.index == index), None)
+
+
+def _context(arguments: "ArgumentCollection", tokens: list[str], end_of_options_delimiter: str) -> dict[str, Any]:
+    """Best-effort converted values of the parameters supplied by ``tokens``."""
+    from cyclopts.bind import _parse_kw_and_flags, _parse_pos
+
+    with suppress(Exception):
+        unused, contiguous = _parse_kw_and_flags(arguments, tokens, end_of_options_delimiter=end_of_options_delimiter)
+        _parse_pos(
+            arguments,
+            unused,
+            end_of_options_delimiter=end_of_options_delimiter,
+            contiguous_positional_count=contiguous,
+        )
+
+    context = {}
+    for argument in arguments:
+        if argument.keys or not argument.has_tokens:
+            continue
+        with suppress(Exception):
+            context[argument.field_info.name] = argument.convert()
+    return context
+
+
+def complete_value(app: "App", words: Sequence[str]) -> list[str] | None:
+    """Values of the :attr:`Parameter.completer` responsible for the last of ``words``.
+
+    Parameters
+    ----------
+    app : App
+        Application object.
+    words : Sequence[str]
+        Command line words after the program name; the last one is being completed.
+
+    Returns
+    -------
+    list[str] | None
+        Completion values, or :obj:`None` if the last word isn't the value of a
+        parameter with a completer.
+    """
+    from cyclopts.argument import ArgumentCollection
+    from cyclopts.core import _iter_resolution_argument_collections
+
+    tokens = _join_equals(words)
+    incomplete = tokens.pop() if tokens else ""
+
+    try:
+        _, execution_path, unused = app.parse_commands(tokens)
+    except Exception:
+        return None
+
+    with app.app_stack(execution_path):
+        collections = [c for _, c in _iter_resolution_argument_collections(execution_path, parse_docstring=False)]
+        delimiter = execution_path[-1].app_stack.resolve("end_of_options_delimiter", fallback="--")
+    if not collections:
+        return None
+    arguments = ArgumentCollection(chain.from_iterable(collections))
+
+    target = None
+    context_tokens = unused
+    if incomplete.startswith("-") and "=" in incomplete and delimiter not in unused:
+        name, _, incomplete = incomplete.partition("=")
+        target = _match(arguments, name)
+    elif incomplete.startswith("-") and delimiter not in unused:
+        return None
+    elif unused and unused[-1].startswith("-") and "=" not in unused[-1] and delimiter not in unused:
+        target = _match(arguments, unused[-1])
+        if target is not None and target.is_flag():
+            target = None
+        context_tokens = unused[:-1]
+
+    if target is None:
+        positional_index = 0
+        skip = after_delimiter = False
+        for token in unused:
+            if skip:
+                skip = False
+            elif after_delimiter or not token.startswith("-"):
+                positional_index += 1
+            elif token == delimiter:
+                after_delimiter = True
+            elif "=" not in token and (option := _match(arguments, token)) is not None and not option.is_flag():
+                skip = True
+        if skip:  # The last word is the value of an option without a completer.
+            return None
+        if any(not name.startswith("-") for name in execution_path[-1]):
+            return None  # Subcommands take precedence over positional values.
+        target = _positional_target(collections[-1], positional_index)
+
+    if target is None or target.parameter.completer is None:
+        return None
+
+    completer = target.parameter.completer
+    if not isinstance(completer, Completer):
+        completer = Completer(completer)
+
+    context = _context(arguments, list(context_tokens), delimiter)
+    key = [[app_.name for app_ in execution_path], target.name, list(context_tokens), incomplete]
+    return completer(incomplete, context, key=key)
+
+
+def handle_completion_request(app: "App", words: Sequence[str]) -> None:
+    """Print the dynamic completion values for ``words``, one per line.
+
+    Called by :meth:`App.__call__` when :data:`COMPLETE_ENV_VAR` is set.
+    The variable is removed first, so programs spawned by a completer run normally.
+    """
+    os.environ.pop(COMPLETE_ENV_VAR, None)
+    try:
+        values = complete_value(app, words) or []
+    except Exception:
+        values = []
+    sys.stdout.write("".join(f"{value}\n" for value in values))
+    sys.stdout.flush()
@@ -0,0 +1,294 @@
+r"""Resident completion daemon for ``cyclopts _complete``.
+
+Every TAB press in ``cyclopts run <script> ...`` otherwise starts a fresh Python
+process and re-imports the target script. The daemon keeps loaded apps resident,
+keyed by script path, and answers completion requests over a local Unix socket.
+An app is reloaded when its script, or a module imported while loading a script,
+changes on disk. Requires ``socket.AF_UNIX``; not available on Windows.
+
+Protocol: the client sends one request line of NUL-separated fields
+``cwd \0 script \0 word \0 word ... \n``. The daemon replies with completion
+lines (``name`` or ``name:description``) and closes the connection.
+"""
+
+import functools
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import sysconfig
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cyclopts import App
+
+DAEMON_ENV_VAR = "CYCLOPTS_COMPLETE_DAEMON"
+"""If set (and not ``"0"``), ``cyclopts _complete`` starts the daemon in the background when it isn't running."""
+
+SOCKET_ENV_VAR = "CYCLOPTS_COMPLETE_SOCKET"
+"""Overrides the daemon's socket path."""
+
+CLIENT_TIMEOUT = 2.0
+"""Seconds the client waits on the daemon before falling back to in-process completion."""
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+
+def socket_path() -> Path:
+    """Path of the completion daemon's Unix socket.
+
+    ``$CYCLOPTS_COMPLETE_SOCKET`` if set, otherwise ``cyclopts-<uid>/complete.sock``
+    inside ``$XDG_RUNTIME_DIR``, ``$TMPDIR`` or ``/tmp`` (first that is set).
+    The generated zsh completion script computes the same path.
+    """
+    if override := os.environ.get(SOCKET_ENV_VAR):
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return Path(base) / f"cyclopts-{os.getuid()}" / "complete.sock"
+
+
+def _encode_request(cwd: str, script: str, words: list[str]) -> bytes:
+    return ("\0".join([cwd, script, *words]) + "\n").encode()
+
+
+def _decode_request(data: bytes) -> tuple[str, str, list[str]]:
+    cwd, script, *words = data.decode().rstrip("\n").split("\0")
+    return cwd, script, words
+
+
+def request_completions(script: str, words: list[str], timeout: float = CLIENT_TIMEOUT) -> list[str] | None:
+    """Ask a running completion daemon for completions.
+
+    Parameters
+    ----------
+    script : str
+        Absolute Python script path, optionally with ``':app_object'`` notation.
+    words : list[str]
+        Current command line words (excluding the script).
+    timeout : float
+        Seconds to wait for the daemon.
+
+    Returns
+    -------
+    list[str] | None
+        Completion lines, or :obj:`None` if no daemon answered; the caller should
+        then complete in-process. If :data:`DAEMON_ENV_VAR` is set, a daemon is
+        started in the background for subsequent requests.
+    """
+    path = socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(_encode_request(str(Path.cwd()), script, words))
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        if os.environ.get(DAEMON_ENV_VAR, "0") != "0":
+            _spawn_daemon()
+        return None
+
+    return b"".join(chunks).decode().splitlines()
+
+
+def _spawn_daemon() -> None:
+    """Start ``cyclopts _complete_server`` detached from the current process."""
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "cyclopts", "_complete_server"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def _absolute_script(cwd: str, script: str) -> str:
+    """``script`` with its file part made absolute against ``cwd``; ``':app_object'`` notation is kept."""
+    file_part, sep, app_name = script, "", ""
+    if ":" in script and not (Path(cwd) / script).exists():
+        file_part, sep, app_name = script.rpartition(":")
+    return os.path.normpath(Path(cwd) / file_part) + sep + app_name
+
+
+def _is_user_module(file: str | None) -> bool:
+    """Whether a module loaded from ``file`` may be edited: not part of Python, an installed package or Cyclopts.
+
+    Installed modules are never unloaded; a second copy of e.g. Cyclopts would break ``isinstance`` checks.
+    """
+    if not file:
+        return False
+    return not any(os.path.commonpath([directory, file]) == directory for directory in _installed())
+
+
+@functools.cache
+def _installed() -> tuple[str, ...]:
+    paths = {sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib", "platlib")}
+    return (*filter(None, paths), str(Path(__file__).parents[1]))
+
+
+class CompletionServer(socketserver.UnixStreamServer):
+    """Unix-socket server that answers completion requests from resident apps.
+
+    Requests are served one at a time; loading a script may ``chdir`` and
+    mutate ``sys.modules``.
+
+    Raises
+    ------
+    BlockingIOError
+        If another daemon holds the lock file next to ``path`` (``<path>.lock``).
+    """
+
+    def __init__(self, path: Path, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT):
+        import fcntl
+
+        self.path = path
+        self.timeout = idle_timeout
+        self.idle = False
+        self.apps: dict[str, tuple[tuple[int, int], App | None]] = {}
+        self.modules: dict[str, list | None] = {}
+        """Source file fingerprints of the modules imported while loading scripts, by module name."""
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The daemon imports whatever scripts it is asked to; only its owner may connect.
+        if path.parent.stat().st_uid != os.getuid():
+            raise PermissionError(f"{path.parent} is not owned by the current user.")
+        # Daemons started at the same time mustn't replace each other's socket.
+        self._lock: int | None = os.open(path.with_name(path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BaseException:
+            self._release_lock()
+            raise
+        if path.is_socket():
+            path.unlink()
+        super().__init__(str(path), _CompletionHandler)  # Closes the server (and releases the lock) on failure.
+        path.chmod(0o600)
+
+    def _evict_changed_modules(self) -> None:
+        """Forget every module imported by scripts, and every app, if one of their source files changed."""
+        from cyclopts.help.cache import _file_fingerprint
+
+        if all(
+            _file_fingerprint(getattr(sys.modules.get(name), "__file__", None)) == fingerprint
+            for name, fingerprint in self.modules.items()
+        ):
+            return
+        for name in self.modules:
+            sys.modules.pop(name, None)
+        self.modules.clear()
+        self.apps.clear()
+
+    def load(self, script: str) -> "App | None":
+        """Return the app of ``script``, (re)loading it if the script changed on disk.
+
+        Apps are cached by absolute script path and the script's ``(mtime_ns, size)``.
+        If the source file of any module imported while loading a script changed,
+        all of them are removed from :data:`sys.modules` and every app is reloaded.
+        """
+        from cyclopts.help.cache import _file_fingerprint
+        from cyclopts.loader import load_app_from_script
+
+        self._evict_changed_modules()
+
+        file_part = script.rsplit(":", 1)[0] if ":" in script and not Path(script).exists() else script
+        try:
+            stat = Path(file_part).stat()
+        except OSError:
+            self.apps.pop(script, None)
+            return None
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self.apps.get(script)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        loaded = set(sys.modules)
+        try:
+            app_obj, _ = load_app_from_script(script)
+        except (Exception, SystemExit):
+            app_obj = None
+        for name in sys.modules.keys() - loaded - {"__cyclopts_doc_module"}:  # The script has its own fingerprint.
+            if _is_user_module(file := getattr(sys.modules[name], "__file__", None)):
+                self.modules[name] = _file_fingerprint(file)
+        self.apps[script] = (fingerprint, app_obj)
+        return app_obj
+
+    def complete(self, cwd: str, script: str, words: list[str]) -> list[str]:
+        from cyclopts.cli._complete import get_completions
+
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+        app_obj = self.load(_absolute_script(cwd, script))
+        if app_obj is None:
+            return []
+        return get_completions(app_obj, words)
+
+    def handle_timeout(self):
+        self.idle = True
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+        self._release_lock()
+
+    def _release_lock(self):
+        if self._lock is not None:
+            os.close(self._lock)
+            self._lock = None
+
+
+class _CompletionHandler(socketserver.StreamRequestHandler):
+    server: CompletionServer
+
+    def handle(self):
+        cwd, script, words = _decode_request(self.rfile.readline())
+        try:
+            lines = self.server.complete(cwd, script, words)
+        except (Exception, SystemExit):
+            lines = []
+        self.wfile.write("".join(f"{line}\n" for line in lines).encode())
+
+
+def daemon_is_running(path: Path) -> bool:
+    """Whether a daemon is accepting connections on ``path``."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+    except OSError:
+        return False
+    return True
+
+
+def serve(path: Path | None = None, idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Serve completion requests on ``path`` until idle for ``idle_timeout`` seconds.
+
+    Returns immediately if another daemon already serves ``path``.
+
+    Parameters
+    ----------
+    path : Path | None
+        Socket path. Defaults to :func:`socket_path`.
+    idle_timeout : float | None
+        Seconds without a request before exiting. :obj:`None` serves forever.
+    """
+    path = path or socket_path()
+    if daemon_is_running(path):
+        return
+
+    try:
+        server = CompletionServer(path, idle_timeout=idle_timeout)
+    except BlockingIOError:  # Another daemon is starting.
+        return
+    with server:
+        while not server.idle:
+            server.handle_request()
@@ -11,9 +11,12 @@ from cyclopts.annotations import is_iterable_type
 from cyclopts.completion._base import (
     CompletionAction,
     CompletionData,
+    ValueCompletion,
+    build_completion_table,
     clean_choice_text,
+    completion_action,
+    completion_choices,
     extract_completion_data,
-    get_completion_action,
     strip_markup,
 )
 
@@ -21,8 +24,18 @@ if TYPE_CHECKING:
     from cyclopts import App
     from cyclopts.command_spec import CommandSpec
 
+# Prints the values of a ``Parameter.completer`` by re-running the program with the
+# words typed so far and ``_CYCLOPTS_COMPLETE`` set; see :mod:`.completer`.
+_CALLBACK = "env _CYCLOPTS_COMPLETE=fish (commandline -opc) (commandline -ct) 2>/dev/null"
 
-def generate_completion_script(app: "App", prog_name: str) -> str:
+
+def generate_completion_script(
+    app: "App",
+    prog_name: str,
+    *,
+    table: bool = False,
+    workers: int | None = None,
+) -> str:
     """Generate fish completion script.
 
     Parameters
@@ -31,6 +44,10 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
         The Cyclopts application to generate completion for.
     prog_name : str
         Program name for completion (alphanumeric with hyphens/underscores).
+    table : bool
+        Emit a table-driven script (see :func:`_generate_table_script`).
+    workers : int | None
+        Import lazy commands with a thread pool of this size; see :func:`.extract_completion_data`.
 
     Returns
     -------
@@ -45,7 +62,10 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
     if not prog_name or not re.match(r"^[a-zA-Z0-9_-]+$", prog_name):
         raise ValueError(f"Invalid prog_name: {prog_name!r}. Must be alphanumeric with hyphens/underscores.")
 
-    completion_data = extract_completion_data(app)
+    completion_data = extract_completion_data(app, workers=workers, cache=app._completion_cache)
+
+    if table:
+        return _generate_table_script(app, completion_data, prog_name)
 
     lines = [
         f"# Fish completion for {prog_name}",
@@ -53,6 +73,11 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
         "",
     ]
 
+    if any(
+        argument.parameter.completer is not None for data in completion_data.values() for argument in data.arguments
+    ):
+        lines.extend(["function __cyclopts_callback", f"    {_CALLBACK}", "end", ""])
+
     has_nested_commands = any(len(path) > 0 for path in completion_data.keys())
     if has_nested_commands:
         lines.extend(_generate_helper_functions(prog_name, completion_data))
@@ -71,11 +96,11 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
 
 
 def _any_nested_positional_choices(completion_data: dict[tuple[str, ...], CompletionData]) -> bool:
-    """Whether any nested command path has a positional argument with choices.
+    """Whether any nested command path has a positional argument with choices or a completer.
 
     The positional-index helper is only needed when there is at least one
-    nested positional that emits a choice list — without choices, fish's
-    default file fallback already produces sensible completions.
+    nested positional that emits a choice list or calls back into the program —
+    otherwise, fish's default file fallback already produces sensible completions.
     """
     for path, data in completion_data.items():
         if not path:
@@ -83,7 +108,7 @@ def _any_nested_positional_choices(completion_data: dict[tuple[str, ...], Comple
         for argument in data.arguments:
             if argument.index is None or not argument.show:
                 continue
-            if argument.get_choices(force=True):
+            if completion_choices(argument) or argument.parameter.completer is not None:
                 return True
     return False
 
@@ -283,6 +308,8 @@ def _map_completion_action_to_fish(action: CompletionAction) -> str:
         return "-r -F"
     if action == CompletionAction.DIRECTORIES:
         return "-r -a '(__fish_complete_directories)'"
+    if action == CompletionAction.CALLBACK:
+        return "-x -a '(__cyclopts_callback)'"
     return ""
 
 
@@ -398,8 +425,16 @@ def _generate_positional_completions(
     rest-arg specs (mirrors the bash/zsh "first iterable wins" rule), only
     the first iterable contributes a rest rule; later iterables remain
     reachable via their ``--name`` keyword forms.
+
+    Positionals with a :attr:`.Parameter.completer` call back into the program.
+    At root, a single rule (without ``-f``, so files remain available) lets the
+    program decide which positional, if any, the current word belongs to.
     """
     if not command_path:
+        has_commands = any(not name.startswith("-") for command in data.commands for name in command.names)
+        local_arguments = data.launcher_arguments + data.own_arguments
+        if not has_commands and any(arg.index is not None and arg.parameter.completer for arg in local_arguments):
+            return ["# Positionals for: (root)", f"complete -c {prog_name} -a '(__cyclopts_callback)'"]
         return []
 
     # Exclude inherited (ancestor-meta) positionals: they were consumed before
@@ -441,25 +476,30 @@ def _generate_positional_completions(
             lines.append(f"# Positionals for: {' '.join(command_path)}")
             header_emitted = True
 
-    for slot_idx, argument in enumerate(head):
-        choices = argument.get_choices(force=True)
+    def _candidates(argument) -> str:
+        """Argument of ``complete -a``, or an empty string if ``argument`` has no choices or completer."""
+        if argument.parameter.completer is not None:
+            return "(__cyclopts_callback)"
+        choices = completion_choices(argument)
         if not choices:
+            return ""
+        return " ".join(_escape_fish_string(clean_choice_text(c)) for c in choices)
+
+    for slot_idx, argument in enumerate(head):
+        candidates = _candidates(argument)
+        if not candidates:
             continue
-        escaped_choices = [_escape_fish_string(clean_choice_text(c)) for c in choices]
-        choices_str = " ".join(escaped_choices)
         pos_cond = f"{base_predicate}; and test ({helper_fn} {path_len}) = {slot_idx}"
         _ensure_header()
-        lines.append(f"complete -c {prog_name} -n '{pos_cond}' -f -a '{choices_str}'")
+        lines.append(f"complete -c {prog_name} -n '{pos_cond}' -f -a '{candidates}'")
 
     if rest_owner is not None:
-        choices = rest_owner.get_choices(force=True)
-        if choices:
+        candidates = _candidates(rest_owner)
+        if candidates:
             rest_slot = rest_idx if rest_idx is not None else 0
-            escaped_choices = [_escape_fish_string(clean_choice_text(c)) for c in choices]
-            choices_str = " ".join(escaped_choices)
             pos_cond = f"{base_predicate}; and test ({helper_fn} {path_len}) -ge {rest_slot}"
             _ensure_header()
-            lines.append(f"complete -c {prog_name} -n '{pos_cond}' -f -a '{choices_str}'")
+            lines.append(f"complete -c {prog_name} -n '{pos_cond}' -f -a '{candidates}'")
 
     return lines
 
@@ -608,8 +648,8 @@ def _generate_keyword_arg_completions(
         escaped_desc = _escape_fish_description(desc)
 
         is_flag = argument.is_flag()
-        choices = argument.get_choices(force=True)
-        action = get_completion_action(argument.hint)
+        choices = completion_choices(argument)
+        action = completion_action(argument)
 
         for name in argument.parameter.name or []:
             if not name.startswith("-"):
@@ -744,3 +784,159 @@ def _get_description_from_app(cmd_app: "App | CommandSpec", help_format: str) ->
         text = str(cmd_app.help or "")
 
     return strip_markup(text, format=help_format)
+
+
+def _fish_quote(text: str) -> str:
+    """Quote ``text`` as a fish single-quoted string."""
+    text = text.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{text}'"
+
+
+def _fish_candidate(name: str, description: str) -> str:
+    """A ``name<TAB>description`` completion candidate as a fish word."""
+    if not description:
+        return _fish_quote(name)
+    return f"{_fish_quote(name)}\\t{_fish_quote(description)}"
+
+
+def _fish_value(value: ValueCompletion) -> str:
+    """Encode a value completion as a fish list: ``f``, ``d``, ``c``, ``n``, or ``w`` followed by the choices."""
+    if value.choices:
+        return " ".join(["w", *(_fish_quote(choice) for choice in value.choices)])
+    if value.action == CompletionAction.FILES:
+        return "f"
+    if value.action == CompletionAction.DIRECTORIES:
+        return "d"
+    if value.action == CompletionAction.CALLBACK:
+        return "c"
+    return "n"
+
+
+def _generate_table_script(
+    app: "App",
+    completion_data: dict[tuple[str, ...], CompletionData],
+    prog_name: str,
+) -> str:
+    """Generate a table-driven fish completion script.
+
+    Instead of one ``complete`` rule (and condition function call) per option
+    and command, a single rule calls a function that walks the typed words
+    through per-node global variables (see :func:`.build_completion_table`):
+
+    * ``<prefix>_t_<node>_<word>`` - child node of command ``word``.
+    * ``<prefix>_v_<node>_<word>`` - value completion of option ``word``.
+    * ``<prefix>_p_<node>_<slot>`` / ``<prefix>_r_<node>`` - positional value completion.
+    * ``<prefix>_o_<node>`` / ``<prefix>_c_<node>`` - option / command candidates.
+
+    Words are turned into variable names with ``string escape --style=var``,
+    so each lookup is a single variable access.
+    """
+    nodes = build_completion_table(
+        completion_data,
+        tuple(app.help_flags) if app.help_flags else (),
+        tuple(app.version_flags) if app.version_flags else (),
+    )
+    prefix = f"__cy_{prog_name.replace('-', '_')}"
+
+    keys: dict[str, int] = {}  # word -> 1-based index into the escaped-key list.
+    tables, lookups = [], []
+    for i, node in enumerate(nodes):
+        if node.options:
+            candidates = " ".join(_fish_candidate(name, help) for name, help in node.options.items())
+            tables.append(f"set -g {prefix}_o_{i} {candidates}")
+        if node.commands:
+            candidates = " ".join(_fish_candidate(name, node.command_help[name]) for name in node.commands)
+            tables.append(f"set -g {prefix}_c_{i} {candidates}")
+        for slot, value in enumerate(node.positionals):
+            tables.append(f"set -g {prefix}_p_{i}_{slot} {_fish_value(value)}")
+        if node.rest is not None:
+            tables.append(f"set -g {prefix}_r_{i} {_fish_value(node.rest)}")
+        for name, child in node.commands.items():
+            key = keys.setdefault(name, len(keys) + 1)
+            lookups.append(f"set -g {prefix}_t_{i}_$__cy_keys[{key}] {child}")
+        for name, value in node.option_values.items():
+            key = keys.setdefault(name, len(keys) + 1)
+            lookups.append(f"set -g {prefix}_v_{i}_$__cy_keys[{key}] {_fish_value(value)}")
+
+    lines = [
+        f"# Fish completion for {prog_name}",
+        "# Generated by Cyclopts (table-driven)",
+        "",
+        *tables,
+    ]
+    if keys:
+        escaped = " ".join(_fish_quote(key) for key in keys)
+        lines.extend(["", f"set -l __cy_keys (string escape --style=var -- {escaped})", *lookups])
+
+    lines.extend(
+        [
+            "",
+            f"function {prefix}_complete",
+            "    set -l tokens (commandline -opc)",
+            "    set -l cur (commandline -ct)",
+            "    set -l node 0",
+            "    set -l pos 0",
+            "    set -l opt",
+            "    set -l var",
+            "    set -e tokens[1]",
+            "    # Walk the typed words: one variable lookup per word.",
+            "    for word in $tokens",
+            "        if set -q opt[1]",
+            "            set opt",
+            "            continue",
+            "        end",
+            "        if string match -q -- '-*' $word",
+            "            if not string match -q -- '*=*' $word",
+            f"                set var {prefix}_v_{{$node}}_(string escape --style=var -- $word)",
+            "                set -q $var; and set opt $word",
+            "            end",
+            "            continue",
+            "        end",
+            f"        set var {prefix}_t_{{$node}}_(string escape --style=var -- $word)",
+            "        if test $pos -eq 0; and set -q $var",
+            "            set node $$var",
+            "        else",
+            "            set pos (math $pos + 1)",
+            "        end",
+            "    end",
+            "",
+            "    set -l prefix ''",
+            "    if string match -q -- '-*=*' $cur",
+            "        set -l parts (string split -m1 = -- $cur)",
+            f"        set var {prefix}_v_{{$node}}_(string escape --style=var -- $parts[1])",
+            "        set -q $var; or return",
+            '        set prefix "$parts[1]="',
+            "        set cur $parts[2]",
+            "    else if set -q opt[1]",
+            f"        set var {prefix}_v_{{$node}}_(string escape --style=var -- $opt)",
+            "    else if string match -q -- '-*' $cur",
+            f"        set var {prefix}_o_$node",
+            "        set -q $var; and printf '%s\\n' $$var",
+            "        return",
+            f"    else if test $pos -eq 0; and set -q {prefix}_c_$node",
+            f"        set var {prefix}_c_$node",
+            "        printf '%s\\n' $$var",
+            "        return",
+            "    else",
+            f"        set var {prefix}_p_{{$node}}_$pos",
+            f"        set -q $var; or set var {prefix}_r_$node",
+            "        set -q $var; or return",
+            "    end",
+            "",
+            "    set -l spec $$var",
+            "    switch $spec[1]",
+            "        case f",
+            "            printf '%s\\n' $prefix(__fish_complete_path $cur)",
+            "        case d",
+            "            printf '%s\\n' $prefix(__fish_complete_directories $cur)",
+            "        case w",
+            "            printf '%s\\n' $prefix$spec[2..-1]",
+            "        case c",
+            f"            printf '%s\\n' $prefix({_CALLBACK})",
+            "    end",
+            "end",
+            "",
+            f"complete -c {prog_name} -f -a '({prefix}_complete)'",
+        ]
+    )
+    return "\n".join(lines) + "\n"
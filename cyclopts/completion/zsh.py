@@ -13,10 +13,13 @@ from cyclopts.annotations import is_iterable_type
 from cyclopts.completion._base import (
     CompletionAction,
     CompletionData,
+    build_completion_table,
     clean_choice_text,
+    completion_action,
+    completion_choices,
+    encode_value_completion,
     escape_for_shell_pattern,
     extract_completion_data,
-    get_completion_action,
     strip_markup,
 )
 from cyclopts.help.help import docstring_parse
@@ -27,6 +30,20 @@ if TYPE_CHECKING:
     from cyclopts.command_spec import CommandSpec
 
 
+# Completes the values of a ``Parameter.completer`` by re-running the program with
+# the words typed so far and ``_CYCLOPTS_COMPLETE`` set; see :mod:`.completer`.
+# Reads ``$_cyclopts_words``/``$_cyclopts_current`` from the calling completion function.
+_CALLBACK_FUNCTION = [
+    "_cyclopts_callback() {",
+    "  local -a values",
+    '  values=(${(f)"$(_CYCLOPTS_COMPLETE=zsh ${(Q)_cyclopts_words[1]} '
+    '"${(@Q)_cyclopts_words[2,_cyclopts_current]}" 2>/dev/null)"})',
+    "  compadd -a values",
+    "}",
+    "",
+]
+
+
 def _is_variadic(arg: "Argument") -> bool:
     """Whether ``arg`` consumes an unbounded number of words positionally.
 
@@ -65,7 +82,13 @@ def _choose_rest_arg(positional_args: list["Argument"]) -> "Argument | None":
     return variadic_args[0] if variadic_args else None
 
 
-def generate_completion_script(app: "App", prog_name: str) -> str:
+def generate_completion_script(
+    app: "App",
+    prog_name: str,
+    *,
+    table: bool = False,
+    workers: int | None = None,
+) -> str:
     """Generate zsh completion script.
 
     Parameters
@@ -74,6 +97,10 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
         The Cyclopts application to generate completion for.
     prog_name : str
         Program name (alphanumeric with hyphens/underscores).
+    table : bool
+        Emit a table-driven script (see :func:`_generate_table_script`).
+    workers : int | None
+        Import lazy commands with a thread pool of this size; see :func:`.extract_completion_data`.
 
     Returns
     -------
@@ -88,20 +115,39 @@ def generate_completion_script(app: "App", prog_name: str) -> str:
     if not prog_name or not re.match(r"^[a-zA-Z0-9_-]+$", prog_name):
         raise ValueError(f"Invalid prog_name: {prog_name!r}. Must be alphanumeric with hyphens/underscores.")
 
-    completion_data = extract_completion_data(app)
+    completion_data = extract_completion_data(app, workers=workers, cache=app._completion_cache)
+
+    if table:
+        return _generate_table_script(app, completion_data, prog_name)
 
     # Namespace the function (and the install file) as ``_cyclopts_<prog>`` so
     # that command names which happen to match a zsh completion helper —
     # ``files``, ``directories``, ``describe``, etc. — don't shadow the builtin
     # when compinit autoloads our script. Plain ``_<prog>`` would otherwise
     # recurse on internal ``_files`` / ``_directories`` calls.
-    lines = [
-        f"#compdef {prog_name}",
-        "",
-        f"_cyclopts_{prog_name}() {{",
-        "  local line state",
-        "",
-    ]
+    lines = [f"#compdef {prog_name}", ""]
+    uses_callback = any(
+        argument.parameter.completer is not None for data in completion_data.values() for argument in data.arguments
+    )
+    if uses_callback:
+        lines.extend(_CALLBACK_FUNCTION)
+    lines.extend(
+        [
+            f"_cyclopts_{prog_name}() {{",
+            "  local line state",
+            "",
+        ]
+    )
+    if uses_callback:
+        # ``_arguments`` narrows ``$words`` to the current subcommand; keep the whole line for the callback.
+        lines.extend(
+            [
+                "  local -a _cyclopts_words",
+                '  _cyclopts_words=("${words[@]}")',
+                "  local _cyclopts_current=$CURRENT",
+                "",
+            ]
+        )
 
     lines.extend(
         _generate_completion_for_path(
@@ -155,21 +201,37 @@ def _generate_run_command_completion(
           return
         fi
 
-        # Get absolute path to the script file
-        script_path=${{words[2]}}
+        # Get absolute path to the script file, keeping any ":app_object" suffix
+        script_path=${{(Q)words[2]}}
+        local app_suffix=
+        if [[ ! -e $script_path && $script_path == *:* ]]; then
+          app_suffix=:${{script_path##*:}}
+          script_path=${{script_path%:*}}
+        fi
         script_path=${{script_path:a}}
         if [[ -f $script_path ]]; then
+          script_path+=$app_suffix
           remaining_words=(${{words[3,-1]}})
           local result
           local cmd
-
-          if command -v {prog_name} &>/dev/null; then
+          local sock=${{CYCLOPTS_COMPLETE_SOCKET:-${{XDG_RUNTIME_DIR:-${{TMPDIR:-/tmp}}}}/cyclopts-$UID/complete.sock}}
+
+          if [[ -S $sock ]] && zmodload zsh/net/socket 2>/dev/null && zsocket $sock 2>/dev/null; then
+            # Ask the resident completion daemon ("{prog_name} _complete_server")
+            local fd=$REPLY line
+            local -a request=("$PWD" "$script_path" "${{remaining_words[@]}}")
+            print -rn -u $fd -- "${{(pj:\\0:)request}}"$'\\n'
+            while IFS= read -r -u $fd line; do
+              result+="$line"$'\\n'
+            done
+            exec {{fd}}>&-
+          elif command -v {prog_name} &>/dev/null; then
             cmd="{prog_name}"
+            # Call back into cyclopts to get dynamic completions from the script
+            result=$($cmd _complete run "$script_path" "${{remaining_words[@]}}" 2>/dev/null)
           else
             return
           fi
-          # Call back into cyclopts to get dynamic completions from the script
-          result=$($cmd _complete run "$script_path" "${{remaining_words[@]}}" 2>/dev/null)
           if [[ -n $result ]]; then
             # Parse and display completion results
             completions=()
@@ -249,7 +311,7 @@ def _generate_describe_completion(
     desc = _get_description_from_argument(argument, help_format)
 
     # Check for choices (Literal/Enum types)
-    choices = argument.get_choices(force=True)
+    choices = completion_choices(argument)
     if choices:
         # Generate choices array with descriptions
         escaped_choices = [_escape_completion_choice(clean_choice_text(c)) for c in choices]
@@ -261,11 +323,13 @@ def _generate_describe_completion(
         lines.append(f"{indent_str}_describe 'argument' choices")
     else:
         # Use completion action (files, directories, or nothing)
-        action = get_completion_action(argument.hint)
+        action = completion_action(argument)
         if action == CompletionAction.FILES:
             lines.append(f"{indent_str}_files")
         elif action == CompletionAction.DIRECTORIES:
             lines.append(f"{indent_str}_directories")
+        elif action == CompletionAction.CALLBACK:
+            lines.append(f"{indent_str}_cyclopts_callback")
         # For other types, provide no completion
 
     return lines
@@ -731,7 +795,7 @@ def _generate_eq_form_prepass(keyword_args: list, indent_str: str) -> list[str]:
         if not long_names:
             continue
 
-        choices = argument.get_choices(force=True)
+        choices = completion_choices(argument)
         if choices:
             # ``compadd`` adds its arguments verbatim — no inner parser to
             # interpret backslash escapes — so we use POSIX single-quoting
@@ -740,14 +804,11 @@ def _generate_eq_form_prepass(keyword_args: list, indent_str: str) -> list[str]:
             quoted = [_shell_single_quote(clean_choice_text(c)) for c in choices]
             action_line = "compadd -- " + " ".join(quoted)
         else:
-            action = get_completion_action(argument.hint)
+            action = completion_action(argument)
             zsh_action = _map_completion_action_to_zsh(action)
-            if zsh_action == "_files":
-                action_line = "_files"
-            elif zsh_action == "_directories":
-                action_line = "_directories"
-            else:
+            if not zsh_action:
                 continue  # Nothing to dispatch to.
+            action_line = zsh_action
 
         for name in long_names:
             cases.append((name, action_line))
@@ -792,7 +853,7 @@ def _generate_keyword_specs(argument: "Argument", help_format: str) -> list[str]
     # ``'`` past the inner ``_arguments`` choice-list eval).
     action = ""
     has_choices = False
-    choices = argument.get_choices(force=True)
+    choices = completion_choices(argument)
     if choices:
         has_choices = True
         escaped_choices = [_escape_choice_for_dq_spec(clean_choice_text(c)) for c in choices]
@@ -800,7 +861,7 @@ def _generate_keyword_specs(argument: "Argument", help_format: str) -> list[str]
         action = f"({choices_str})"
         flag = False
     else:
-        action = _map_completion_action_to_zsh(get_completion_action(argument.hint))
+        action = _map_completion_action_to_zsh(completion_action(argument))
 
     desc = (
         _escape_zsh_description_dq(_description_text(argument, help_format))
@@ -886,7 +947,7 @@ def _generate_positional_spec(argument: "Argument", help_format: str, offset: in
     """
     # Check for choices first (Literal/Enum types). Choice-bearing specs use
     # double-quoted outer to allow embedding a literal ``'`` in a choice.
-    choices = argument.get_choices(force=True)
+    choices = completion_choices(argument)
     if choices:
         escaped_choices = [_escape_choice_for_dq_spec(clean_choice_text(c)) for c in choices]
         choices_str = " ".join(escaped_choices)
@@ -894,7 +955,7 @@ def _generate_positional_spec(argument: "Argument", help_format: str, offset: in
         desc = _escape_zsh_description_dq(_description_text(argument, help_format))
         quote = '"'
     else:
-        action = _map_completion_action_to_zsh(get_completion_action(argument.hint))
+        action = _map_completion_action_to_zsh(completion_action(argument))
         desc = _get_description_from_argument(argument, help_format)
         quote = "'"
 
@@ -956,6 +1017,8 @@ def _map_completion_action_to_zsh(action: CompletionAction) -> str:
         return "_files"
     elif action == CompletionAction.DIRECTORIES:
         return "_directories"
+    elif action == CompletionAction.CALLBACK:
+        return "_cyclopts_callback"
     return ""
 
 
@@ -1012,3 +1075,156 @@ def _safe_get_description_from_app(cmd_app: "App | CommandSpec", help_format: st
 
     text = strip_markup(text, format=help_format)
     return _escape_zsh_description(text)
+
+
+def _ansi_c_quote(text: str) -> str:
+    r"""Quote ``text`` as a zsh ``$'...'`` string, encoding newlines as ``\n``."""
+    text = text.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+    return f"$'{text}'"
+
+
+def _describe_entry(name: str, description: str) -> str:
+    """``name:description`` entry for ``_describe``; colons in ``name`` are escaped."""
+    name = name.replace("\\", "\\\\").replace(":", "\\:")
+    return f"{name}:{description}" if description else name
+
+
+def _generate_table_script(
+    app: "App",
+    completion_data: dict[tuple[str, ...], CompletionData],
+    prog_name: str,
+) -> str:
+    """Generate a table-driven zsh completion script.
+
+    Uses the same node-indexed tables as the bash generator (see
+    :func:`.build_completion_table`), stored in global associative arrays:
+
+    * ``<prefix>_t["<node> <command>"]`` - child node.
+    * ``<prefix>_v["<node> <option>"]`` - value completion of an option that takes a value;
+      ``"<node> @<slot>"`` and ``"<node> @*"`` for positionals.
+    * ``<prefix>_o[<node>]`` / ``<prefix>_c[<node>]`` - newline-separated ``_describe`` entries.
+
+    The dynamic ``cyclopts run`` completion is not available in this mode.
+    """
+    nodes = build_completion_table(
+        completion_data,
+        tuple(app.help_flags) if app.help_flags else (),
+        tuple(app.version_flags) if app.version_flags else (),
+    )
+    prefix = f"_cyclopts_{prog_name.replace('-', '_')}"
+
+    transitions, values, options, commands = [], [], [], []
+    for i, node in enumerate(nodes):
+        transitions.extend(f"  {_ansi_c_quote(f'{i} {name}')} {child}" for name, child in node.commands.items())
+        values.extend(
+            f"  {_ansi_c_quote(f'{i} {name}')} {_ansi_c_quote(encode_value_completion(value))}"
+            for name, value in node.option_values.items()
+        )
+        values.extend(
+            f"  {_ansi_c_quote(f'{i} @{slot}')} {_ansi_c_quote(encode_value_completion(value))}"
+            for slot, value in enumerate(node.positionals)
+        )
+        if node.rest is not None:
+            values.append(f"  {_ansi_c_quote(f'{i} @*')} {_ansi_c_quote(encode_value_completion(node.rest))}")
+        if node.options:
+            entries = "\n".join(_describe_entry(name, help) for name, help in node.options.items())
+            options.append(f"  {i} {_ansi_c_quote(entries)}")
+        if node.commands:
+            entries = "\n".join(_describe_entry(name, node.command_help[name]) for name in node.commands)
+            commands.append(f"  {i} {_ansi_c_quote(entries)}")
+
+    body = dedent(f"""\
+        _cyclopts_{prog_name}() {{
+          local cur=${{words[CURRENT]}} node=0 pos=0 skip=0 opt= word next spec key i
+          local -a entries
+
+          # Walk the typed words: one table lookup per word.
+          for (( i = 2; i < CURRENT; i++ )); do
+            word=${{words[i]}}
+            if (( skip )); then
+              skip=0
+              continue
+            fi
+            if [[ $word == -* ]]; then
+              key="$node $word"
+              if [[ $word != *=* ]] && (( ${{+{prefix}_v[$key]}} )); then
+                skip=1
+                opt=$word
+              fi
+              continue
+            fi
+            key="$node $word"
+            next=${{{prefix}_t[$key]}}
+            if (( pos == 0 )) && [[ -n $next ]]; then
+              node=$next
+            else
+              (( ++pos ))
+            fi
+          done
+
+          if [[ $cur == -*=* ]]; then
+            key="$node ${{cur%%=*}}"
+            (( ${{+{prefix}_v[$key]}} )) || return 1
+            compset -P '*='
+            spec=${{{prefix}_v[$key]}}
+          elif (( skip )); then
+            key="$node $opt"
+            spec=${{{prefix}_v[$key]}}
+          elif [[ $cur == -* ]]; then
+            entries=(${{(f){prefix}_o[$node]}})
+            _describe -t options 'option' entries
+            return
+          elif (( pos == 0 )) && [[ -n ${{{prefix}_c[$node]}} ]]; then
+            entries=(${{(f){prefix}_c[$node]}})
+            _describe -t commands 'command' entries
+            return
+          else
+            key="$node @$pos"
+            (( ${{+{prefix}_v[$key]}} )) || key="$node @*"
+            spec=${{{prefix}_v[$key]}}
+          fi
+
+          case $spec in
+            f) _files ;;
+            d) _files -/ ;;
+            w*)
+              entries=(${{(f)spec[2,-1]}})
+              compadd -a entries
+              ;;
+            c)
+              entries=(${{(f)"$(_CYCLOPTS_COMPLETE=zsh ${{(Q)words[1]}} "${{(@Q)words[2,CURRENT]}}" 2>/dev/null)"}})
+              compadd -a entries
+              ;;
+            *) return 1 ;;
+          esac
+        }}""")
+
+    lines = [
+        f"#compdef {prog_name}",
+        "# Generated by Cyclopts (table-driven)",
+        "",
+        f"typeset -gA {prefix}_t {prefix}_v {prefix}_o {prefix}_c",
+        f"{prefix}_t=(",
+        *transitions,
+        ")",
+        f"{prefix}_v=(",
+        *values,
+        ")",
+        f"{prefix}_o=(",
+        *options,
+        ")",
+        f"{prefix}_c=(",
+        *commands,
+        ")",
+        "",
+        body,
+        "",
+        # Autoloaded from $fpath by compinit: run now. Sourced directly: register.
+        "if [[ ${zsh_eval_context[-1]} == loadautofunc ]]; then",
+        f'  _cyclopts_{prog_name} "$@"',
+        "else",
+        f"  compdef _cyclopts_{prog_name} {prog_name}",
+        "fi",
+        "",
+    ]
+    return "\n".join(lines)
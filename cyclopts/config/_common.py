@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from attrs import define, field
 
 from cyclopts.argument import ArgumentCollection, update_argument_collection
+from cyclopts.config import _disk_cache, _search
 from cyclopts.exceptions import CycloptsError
 from cyclopts.utils import to_tuple_converter
 
@@ -94,13 +95,14 @@ class FileCacheKey:
 
     def __init__(self, path: str | Path):
         self.path = Path(path).absolute()
-        if self.path.exists():
+        try:
             stat = self.path.stat()
-            self._mtime = stat.st_mtime
-            self._size = stat.st_size
-        else:
+        except OSError:
             self._mtime = None
             self._size = None
+        else:
+            self._mtime = stat.st_mtime
+            self._size = stat.st_size
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -119,6 +121,7 @@ class ConfigFromFile(ConfigBase):
     path: str | Path = field(converter=Path)
     must_exist: bool = field(default=False, kw_only=True)
     search_parents: bool = field(default=False, kw_only=True)
+    disk_cache: bool = field(default=False, kw_only=True)
 
     _config: dict[str, Any] | None = field(default=None, init=False, repr=False)
     "Loaded configuration structure (to be loaded by subclassed ``_load_config`` method)."
@@ -147,30 +150,31 @@ class ConfigFromFile(ConfigBase):
     @property
     def config(self) -> dict[str, Any]:
         assert isinstance(self.path, Path)
-        for parent in self.path.expanduser().resolve().absolute().parents:
-            candidate = parent / self.path.name
-            if candidate.exists():
-                cache_key = FileCacheKey(candidate)
-                if self._config_cache_key == cache_key:
-                    return self._config or {}
-
-                try:
+        path = self.path.expanduser().resolve().absolute()
+        for candidate in _search.candidates(path, self.search_parents):
+            cache_key = FileCacheKey(candidate)
+            if cache_key._mtime is None:
+                continue  # Listed, but doesn't exist (e.g. a dangling symlink).
+            if self._config_cache_key == cache_key:
+                return self._config or {}
+
+            try:
+                if self.disk_cache:
+                    self._config = _disk_cache.load(candidate, type(self), self._load_config)
+                else:
                     self._config = self._load_config(candidate)
-                    self._config_cache_key = cache_key
-                except CycloptsError:
-                    raise
-                except Exception as e:
-                    msg = getattr(type(e), "__name__", "")
-                    with suppress(IndexError):
-                        exception_msg = e.args[0]
-                        if msg:
-                            msg += ": "
-                        msg += exception_msg
-                    raise CycloptsError(msg=msg) from e
-                return self._config
-            if not self.search_parents:
-                # Only look at the specified path; do not walk parent directories.
-                break
+                self._config_cache_key = cache_key
+            except CycloptsError:
+                raise
+            except Exception as e:
+                msg = getattr(type(e), "__name__", "")
+                with suppress(IndexError):
+                    exception_msg = e.args[0]
+                    if msg:
+                        msg += ": "
+                    msg += exception_msg
+                raise CycloptsError(msg=msg) from e
+            return self._config
 
         # No matching file was found.
         if self.must_exist:
@@ -0,0 +1,79 @@
+"""On-disk cache of parsed configuration files; see :attr:`ConfigFromFile.disk_cache`.
+
+Parsed configurations are pickled into ``$XDG_CACHE_HOME/cyclopts/config/``, one
+file per configuration file and loader type, and reused while the configuration
+file's modification time and size are unchanged. Since unpickling can run arbitrary code,
+entries are only loaded if they, and their directory, can't have been written by another user.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from collections.abc import Callable
+from pathlib import Path
+from stat import S_IWGRP, S_IWOTH
+from typing import Any
+
+from cyclopts._cache import RACY_NS, atomic_write, cache_root
+
+_FORMAT = 1
+
+
+def cache_dir() -> Path:
+    return cache_root() / "config"
+
+
+def _private(stat: os.stat_result) -> bool:
+    """Whether only the current user may modify the file or directory; always true on Windows."""
+    if not hasattr(os, "getuid"):
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & (S_IWGRP | S_IWOTH)
+
+
+def load(path: Path, loader: type, parse: Callable[[Path], dict[str, Any]]) -> dict[str, Any]:
+    """``parse(path)``, cached on disk.
+
+    Parameters
+    ----------
+    path: Path
+        Absolute path of the configuration file.
+    loader: type
+        Class of the configuration source; entries of different loaders are independent.
+    parse: Callable[[Path], dict[str, Any]]
+        Parses the configuration file. Its exceptions are propagated.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return parse(path)
+
+    from cyclopts import __version__
+
+    name = f"{loader.__module__}.{loader.__qualname__}"
+    identity = (_FORMAT, __version__, name, str(path), stat.st_mtime_ns, stat.st_size)
+    file = cache_dir() / f"{hashlib.sha256(f'{name}:{path}'.encode()).hexdigest()[:32]}.pickle"
+
+    try:
+        with file.open("rb") as f:
+            if _private(file.parent.stat()) and _private(os.fstat(f.fileno())):
+                cached_identity, config = pickle.load(f)
+                if cached_identity == identity and isinstance(config, dict):
+                    return config
+    except Exception:  # Missing, corrupt or incompatible; parse instead.
+        pass
+
+    config = parse(path)
+    if time.time_ns() - stat.st_mtime_ns > RACY_NS:  # Recently modified files are parsed, but not cached.
+        _store(file, identity, config)
+    return config
+
+
+def _store(file: Path, identity: tuple, config: Any) -> None:
+    """Atomically write a cache entry. Failures are silently ignored."""
+    try:
+        data = pickle.dumps((identity, config), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        return
+    # Only the current user may write pickles that are loaded later.
+    atomic_write(file, data, mode=0o700, file_mode=0o600)
@@ -0,0 +1,113 @@
+"""Search for configuration files in a directory and its ancestors.
+
+Each directory is read with a single :func:`os.scandir`. Listings are cached per process
+and revalidated by the directory's modification time, which changes whenever an entry is
+added, removed or renamed. Within a :func:`session` (e.g. while an app applies all of its
+configuration sources) each directory is revalidated at most once, so sources looking for
+different files in the same ancestors share one upward walk.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+
+from cyclopts._cache import RACY_NS
+
+# The default file systems of macOS and Windows are case-insensitive.
+_CASE_INSENSITIVE = sys.platform in ("darwin", "win32")
+
+_listings: dict[Path, tuple[int, frozenset[str]]] = {}
+# Per thread (and task), e.g. for ``App.parse_many`` workers.
+_session: ContextVar[dict[Path, frozenset[str] | None] | None] = ContextVar("_session", default=None)
+
+
+def clear() -> None:
+    """Forget all cached directory listings."""
+    _listings.clear()
+    _ancestors.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _ancestors(directory: Path) -> tuple[Path, ...]:
+    # Reusing the same ``Path`` objects keeps their (lazily computed) string and hash.
+    return (directory, *directory.parents)
+
+
+@contextmanager
+def session() -> Iterator[None]:
+    """Revalidate each directory listing at most once within this context. Reentrant."""
+    if _session.get() is not None:
+        yield
+        return
+    token = _session.set({})
+    try:
+        yield
+    finally:
+        _session.reset(token)
+
+
+def listing(directory: Path) -> frozenset[str] | None:
+    """Names of the entries of ``directory``; :obj:`None` if it cannot be read."""
+    session = _session.get()
+    if session is not None and directory in session:
+        return session[directory]
+
+    names: frozenset[str] | None
+    try:
+        mtime = directory.stat().st_mtime_ns
+        cached = _listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            names = cached[1]
+        else:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries)
+            if time.time_ns() - mtime > RACY_NS:
+                _listings[directory] = (mtime, names)
+            else:
+                _listings.pop(directory, None)
+    except OSError:
+        names = None
+
+    if session is not None:
+        session[directory] = names
+    return names
+
+
+def _contains(names: frozenset[str], name: str) -> bool:
+    if name in names:
+        return True
+    if not _CASE_INSENSITIVE:
+        return False
+    folded = name.casefold()
+    return any(entry.casefold() == folded for entry in names)
+
+
+def candidates(path: Path, search_parents: bool) -> Iterator[Path]:
+    """Possible locations of ``path.name`` in ``path``'s directory and, optionally, its ancestors.
+
+    Names are compared case-insensitively on macOS and Windows, like their default file systems do.
+    Yielded paths may still not exist (e.g. dangling symlinks), so callers :meth:`~pathlib.Path.stat`
+    them anyway. Without ``search_parents``, ``path`` is yielded as-is: that single ``stat()`` is cheaper
+    than reading its directory. Directories that can't be listed (e.g. with execute but no read permission)
+    also fall back to ``stat()``.
+
+    Parameters
+    ----------
+    path: Path
+        Absolute path of the file.
+    search_parents: bool
+        Also look in all ancestors of ``path``'s directory, nearest first.
+    """
+    if not search_parents:
+        yield path
+        return
+    name = path.name
+    for parent in _ancestors(path.parent):
+        names = listing(parent)
+        if names is None or _contains(names, name):
+            yield parent / name
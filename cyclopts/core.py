@@ -3,8 +3,10 @@ import inspect
 import os
 import sys
 import traceback
+from collections import deque
 from collections.abc import Callable, Coroutine, Iterable, Iterator, Sequence
 from contextlib import suppress
+from contextvars import copy_context
 from copy import copy
 from enum import Enum
 from functools import lru_cache, partial
@@ -16,7 +18,9 @@ from typing import (
     Annotated,
     Any,
     Literal,
+    NamedTuple,
     Optional,
+    TextIO,
     TypeVar,
     Union,
     cast,
@@ -25,6 +29,7 @@ from typing import (
 
 from attrs import Factory, define, field
 
+import cyclopts.field_info
 from cyclopts.annotations import resolve_annotated
 from cyclopts.app_stack import AppStack
 from cyclopts.argument import ArgumentCollection
@@ -46,6 +51,7 @@ from cyclopts.panel import CycloptsPanel
 from cyclopts.parameter import Parameter, validate_command
 from cyclopts.protocols import Dispatcher
 from cyclopts.token import Token
+from cyclopts.tracing import span
 from cyclopts.utils import (
     UNSET,
     create_error_console_from_console,
@@ -75,6 +81,7 @@ if TYPE_CHECKING:
     from cyclopts.help import HelpPanel
     from cyclopts.help.protocols import HelpFormatter
 
+from cyclopts import _plain
 from cyclopts._result_action import ResultAction, ResultActionSingle
 from cyclopts._run import _run_maybe_async_command
 
@@ -134,6 +141,26 @@ def _get_version_command(app):
         return app.version_print
 
 
+_parse_many_worker_app: "App | None" = None
+"""App used by :meth:`App.parse_many` process-pool workers; set by :func:`_parse_many_worker_init`."""
+
+
+def _parse_many_worker_init(app: "App"):
+    global _parse_many_worker_app
+    _parse_many_worker_app = app
+
+
+def _parse_many_worker(argvs: list[list[str]]):
+    assert _parse_many_worker_app is not None
+    results = _parse_many_worker_app._parse_batch(argvs)
+    for _, _, error in results:
+        if isinstance(error, CycloptsError):
+            # The worker's copy of the app is meaningless (and possibly unpicklable) in the parent process;
+            # :meth:`App.parse_many` re-attaches the parent's app.
+            error.app = None
+    return results
+
+
 def _apply_parent_defaults_to_app(app: "App", parent_app: "App") -> None:
     """Apply parent app's group defaults to app if not already set.
 
@@ -205,6 +232,8 @@ def _combined_meta_command_mapping(
     CommandSpec instances are NOT resolved here - they are resolved lazily
     only when the command is actually executed, enabling true lazy loading.
 
+    The returned mapping is cached on ``app`` and **must not** be mutated.
+
     Parameters
     ----------
     app : App | None
@@ -221,6 +250,11 @@ def _combined_meta_command_mapping(
     """
     if app is None:
         return {}
+    return app._command_lookup(recurse_meta, recurse_parent_meta).mapping
+
+
+def _build_command_mapping(app: "App", recurse_meta: bool, recurse_parent_meta: bool) -> dict[str, "App | CommandSpec"]:
+    """Uncached implementation of :func:`_combined_meta_command_mapping`."""
     command_mapping = dict(app._commands)
 
     # Add flattened subapp commands (parent commands take precedence)
@@ -237,6 +271,132 @@ def _combined_meta_command_mapping(
     return command_mapping
 
 
+def _build_item_mapping(app: "App", recurse_meta: bool) -> dict[str, "App | CommandSpec"]:
+    """Commands reachable through :meth:`App._get_item`; CommandSpecs are left unresolved.
+
+    Precedence, highest first: the meta app (if ``recurse_meta``), the parent meta app,
+    the app's own commands, then flattened subapps in registration order.
+    """
+    mapping = {}
+    for subapp in reversed(app._flattened_subapps):
+        mapping.update(subapp._item_lookup(recurse_meta=False).mapping)
+    mapping.update(app._commands)
+    if app._meta_parent:
+        mapping.update(app._meta_parent._item_lookup(recurse_meta=False).mapping)
+    if recurse_meta and app._meta:
+        mapping.update(app._meta._item_lookup(recurse_meta=True).mapping)
+    return mapping
+
+
+class _CommandLookup:
+    """Merged command mapping of an :class:`App` at a given ``App._commands_version``.
+
+    The fuzzy-matching index is only built the first time a token misses the exact lookup.
+    """
+
+    __slots__ = ("mapping", "version", "_fuzzy_index")
+
+    def __init__(self, mapping: dict[str, "App | CommandSpec"], version: int):
+        self.mapping = mapping
+        self.version = version
+        self._fuzzy_index: dict[str, list[str]] | None = None
+
+    @property
+    def fuzzy_index(self) -> dict[str, list[str]]:
+        """Maps normalized command names to the command names that produce them."""
+        if self._fuzzy_index is None:
+            fuzzy_index = {}
+            for cmd_name in self.mapping:
+                # Exclude option-like commands (--help, --version, etc.) from fuzzy matching.
+                # Prevents "version" from matching to "--version"
+                if not cmd_name.startswith("-"):
+                    fuzzy_index.setdefault(_normalize_for_matching(cmd_name), []).append(cmd_name)
+            self._fuzzy_index = fuzzy_index
+        return self._fuzzy_index
+
+    def match(self, token: str) -> "App | CommandSpec | None":
+        """Look up ``token``, falling back to fuzzy matching.
+
+        Raises
+        ------
+        ValueError
+            If ``token`` fuzzy-matches more than one command.
+        """
+        # Try exact match first
+        with suppress(KeyError):
+            return self.mapping[token]
+
+        # Don't apply fuzzy matching to option-like tokens (starting with -)
+        # Fuzzy matching is for camelCase command names, not for flags like --h matching -h
+        # Issue #698
+        if token.startswith("-"):
+            return None
+
+        # Try fuzzy match (backward compatibility for camelCase commands).
+        # NOTE: This fuzzy matching is for v4 backward compatibility with
+        # _pascal_to_snake introduction. Consider removing in v5.
+        matches = self.fuzzy_index.get(_normalize_for_matching(token), ())
+        if len(matches) == 1:
+            # Single fuzzy match found
+            return self.mapping[matches[0]]
+        elif len(matches) > 1:
+            # Ambiguous match - multiple commands match after normalization
+            raise ValueError(f"Ambiguous command '{token}'. Could match: {', '.join(sorted(matches))}.")
+        return None
+
+
+def _resolve_command(app_or_spec: "App | CommandSpec", parent_app: "App") -> "App":
+    # CommandSpec.resolve() has built-in caching via its _resolved field.
+    # Pass the current app as parent to inherit its defaults.
+    if isinstance(app_or_spec, CommandSpec):
+        return app_or_spec.resolve(parent_app)
+    return app_or_spec
+
+
+def _meta_parents(app: "App") -> list["App"]:
+    """Parent meta apps of ``app``; the "root" non-meta app first."""
+    meta_parents = []
+    meta_parent = app
+    while (meta_parent := meta_parent._meta_parent) is not None:
+        meta_parents.append(meta_parent)
+    meta_parents.reverse()
+    return meta_parents
+
+
+class _CommandResolution(NamedTuple):
+    """Result of :meth:`App._resolve_commands`.
+
+    The "context" fields correspond to ``parse_commands(include_parent_meta=True)``,
+    the "execution" fields to ``parse_commands(include_parent_meta=False)``.
+    Offsets index into the normalized token list.
+    """
+
+    tokens: list[str]
+    context_chain: tuple[str, ...]
+    context_path: tuple["App", ...]
+    context_offset: int
+    execution_chain: tuple[str, ...]
+    execution_path: tuple["App", ...]
+    execution_offset: int
+
+
+def _strip_special_flag_commands(resolution: _CommandResolution) -> tuple[tuple[str, ...], "App"]:
+    """Return the execution command chain and command app, excluding trailing help/version commands."""
+    command_chain = resolution.execution_chain
+    execution_apps = resolution.execution_path
+    with suppress(IndexError):
+        # Remove trailing help/version commands from the execution chain.
+        # When users provide multiple flags (e.g., "myapp cmd --help --help"), the parser
+        # may treat trailing help/version flags as commands in the chain. We must remove ALL
+        # such trailing commands and keep command_chain synchronized with execution_apps.
+        while command_chain and command_chain[-1] in set(
+            execution_apps[-2].help_flags + execution_apps[-2].version_flags  # pyright: ignore[reportOperatorIssue]
+        ):
+            execution_apps = execution_apps[:-1]
+            command_chain = command_chain[:-1]
+    return command_chain, execution_apps[-1]
+
+
 def _walk_metas(app: "App"):
     """Typically the result looks like [app] or [meta_app, app].
 
@@ -389,6 +549,7 @@ class App:
     help_on_error: bool | None = field(default=None, kw_only=True)
     help_prologue: str | None = field(default=None, kw_only=True)
     help_epilogue: str | None = field(default=None, kw_only=True)
+    help_cache: bool | None = field(default=None, kw_only=True)
 
     version_format: Literal["markdown", "md", "plaintext", "restructuredtext", "rst", "rich"] | None = field(
         default=None, kw_only=True
@@ -477,6 +638,18 @@ class App:
     _meta: Optional["App"] = field(init=False, default=None)
     _meta_parent: Optional["App"] = field(init=False, default=None)
 
+    # Apps that flattened this app into their own commands (inverse of ``_flattened_subapps``).
+    _flattened_parents: list["App"] = field(init=False, factory=list, repr=False, eq=False)
+
+    _commands_version: int = field(init=False, default=0, repr=False, eq=False)
+    """Bumped whenever the commands reachable from this app change; see :meth:`_invalidate_commands`."""
+
+    _command_lookups: dict[tuple[bool, bool], _CommandLookup] = field(init=False, factory=dict, repr=False, eq=False)
+    """Cached :class:`_CommandLookup` per ``(recurse_meta, recurse_parent_meta)``."""
+
+    _item_lookups: dict[bool, _CommandLookup] = field(init=False, factory=dict, repr=False, eq=False)
+    """Cached :class:`_CommandLookup` of :meth:`_get_item` per ``recurse_meta``."""
+
     _instantiating_module_name: str | None = field(init=False, default=None, repr=False)
     """Module name (e.g., '__main__' or 'mypackage.cli') captured during App initialization.
 
@@ -504,6 +677,21 @@ class App:
 
     app_stack: AppStack = field(init=False, default=Factory(AppStack, takes_self=True))
 
+    _argument_collection_cache: dict[bool, tuple[tuple, tuple, ArgumentCollection]] = field(
+        init=False, factory=dict, repr=False
+    )
+    """Pristine assembled :class:`ArgumentCollection` per ``parse_docstring`` value.
+
+    Each entry is ``(identity_key, equality_key, argument_collection)``. ``identity_key``
+    holds objects compared with ``is`` (``default_command`` and the default groups);
+    ``equality_key`` holds the effective default :class:`Parameter` (and its provided
+    arguments) and the reserved short flags. Any mutation of these inputs yields a
+    mismatching key, so the entry is rebuilt. See :meth:`assemble_argument_collection`.
+    """
+
+    _completion_cache: dict[tuple[str, ...], tuple[str, Any]] = field(init=False, factory=dict, repr=False, eq=False)
+    """Fingerprinted completion data per command path; see :func:`.extract_completion_data`."""
+
     def __attrs_post_init__(self):
         # Trigger the setters
         self.help_flags = self._help_flags
@@ -524,6 +712,41 @@ class App:
     ###########
     # Methods #
     ###########
+    def _invalidate_commands(self):
+        """Bump ``_commands_version`` of this app and of every app whose command mapping includes it."""
+        seen = set()
+        stack = [self]
+        while stack:
+            app = stack.pop()
+            if id(app) in seen:
+                continue
+            seen.add(id(app))
+            app._commands_version += 1
+            if app._meta is not None:
+                stack.append(app._meta)
+            if app._meta_parent is not None:
+                stack.append(app._meta_parent)
+            stack.extend(app._flattened_parents)
+
+    def _command_lookup(self, recurse_meta: bool = True, recurse_parent_meta: bool = True) -> _CommandLookup:
+        """Cached merged command mapping; see :func:`_combined_meta_command_mapping`."""
+        key = (recurse_meta, recurse_parent_meta)
+        lookup = self._command_lookups.get(key)
+        if lookup is None or lookup.version != self._commands_version:
+            version = self._commands_version
+            lookup = _CommandLookup(_build_command_mapping(self, recurse_meta, recurse_parent_meta), version)
+            self._command_lookups[key] = lookup
+        return lookup
+
+    def _item_lookup(self, recurse_meta: bool) -> _CommandLookup:
+        """Cached mapping of :meth:`_get_item`; see :func:`_build_item_mapping`."""
+        lookup = self._item_lookups.get(recurse_meta)
+        if lookup is None or lookup.version != self._commands_version:
+            version = self._commands_version
+            lookup = _CommandLookup(_build_item_mapping(self, recurse_meta), version)
+            self._item_lookups[recurse_meta] = lookup
+        return lookup
+
     def _delete_commands(self, commands: Iterable[str]):
         """Safely delete commands.
 
@@ -943,35 +1166,27 @@ class App:
 
     def _get_item(self, key, recurse_meta=True) -> "App | CommandSpec":
         """Internal getter that returns App or unresolved CommandSpec."""
-        if recurse_meta and self._meta:
-            with suppress(KeyError):
-                return self.meta._get_item(key, recurse_meta=True)
-        if self._meta_parent:
-            with suppress(KeyError):
-                return self._meta_parent._get_item(key, recurse_meta=False)
-
-        # Check local commands first
-        if key in self._commands:
-            return self._commands[key]
-
-        # Check flattened subapps
-        for subapp in self._flattened_subapps:
-            with suppress(KeyError):
-                return subapp._get_item(key, recurse_meta=False)
-
-        raise KeyError(key)
+        return self._item_lookup(recurse_meta).mapping[key]
 
     def __delitem__(self, key: str):
         del self._commands[key]
+        self._invalidate_commands()
 
     def __contains__(self, k: str) -> bool:
+        return k in self._command_lookup(recurse_meta=False).mapping
+
+    def _has_command(self, k: str) -> bool:
+        """Uncached :meth:`__contains__`.
+
+        Used while registering commands so that each registration doesn't rebuild the merged mapping.
+        """
         if k in self._commands:
             return True
         if self._meta_parent:
-            if k in self._meta_parent:
+            if self._meta_parent._has_command(k):
                 return True
         for subapp in self._flattened_subapps:
-            if k in subapp:
+            if subapp._has_command(k):
                 return True
         return False
 
@@ -1028,6 +1243,7 @@ class App:
                 result_action=self.result_action,
             )
             self._meta._meta_parent = self
+            self._invalidate_commands()
         return self._meta
 
     def parse_commands(
@@ -1068,92 +1284,115 @@ class App:
         list[str]
             The remaining non-command tokens.
         """
-        tokens = normalize_tokens(tokens)
-
-        command_chain = []
-        app = self
-        apps: list[App] = []
-        unused_tokens = tokens
+        resolution = self._resolve_commands(tokens)
+        if include_parent_meta:
+            return (
+                resolution.context_chain,
+                resolution.context_path,
+                resolution.tokens[resolution.context_offset :],
+            )
+        return (
+            resolution.execution_chain,
+            resolution.execution_path,
+            resolution.tokens[resolution.execution_offset :],
+        )
 
-        def add_parent_metas(app):
-            """If ``app`` is a meta-app, also add it's "normal" app.
+    def _resolve_commands(self, tokens: None | str | Iterable[str] = None) -> _CommandResolution:
+        """Resolve the command chain for both ``include_parent_meta`` modes in a single pass.
 
-            We assume that ``app._meta`` will always invoke the ``app``.
-            """
-            if not include_parent_meta:
-                return
-            meta_parents = []
-            meta_parent = app
-            while (meta_parent := meta_parent._meta_parent) is not None:
-                meta_parents.append(meta_parent)
-            # The "root" non-meta app gets highest priority (first)
-            apps.extend(meta_parents[::-1])
-
-        add_parent_metas(app)
-        apps.append(app)
-        command_mapping = _combined_meta_command_mapping(app, recurse_parent_meta=include_parent_meta)
-
-        unused_tokens = tokens
-        while unused_tokens:
-            token = unused_tokens[0]
-            app_or_spec = None
-
-            # Try exact match first; O(1)
-            if token in command_mapping:
-                app_or_spec = command_mapping[token]
-            # Don't apply fuzzy matching to option-like tokens (starting with -)
-            # Fuzzy matching is for camelCase command names, not for flags like --h matching -h
-            # Issue #698
-            elif not token.startswith("-"):
-                # Try fuzzy match (backward compatibility for camelCase commands) O(n).
-                # NOTE: This fuzzy matching is for v4 backward compatibility with
-                # _pascal_to_snake introduction. Consider removing in v5.
-                normalized_token = _normalize_for_matching(token)
-                # Also exclude option-like commands (--help, --version, etc.) from fuzzy matching.
-                # Prevents "version" from matching to "--version"
-                matches = [
-                    cmd_name
-                    for cmd_name in command_mapping
-                    if not cmd_name.startswith("-") and _normalize_for_matching(cmd_name) == normalized_token
-                ]
+        The context walk (``include_parent_meta=True``) also sees parent meta-app commands
+        and skips over leading meta-app options. The execution walk
+        (``include_parent_meta=False``) stops at the first non-command token.
+        Both walks take identical steps until the execution walk stops or, when
+        the current app is a meta app, resolves a token differently; only from
+        that point on is the execution walk continued on its own.
+        """
+        tokens = normalize_tokens(tokens)
+        n_tokens = len(tokens)
 
-                if len(matches) == 1:
-                    # Single fuzzy match found
-                    app_or_spec = command_mapping[matches[0]]
-                elif len(matches) > 1:
-                    # Ambiguous match - multiple commands match after normalization
-                    raise ValueError(f"Ambiguous command '{token}'. Could match: {', '.join(sorted(matches))}.")
+        app = self
+        context_chain: list[str] = []
+        context_path = _meta_parents(app)
+        context_path.append(app)
+        execution_chain: list[str] = []
+        execution_path: list[App] = [app]
+        execution_offset = None  # ``None`` while the execution walk is in lockstep.
+
+        i = 0
+        while i < n_tokens:
+            token = tokens[i]
+            app_or_spec = app._command_lookup().match(token)
+
+            if execution_offset is None and app._meta_parent is not None:
+                # Parent meta commands are only visible to the context walk.
+                execution_app_or_spec = app._command_lookup(recurse_parent_meta=False).match(token)
+                if execution_app_or_spec is not app_or_spec:
+                    execution_offset = self._walk_execution_commands(app, tokens, i, execution_chain, execution_path)
 
             if app_or_spec is None:
+                if execution_offset is None:
+                    execution_offset = i
                 # Token is not a command. Try to consume it as a meta app parameter.
-                # This is only relevant when ``include_parent_meta==True``, because
-                # otherwise it will be handled by the natural parsing process.
-                if include_parent_meta:
-                    remaining = self._consume_leading_meta_options(apps, unused_tokens)
-                    if len(remaining) < len(unused_tokens):
-                        # Some meta parameters were consumed, continue looking for commands
-                        unused_tokens = remaining
-                        continue
+                consumed = self._consume_leading_meta_options(context_path, tokens, i)
+                if consumed > i:
+                    # Some meta parameters were consumed, continue looking for commands
+                    i = consumed
+                    continue
                 # Not a command or meta parameter, stop parsing commands
                 break
 
-            # Resolve CommandSpec if needed (lazy loading)
-            # Note: CommandSpec.resolve() has built-in caching via its _resolved field
-            # Pass the current app as parent to inherit its defaults
-            if isinstance(app_or_spec, CommandSpec):
-                parent_app = app  # Save parent before overwriting
-                app = app_or_spec.resolve(parent_app)
-            else:
-                app = app_or_spec
+            app = _resolve_command(app_or_spec, app)
 
             # Found a command - add it to the chain
-            add_parent_metas(app)
+            context_path.extend(_meta_parents(app))
+            context_path.append(app)
+            context_chain.append(token)
+            if execution_offset is None:
+                execution_path.append(app)
+                execution_chain.append(token)
+            i += 1
+
+        if execution_offset is None:
+            execution_offset = i
+
+        return _CommandResolution(
+            tokens=tokens,
+            context_chain=tuple(context_chain),
+            context_path=tuple(context_path),
+            context_offset=i,
+            execution_chain=tuple(execution_chain),
+            execution_path=tuple(execution_path),
+            execution_offset=execution_offset,
+        )
+
+    @staticmethod
+    def _walk_execution_commands(
+        app: "App",
+        tokens: list[str],
+        start: int,
+        command_chain: list[str],
+        apps: list["App"],
+    ) -> int:
+        """Continue the ``include_parent_meta=False`` walk from ``tokens[start]``.
+
+        ``command_chain`` and ``apps`` are extended in-place.
+
+        Returns
+        -------
+        int
+            Offset of the first non-command token.
+        """
+        i = start
+        while i < len(tokens):
+            token = tokens[i]
+            app_or_spec = app._command_lookup(recurse_parent_meta=False).match(token)
+            if app_or_spec is None:
+                break
+            app = _resolve_command(app_or_spec, app)
             apps.append(app)
-            command_mapping = _combined_meta_command_mapping(app, recurse_parent_meta=include_parent_meta)
             command_chain.append(token)
-            unused_tokens = unused_tokens[1:]
-
-        return tuple(command_chain), tuple(apps), unused_tokens
+            i += 1
+        return i
 
     def _get_resolution_context(self, execution_path: Sequence["App"]) -> list["App"]:
         """Get all apps that contribute to parameter resolution for the given execution path.
@@ -1192,7 +1431,7 @@ class App:
 
         return apps
 
-    def _consume_leading_meta_options(self, apps: list["App"], tokens: list[str]) -> list[str]:
+    def _consume_leading_meta_options(self, apps: list["App"], tokens: list[str], start: int = 0) -> int:
         """Consume meta app options from the beginning of the token stream.
 
         This is used to skip over meta app parameters when looking for commands.
@@ -1206,22 +1445,21 @@ class App:
         apps: list[App]
             Current app stack including parent meta apps.
         tokens: list[str]
-            Tokens to try parsing, starting from current position.
+            Full token stream.
+        start: int
+            Offset of the first token to try parsing.
 
         Returns
         -------
-        list[str]
-            The remaining unused tokens after consuming any leading meta options.
+        int
+            Offset of the first token after any consumed leading meta options.
         """
-        if not apps or not tokens:
-            return tokens
+        # Meta options can only be consumed if they start with an option.
+        if not apps or start >= len(tokens) or not is_option_like(tokens[start], allow_numbers=True):
+            return start
 
         from cyclopts.bind import _parse_kw_and_flags
 
-        # Resolve end_of_options_delimiter from the partially-resolved app stack
-        with self.app_stack(apps):
-            end_of_options_delimiter = self.app_stack.resolve("end_of_options_delimiter", fallback="--")
-
         # Collect meta apps that could have parameters
         # We need both:
         # 1. Meta apps in the current stack (apps that ARE meta apps)
@@ -1232,25 +1470,33 @@ class App:
         if apps[-1]._meta and apps[-1]._meta.default_command:
             meta_apps_to_try.append(apps[-1]._meta)
 
-        # Try to parse with each meta app's parameters
-        unused_tokens = tokens
-        for meta_app in meta_apps_to_try:
-            try:
-                argument_collection = meta_app.assemble_argument_collection()
+        if not meta_apps_to_try:
+            return start
 
-                # Try to consume tokens with this meta app's parameters
-                # stop_at_first_unknown=True ensures we only consume contiguous leading options
-                unused_tokens, _ = _parse_kw_and_flags(
-                    argument_collection,
-                    unused_tokens,
-                    end_of_options_delimiter=end_of_options_delimiter,
-                    stop_at_first_unknown=True,
-                )
-            except Exception:
-                # If parsing fails, try next meta app
-                continue
+        with span("consume_meta_options"):
+            # Resolve end_of_options_delimiter from the partially-resolved app stack
+            with self.app_stack(apps):
+                end_of_options_delimiter = self.app_stack.resolve("end_of_options_delimiter", fallback="--")
+
+            # Try to parse with each meta app's parameters
+            unused_tokens = tokens[start:]
+            for meta_app in meta_apps_to_try:
+                try:
+                    argument_collection = meta_app.assemble_argument_collection()
+
+                    # Try to consume tokens with this meta app's parameters
+                    # stop_at_first_unknown=True ensures we only consume contiguous leading options
+                    unused_tokens, _ = _parse_kw_and_flags(
+                        argument_collection,
+                        unused_tokens,
+                        end_of_options_delimiter=end_of_options_delimiter,
+                        stop_at_first_unknown=True,
+                    )
+                except Exception:
+                    # If parsing fails, try next meta app
+                    continue
 
-        return unused_tokens
+        return len(tokens) - len(unused_tokens)
 
     # This overload is used in code like:
     #
@@ -1369,6 +1615,8 @@ class App:
 
             _apply_parent_defaults_to_app(obj, self)
             self._flattened_subapps.append(obj)
+            obj._flattened_parents.append(self)
+            self._invalidate_commands()
             return obj  # pyright: ignore[reportReturnType]
 
         # Convert string path to a CommandSpec
@@ -1401,9 +1649,10 @@ class App:
 
             # Register the CommandSpec
             for n in name + alias:
-                if n in self:
+                if self._has_command(n):
                     raise CommandCollisionError(f'Command "{n}" already registered.')
                 self._commands[n] = spec
+                self._invalidate_commands()
 
             return None
 
@@ -1445,9 +1694,10 @@ class App:
             alias = to_tuple_converter(alias)
 
         for n in name + alias:  # pyright: ignore[reportOperatorIssue]
-            if n in self:
+            if self._has_command(n):
                 raise CommandCollisionError(f'Command "{n}" already registered.')
             self._commands[n] = app
+            self._invalidate_commands()
 
         return obj  # pyright: ignore[reportReturnType]
 
@@ -1549,14 +1799,41 @@ class App:
                 "Use @app.default to register a default command, or access a specific "
                 "subcommand's argument collection via app['command_name'].assemble_argument_collection()."
             )
-        return ArgumentCollection._from_callable(
-            self.default_command,  # pyright: ignore
-            Parameter.combine(self.app_stack.default_parameter, default_parameter),
-            group_arguments=self._group_arguments,  # pyright: ignore
-            group_parameters=self._group_parameters,  # pyright: ignore
-            parse_docstring=parse_docstring,
-            reserved=(f for f in (*self.help_flags, *self.version_flags) if is_short_flag(f)),
-        )
+        with span("assemble_argument_collection", parse_docstring=parse_docstring) as metadata:
+            combined_default_parameter = Parameter.combine(self.app_stack.default_parameter, default_parameter)
+            reserved = tuple(f for f in (*self.help_flags, *self.version_flags) if is_short_flag(f))
+
+            # Assembly is a pure function of these inputs; reuse the pristine collection and
+            # hand out a clone with fresh per-parse state (tokens, values, marks).
+            identity_key = (self.default_command, self._group_arguments, self._group_parameters)
+            equality_key = (
+                combined_default_parameter,
+                combined_default_parameter._provided_args,
+                reserved,
+                cyclopts.field_info._cache_generation,
+            )
+            with suppress(KeyError):
+                cached_identity_key, cached_equality_key, argument_collection = self._argument_collection_cache[
+                    parse_docstring
+                ]
+                if (
+                    all(a is b for a, b in zip(cached_identity_key, identity_key, strict=True))
+                    and cached_equality_key == equality_key
+                ):
+                    metadata["cached"] = True
+                    return argument_collection._clone()
+
+            metadata["cached"] = False
+            argument_collection = ArgumentCollection._from_callable(
+                self.default_command,  # pyright: ignore
+                combined_default_parameter,
+                group_arguments=self._group_arguments,  # pyright: ignore
+                group_parameters=self._group_parameters,  # pyright: ignore
+                parse_docstring=parse_docstring,
+                reserved=reserved,
+            )
+            self._argument_collection_cache[parse_docstring] = (identity_key, equality_key, argument_collection)
+            return argument_collection._clone()
 
     def parse_known_args(
         self,
@@ -1616,134 +1893,157 @@ class App:
         tokens: None | str | Iterable[str] = None,
         *,
         raise_on_unused_tokens: bool = False,
+        _plain_errors: bool = False,
     ) -> tuple[Callable[..., Any], inspect.BoundArguments, list[str], dict[str, Any], ArgumentCollection]:
         if tokens is None:
             _log_framework_warning(_detect_test_framework())
 
-        tokens = normalize_tokens(tokens)
-
-        meta_parent = self
-
         # We need both versions of the apps list:
         # 1. apps_for_context (with parent metas) - for setting up the app_stack context
         # 2. execution_apps (without parent metas) - for determining the actual execution command
-        # These can differ when parse_commands is called from a meta app, so we must
-        # call parse_commands twice. This is not inefficient since the parsing is fast.
-        _, apps_for_context, _ = self.parse_commands(tokens, include_parent_meta=True)
-        command_chain, execution_apps, unused_tokens = self.parse_commands(tokens, include_parent_meta=False)
-
-        # We don't want the command_app to be the version/help handler; we handle those specially
-        command_app = execution_apps[-1]
-        with suppress(IndexError):
-            # Remove trailing help/version commands from the execution chain.
-            # When users provide multiple flags (e.g., "myapp cmd --help --help"), the parser
-            # may treat trailing help/version flags as commands in the chain. We must remove ALL
-            # such trailing commands and keep command_chain synchronized with execution_apps.
-            while command_chain and command_chain[-1] in set(
-                execution_apps[-2].help_flags + execution_apps[-2].version_flags  # pyright: ignore[reportOperatorIssue]
-            ):
-                execution_apps = execution_apps[:-1]
-                command_chain = command_chain[:-1]
+        # These can differ when parsing from a meta app; both come from a single traversal.
+        with span("parse_commands"):
+            resolution = self._resolve_commands(tokens)
+        tokens = resolution.tokens
+        unused_tokens = tokens[resolution.execution_offset :]
+        command_chain, command_app = _strip_special_flag_commands(resolution)
+
+        with self.app_stack(resolution.context_path):
+            config, end_of_options_delimiter = self._command_settings(command_app, command_chain)
+            try:
+                return self._parse_resolved(
+                    command_app,
+                    command_chain,
+                    tokens,
+                    unused_tokens,
+                    config=config,
+                    end_of_options_delimiter=end_of_options_delimiter,
+                    raise_on_unused_tokens=raise_on_unused_tokens,
+                )
+            except CycloptsError as e:
+                # With ``_plain_errors``, the caller may print the error without rich; see ``cyclopts._plain``.
+                if e.console is None and not (_plain_errors and _plain.errors_enabled(command_app)):
+                    e.console = command_app.error_console
+                raise
 
-        command_app = execution_apps[-1]
-        del execution_apps  # Always use AppStack from here-on.
+    def _command_settings(self, command_app: "App", command_chain: tuple[str, ...]) -> tuple[tuple[Callable, ...], str]:
+        """Resolve the config callbacks and end-of-options delimiter for ``command_app``.
 
-        ignored: dict[str, Any] = {}
+        Must be called within the command's ``app_stack`` context.
+        """
+        config: tuple[Callable, ...] = command_app.app_stack.resolve("_config") or ()
+        config = tuple(partial(x, command_app, command_chain) for x in config)
+        end_of_options_delimiter = self.app_stack.resolve("end_of_options_delimiter", fallback="--")
+        return config, end_of_options_delimiter
 
-        with self.app_stack(apps_for_context):
-            config: tuple[Callable, ...] = command_app.app_stack.resolve("_config") or ()
-            config = tuple(partial(x, command_app, command_chain) for x in config)
-            end_of_options_delimiter = self.app_stack.resolve("end_of_options_delimiter", fallback="--")
+    def _parse_resolved(
+        self,
+        command_app: "App",
+        command_chain: tuple[str, ...],
+        tokens: list[str],
+        unused_tokens: list[str],
+        *,
+        config: tuple[Callable, ...],
+        end_of_options_delimiter: str,
+        raise_on_unused_tokens: bool,
+    ) -> tuple[Callable[..., Any], inspect.BoundArguments, list[str], dict[str, Any], ArgumentCollection]:
+        """Bind ``unused_tokens`` to an already-resolved ``command_app``.
 
-            # Special flags (help/version) get intercepted by the root app.
-            # Special flags are allows to be **anywhere** in the token stream.
+        Must be called within the command's ``app_stack`` context.
+        """
+        meta_parent = self
+        ignored: dict[str, Any] = {}
 
-            help_flag_index = _get_help_flag_index(tokens, command_app.help_flags, end_of_options_delimiter)
+        # Special flags (help/version) get intercepted by the root app.
+        # Special flags are allows to be **anywhere** in the token stream.
 
-            try:
-                if help_flag_index is not None:
-                    # Remove ALL help and version flags from both token lists.
-                    # Users can provide multiple flags (e.g., "myapp --help --help --version").
-                    # When help is requested, it takes priority over version, so we remove all
-                    # occurrences of both flag types to prevent downstream parsing errors.
-                    flags_to_remove = set(command_app.help_flags + command_app.version_flags)  # pyright: ignore[reportOperatorIssue]
-                    tokens[:] = [t for t in tokens if t not in flags_to_remove]
-                    unused_tokens[:] = [t for t in unused_tokens if t not in flags_to_remove]
-
-                    command = self.help_print
-                    while meta_parent := meta_parent._meta_parent:
-                        command = meta_parent.help_print
-                    bound = inspect.signature(command).bind(tokens, console=command_app.console)
-                    unused_tokens = []
-                    argument_collection = ArgumentCollection()
-                elif any(flag in tokens for flag in command_app.version_flags):
-                    command = _get_version_command(command_app)
-                    while meta_parent := meta_parent._meta_parent:
-                        command = _get_version_command(meta_parent)
-
-                    bound = inspect.signature(command).bind(console=command_app.console)
-                    unused_tokens = []
-                    argument_collection = ArgumentCollection()
-                else:
-                    if command_app.default_command:
-                        command = command_app.default_command
-                        validate_command(command)
-                        argument_collection = command_app.assemble_argument_collection()
-                        ignored: dict[str, Any] = {
-                            argument.field_info.name: resolve_annotated(argument.field_info.annotation)
-                            for argument in argument_collection.filter_by(parse=False)
-                        }
-
-                        bound, unused_tokens = create_bound_arguments(
-                            command_app.default_command,
-                            argument_collection,
-                            unused_tokens,
-                            config,
-                            end_of_options_delimiter=end_of_options_delimiter,
-                        )
-                        try:
-                            for validator in command_app.validator:
+        help_flag_index = _get_help_flag_index(tokens, command_app.help_flags, end_of_options_delimiter)
+
+        try:
+            if help_flag_index is not None:
+                # Remove ALL help and version flags from both token lists.
+                # Users can provide multiple flags (e.g., "myapp --help --help --version").
+                # When help is requested, it takes priority over version, so we remove all
+                # occurrences of both flag types to prevent downstream parsing errors.
+                flags_to_remove = set(command_app.help_flags + command_app.version_flags)  # pyright: ignore[reportOperatorIssue]
+                tokens[:] = [t for t in tokens if t not in flags_to_remove]
+                unused_tokens[:] = [t for t in unused_tokens if t not in flags_to_remove]
+
+                command = self.help_print
+                while meta_parent := meta_parent._meta_parent:
+                    command = meta_parent.help_print
+                # Only an explicitly configured console; otherwise ``help_print`` may skip rich entirely.
+                bound = inspect.signature(command).bind(tokens, console=command_app.app_stack.resolve("_console"))
+                unused_tokens = []
+                argument_collection = ArgumentCollection()
+            elif any(flag in tokens for flag in command_app.version_flags):
+                command = _get_version_command(command_app)
+                while meta_parent := meta_parent._meta_parent:
+                    command = _get_version_command(meta_parent)
+
+                bound = inspect.signature(command).bind(console=command_app.console)
+                unused_tokens = []
+                argument_collection = ArgumentCollection()
+            else:
+                if command_app.default_command:
+                    command = command_app.default_command
+                    validate_command(command)
+                    argument_collection = command_app.assemble_argument_collection()
+                    ignored: dict[str, Any] = {
+                        argument.field_info.name: resolve_annotated(argument.field_info.annotation)
+                        for argument in argument_collection.filter_by(parse=False)
+                    }
+
+                    bound, unused_tokens = create_bound_arguments(
+                        command_app.default_command,
+                        argument_collection,
+                        unused_tokens,
+                        config,
+                        end_of_options_delimiter=end_of_options_delimiter,
+                    )
+                    try:
+                        for validator in command_app.validator:
+                            validator(**bound.arguments)
+                    except (AssertionError, ValueError, TypeError) as e:
+                        raise ValidationError(exception_message=e.args[0] if e.args else "", app=command_app) from e
+
+                    try:
+                        for command_group in command_app.app_stack.command_groups:
+                            for validator in command_group.validator:  # pyright: ignore
                                 validator(**bound.arguments)
-                        except (AssertionError, ValueError, TypeError) as e:
-                            raise ValidationError(exception_message=e.args[0] if e.args else "", app=command_app) from e
-
-                        try:
-                            for command_group in command_app.app_stack.command_groups:
-                                for validator in command_group.validator:  # pyright: ignore
-                                    validator(**bound.arguments)
-                        except (AssertionError, ValueError, TypeError) as e:
-                            raise ValidationError(
-                                exception_message=e.args[0] if e.args else "",
-                                group=command_group,  # pyright: ignore
-                            ) from e
+                    except (AssertionError, ValueError, TypeError) as e:
+                        raise ValidationError(
+                            exception_message=e.args[0] if e.args else "",
+                            group=command_group,  # pyright: ignore
+                        ) from e
 
+                else:
+                    if unused_tokens:
+                        raise UnknownCommandError(unused_tokens=unused_tokens)
                     else:
-                        if unused_tokens:
-                            raise UnknownCommandError(unused_tokens=unused_tokens)
-                        else:
-                            # Running the application with no arguments and no registered
-                            # ``default_command`` will default to ``help_print``.
-                            command = self.help_print
-                            bound = inspect.signature(command).bind(tokens=tokens, console=command_app.console)
-                            unused_tokens = []
-                            argument_collection = ArgumentCollection()
-                if raise_on_unused_tokens and unused_tokens:
-                    for token in unused_tokens:
-                        if is_option_like(token):
-                            token = token.split("=")[0]
-                            raise UnknownOptionError(
-                                token=Token(keyword=token, source="cli"),
-                                argument_collection=argument_collection,
-                            )
-                    raise UnusedCliTokensError(target=command, unused_tokens=unused_tokens)
-            except CycloptsError as e:
-                e.target = command_app.default_command
-                e.app = command_app
-                if command_chain:
-                    e.command_chain = command_chain
-                if e.console is None:
-                    e.console = command_app.error_console
-                raise
+                        # Running the application with no arguments and no registered
+                        # ``default_command`` will default to ``help_print``.
+                        command = self.help_print
+                        bound = inspect.signature(command).bind(
+                            tokens=tokens, console=command_app.app_stack.resolve("_console")
+                        )
+                        unused_tokens = []
+                        argument_collection = ArgumentCollection()
+            if raise_on_unused_tokens and unused_tokens:
+                for token in unused_tokens:
+                    if is_option_like(token):
+                        token = token.split("=")[0]
+                        raise UnknownOptionError(
+                            token=Token(keyword=token, source="cli"),
+                            argument_collection=argument_collection,
+                        )
+                raise UnusedCliTokensError(target=command, unused_tokens=unused_tokens)
+        except CycloptsError as e:
+            e.target = command_app.default_command
+            e.app = command_app
+            if command_chain:
+                e.command_chain = command_chain
+            raise
 
         return command, bound, unused_tokens, ignored, argument_collection
 
@@ -1836,6 +2136,7 @@ class App:
                 command, bound, _, ignored, _ = self._parse_known_args(
                     tokens,
                     raise_on_unused_tokens=True,
+                    _plain_errors=True,
                 )
             except CycloptsError as e:
                 print_error = self.app_stack.resolve("print_error")
@@ -1845,21 +2146,194 @@ class App:
 
                 e.verbose = verbose if verbose is not None else False
                 e.root_input_tokens = tokens
-                assert e.console is not None
-                if help_on_error if help_on_error is not None else False:
-                    self.help_print(tokens, console=e.console)
-                if print_error if print_error is not None else True:
-                    resolved_error_formatter = self.app_stack.resolve("error_formatter")
-                    if resolved_error_formatter is not None:
-                        e.console.print(resolved_error_formatter(e))
-                    else:
-                        e.console.print(CycloptsPanel(e))
+                help_on_error = help_on_error if help_on_error is not None else False
+                print_error = print_error if print_error is not None else True
+                if e.console is not None or not self._print_plain_error(e, tokens, help_on_error, print_error):
+                    if e.console is None:
+                        e.console = self.error_console
+                    if help_on_error:
+                        self.help_print(tokens, console=e.console)
+                    if print_error:
+                        resolved_error_formatter = self.app_stack.resolve("error_formatter")
+                        if resolved_error_formatter is not None:
+                            e.console.print(resolved_error_formatter(e))
+                        else:
+                            e.console.print(CycloptsPanel(e))
                 if exit_on_error if exit_on_error is not None else True:
                     sys.exit(1)
+                if e.console is None:
+                    e.console = self.error_console
                 raise
 
         return command, bound, ignored
 
+    def _print_plain_error(self, e: CycloptsError, tokens: list[str], help_on_error: bool, print_error: bool) -> bool:
+        """Print ``e`` (and the help page) to stderr without rich; see ``cyclopts._plain``.
+
+        Returns :obj:`False`, having printed nothing, if rich is needed.
+        """
+        out = []
+        if help_on_error:
+            resolution = self._resolve_commands(tokens)
+            with self.app_stack(resolution.context_path):
+                out.append(_plain.help_page(self, resolution, sys.stderr))
+        if print_error:
+            out.append(_plain.error_panel(e))
+        if None in out:
+            return False
+        sys.stderr.write("".join(cast(list[str], out)))
+        return True
+
+    def parse_many(
+        self,
+        argvs: Iterable[str | Iterable[str]],
+        *,
+        workers: int | None = None,
+        executor: Literal["thread", "process"] = "thread",
+        chunksize: int = 512,
+    ) -> Iterator[tuple[Callable[..., Any] | None, inspect.BoundArguments | None, Exception | None]]:
+        """Interpret many independent command lines, as if calling :meth:`parse_args` on each.
+
+        Command lines are processed in chunks. Within a chunk, they are grouped by their resolved
+        command so that each command's resolution context and :class:`.ArgumentCollection`
+        are set up once per group rather than once per command line.
+        Errors are never printed and never exit; they are yielded instead.
+
+        Parameters
+        ----------
+        argvs: Iterable[str | Iterable[str]]
+            Command lines; each is either a string or a list of strings.
+            Consumed lazily, one chunk at a time.
+        workers: int | None
+            Number of chunks to parse concurrently.
+            If :obj:`None` (default), everything is parsed in the calling thread.
+        executor: Literal["thread", "process"]
+            Kind of pool to use when ``workers`` is set.
+            A ``"process"`` pool requires the app, its commands, and the parsed values to be picklable.
+        chunksize: int
+            Number of command lines per chunk.
+
+        Yields
+        ------
+        command: Callable | None
+            Function associated with command action; :obj:`None` if parsing failed.
+        bound: inspect.BoundArguments | None
+            Parsed and converted ``args`` and ``kwargs``; :obj:`None` if parsing failed.
+        error: Exception | None
+            The error parsing failed with; :obj:`None` on success.
+            Usually a :exc:`.CycloptsError`, but any exception :meth:`parse_args` would raise
+            for this command line (e.g. a :exc:`ValueError` for an ambiguous command) is yielded too.
+
+        Results are yielded in the same order as ``argvs``.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive; got {chunksize}.")
+
+        def chunks() -> Iterator[list[list[str]]]:
+            chunk = []
+            for argv in argvs:
+                chunk.append(normalize_tokens(argv))
+                if len(chunk) == chunksize:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        if workers is None:
+            for chunk in chunks():
+                yield from self._parse_batch(chunk)
+            return
+
+        from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+        if executor == "process":
+            pool = ProcessPoolExecutor(workers, initializer=_parse_many_worker_init, initargs=(self,))
+
+            def submit(chunk: list[list[str]]) -> Future:
+                return pool.submit(_parse_many_worker, chunk)
+
+            def receive(future: Future):
+                results = future.result()
+                for _, _, error in results:
+                    if isinstance(error, CycloptsError):
+                        _, error.app = _strip_special_flag_commands(self._resolve_commands(error.root_input_tokens))
+                return results
+
+        elif executor == "thread":
+            pool = ThreadPoolExecutor(workers)
+
+            def submit(chunk: list[list[str]]) -> Future:
+                # Each chunk runs in a copy of the caller's context so that it sees the caller's app-stack state.
+                return pool.submit(copy_context().run, self._parse_batch, chunk)
+
+            def receive(future: Future):
+                return future.result()
+
+        else:
+            raise ValueError(f'executor must be "thread" or "process"; got {executor!r}.')
+
+        # Bound the number of in-flight chunks so that ``argvs`` is consumed lazily.
+        pending: deque[Future] = deque()
+        try:
+            for chunk in chunks():
+                pending.append(submit(chunk))
+                if len(pending) >= 2 * workers:
+                    yield from receive(pending.popleft())
+            while pending:
+                yield from receive(pending.popleft())
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _parse_batch(
+        self, argvs: list[list[str]]
+    ) -> list[tuple[Callable[..., Any] | None, inspect.BoundArguments | None, Exception | None]]:
+        """Parse a chunk of normalized command lines for :meth:`parse_many`."""
+        results: list = [None] * len(argvs)
+        groups: dict[tuple, tuple[tuple[App, ...], App, tuple[str, ...], list[tuple[int, list[str], int]]]] = {}
+
+        def fail(i: int, error: Exception):
+            if isinstance(error, CycloptsError):
+                error.root_input_tokens = argvs[i]
+            results[i] = (None, None, error)
+
+        with span("parse_commands", batch=len(argvs)):
+            for i, tokens in enumerate(argvs):
+                try:
+                    resolution = self._resolve_commands(tokens)
+                    command_chain, command_app = _strip_special_flag_commands(resolution)
+                except Exception as e:
+                    fail(i, e)
+                    continue
+                key = (tuple(id(app) for app in resolution.context_path), id(command_app), command_chain)
+                if key not in groups:
+                    groups[key] = (resolution.context_path, command_app, command_chain, [])
+                groups[key][3].append((i, resolution.tokens, resolution.execution_offset))
+
+        for apps_for_context, command_app, command_chain, members in groups.values():
+            with self.app_stack(apps_for_context):
+                try:
+                    config, end_of_options_delimiter = self._command_settings(command_app, command_chain)
+                except Exception as e:
+                    for i, _, _ in members:
+                        fail(i, e)
+                    continue
+                for i, tokens, execution_offset in members:
+                    try:
+                        command, bound, *_ = self._parse_resolved(
+                            command_app,
+                            command_chain,
+                            tokens,
+                            tokens[execution_offset:],
+                            config=config,
+                            end_of_options_delimiter=end_of_options_delimiter,
+                            raise_on_unused_tokens=True,
+                        )
+                    except Exception as e:
+                        fail(i, e)
+                    else:
+                        results[i] = (command, bound, None)
+        return results
+
     def _is_nested_call(self) -> bool:
         """Check if this is a nested call (meta app pattern or same-app recursion)."""
         return len(self.app_stack.overrides_stack) > 1 or (
@@ -1927,6 +2401,7 @@ class App:
             The value the command function returns.
         """
         if tokens is None:
+            _handle_completion_request(self)
             _log_framework_warning(_detect_test_framework())
 
         tokens = normalize_tokens(tokens)
@@ -1959,7 +2434,8 @@ class App:
 
             resolved_backend = cast(Literal["asyncio", "trio"], self.app_stack.resolve("backend", fallback="asyncio"))
             try:
-                result = _run_maybe_async_command(command, bound, resolved_backend)
+                with span("dispatch", command=command):
+                    result = _run_maybe_async_command(command, bound, resolved_backend)
                 return self._handle_result_action(result)
             except KeyboardInterrupt:
                 if self.suppress_keyboard_interrupt:
@@ -2056,6 +2532,7 @@ class App:
             asyncio.run(main())
         """
         if tokens is None:
+            _handle_completion_request(self)
             _log_framework_warning(_detect_test_framework())
 
         tokens = normalize_tokens(tokens)
@@ -2087,10 +2564,11 @@ class App:
             )
 
             try:
-                if inspect.iscoroutinefunction(command):
-                    result = await command(*bound.args, **bound.kwargs)
-                else:
-                    result = command(*bound.args, **bound.kwargs)
+                with span("dispatch", command=command):
+                    if inspect.iscoroutinefunction(command):
+                        result = await command(*bound.args, **bound.kwargs)
+                    else:
+                        result = command(*bound.args, **bound.kwargs)
 
                 return self._handle_result_action(result)
             except KeyboardInterrupt:
@@ -2116,85 +2594,137 @@ class App:
             Console to print help and runtime Cyclopts errors.
             If not provided, follows the resolution order defined in :attr:`App.console`.
         """
-        from cyclopts.help import format_doc, format_usage
         from cyclopts.help.formatters import DefaultFormatter
 
-        tokens = normalize_tokens(tokens)
-
-        command_chain, apps, _ = self.parse_commands(tokens)
+        resolution = self._resolve_commands(tokens)
+        command_chain, apps = resolution.context_chain, resolution.context_path
         executing_app = apps[-1]
         overrides = {"_console": console}
         with self.app_stack(apps, overrides=overrides):
-            console = executing_app.console
-
-            # Prepare usage
-            if executing_app.usage is None:
-                usage = format_usage(self, command_chain, execution_path=apps)
-            elif executing_app.usage:  # i.e. skip empty-string.
-                usage = executing_app.usage + "\n"
-            else:
-                usage = None
+            if (page := _plain.help_page(self, resolution, sys.stdout)) is not None:
+                sys.stdout.write(page)
+                return
 
-            # Prepare description
+            console = executing_app.console
             help_format = executing_app.app_stack.resolve("help_format", fallback=DEFAULT_FORMAT)
-            description = format_doc(executing_app, help_format)
+            default_formatter = executing_app.app_stack.resolve("help_formatter", fallback=DefaultFormatter())
 
-            # Prepare panels with their associated groups
-            help_panels_with_groups = self._assemble_help_panels(tokens, help_format)
+            from cyclopts.help import cache
 
-            # Render prologue
-            if help_prologue := executing_app.app_stack.resolve("help_prologue"):
-                from cyclopts.help import InlineText
+            if not (
+                executing_app.app_stack.resolve("help_cache", fallback=False)
+                and cache.cache_enabled()
+                and cache.supports(console)
+            ):
+                self._render_help(console, resolution, help_format, default_formatter)
+                return
+
+            # Replay the rendered page, or render it once and store it.
+            cache_key = cache.fingerprint(command_chain, apps, console, help_format, default_formatter)
+            if (page := cache.lookup(cache_key)) is None:
+                # A nested capture also collects output buffered by an enclosing one; set it aside first.
+                with console.capture() as pending:
+                    pass
+                with console.capture() as capture:
+                    self._render_help(console, resolution, help_format, default_formatter)
+                page = capture.get()
+                cache.store(cache_key, page)
+                page = pending.get() + page
+            cache.replay(console, page)
+
+    def _render_help(
+        self,
+        console: "Console",
+        resolution: _CommandResolution,
+        help_format: str,
+        default_formatter: Any,
+    ) -> None:
+        """Print the help page of ``resolution`` to ``console``; called within the app stack of :meth:`help_print`."""
+        from cyclopts.help import format_doc, format_usage
 
-                prologue = InlineText.from_format(help_prologue, format=help_format)
-                console.print(prologue)
-                console.print()  # Add blank line after prologue
+        command_chain, apps = resolution.context_chain, resolution.context_path
+        executing_app = apps[-1]
 
-            # Render usage
-            default_formatter = executing_app.app_stack.resolve("help_formatter", fallback=DefaultFormatter())
-            if hasattr(default_formatter, "render_usage"):
-                default_formatter.render_usage(console, console.options, usage)
-            elif usage:
-                console.print(usage)
-
-            # Render description
-            if hasattr(default_formatter, "render_description"):
-                default_formatter.render_description(console, console.options, description)
-            elif description:
-                console.print(description)
-
-            # Render each panel with its group's formatter (or default)
-            for group, panel in help_panels_with_groups:
-                formatter = group.help_formatter if group else None
-                if formatter is None:
-                    formatter = default_formatter
-                formatter = cast("HelpFormatter", formatter)
-                formatter(console, console.options, panel)
-
-            # Render epilogue
-            if help_epilogue := executing_app.app_stack.resolve("help_epilogue"):
-                from cyclopts.help import InlineText
-
-                console.print()  # Add blank line before epilogue
-                epilogue = InlineText.from_format(help_epilogue, format=help_format)
-                console.print(epilogue)
+        # Prepare usage
+        if executing_app.usage is None:
+            usage = format_usage(self, command_chain, execution_path=apps)
+        elif executing_app.usage:  # i.e. skip empty-string.
+            usage = executing_app.usage + "\n"
+        else:
+            usage = None
+
+        # Prepare description
+        description = format_doc(executing_app, help_format)
+
+        # Prepare panels with their associated groups
+        help_panels_with_groups = self._assemble_help_panels(resolution.tokens, help_format, _resolution=resolution)
+
+        # Render prologue
+        if help_prologue := executing_app.app_stack.resolve("help_prologue"):
+            from cyclopts.help import InlineText
+
+            prologue = InlineText.from_format(help_prologue, format=help_format)
+            console.print(prologue)
+            console.print()  # Add blank line after prologue
+
+        # Render usage
+        if hasattr(default_formatter, "render_usage"):
+            default_formatter.render_usage(console, console.options, usage)
+        elif usage:
+            console.print(usage)
+
+        # Render description
+        if hasattr(default_formatter, "render_description"):
+            default_formatter.render_description(console, console.options, description)
+        elif description:
+            console.print(description)
+
+        # Render each panel with its group's formatter (or default)
+        for group, panel in help_panels_with_groups:
+            formatter = group.help_formatter if group else None
+            if formatter is None:
+                formatter = default_formatter
+            formatter = cast("HelpFormatter", formatter)
+            formatter(console, console.options, panel)
+
+        # Render epilogue
+        if help_epilogue := executing_app.app_stack.resolve("help_epilogue"):
+            from cyclopts.help import InlineText
+
+            console.print()  # Add blank line before epilogue
+            epilogue = InlineText.from_format(help_epilogue, format=help_format)
+            console.print(epilogue)
 
     def _assemble_help_panels(
         self,
         tokens: None | str | Iterable[str],
         help_format,
+        *,
+        _resolution: _CommandResolution | None = None,
+        _plain: bool = False,
     ) -> list[tuple[Optional["Group"], "HelpPanel"]]:
-        from rich.console import Group as RichGroup
-        from rich.console import NewLine
-
-        from cyclopts.help import (
-            HelpPanel,
-            InlineText,
-            create_parameter_help_panel,
-            format_command_entries,
-        )
+        """Help panels of the command selected by ``tokens``, sorted for display.
+
+        With ``_plain``, rich isn't imported: panel descriptions are lists of
+        :class:`.InlineText` for the plain-text renderer (see :mod:`cyclopts._plain`).
+        """
+        from cyclopts.help import HelpPanel, InlineText, create_parameter_help_panel, format_command_entries
+        from cyclopts.help.help import _parameter_help_entries
+
+        if _plain:
 
-        command_chain, execution_path, _ = self.parse_commands(tokens)
+            def join(first, second):
+                return first + second
+        else:
+            from rich.console import Group as RichGroup
+            from rich.console import NewLine
+
+            def join(first, second):
+                return RichGroup(first, NewLine(), second)
+
+        if _resolution is None:
+            _resolution = self._resolve_commands(tokens)
+        command_chain, execution_path = _resolution.context_chain, _resolution.context_path
         command_app = execution_path[-1]
 
         help_format = command_app.app_stack.resolve("help_format", help_format, DEFAULT_FORMAT)
@@ -2211,14 +2741,16 @@ class App:
                 try:
                     _, command_panel = panels[group.name]
                 except KeyError:
-                    command_panel = HelpPanel(title=group.name, format="command")
+                    command_panel = HelpPanel(title=group.name, format="command", description=[] if _plain else None)
                     panels[group.name] = (group, command_panel)
 
                 if group.help:
                     group_help = InlineText.from_format(group.help, format=help_format, force_empty_end=True)
+                    if _plain:
+                        group_help = [group_help]
 
                     if command_panel.description:
-                        command_panel.description = RichGroup(command_panel.description, NewLine(), group_help)
+                        command_panel.description = join(command_panel.description, group_help)
                     else:
                         command_panel.description = group_help
 
@@ -2248,7 +2780,17 @@ class App:
                     continue
 
                 _, existing_panel = panels.get(group.name, (None, None))
-                new_panel = create_parameter_help_panel(group, group_argument_collection, help_format)
+                if _plain:
+                    new_panel = HelpPanel(
+                        format="parameter",
+                        title=group.name,
+                        description=[InlineText.from_format(group.help, format=help_format, force_empty_end=True)]
+                        if group.help
+                        else [],
+                        entries=_parameter_help_entries(group_argument_collection, help_format),
+                    )
+                else:
+                    new_panel = create_parameter_help_panel(group, group_argument_collection, help_format)
 
                 if existing_panel:
                     # An imperfect merging process
@@ -2256,9 +2798,7 @@ class App:
                     new_panel.entries = new_panel.entries + existing_panel.entries  # Commands go last
                     if new_panel.description:
                         if existing_panel.description:
-                            new_panel.description = RichGroup(
-                                existing_panel.description, NewLine(), new_panel.description
-                            )
+                            new_panel.description = join(existing_panel.description, new_panel.description)
                     else:
                         new_panel.description = existing_panel.description
 
@@ -2277,6 +2817,35 @@ class App:
             out.append((group, help_panel))
         return out
 
+    @overload
+    def generate_docs(  # pragma: no cover
+        self,
+        output_format: "DocFormat" = "markdown",
+        recursive: bool = True,
+        include_hidden: bool = False,
+        heading_level: int = 1,
+        max_heading_level: int = 6,
+        flatten_commands: bool = False,
+        usage_name: str | None = None,
+        workers: int | None = None,
+        file: None = None,
+    ) -> str: ...
+
+    @overload
+    def generate_docs(  # pragma: no cover
+        self,
+        output_format: "DocFormat" = "markdown",
+        recursive: bool = True,
+        include_hidden: bool = False,
+        heading_level: int = 1,
+        max_heading_level: int = 6,
+        flatten_commands: bool = False,
+        usage_name: str | None = None,
+        workers: int | None = None,
+        *,
+        file: TextIO,
+    ) -> None: ...
+
     def generate_docs(
         self,
         output_format: "DocFormat" = "markdown",
@@ -2286,7 +2855,9 @@ class App:
         max_heading_level: int = 6,
         flatten_commands: bool = False,
         usage_name: str | None = None,
-    ) -> str:
+        workers: int | None = None,
+        file: TextIO | None = None,
+    ) -> str | None:
         """Generate documentation for this CLI application.
 
         Parameters
@@ -2318,11 +2889,22 @@ class App:
             ``Usage:`` lines change; document titles, section headings, and
             table-of-contents anchors continue to use ``app.name[0]``.
             Default is None (use ``app.name[0]``).
+        workers : int | None
+            Number of worker processes rendering the top-level commands' sections
+            (each including its nested commands) in parallel. Sections are merged in
+            command order, so the output is identical to serial rendering. Capped at the
+            number of available CPUs. Workers are forked, which is only done on Linux;
+            elsewhere, rendering is serial.
+            Default is None (render in the current process).
+        file : TextIO | None
+            If provided, write the documentation to this text stream as it is
+            generated (see :meth:`iter_docs`) instead of returning it.
+            Default is None.
 
         Returns
         -------
-        str
-            The generated documentation.
+        str | None
+            The generated documentation; :obj:`None` if written to ``file``.
 
         Raises
         ------
@@ -2337,20 +2919,72 @@ class App:
         >>> rst_docs = app.generate_docs(output_format="rst")  # Generate RST
         >>> # To write to file, caller can do:
         >>> # Path("docs/cli.md").write_text(docs)
+        >>> # Or stream it, section by section:
+        >>> # with open("docs/cli.md", "w") as f:
+        >>> #     app.generate_docs(file=f)
         >>> # Override the invocation shown in Usage: lines (e.g., uv run cli)
         >>> docs = app.generate_docs(usage_name="uv run cli")
+        >>> # Render a large CLI's command sections in 8 processes
+        >>> docs = app.generate_docs(workers=8)
+        """
+        chunks = self.iter_docs(
+            output_format,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            max_heading_level=max_heading_level,
+            flatten_commands=flatten_commands,
+            usage_name=usage_name,
+            workers=workers,
+        )
+        if file is None:
+            return "".join(chunks)
+        for chunk in chunks:
+            file.write(chunk)
+        return None
+
+    def iter_docs(
+        self,
+        output_format: "DocFormat" = "markdown",
+        recursive: bool = True,
+        include_hidden: bool = False,
+        heading_level: int = 1,
+        max_heading_level: int = 6,
+        flatten_commands: bool = False,
+        usage_name: str | None = None,
+        workers: int | None = None,
+    ) -> Iterator[str]:
+        """Generate documentation for this CLI application, in chunks.
+
+        Yields the document's preamble, then the section of each top-level command
+        (including its nested commands) as soon as it is rendered, so memory use is
+        bounded by the largest section rather than the whole document. The
+        concatenated chunks equal the output of :meth:`generate_docs`, which
+        documents the parameters.
+
+        Raises
+        ------
+        ValueError
+            If an unsupported output format is specified.
+
+        Examples
+        --------
+        >>> app = App(name="myapp", help="My CLI Application")
+        >>> # Pipe documentation to another program as it is generated:
+        >>> # for chunk in app.iter_docs():
+        >>> #     sys.stdout.write(chunk)
         """
         from cyclopts.docs import (
-            generate_markdown_docs,
-            generate_rst_docs,
+            iter_html_docs,
+            iter_markdown_docs,
+            iter_rst_docs,
             normalize_format,
         )
-        from cyclopts.docs.html import generate_html_docs
 
         output_format = normalize_format(output_format)
 
         if output_format == "markdown":
-            doc = generate_markdown_docs(
+            return iter_markdown_docs(
                 self,
                 recursive=recursive,
                 include_hidden=include_hidden,
@@ -2358,9 +2992,10 @@ class App:
                 max_heading_level=max_heading_level,
                 flatten_commands=flatten_commands,
                 usage_name=usage_name,
+                workers=workers,
             )
         elif output_format == "html":
-            doc = generate_html_docs(
+            return iter_html_docs(
                 self,
                 recursive=recursive,
                 include_hidden=include_hidden,
@@ -2368,9 +3003,10 @@ class App:
                 max_heading_level=max_heading_level,
                 flatten_commands=flatten_commands,
                 usage_name=usage_name,
+                workers=workers,
             )
-        elif output_format == "rst":
-            doc = generate_rst_docs(
+        else:
+            return iter_rst_docs(
                 self,
                 recursive=recursive,
                 include_hidden=include_hidden,
@@ -2379,9 +3015,69 @@ class App:
                 flatten_commands=flatten_commands,
                 no_root_title=False,  # Default to False for direct API usage
                 usage_name=usage_name,
+                workers=workers,
             )
 
-        return doc
+    def write_docs(
+        self,
+        directory: str | Path,
+        output_format: "DocFormat" = "markdown",
+        *,
+        include_hidden: bool = False,
+        heading_level: int = 1,
+        max_heading_level: int = 6,
+        usage_name: str | None = None,
+        workers: int | None = None,
+    ) -> list[Path]:
+        """Write documentation into ``directory``, one file per command.
+
+        Each command's page is named after its anchor (e.g. ``myapp-files-cp.md``) and links
+        to its subcommands' pages; the root's page holds the table of contents. A manifest
+        (``.cyclopts-docs.json``) records a hash of what each page depends on: the options,
+        the command's signature, docstring, :class:`Parameter` metadata and groups, the
+        settings of its parent apps, and its subcommands. Subsequent calls only render pages
+        whose hash changed and only write files whose content changed, so unchanged files
+        keep their modification times and downstream (Sphinx, MkDocs) builds stay incremental.
+        Pages of removed commands are deleted.
+
+        Parameters
+        ----------
+        directory : str | Path
+            Output directory; created if missing.
+        output_format : DocFormat
+            Output format; see :meth:`generate_docs`. Default is "markdown".
+        include_hidden : bool
+            If True, include hidden commands/parameters in documentation.
+            Default is False.
+        heading_level : int
+            Heading level of each page's title.
+            Default is 1.
+        max_heading_level : int
+            Maximum heading level to use.
+            Default is 6.
+        usage_name : str | None
+            Optional replacement for the root app name shown in ``Usage:`` lines;
+            see :meth:`generate_docs`.
+        workers : int | None
+            Number of worker processes rendering changed pages; see :meth:`generate_docs`.
+
+        Returns
+        -------
+        list[Path]
+            Files that were created or modified.
+        """
+        from cyclopts.docs.incremental import write_docs
+
+        return write_docs(
+            self,
+            directory,
+            output_format,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            max_heading_level=max_heading_level,
+            usage_name=usage_name,
+            workers=workers,
+        )
 
     def command_tree(
         self,
@@ -2453,11 +3149,62 @@ class App:
         build(tree, self, 1)
         return tree
 
+    def export_manifest(self, path: str | Path) -> None:
+        """Write a manifest of the full command tree to ``path``.
+
+        The manifest is a compact JSON file containing, for every command, its names,
+        help, groups and parameter table (names, token counts, choices, help).
+        It is intended to be generated at build/release time and loaded via
+        :meth:`load_manifest`, so that help pages, usage lines and dynamic shell
+        completion don't have to import lazily-registered commands.
+
+        All lazy commands are imported while building the manifest.
+
+        Parameters
+        ----------
+        path: str | Path
+            Output file path.
+        """
+        import json
+
+        from cyclopts.manifest import build_manifest
+
+        Path(path).write_text(json.dumps(build_manifest(self), separators=(",", ":")), encoding="utf-8")
+
+    def load_manifest(self, path: str | Path) -> None:
+        """Load a manifest previously written by :meth:`export_manifest`.
+
+        Unresolved lazy commands will report their ``help``, ``group``, ``show`` and ``sort_key``
+        from the manifest unless explicitly provided at registration, and dynamic shell completion
+        is answered from the manifest. A lazy command is still imported when it is executed.
+
+        Manifest entries whose command no longer exists or points to a different import path are ignored.
+        If the manifest was exported with a different version of Cyclopts, or the source of a lazy command's
+        module changed since, a :class:`UserWarning` is emitted and the whole manifest is ignored.
+
+        Parameters
+        ----------
+        path: str | Path
+            Manifest file path.
+
+        Raises
+        ------
+        ValueError
+            If the manifest was produced by an incompatible version of Cyclopts.
+        """
+        import json
+
+        from cyclopts.manifest import apply_manifest
+
+        apply_manifest(self, json.loads(Path(path).read_text(encoding="utf-8")), stacklevel=3)
+
     def generate_completion(
         self,
         *,
         prog_name: str | None = None,
         shell: Literal["zsh", "bash", "fish"] | None = None,
+        table: bool = False,
+        workers: int | None = None,
     ) -> str:
         """Generate shell completion script for this application.
 
@@ -2468,6 +3215,15 @@ class App:
         shell : Literal["zsh", "bash", "fish"] | None
             Shell type. If None, automatically detects current shell.
             Supported shells: "zsh", "bash", "fish".
+        table : bool
+            Generate a table-driven script whose per-TAB cost does not grow with
+            the number of commands. Recommended for very large command trees.
+            The bash variant requires bash 4.2+.
+        workers : int | None
+            Import lazy commands (see :ref:`Lazy Loading`) concurrently with a thread pool of this size.
+
+        Completion data of each command is cached on the app. Regenerating the script after
+        changing a command only re-extracts that command and its subcommands.
 
         Returns
         -------
@@ -2506,15 +3262,15 @@ class App:
         if shell == "zsh":
             from cyclopts.completion.zsh import generate_completion_script
 
-            return generate_completion_script(self, prog_name)
+            return generate_completion_script(self, prog_name, table=table, workers=workers)
         elif shell == "bash":
             from cyclopts.completion.bash import generate_completion_script
 
-            return generate_completion_script(self, prog_name)
+            return generate_completion_script(self, prog_name, table=table, workers=workers)
         elif shell == "fish":
             from cyclopts.completion.fish import generate_completion_script
 
-            return generate_completion_script(self, prog_name)
+            return generate_completion_script(self, prog_name, table=table, workers=workers)
         else:
             raise ValueError(f"Unsupported shell: {shell}")
 
@@ -2524,6 +3280,7 @@ class App:
         shell: Literal["zsh", "bash", "fish"] | None = None,
         output: Path | None = None,
         add_to_startup: bool = True,
+        table: bool = False,
     ) -> Path:
         """Install shell completion script to appropriate location.
 
@@ -2541,6 +3298,8 @@ class App:
         add_to_startup : bool
             If True (default), adds source line to shell RC file to ensure completion is loaded.
             Set to False if completions are already configured to auto-load.
+        table : bool
+            Install a table-driven script; see :meth:`generate_completion`.
 
         Returns
         -------
@@ -2580,7 +3339,7 @@ class App:
 
         from cyclopts.completion.install import add_to_rc_file, get_default_completion_path
 
-        script_content = self.generate_completion(shell=shell)
+        script_content = self.generate_completion(shell=shell, table=table)
 
         if output is None:
             output = get_default_completion_path(shell, self.name[0])
@@ -2739,7 +3498,8 @@ class App:
                     command, bound, ignored = self.parse_args(
                         tokens, console=console, exit_on_error=exit_on_error, **kwargs
                     )
-                    result = dispatcher(command, bound, ignored)
+                    with span("dispatch", command=command):
+                        result = dispatcher(command, bound, ignored)
                     self._handle_result_action(result, fallback="print_non_int_return_int_as_exit_code")
             except CycloptsError:
                 # Upstream ``parse_args`` already printed the error
@@ -2782,6 +3542,7 @@ class App:
             All commands from this application will be copied over.
         """
         self._commands.update(app._commands)
+        self._invalidate_commands()
 
     def __repr__(self):
         """Only shows non-default values."""
@@ -2839,6 +3600,19 @@ def _detect_test_framework() -> TestFramework:
         return TestFramework.UNKNOWN
 
 
+def _handle_completion_request(app: "App") -> None:
+    """Answer a completion script calling back for :attr:`Parameter.completer` values, then exit.
+
+    Does nothing unless the ``_CYCLOPTS_COMPLETE`` environment variable is set.
+    """
+    if not os.environ.get("_CYCLOPTS_COMPLETE"):
+        return
+    from cyclopts.completion.completer import handle_completion_request
+
+    handle_completion_request(app, sys.argv[1:])
+    sys.exit(0)
+
+
 @lru_cache  # Prevent logging of multiple warnings
 def _log_framework_warning(framework: TestFramework) -> None:
     """Log a warning message for a given testing framework.
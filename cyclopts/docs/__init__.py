@@ -1,8 +1,9 @@
 """Documentation generation for cyclopts CLI applications."""
 
-from cyclopts.docs.html import generate_html_docs
-from cyclopts.docs.markdown import generate_markdown_docs
-from cyclopts.docs.rst import generate_rst_docs
+from cyclopts.docs.html import generate_html_docs, iter_html_docs
+from cyclopts.docs.incremental import write_docs
+from cyclopts.docs.markdown import generate_markdown_docs, iter_markdown_docs
+from cyclopts.docs.rst import generate_rst_docs, iter_rst_docs
 from cyclopts.docs.types import (
     FORMAT_ALIASES,
     CanonicalDocFormat,
@@ -14,8 +15,12 @@ __all__ = [
     "generate_html_docs",
     "generate_markdown_docs",
     "generate_rst_docs",
+    "iter_html_docs",
+    "iter_markdown_docs",
+    "iter_rst_docs",
     "DocFormat",
     "CanonicalDocFormat",
     "FORMAT_ALIASES",
     "normalize_format",
+    "write_docs",
 ]
@@ -0,0 +1,72 @@
+"""Rendering the top-level command sections of a document in worker processes."""
+
+import itertools
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+# Section renderer and its arguments of each running ``render_sections`` call, by job id.
+# Forked workers inherit the job they were started for.
+_jobs: dict[int, tuple[Callable[..., list[str]], Sequence[tuple]]] = {}
+_job_ids = itertools.count()
+
+
+def _render(job: int, index: int) -> list[str]:
+    render, sections = _jobs[job]
+    return render(*sections[index])
+
+
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def render_sections(
+    render: Callable[..., list[str]],
+    sections: Sequence[tuple],
+    workers: int | None,
+) -> Iterable[list[str]]:
+    """Lines of ``render(*section)`` for each of ``sections``, in order.
+
+    With more than one worker, sections are rendered in a pool of forked processes.
+    Workers inherit the (already resolved) command tree and the current ``app_stack``
+    state, so only section indices and rendered lines cross process boundaries.
+    ``fork`` is only used on Linux (it is unsafe on macOS, and unavailable on Windows);
+    elsewhere, and when only one CPU is available, sections are rendered serially.
+
+    Parameters
+    ----------
+    render : Callable[..., list[str]]
+        Renders one section; must not depend on previously rendered sections.
+    sections : Sequence[tuple]
+        Arguments of each ``render`` call.
+    workers : int | None
+        Number of worker processes; capped at the number of available CPUs.
+        :obj:`None` or ``1`` renders in this process.
+
+    Raises
+    ------
+    ValueError
+        If ``workers`` is less than 1.
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers}.")
+    if workers:
+        workers = min(workers, len(sections), _available_cpus())
+    if not workers or workers == 1 or not sys.platform.startswith("linux"):
+        return (render(*section) for section in sections)
+
+    chunksize = max(1, len(sections) // (4 * workers))
+    job = next(_job_ids)
+    _jobs[job] = (render, sections)
+    try:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            return list(
+                executor.map(_render, itertools.repeat(job, len(sections)), range(len(sections)), chunksize=chunksize)
+            )
+    finally:
+        del _jobs[job]
@@ -1,7 +1,7 @@
 """Base utilities for documentation generation."""
 
 import re
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -532,3 +532,52 @@ def iterate_commands(app: "App", include_hidden: bool = False, resolve_lazy: boo
         seen.add(app_id)
 
         yield name, subapp
+
+
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def join_sections(
+    sections: Iterable[list[str]],
+    *,
+    collapse_blank_lines: bool = False,
+    strip_end: bool = False,
+) -> Iterator[str]:
+    r"""Stream ``"\n".join`` of the lines of all ``sections``, one chunk per section.
+
+    Trailing newlines (or whitespace) of a chunk are held back until the next
+    section arrives, so the concatenated chunks equal post-processing the fully
+    joined document.
+
+    Parameters
+    ----------
+    sections : Iterable[list[str]]
+        Lines of each section of the document. Consumed lazily.
+    collapse_blank_lines : bool
+        Replace runs of three or more newlines by two.
+    strip_end : bool
+        Strip trailing whitespace from the document and end it with a single newline.
+    """
+    pending = ""
+    first = True
+    for lines in sections:
+        if not lines:
+            continue
+        text = pending + ("" if first else "\n") + "\n".join(lines)
+        first = False
+        if strip_end:
+            chunk = text.rstrip()
+        elif collapse_blank_lines:
+            chunk = text.rstrip("\n")
+        else:
+            chunk = text
+        pending = text[len(chunk) :]
+        if collapse_blank_lines:
+            chunk = _BLANK_LINES.sub("\n\n", chunk)
+        if chunk:
+            yield chunk
+
+    if strip_end:
+        yield "\n"
+    elif pending:
+        yield _BLANK_LINES.sub("\n\n", pending) if collapse_blank_lines else pending
@@ -1,8 +1,11 @@
 """HTML documentation generation for cyclopts apps."""
 
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from cyclopts._markup import escape_html, extract_text
+from cyclopts.docs._parallel import render_sections
 from cyclopts.docs.base import (
     apply_usage_name,
     build_command_chain,
@@ -12,6 +15,7 @@ from cyclopts.docs.base import (
     format_usage_line,
     generate_anchor,
     iterate_commands,
+    join_sections,
 )
 
 if TYPE_CHECKING:
@@ -337,6 +341,8 @@ def generate_html_docs(
     generate_toc: bool = True,
     flatten_commands: bool = False,
     usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
 ) -> str:
     """Generate HTML documentation for a CLI application.
 
@@ -375,12 +381,61 @@ def generate_html_docs(
         Optional replacement for the root app name in every ``Usage:`` line
         (root and subcommands). Section headings and anchors continue to use
         ``app.name[0]``. Default is None.
+    workers : int | None
+        Number of processes rendering the top-level command sections in parallel.
+        The output is identical to serial rendering.
+        Default is None (render in the current process).
+    subcommand_sections : bool
+        If False, document only this command; its subcommands are listed, but get
+        no sections of their own. Used for one-file-per-command output.
+        Default is True.
 
     Returns
     -------
     str
         The generated HTML documentation.
     """
+    return "".join(
+        iter_html_docs(
+            app,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            max_heading_level=max_heading_level,
+            standalone=standalone,
+            custom_css=custom_css,
+            command_chain=command_chain,
+            generate_toc=generate_toc,
+            flatten_commands=flatten_commands,
+            usage_name=usage_name,
+            workers=workers,
+            subcommand_sections=subcommand_sections,
+        )
+    )
+
+
+def iter_html_docs(
+    app: "App",
+    recursive: bool = True,
+    include_hidden: bool = False,
+    heading_level: int = 1,
+    max_heading_level: int = 6,
+    standalone: bool = True,
+    custom_css: str | None = None,
+    command_chain: list[str] | None = None,
+    generate_toc: bool = True,
+    flatten_commands: bool = False,
+    usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
+) -> Iterator[str]:
+    """Generate HTML documentation for a CLI application, in chunks.
+
+    Yields the document's preamble, then the section of each top-level command as soon
+    as it has been rendered, so memory use is bounded by the largest section. The
+    concatenated chunks equal the output of :func:`generate_html_docs`, which
+    documents the parameters.
+    """
     from cyclopts.help.formatters.html import HtmlFormatter
 
     # Initialize command chain if not provided
@@ -473,138 +528,145 @@ def generate_html_docs(
     if panel_docs:
         lines.append(panel_docs)
 
-    # Handle recursive documentation for subcommands
-    if app._commands:
-        # Iterate through registered commands
-        for name, subapp in iterate_commands(app, include_hidden):
-            # Build the command chain for this subcommand
-            sub_command_chain = build_command_chain(command_chain, name, app_name)
-
-            # Determine heading level for subcommand
-            if flatten_commands:
-                sub_heading_level = heading_level
-            else:
-                sub_heading_level = heading_level + 1
-
-            # Generate subcommand documentation
-            lines.append('<section class="command-section">')
-            # Create anchor-friendly ID
-            anchor_id = (
-                f"{app_name}-{'-'.join(sub_command_chain[1:])}".lower()
-                if len(sub_command_chain) > 1
-                else f"{app_name}-{name}".lower()
-            )
-            effective_sub_level = min(sub_heading_level, max_heading_level)
-            lines.append(
-                f'<h{effective_sub_level} id="{anchor_id}" class="command-title"><code>{escape_html(" ".join(sub_command_chain))}</code></h{effective_sub_level}>'
-            )
-
-            # Get subapp help
-            # Include parent app in the stack so default_parameter is properly inherited
-            with subapp.app_stack([app, subapp]):
-                sub_help_format = subapp.app_stack.resolve("help_format", fallback=help_format)
-                sub_description = extract_description(subapp, sub_help_format)
-                if sub_description:
-                    sub_desc_text = extract_text(sub_description, None)
-                    if sub_desc_text:
-                        lines.append(f'<div class="command-description">{escape_html(sub_desc_text)}</div>')
-
-                # Generate usage for subcommand
-                sub_usage = extract_usage(subapp)
-                if sub_usage:
-                    if flatten_commands:
-                        usage_heading_level = heading_level + 1
-                    else:
-                        usage_heading_level = heading_level + 2
-                    usage_heading_level = min(usage_heading_level, max_heading_level)
-                    lines.append(f"<h{usage_heading_level}>Usage</h{usage_heading_level}>")
-                    lines.append('<div class="usage-block">')
-                    if isinstance(sub_usage, str):
-                        sub_usage_text = sub_usage
-                    else:
-                        sub_usage_text = extract_text(sub_usage, None)
-                    sub_display_chain = apply_usage_name(sub_command_chain, usage_name)
-                    sub_usage_text = format_usage_line(sub_usage_text, sub_display_chain, prefix="$")
-                    lines.append(f'<pre class="usage">{escape_html(sub_usage_text)}</pre>')
-                    lines.append("</div>")
-
-                # Only show subcommand panels if we're in recursive mode
-                if recursive:
-                    # Get help panels for subcommand
-                    sub_panels = subapp._assemble_help_panels([], sub_help_format)
-
-                    # Render subcommand panels
+    def render_subcommand(name: str, subapp: "App") -> list[str]:
+        """Render the section of the subcommand ``name`` (including its nested commands)."""
+        lines = []
+
+        # Build the command chain for this subcommand
+        sub_command_chain = build_command_chain(command_chain, name, app_name)
+
+        # Determine heading level for subcommand
+        if flatten_commands:
+            sub_heading_level = heading_level
+        else:
+            sub_heading_level = heading_level + 1
+
+        # Generate subcommand documentation
+        lines.append('<section class="command-section">')
+        # Create anchor-friendly ID
+        anchor_id = (
+            f"{app_name}-{'-'.join(sub_command_chain[1:])}".lower()
+            if len(sub_command_chain) > 1
+            else f"{app_name}-{name}".lower()
+        )
+        effective_sub_level = min(sub_heading_level, max_heading_level)
+        lines.append(
+            f'<h{effective_sub_level} id="{anchor_id}" class="command-title"><code>{escape_html(" ".join(sub_command_chain))}</code></h{effective_sub_level}>'
+        )
+
+        # Get subapp help
+        # Include parent app in the stack so default_parameter is properly inherited
+        with subapp.app_stack([app, subapp]):
+            sub_help_format = subapp.app_stack.resolve("help_format", fallback=help_format)
+            sub_description = extract_description(subapp, sub_help_format)
+            if sub_description:
+                sub_desc_text = extract_text(sub_description, None)
+                if sub_desc_text:
+                    lines.append(f'<div class="command-description">{escape_html(sub_desc_text)}</div>')
+
+            # Generate usage for subcommand
+            sub_usage = extract_usage(subapp)
+            if sub_usage:
+                if flatten_commands:
+                    usage_heading_level = heading_level + 1
+                else:
+                    usage_heading_level = heading_level + 2
+                usage_heading_level = min(usage_heading_level, max_heading_level)
+                lines.append(f"<h{usage_heading_level}>Usage</h{usage_heading_level}>")
+                lines.append('<div class="usage-block">')
+                if isinstance(sub_usage, str):
+                    sub_usage_text = sub_usage
+                else:
+                    sub_usage_text = extract_text(sub_usage, None)
+                sub_display_chain = apply_usage_name(sub_command_chain, usage_name)
+                sub_usage_text = format_usage_line(sub_usage_text, sub_display_chain, prefix="$")
+                lines.append(f'<pre class="usage">{escape_html(sub_usage_text)}</pre>')
+                lines.append("</div>")
+
+            # Only show subcommand panels if we're in recursive mode
+            if recursive:
+                # Get help panels for subcommand
+                sub_panels = subapp._assemble_help_panels([], sub_help_format)
+
+                # Render subcommand panels
+                if flatten_commands:
+                    panel_heading_level = heading_level + 1
+                else:
+                    panel_heading_level = heading_level + 2
+                panel_heading_level = min(panel_heading_level, max_heading_level)
+                sub_formatter = HtmlFormatter(
+                    heading_level=panel_heading_level,
+                    include_hidden=include_hidden,
+                    app_name=app_name,
+                    command_chain=sub_command_chain,
+                )
+                for sub_group, sub_panel in sub_panels:
+                    if not include_hidden and sub_group and not sub_group.show:
+                        continue
+                    if not include_hidden:
+                        sub_panel.entries = filter_help_entries(subapp, sub_panel, include_hidden)
+                    if sub_panel.entries:
+                        sub_formatter(None, None, sub_panel)
+
+                sub_panel_docs = sub_formatter.get_output().strip()
+                if sub_panel_docs:
+                    lines.append(sub_panel_docs)
+
+            # Recursively handle nested subcommands
+            if recursive and subapp._commands:
+                for nested_name, nested_app in iterate_commands(subapp, include_hidden):
+                    # Build nested command chain
+                    nested_chain = build_command_chain(sub_command_chain, nested_name, app_name)
+                    # Determine heading level for nested commands
                     if flatten_commands:
-                        panel_heading_level = heading_level + 1
+                        nested_heading_level = heading_level
                     else:
-                        panel_heading_level = heading_level + 2
-                    panel_heading_level = min(panel_heading_level, max_heading_level)
-                    sub_formatter = HtmlFormatter(
-                        heading_level=panel_heading_level,
-                        include_hidden=include_hidden,
-                        app_name=app_name,
-                        command_chain=sub_command_chain,
-                    )
-                    for sub_group, sub_panel in sub_panels:
-                        if not include_hidden and sub_group and not sub_group.show:
-                            continue
-                        if not include_hidden:
-                            sub_panel.entries = filter_help_entries(subapp, sub_panel, include_hidden)
-                        if sub_panel.entries:
-                            sub_formatter(None, None, sub_panel)
-
-                    sub_panel_docs = sub_formatter.get_output().strip()
-                    if sub_panel_docs:
-                        lines.append(sub_panel_docs)
-
-                # Recursively handle nested subcommands
-                if recursive and subapp._commands:
-                    for nested_name, nested_app in iterate_commands(subapp, include_hidden):
-                        # Build nested command chain
-                        nested_chain = build_command_chain(sub_command_chain, nested_name, app_name)
-                        # Determine heading level for nested commands
-                        if flatten_commands:
-                            nested_heading_level = heading_level
-                        else:
-                            nested_heading_level = heading_level + 2
-                        # Set up context for nested_app, then recurse
-                        # The recursive call's app_stack([app]) will stack on top of this
-                        with nested_app.app_stack([subapp, nested_app]):
-                            nested_docs = generate_html_docs(
-                                nested_app,
-                                recursive=recursive,
-                                include_hidden=include_hidden,
-                                heading_level=nested_heading_level,
-                                max_heading_level=max_heading_level,
-                                standalone=False,  # Not standalone for nested
-                                custom_css=None,
-                                command_chain=nested_chain,  # Pass the command chain
-                                generate_toc=False,  # No TOC for nested commands
-                                flatten_commands=flatten_commands,
-                                usage_name=usage_name,
-                            )
-                        lines.append(nested_docs)
-
-            # Add back to top link if we're in a nested section
-            if command_chain:
-                lines.append('<a href="#top" class="back-to-top">↑ Back to top</a>')
-            lines.append("</section>")
+                        nested_heading_level = heading_level + 2
+                    # Set up context for nested_app, then recurse
+                    # The recursive call's app_stack([app]) will stack on top of this
+                    with nested_app.app_stack([subapp, nested_app]):
+                        nested_docs = generate_html_docs(
+                            nested_app,
+                            recursive=recursive,
+                            include_hidden=include_hidden,
+                            heading_level=nested_heading_level,
+                            max_heading_level=max_heading_level,
+                            standalone=False,  # Not standalone for nested
+                            custom_css=None,
+                            command_chain=nested_chain,  # Pass the command chain
+                            generate_toc=False,  # No TOC for nested commands
+                            flatten_commands=flatten_commands,
+                            usage_name=usage_name,
+                        )
+                    lines.append(nested_docs)
+
+        # Add back to top link if we're in a nested section
+        if command_chain:
+            lines.append('<a href="#top" class="back-to-top">↑ Back to top</a>')
+        lines.append("</section>")
+
+        return lines
+
+    # Handle recursive documentation for subcommands
+    sections: Iterable[list[str]] = [lines]
+    if subcommand_sections and app._commands:
+        # Iterate through registered commands
+        subcommands = list(iterate_commands(app, include_hidden))
+        sections = chain(sections, render_sections(render_subcommand, subcommands, workers))
 
+    closing = []
     # Close section if nested command
     if command_chain:
-        lines.append("</section>")
+        closing.append("</section>")
 
     # Only close cli-documentation div for standalone or root
     if standalone or not command_chain:
-        lines.append("</div>")  # Close cli-documentation div
-
-    # Join all lines into body content
-    body_content = "\n".join(lines)
+        closing.append("</div>")  # Close cli-documentation div
 
     # If standalone, wrap in complete HTML document
     if standalone:
         css = custom_css if custom_css else DEFAULT_CSS
-        doc = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -615,9 +677,9 @@ def generate_html_docs(
     </style>
 </head>
 <body id="top">
-{body_content}
+"""
+    yield from join_sections(chain(sections, [closing]))
+    if standalone:
+        yield """
 </body>
 </html>"""
-        return doc
-    else:
-        return body_content
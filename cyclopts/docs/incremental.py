@@ -0,0 +1,179 @@
+"""Incremental documentation builds: one file per command; see :meth:`App.write_docs <cyclopts.App.write_docs>`.
+
+Alongside the pages, a manifest (:data:`MANIFEST_NAME`) records a hash of everything
+each page depends on: the output options, the settings of the apps leading to the
+command, the command's function (signature, docstring, ``Parameter`` annotations and
+source file ``(mtime_ns, size)``), the source files of its parameter types (dataclasses,
+attrs classes, ...), its groups and its listed subcommands. Subsequent
+builds only render pages whose hash changed, and only write files whose content
+changed, so unchanged files keep their modification times.
+"""
+
+import hashlib
+import json
+import re
+from collections.abc import Callable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cyclopts._cache import atomic_open
+from cyclopts.docs._parallel import render_sections
+from cyclopts.docs.base import generate_anchor, iterate_commands
+from cyclopts.docs.types import DocFormat, normalize_format
+
+if TYPE_CHECKING:
+    from cyclopts.core import App
+
+MANIFEST_NAME = ".cyclopts-docs.json"
+"""Name of the manifest file written into the output directory."""
+
+_FORMAT = 1
+
+_EXTENSIONS = {"markdown": ".md", "rst": ".rst", "html": ".html"}
+
+# Links to a command's section within a single document; rewritten to link to its page.
+_LINKS = {
+    "markdown": re.compile(r"\]\(#([^)\s]+)\)"),
+    "html": re.compile(r'href="#([^"]+)"'),
+}
+
+
+def _walk(app: "App", include_hidden: bool) -> list[tuple[list[str], list["App"]]]:
+    """``(command_chain, execution_path)`` of ``app`` and each of its subcommands, depth first."""
+    out = []
+
+    def visit(chain: list[str], path: list["App"]):
+        out.append((chain, path))
+        for name, subapp in iterate_commands(path[-1], include_hidden):
+            with subapp.app_stack([path[-1], subapp]):
+                visit(chain + [name], path + [subapp])
+
+    visit([app.name[0]], [app])
+    return out
+
+
+def _page_names(chains: list[list[str]], extension: str) -> list[str]:
+    """File name of each command's page, from its anchor; duplicates are numbered like TOC anchors."""
+    counts: dict[str, int] = {}
+    names = []
+    for chain in chains:
+        anchor = generate_anchor(" ".join(chain))
+        if anchor in counts:
+            counts[anchor] += 1
+            anchor = f"{anchor}_{counts[anchor]}"
+        else:
+            counts[anchor] = 0
+        names.append(anchor + extension)
+    return names
+
+
+def _page_key(output_format: str, options: dict[str, Any], chain: list[str], path: list["App"], tree: list) -> str:
+    from cyclopts import __version__
+    from cyclopts.help.cache import definition
+
+    content = [_FORMAT, __version__, output_format, sorted(options.items()), definition(chain, path)]
+    if len(path) == 1:
+        content.append(tree)  # The root page's table of contents lists every command.
+    return hashlib.sha256(repr(content).encode()).hexdigest()
+
+
+def _load_manifest(path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["format"] == _FORMAT and isinstance(data["pages"], dict):
+            return data["pages"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, ValueError):
+        pass
+    with atomic_open(path) as f:
+        f.write(content)
+    return True
+
+
+def _generator(output_format: str) -> Callable[..., str]:
+    from cyclopts.docs import generate_markdown_docs, generate_rst_docs
+    from cyclopts.docs.html import generate_html_docs
+
+    return {"markdown": generate_markdown_docs, "rst": generate_rst_docs, "html": generate_html_docs}[output_format]
+
+
+def write_docs(
+    app: "App",
+    directory: str | Path,
+    output_format: DocFormat = "markdown",
+    *,
+    include_hidden: bool = False,
+    heading_level: int = 1,
+    max_heading_level: int = 6,
+    usage_name: str | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """Write the documentation of ``app`` into ``directory``, one file per command.
+
+    See :meth:`App.write_docs <cyclopts.App.write_docs>`.
+    """
+    output_format = normalize_format(output_format)
+    directory = Path(directory)
+    generate = _generator(output_format)
+    options = {
+        "include_hidden": include_hidden,
+        "heading_level": heading_level,
+        "max_heading_level": max_heading_level,
+        "usage_name": usage_name,
+    }
+
+    commands = _walk(app, include_hidden)
+    names = _page_names([chain for chain, _ in commands], _EXTENSIONS[output_format])
+    anchors = {name.rsplit(".", 1)[0]: name for name in names}
+    tree = [(chain, name) for (chain, _), name in zip(commands, names, strict=True)]
+    keys = [_page_key(output_format, options, chain, path, tree) for chain, path in commands]
+
+    manifest_path = directory / MANIFEST_NAME
+    previous = _load_manifest(manifest_path)
+    stale = [
+        i
+        for i, (name, key) in enumerate(zip(names, keys, strict=True))
+        if previous.get(name) != key or not (directory / name).exists()
+    ]
+
+    def render_page(chain: list[str], path: list["App"]) -> list[str]:
+        with ExitStack() as stack:
+            for parent, child in zip(path[:-1], path[1:], strict=True):
+                stack.enter_context(child.app_stack([parent, child]))
+            page = generate(
+                path[-1],
+                command_chain=chain if len(path) > 1 else None,
+                generate_toc=len(path) == 1,
+                flatten_commands=True,
+                subcommand_sections=False,
+                **options,
+            )
+        if link := _LINKS.get(output_format):
+            page = link.sub(lambda m: m[0].replace(f"#{m[1]}", anchors.get(m[1], f"#{m[1]}")), page)
+        return [page]
+
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    pages = render_sections(render_page, [commands[i] for i in stale], workers)
+    for i, (page,) in zip(stale, pages, strict=True):
+        path = directory / names[i]
+        if _write_if_changed(path, page):
+            written.append(path)
+
+    # Pages of removed commands.
+    for name in previous.keys() - set(names):
+        if Path(name).name == name and name != MANIFEST_NAME:
+            (directory / name).unlink(missing_ok=True)
+
+    manifest = {"format": _FORMAT, "pages": dict(zip(names, keys, strict=True))}
+    _write_if_changed(manifest_path, json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    return written
@@ -1,9 +1,12 @@
 """Documentation generation functions for cyclopts apps."""
 
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from cyclopts._markup import extract_text
 from cyclopts.core import DEFAULT_FORMAT
+from cyclopts.docs._parallel import render_sections
 from cyclopts.docs.base import (
     adjust_filters_for_subcommand,
     apply_usage_name,
@@ -15,6 +18,7 @@ from cyclopts.docs.base import (
     get_app_info,
     is_all_builtin_flags,
     iterate_commands,
+    join_sections,
     normalize_command_filters,
     should_include_command,
     should_show_commands_list,
@@ -331,6 +335,8 @@ def generate_markdown_docs(
     code_block_title: bool = False,
     skip_preamble: bool = False,
     usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
 ) -> str:
     """Generate markdown documentation for a CLI application.
 
@@ -380,12 +386,67 @@ def generate_markdown_docs(
         Optional replacement for the root app name used in ``Usage:`` lines
         only. Headings and TOC anchors still use ``app.name[0]``.
         Default is None (use ``app.name[0]`` as before).
+    workers : int | None
+        Number of processes rendering the top-level command sections in parallel.
+        The output is identical to serial rendering.
+        Default is None (render in the current process).
+    subcommand_sections : bool
+        If False, document only this command; its subcommands are listed, but get
+        no sections of their own. Used for one-file-per-command output.
+        Default is True.
 
     Returns
     -------
     str
         The generated markdown documentation.
     """
+    return "".join(
+        iter_markdown_docs(
+            app,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            max_heading_level=max_heading_level,
+            command_chain=command_chain,
+            generate_toc=generate_toc,
+            flatten_commands=flatten_commands,
+            commands_filter=commands_filter,
+            exclude_commands=exclude_commands,
+            no_root_title=no_root_title,
+            code_block_title=code_block_title,
+            skip_preamble=skip_preamble,
+            usage_name=usage_name,
+            workers=workers,
+            subcommand_sections=subcommand_sections,
+        )
+    )
+
+
+def iter_markdown_docs(
+    app: "App",
+    recursive: bool = True,
+    include_hidden: bool = False,
+    heading_level: int = 1,
+    max_heading_level: int = 6,
+    command_chain: list[str] | None = None,
+    generate_toc: bool = True,
+    flatten_commands: bool = False,
+    commands_filter: list[str] | None = None,
+    exclude_commands: list[str] | None = None,
+    no_root_title: bool = False,
+    code_block_title: bool = False,
+    skip_preamble: bool = False,
+    usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
+) -> Iterator[str]:
+    """Generate markdown documentation for a CLI application, in chunks.
+
+    Yields the document's preamble, then the section of each top-level command as soon
+    as it has been rendered, so memory use is bounded by the largest section. The
+    concatenated chunks equal the output of :func:`generate_markdown_docs`, which
+    documents the parameters.
+    """
     from cyclopts.help.formatters.markdown import MarkdownFormatter
 
     # Build the main documentation
@@ -505,276 +566,279 @@ def generate_markdown_docs(
         )
         parent_path = []
 
-    # Handle recursive documentation for subcommands
-    if app._commands:
-        # Iterate through registered commands using iterate_commands helper
-        # This automatically resolves CommandSpec instances
-        for name, subapp in iterate_commands(app, include_hidden):
-            if not should_include_command(
-                name, parent_path, normalized_commands_filter, normalized_exclude_commands, subapp
-            ):
-                continue
+    def render_subcommand(name: str, subapp: "App") -> list[str]:
+        """Render the section of the subcommand ``name`` (including its nested commands)."""
+        lines = []
 
-            # Build the command chain for this subcommand
-            sub_command_chain = build_command_chain(command_chain, name, app_name)
+        # Build the command chain for this subcommand
+        sub_command_chain = build_command_chain(command_chain, name, app_name)
 
-            # Determine heading level for subcommand
-            if flatten_commands:
-                sub_heading_level = heading_level
-            elif no_root_title and not command_chain:
-                # When root title is skipped, subcommands "take over" the root heading level
-                sub_heading_level = heading_level
-            else:
-                sub_heading_level = heading_level + 1
-
-            # Check if we should skip this command's title heading
-            # Skip title when: root was skipped (single command filter) AND this is the direct target
-            # OR this is an intermediate command on the path to a nested target
-            # This allows the markdown author's section title to serve as the heading
-            is_single_filter = commands_filter is not None and len(commands_filter) == 1
-            is_exact_target = is_single_filter and commands_filter is not None and name == commands_filter[0]
-            is_intermediate_path = (
-                is_single_filter and commands_filter is not None and commands_filter[0].startswith(name + ".")
-            )
+        # Determine heading level for subcommand
+        if flatten_commands:
+            sub_heading_level = heading_level
+        elif no_root_title and not command_chain:
+            # When root title is skipped, subcommands "take over" the root heading level
+            sub_heading_level = heading_level
+        else:
+            sub_heading_level = heading_level + 1
+
+        # Check if we should skip this command's title heading
+        # Skip title when: root was skipped (single command filter) AND this is the direct target
+        # OR this is an intermediate command on the path to a nested target
+        # This allows the markdown author's section title to serve as the heading
+        is_single_filter = commands_filter is not None and len(commands_filter) == 1
+        is_exact_target = is_single_filter and commands_filter is not None and name == commands_filter[0]
+        is_intermediate_path = (
+            is_single_filter and commands_filter is not None and commands_filter[0].startswith(name + ".")
+        )
 
-            skip_this_command_title = skip_current_level and is_exact_target
-            # Also skip intermediate commands entirely when skip_preamble is set
-            skip_intermediate = skip_preamble and skip_current_level and is_intermediate_path
-            # Skip preamble for the exact target when skip_preamble is set (even in recursive calls)
-            skip_target_preamble = skip_preamble and is_exact_target
-
-            # Generate subcommand title (skip if this is the single filtered command at root level,
-            # or if this is an intermediate command and skip_preamble is set)
-            if not skip_this_command_title and not skip_intermediate:
-                # Always use full command path to avoid anchor collisions
-                display_name = " ".join(sub_command_chain)
-                display_fmt = f"`{display_name}`" if code_block_title else display_name
-                effective_sub_level = min(sub_heading_level, max_heading_level)
-                lines.append(f"{'#' * effective_sub_level} {display_fmt}")
-                lines.append("")
-
-            # Get subapp help - show description, usage, and panels for included commands
-            # Skip preamble (description + usage) if:
-            # - skip_preamble is True and this is the exact target (even in recursive calls)
-            # - or this is an intermediate command on the path to a nested target
-            skip_this_preamble = skip_target_preamble or skip_intermediate
-
-            # Include parent app in the stack so default_parameter is properly inherited
-            with subapp.app_stack([app, subapp]):
-                sub_help_format = subapp.app_stack.resolve("help_format", fallback=help_format)
-                # Preserve markup when sub_help_format matches output format (markdown)
-                preserve_sub = sub_help_format in ("markdown", "md")
-
-                if not skip_this_preamble:
-                    # Generate usage first for subcommand
-                    _render_usage_section(subapp, sub_command_chain, lines, usage_name=usage_name)
-                    _render_description_section(subapp, sub_help_format, lines)
-
-                # Only show subcommand panels if we're in recursive mode
-                # (Otherwise we just show the basic info about this command)
-                if recursive:
-                    # Get help panels for subcommand (already sorted)
-                    sub_panels = subapp._assemble_help_panels([], sub_help_format)
-
-                    # Set up command filtering for this subcommand
-                    sub_commands_filter_for_panel, sub_exclude_commands_for_panel = adjust_filters_for_subcommand(
-                        name, normalized_commands_filter, normalized_exclude_commands
-                    )
-                    normalized_sub_filter_panel, normalized_sub_exclude_panel = normalize_command_filters(
-                        sub_commands_filter_for_panel, sub_exclude_commands_for_panel
-                    )
+        skip_this_command_title = skip_current_level and is_exact_target
+        # Also skip intermediate commands entirely when skip_preamble is set
+        skip_intermediate = skip_preamble and skip_current_level and is_intermediate_path
+        # Skip preamble for the exact target when skip_preamble is set (even in recursive calls)
+        skip_target_preamble = skip_preamble and is_exact_target
+
+        # Generate subcommand title (skip if this is the single filtered command at root level,
+        # or if this is an intermediate command and skip_preamble is set)
+        if not skip_this_command_title and not skip_intermediate:
+            # Always use full command path to avoid anchor collisions
+            display_name = " ".join(sub_command_chain)
+            display_fmt = f"`{display_name}`" if code_block_title else display_name
+            effective_sub_level = min(sub_heading_level, max_heading_level)
+            lines.append(f"{'#' * effective_sub_level} {display_fmt}")
+            lines.append("")
 
-                    # Build a map of command names to App objects for filtering
-                    sub_command_map = _build_command_map(subapp, include_hidden=True)
+        # Get subapp help - show description, usage, and panels for included commands
+        # Skip preamble (description + usage) if:
+        # - skip_preamble is True and this is the exact target (even in recursive calls)
+        # - or this is an intermediate command on the path to a nested target
+        skip_this_preamble = skip_target_preamble or skip_intermediate
+
+        # Include parent app in the stack so default_parameter is properly inherited
+        with subapp.app_stack([app, subapp]):
+            sub_help_format = subapp.app_stack.resolve("help_format", fallback=help_format)
+            # Preserve markup when sub_help_format matches output format (markdown)
+            preserve_sub = sub_help_format in ("markdown", "md")
+
+            if not skip_this_preamble:
+                # Generate usage first for subcommand
+                _render_usage_section(subapp, sub_command_chain, lines, usage_name=usage_name)
+                _render_description_section(subapp, sub_help_format, lines)
+
+            # Only show subcommand panels if we're in recursive mode
+            # (Otherwise we just show the basic info about this command)
+            if recursive:
+                # Get help panels for subcommand (already sorted)
+                sub_panels = subapp._assemble_help_panels([], sub_help_format)
+
+                # Set up command filtering for this subcommand
+                sub_commands_filter_for_panel, sub_exclude_commands_for_panel = adjust_filters_for_subcommand(
+                    name, normalized_commands_filter, normalized_exclude_commands
+                )
+                normalized_sub_filter_panel, normalized_sub_exclude_panel = normalize_command_filters(
+                    sub_commands_filter_for_panel, sub_exclude_commands_for_panel
+                )
 
-                    # Build parent path for nested commands
-                    # Use empty path since filter was already adjusted to strip current level's prefix
-                    nested_parent_path_for_panel = []
+                # Build a map of command names to App objects for filtering
+                sub_command_map = _build_command_map(subapp, include_hidden=True)
 
-                    # Create formatter
-                    if flatten_commands:
-                        panel_heading_level = heading_level + 1
-                    else:
-                        panel_heading_level = heading_level + 2
-                    sub_formatter = MarkdownFormatter(
-                        heading_level=panel_heading_level, include_hidden=include_hidden, table_style="list"
-                    )
+                # Build parent path for nested commands
+                # Use empty path since filter was already adjusted to strip current level's prefix
+                nested_parent_path_for_panel = []
 
-                    # Check if we'll be recursively documenting commands
-                    will_recurse = recursive and subapp._commands
-
-                    # Iterate through panels in order
-                    for group, panel in sub_panels:
-                        # Skip hidden groups
-                        if not include_hidden and group and not group.show:
-                            continue
-
-                        if panel.format == "command" and should_show_commands_list(subapp):
-                            # Always filter out built-in flags (--help, --version) from command panels
-                            command_entries_list = [
-                                e for e in panel.entries if not (e.names and is_all_builtin_flags(subapp, e.names))
-                            ]
-
-                            if not command_entries_list:
-                                continue  # Skip empty panel
-
-                            # Apply command filtering for command panels
-                            if will_recurse:
-                                # Show simple command list
-                                command_entries = []
-                                for entry in command_entries_list:
-                                    if entry.names:
-                                        cmd_name = entry.names[0]
-                                        sub_cmd_app = sub_command_map.get(cmd_name)
-                                        if sub_cmd_app and not should_include_command(
-                                            cmd_name,
-                                            nested_parent_path_for_panel,
-                                            normalized_sub_filter_panel,
-                                            normalized_sub_exclude_panel,
-                                            sub_cmd_app,
-                                        ):
-                                            continue
-
-                                        desc_text = (
-                                            extract_text(entry.description, None, preserve_markup=preserve_sub)
-                                            if entry.description
-                                            else ""
-                                        )
-                                        # Generate anchor for the full command path
-                                        full_cmd_path = " ".join(sub_command_chain + [cmd_name])
-                                        anchor = generate_anchor(full_cmd_path)
-                                        if desc_text:
-                                            command_entries.append(f"* [`{cmd_name}`](#{anchor}): {desc_text}")
-                                        else:
-                                            command_entries.append(f"* [`{cmd_name}`](#{anchor})")
-
-                                if command_entries:
-                                    if panel.title:
-                                        lines.append(f"**{panel.title}**:\n")
-                                    lines.extend(command_entries)
-                                    lines.append("")
-                            else:
-                                # Show full command panel
-                                filtered_entries = []
-                                for entry in command_entries_list:
-                                    if entry.names:
-                                        cmd_name = entry.names[0]
-                                        sub_cmd_app = sub_command_map.get(cmd_name)
-                                        if sub_cmd_app and not should_include_command(
-                                            cmd_name,
-                                            nested_parent_path_for_panel,
-                                            normalized_sub_filter_panel,
-                                            normalized_sub_exclude_panel,
-                                            sub_cmd_app,
-                                        ):
-                                            continue
-                                        filtered_entries.append(entry)
-
-                                if filtered_entries:
-                                    if panel.title:
-                                        lines.append(f"**{panel.title}**:\n")
-
-                                    sub_formatter.reset()
-                                    filtered_panel = panel.__class__(
-                                        title="",
-                                        entries=filtered_entries,
-                                        format=panel.format,
-                                        description=panel.description,
+                # Create formatter
+                if flatten_commands:
+                    panel_heading_level = heading_level + 1
+                else:
+                    panel_heading_level = heading_level + 2
+                sub_formatter = MarkdownFormatter(
+                    heading_level=panel_heading_level, include_hidden=include_hidden, table_style="list"
+                )
+
+                # Check if we'll be recursively documenting commands
+                will_recurse = recursive and subapp._commands
+
+                # Iterate through panels in order
+                for group, panel in sub_panels:
+                    # Skip hidden groups
+                    if not include_hidden and group and not group.show:
+                        continue
+
+                    if panel.format == "command" and should_show_commands_list(subapp):
+                        # Always filter out built-in flags (--help, --version) from command panels
+                        command_entries_list = [
+                            e for e in panel.entries if not (e.names and is_all_builtin_flags(subapp, e.names))
+                        ]
+
+                        if not command_entries_list:
+                            continue  # Skip empty panel
+
+                        # Apply command filtering for command panels
+                        if will_recurse:
+                            # Show simple command list
+                            command_entries = []
+                            for entry in command_entries_list:
+                                if entry.names:
+                                    cmd_name = entry.names[0]
+                                    sub_cmd_app = sub_command_map.get(cmd_name)
+                                    if sub_cmd_app and not should_include_command(
+                                        cmd_name,
+                                        nested_parent_path_for_panel,
+                                        normalized_sub_filter_panel,
+                                        normalized_sub_exclude_panel,
+                                        sub_cmd_app,
+                                    ):
+                                        continue
+
+                                    desc_text = (
+                                        extract_text(entry.description, None, preserve_markup=preserve_sub)
+                                        if entry.description
+                                        else ""
                                     )
-                                    sub_formatter(None, None, filtered_panel)
-                                    output = sub_formatter.get_output().strip()
-                                    if output:
-                                        lines.append(output)
-                                    lines.append("")
-                        elif panel.format == "parameter":
-                            # Handle parameter panels - split into arguments and options if needed
-                            _render_parameter_panel(panel, sub_formatter, lines)
-
-                # Process nested commands INSIDE the with block so context is preserved
-                if recursive and subapp._commands:
-                    sub_commands_filter, sub_exclude_commands = adjust_filters_for_subcommand(
-                        name, normalized_commands_filter, normalized_exclude_commands
-                    )
+                                    # Generate anchor for the full command path
+                                    full_cmd_path = " ".join(sub_command_chain + [cmd_name])
+                                    anchor = generate_anchor(full_cmd_path)
+                                    if desc_text:
+                                        command_entries.append(f"* [`{cmd_name}`](#{anchor}): {desc_text}")
+                                    else:
+                                        command_entries.append(f"* [`{cmd_name}`](#{anchor})")
+
+                            if command_entries:
+                                if panel.title:
+                                    lines.append(f"**{panel.title}**:\n")
+                                lines.extend(command_entries)
+                                lines.append("")
+                        else:
+                            # Show full command panel
+                            filtered_entries = []
+                            for entry in command_entries_list:
+                                if entry.names:
+                                    cmd_name = entry.names[0]
+                                    sub_cmd_app = sub_command_map.get(cmd_name)
+                                    if sub_cmd_app and not should_include_command(
+                                        cmd_name,
+                                        nested_parent_path_for_panel,
+                                        normalized_sub_filter_panel,
+                                        normalized_sub_exclude_panel,
+                                        sub_cmd_app,
+                                    ):
+                                        continue
+                                    filtered_entries.append(entry)
+
+                            if filtered_entries:
+                                if panel.title:
+                                    lines.append(f"**{panel.title}**:\n")
+
+                                sub_formatter.reset()
+                                filtered_panel = panel.__class__(
+                                    title="",
+                                    entries=filtered_entries,
+                                    format=panel.format,
+                                    description=panel.description,
+                                )
+                                sub_formatter(None, None, filtered_panel)
+                                output = sub_formatter.get_output().strip()
+                                if output:
+                                    lines.append(output)
+                                lines.append("")
+                    elif panel.format == "parameter":
+                        # Handle parameter panels - split into arguments and options if needed
+                        _render_parameter_panel(panel, sub_formatter, lines)
+
+            # Process nested commands INSIDE the with block so context is preserved
+            if recursive and subapp._commands:
+                sub_commands_filter, sub_exclude_commands = adjust_filters_for_subcommand(
+                    name, normalized_commands_filter, normalized_exclude_commands
+                )
 
-                    normalized_sub_filter, normalized_sub_exclude = normalize_command_filters(
-                        sub_commands_filter, sub_exclude_commands
-                    )
+                normalized_sub_filter, normalized_sub_exclude = normalize_command_filters(
+                    sub_commands_filter, sub_exclude_commands
+                )
 
-                    # Build parent path for nested commands
-                    # Use empty path since filter was already adjusted to strip current level's prefix
-                    nested_parent_path = []
-
-                    for nested_name, nested_app in iterate_commands(subapp, include_hidden):
-                        if not should_include_command(
-                            nested_name, nested_parent_path, normalized_sub_filter, normalized_sub_exclude, nested_app
-                        ):
-                            continue
-
-                        # Build nested command chain (always use full path for correct usage)
-                        nested_command_chain = build_command_chain(sub_command_chain, nested_name, app_name)
-                        # Determine heading level for nested commands
-                        if flatten_commands:
-                            nested_heading_level = heading_level
-                        elif skip_this_command_title:
-                            # When parent command's title was skipped, promote nested commands to parent's level
-                            nested_heading_level = sub_heading_level
-                        else:
-                            nested_heading_level = sub_heading_level + 1
-                        # Determine commands_filter for the recursive call
-                        # Adjust filter to strip current command's prefix for the nested level
-                        if normalized_sub_filter:
-                            nested_commands_filter, _ = adjust_filters_for_subcommand(
-                                nested_name, normalized_sub_filter, normalized_sub_exclude
-                            )
-                        else:
-                            nested_commands_filter = None
-
-                        # Check if this nested command is the target for skip_preamble purposes
-                        # This handles nested paths like "parent.child" where "child" is the target
-                        nested_is_target = (
-                            skip_preamble
-                            and sub_commands_filter is not None
-                            and len(sub_commands_filter) == 1
-                            and nested_name == sub_commands_filter[0]
+                # Build parent path for nested commands
+                # Use empty path since filter was already adjusted to strip current level's prefix
+                nested_parent_path = []
+
+                for nested_name, nested_app in iterate_commands(subapp, include_hidden):
+                    if not should_include_command(
+                        nested_name, nested_parent_path, normalized_sub_filter, normalized_sub_exclude, nested_app
+                    ):
+                        continue
+
+                    # Build nested command chain (always use full path for correct usage)
+                    nested_command_chain = build_command_chain(sub_command_chain, nested_name, app_name)
+                    # Determine heading level for nested commands
+                    if flatten_commands:
+                        nested_heading_level = heading_level
+                    elif skip_this_command_title:
+                        # When parent command's title was skipped, promote nested commands to parent's level
+                        nested_heading_level = sub_heading_level
+                    else:
+                        nested_heading_level = sub_heading_level + 1
+                    # Determine commands_filter for the recursive call
+                    # Adjust filter to strip current command's prefix for the nested level
+                    if normalized_sub_filter:
+                        nested_commands_filter, _ = adjust_filters_for_subcommand(
+                            nested_name, normalized_sub_filter, normalized_sub_exclude
                         )
-                        # Also check if this is an intermediate on a deeper path
-                        nested_is_intermediate = (
-                            skip_preamble
-                            and sub_commands_filter is not None
-                            and len(sub_commands_filter) == 1
-                            and sub_commands_filter[0].startswith(nested_name + ".")
+                    else:
+                        nested_commands_filter = None
+
+                    # Check if this nested command is the target for skip_preamble purposes
+                    # This handles nested paths like "parent.child" where "child" is the target
+                    nested_is_target = (
+                        skip_preamble
+                        and sub_commands_filter is not None
+                        and len(sub_commands_filter) == 1
+                        and nested_name == sub_commands_filter[0]
+                    )
+                    # Also check if this is an intermediate on a deeper path
+                    nested_is_intermediate = (
+                        skip_preamble
+                        and sub_commands_filter is not None
+                        and len(sub_commands_filter) == 1
+                        and sub_commands_filter[0].startswith(nested_name + ".")
+                    )
+
+                    # Set up context for nested_app, then recurse
+                    # The recursive call's app_stack([app]) will stack on top of this
+                    with nested_app.app_stack([subapp, nested_app]):
+                        nested_docs = generate_markdown_docs(
+                            nested_app,
+                            recursive=recursive,
+                            include_hidden=include_hidden,
+                            heading_level=nested_heading_level,
+                            max_heading_level=max_heading_level,
+                            command_chain=nested_command_chain,
+                            generate_toc=False,  # Don't generate TOC for nested commands
+                            flatten_commands=flatten_commands,
+                            commands_filter=nested_commands_filter,
+                            exclude_commands=sub_exclude_commands,
+                            no_root_title=nested_is_intermediate,  # Skip title for intermediate paths
+                            code_block_title=code_block_title,
+                            skip_preamble=nested_is_target or nested_is_intermediate,
+                            usage_name=usage_name,
                         )
+                    # Just append the generated docs - no title replacement
+                    lines.append(nested_docs)
+                    lines.append("")
 
-                        # Set up context for nested_app, then recurse
-                        # The recursive call's app_stack([app]) will stack on top of this
-                        with nested_app.app_stack([subapp, nested_app]):
-                            nested_docs = generate_markdown_docs(
-                                nested_app,
-                                recursive=recursive,
-                                include_hidden=include_hidden,
-                                heading_level=nested_heading_level,
-                                max_heading_level=max_heading_level,
-                                command_chain=nested_command_chain,
-                                generate_toc=False,  # Don't generate TOC for nested commands
-                                flatten_commands=flatten_commands,
-                                commands_filter=nested_commands_filter,
-                                exclude_commands=sub_exclude_commands,
-                                no_root_title=nested_is_intermediate,  # Skip title for intermediate paths
-                                code_block_title=code_block_title,
-                                skip_preamble=nested_is_target or nested_is_intermediate,
-                                usage_name=usage_name,
-                            )
-                        # Just append the generated docs - no title replacement
-                        lines.append(nested_docs)
-                        lines.append("")
+        return lines
 
-    # Join all lines into final document
-    doc = "\n".join(lines).rstrip() + "\n"
+    # Handle recursive documentation for subcommands
+    sections: Iterable[list[str]] = [lines]
+    if subcommand_sections and app._commands:
+        # Iterate through registered commands using iterate_commands helper
+        # This automatically resolves CommandSpec instances
+        subcommands = [
+            (name, subapp)
+            for name, subapp in iterate_commands(app, include_hidden)
+            if should_include_command(
+                name, parent_path, normalized_commands_filter, normalized_exclude_commands, subapp
+            )
+        ]
+        sections = chain(sections, render_sections(render_subcommand, subcommands, workers))
 
     # Normalize multiple consecutive blank lines to a single blank line
     # This ensures consistent spacing regardless of how content was assembled
-    import re
-
-    doc = re.sub(r"\n{3,}", "\n\n", doc)
-
-    return doc
+    yield from join_sections(sections, collapse_blank_lines=True, strip_end=True)
@@ -1,8 +1,12 @@
 """RST documentation generation functions for cyclopts apps."""
 
+import hashlib
+from collections.abc import Iterable, Iterator, MutableMapping
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from cyclopts._markup import extract_text
+from cyclopts.docs._parallel import render_sections
 from cyclopts.docs.base import (
     adjust_filters_for_subcommand,
     apply_usage_name,
@@ -12,6 +16,7 @@ from cyclopts.docs.base import (
     get_app_info,
     is_all_builtin_flags,
     iterate_commands,
+    join_sections,
     normalize_command_filters,
     should_include_command,
     should_show_usage,
@@ -156,6 +161,22 @@ def _generate_toc(lines: list[str]) -> None:
     lines.append("")
 
 
+def _section_key(settings: list, app: "App", name: str, subapp: "App") -> str:
+    """Hash of everything the section of the top-level command ``name`` is rendered from."""
+    from cyclopts import __version__
+    from cyclopts.help.cache import definition
+
+    definitions = []
+
+    def visit(command_chain: list[str], path: list["App"]):
+        definitions.append(definition(command_chain, path))
+        for sub_name, sub_app in iterate_commands(path[-1], include_hidden=True):
+            visit(command_chain + [sub_name], path + [sub_app])
+
+    visit([name], [app, subapp])
+    return hashlib.sha256(repr([__version__, settings, name, definitions]).encode()).hexdigest()
+
+
 def generate_rst_docs(
     app: "App",
     recursive: bool = True,
@@ -171,6 +192,9 @@ def generate_rst_docs(
     code_block_title: bool = False,
     skip_preamble: bool = False,
     usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
+    section_cache: MutableMapping[str, list[str]] | None = None,
 ) -> str:
     """Generate reStructuredText documentation for a CLI application.
 
@@ -221,12 +245,76 @@ def generate_rst_docs(
         Optional replacement for the root app name used in ``Usage:`` lines
         only. Section headings, anchors, and TOC continue to use ``app.name[0]``.
         Default is None.
+    workers : int | None
+        Number of processes rendering the top-level command sections in parallel.
+        The output is identical to serial rendering.
+        Default is None (render in the current process).
+    subcommand_sections : bool
+        If False, document only this command; its subcommands are listed, but get
+        no sections of their own. Used for one-file-per-command output.
+        Default is True.
+    section_cache : MutableMapping[str, list[str]] | None
+        Rendered sections of the top-level commands, keyed by a hash of the options and of
+        the definitions of the command and all of its subcommands. Cached sections are reused,
+        the others are rendered and added. Every section used is (re)assigned, so a
+        :class:`~collections.ChainMap` of a new dict and a previous cache collects exactly the
+        current sections in the new dict. ``app`` must be the root application.
+        Default is None (render every section).
 
     Returns
     -------
     str
         The generated RST documentation.
     """
+    return "".join(
+        iter_rst_docs(
+            app,
+            recursive=recursive,
+            include_hidden=include_hidden,
+            heading_level=heading_level,
+            max_heading_level=max_heading_level,
+            command_chain=command_chain,
+            generate_toc=generate_toc,
+            flatten_commands=flatten_commands,
+            commands_filter=commands_filter,
+            exclude_commands=exclude_commands,
+            no_root_title=no_root_title,
+            code_block_title=code_block_title,
+            skip_preamble=skip_preamble,
+            usage_name=usage_name,
+            workers=workers,
+            subcommand_sections=subcommand_sections,
+            section_cache=section_cache,
+        )
+    )
+
+
+def iter_rst_docs(
+    app: "App",
+    recursive: bool = True,
+    include_hidden: bool = False,
+    heading_level: int = 1,
+    max_heading_level: int = 6,
+    command_chain: list[str] | None = None,
+    generate_toc: bool = True,
+    flatten_commands: bool = False,
+    commands_filter: list[str] | None = None,
+    exclude_commands: list[str] | None = None,
+    no_root_title: bool = False,
+    code_block_title: bool = False,
+    skip_preamble: bool = False,
+    usage_name: str | None = None,
+    workers: int | None = None,
+    subcommand_sections: bool = True,
+    section_cache: MutableMapping[str, list[str]] | None = None,
+) -> Iterator[str]:
+    """Generate RST documentation for a CLI application, in chunks.
+
+    Yields the document's preamble, then the section of each top-level command as soon
+    as it has been rendered, so memory use is bounded by the largest section. The
+    concatenated chunks equal the output of :func:`generate_rst_docs`, which
+    documents the parameters.
+    """
     from cyclopts.help.formatters.rst import RstFormatter
 
     lines = []
@@ -410,74 +498,103 @@ def generate_rst_docs(
                 lines.append(output)
                 lines.append("")
 
-    if recursive and app._commands:
-        normalized_commands_filter, normalized_exclude_commands = normalize_command_filters(
-            commands_filter, exclude_commands
-        )
-        parent_path = []
-
-        for name, subapp in iterate_commands(app, include_hidden):
-            if not should_include_command(
-                name, parent_path, normalized_commands_filter, normalized_exclude_commands, subapp
-            ):
-                continue
+    def render_subcommand(name: str, subapp: "App") -> list[str]:
+        """Render the section of the subcommand ``name`` (including its nested commands)."""
+        lines = [""]
 
-            lines.append("")
+        subcommand_chain = command_chain + [name] if command_chain else [app_name, name]
+        if flatten_commands:
+            next_heading_level = heading_level
+        elif no_root_title and not command_chain:
+            next_heading_level = heading_level - 1
+        else:
+            next_heading_level = heading_level
 
-            subcommand_chain = command_chain + [name] if command_chain else [app_name, name]
-            if flatten_commands:
-                next_heading_level = heading_level
-            elif no_root_title and not command_chain:
-                next_heading_level = heading_level - 1
-            else:
-                next_heading_level = heading_level
+        sub_commands_filter, sub_exclude_commands = adjust_filters_for_subcommand(
+            name, normalized_commands_filter, normalized_exclude_commands
+        )
 
-            sub_commands_filter, sub_exclude_commands = adjust_filters_for_subcommand(
-                name, normalized_commands_filter, normalized_exclude_commands
-            )
+        # Determine if this subcommand should skip its preamble
+        # Skip preamble when: we're at root, skip_preamble is True, and this is the single target command
+        # OR this is an intermediate command on the path to a nested target
+        is_single_target = (
+            not command_chain
+            and skip_preamble
+            and commands_filter is not None
+            and len(commands_filter) == 1
+            and name == commands_filter[0]
+        )
+        is_intermediate_path = (
+            not command_chain
+            and skip_preamble
+            and commands_filter is not None
+            and len(commands_filter) == 1
+            and commands_filter[0].startswith(name + ".")
+        )
 
-            # Determine if this subcommand should skip its preamble
-            # Skip preamble when: we're at root, skip_preamble is True, and this is the single target command
-            # OR this is an intermediate command on the path to a nested target
-            is_single_target = (
-                not command_chain
-                and skip_preamble
-                and commands_filter is not None
-                and len(commands_filter) == 1
-                and name == commands_filter[0]
-            )
-            is_intermediate_path = (
-                not command_chain
-                and skip_preamble
-                and commands_filter is not None
-                and len(commands_filter) == 1
-                and commands_filter[0].startswith(name + ".")
+        # Push subapp onto app_stack - context will stack with recursive call's app_stack([app])
+        with subapp.app_stack([app, subapp]):
+            subdocs = generate_rst_docs(
+                subapp,
+                recursive=recursive,
+                include_hidden=include_hidden,
+                heading_level=next_heading_level,
+                max_heading_level=max_heading_level,
+                command_chain=subcommand_chain,
+                generate_toc=False,  # Only generate TOC at root level
+                flatten_commands=flatten_commands,
+                commands_filter=sub_commands_filter,
+                exclude_commands=sub_exclude_commands,
+                no_root_title=is_intermediate_path,  # Skip title for intermediate path commands
+                code_block_title=code_block_title,
+                skip_preamble=is_single_target or is_intermediate_path,  # Skip preamble for target or intermediate
+                usage_name=usage_name,
             )
+        lines.append(subdocs)
 
-            # Push subapp onto app_stack - context will stack with recursive call's app_stack([app])
-            with subapp.app_stack([app, subapp]):
-                subdocs = generate_rst_docs(
-                    subapp,
-                    recursive=recursive,
-                    include_hidden=include_hidden,
-                    heading_level=next_heading_level,
-                    max_heading_level=max_heading_level,
-                    command_chain=subcommand_chain,
-                    generate_toc=False,  # Only generate TOC at root level
-                    flatten_commands=flatten_commands,
-                    commands_filter=sub_commands_filter,
-                    exclude_commands=sub_exclude_commands,
-                    no_root_title=is_intermediate_path,  # Skip title for intermediate path commands
-                    code_block_title=code_block_title,
-                    skip_preamble=is_single_target or is_intermediate_path,  # Skip preamble for target or intermediate
-                    usage_name=usage_name,
-                )
-            lines.append(subdocs)
+        return lines
 
-    # Join and normalize multiple consecutive blank lines to a single blank line
-    import re
+    sections: Iterable[list[str]] = [lines]
+    if recursive and subcommand_sections and app._commands:
+        normalized_commands_filter, normalized_exclude_commands = normalize_command_filters(
+            commands_filter, exclude_commands
+        )
+        parent_path = []
 
-    doc = "\n".join(lines)
-    doc = re.sub(r"\n{3,}", "\n\n", doc)
+        subcommands = [
+            (name, subapp)
+            for name, subapp in iterate_commands(app, include_hidden)
+            if should_include_command(
+                name, parent_path, normalized_commands_filter, normalized_exclude_commands, subapp
+            )
+        ]
+        if section_cache is None:
+            sections = chain(sections, render_sections(render_subcommand, subcommands, workers))
+        else:
+            settings = [
+                recursive,
+                include_hidden,
+                heading_level,
+                max_heading_level,
+                command_chain,
+                flatten_commands,
+                commands_filter,
+                exclude_commands,
+                no_root_title,
+                code_block_title,
+                skip_preamble,
+                usage_name,
+            ]
+            keys = [_section_key(settings, app, name, subapp) for name, subapp in subcommands]
+            missing = [i for i, key in enumerate(keys) if key not in section_cache]
+            rendered = render_sections(render_subcommand, [subcommands[i] for i in missing], workers)
+            fresh = dict(zip(missing, rendered, strict=True))
+            cached = []
+            for i, key in enumerate(keys):
+                # Reassigned even when cached; see ``section_cache`` in :func:`generate_rst_docs`.
+                section_cache[key] = section = fresh[i] if i in fresh else section_cache[key]
+                cached.append(section)
+            sections = chain(sections, cached)
 
-    return doc
+    # Join and normalize multiple consecutive blank lines to a single blank line
+    yield from join_sections(sections, collapse_blank_lines=True)
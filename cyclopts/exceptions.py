@@ -5,7 +5,7 @@ from enum import Enum
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Literal, Optional, get_args, get_origin
 
-from attrs import define, field
+from attrs import define, field, fields
 
 import cyclopts.utils
 from cyclopts.annotations import get_hint_name
@@ -61,6 +61,13 @@ def _get_function_info(func):
     return inspect.getsourcefile(func), inspect.getsourcelines(func)[1]
 
 
+def _restore_error(cls: type["CycloptsError"], state: dict[str, Any]) -> "CycloptsError":
+    error = cls.__new__(cls)
+    for name, value in state.items():
+        object.__setattr__(error, name, value)
+    return error
+
+
 class CommandCollisionError(Exception):
     """A command with the same name has already been registered to the app."""
 
@@ -158,6 +165,13 @@ class CycloptsError(Exception):
             return self.msg
         return Text(self.msg)
 
+    def _msg_segment(self) -> "tuple[str, str] | Text":
+        """``self.msg`` as a segment; strings stay plain so ``str(error)`` doesn't import rich."""
+        assert self.msg is not None
+        if isinstance(self.msg, str):
+            return self.msg, ""
+        return self.msg
+
     def _segments(self) -> "Iterator[tuple[str, str] | Text]":
         """Yield segments that compose the error message.
 
@@ -168,7 +182,7 @@ class CycloptsError(Exception):
         ``yield from super()._segments()`` to include the verbose preamble.
         """
         if self.msg is not None:
-            yield self._resolved_msg()
+            yield self._msg_segment()
             return
 
         if not self.verbose:
@@ -206,6 +220,11 @@ class CycloptsError(Exception):
                 out.append_text(item)
         return out
 
+    def __reduce__(self):
+        # The default ``Exception`` pickling re-invokes ``__init__`` positionally,
+        # which doesn't work for keyword-only attrs fields.
+        return _restore_error, (type(self), {f.name: getattr(self, f.name) for f in fields(type(self))})
+
 
 @define(kw_only=True)
 class CombinedShortOptionError(CycloptsError):
@@ -333,14 +352,16 @@ class CoercionError(CycloptsError):
         # Branch 1: explicit msg override. User-supplied markup is preserved;
         # the framework wraps it with the standard prefix when a keyword exists.
         if self.msg is not None:
-            msg_text = self._resolved_msg()
+            msg = self._msg_segment()
             if not self.token or self.token.keyword is None:
-                yield msg_text
+                yield msg
+            elif isinstance(msg, tuple):
+                yield f"Invalid value for {self.token.keyword}: {msg[0]}", ""
             else:
                 from rich.text import Text
 
                 prefix = Text(f"Invalid value for {self.token.keyword}: ")
-                yield prefix + msg_text
+                yield prefix + msg
             return
 
         # Branch 2: JSONDecodeError verbosifier path. Plain, like branch 1.
@@ -643,7 +664,7 @@ class RepeatArgumentError(CycloptsError):
 
     def _segments(self) -> "Iterator[tuple[str, str] | Text]":
         if self.msg is not None:
-            yield self._resolved_msg()
+            yield self._msg_segment()
             return
         # Invariant: positional duplication is routed to UnusedCliTokensError by the binder,
         # so any token reaching this error path was matched by keyword.
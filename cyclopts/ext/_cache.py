@@ -0,0 +1,72 @@
+"""Generated documentation cached by the Sphinx and MkDocs extensions.
+
+Entries record the ``(path, mtime_ns, size)`` of every source file of the documented
+app, and are reused while none of those files changed. Once one did, the app is imported
+again, but the sections of unchanged top-level commands can still be reused.
+"""
+
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+from cyclopts import __version__
+
+if TYPE_CHECKING:
+    from cyclopts.core import App
+
+
+@attrs.frozen
+class CacheEntry:
+    """Documentation generated for one directive, and the source files it was generated from."""
+
+    version: str
+    sources: tuple[tuple[str, int, int], ...]
+    """``(path, mtime_ns, size)`` of each source file of the app."""
+    content: str
+    sections: dict[str, list[str]] = attrs.field(factory=dict)
+    """Rendered top-level command sections, by content hash; see ``section_cache`` of :func:`.generate_rst_docs`."""
+
+    @classmethod
+    def create(
+        cls, module_path: str, app: "App", content: str, sections: dict[str, list[str]] | None = None
+    ) -> "CacheEntry":
+        sources = tuple(filter(None, map(file_fingerprint, app_sources(module_path, app))))
+        return cls(version=__version__, sources=sources, content=content, sections=sections or {})
+
+    def is_current(self) -> bool:
+        return self.version == __version__ and all(
+            file_fingerprint(path) == (path, *stat) for path, *stat in self.sources
+        )
+
+
+def file_fingerprint(path: str) -> tuple[str, int, int] | None:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def app_sources(module_path: str, app: "App") -> list[str]:
+    """Source files of the package defining ``app``, of all of its commands, and of their parameter types."""
+    from cyclopts.docs.base import iterate_commands
+    from cyclopts.help.cache import _source_file, parameter_type_files
+
+    package = module_path.partition(":")[0].partition(".")[0]
+    files = set()
+    for name, module in list(sys.modules.items()):
+        if name == package or name.startswith(package + "."):
+            if path := getattr(module, "__file__", None):
+                files.add(path)
+
+    apps = [app]
+    while apps:
+        current = apps.pop()
+        if current.default_command is not None:
+            if path := _source_file(current.default_command):
+                files.add(path)
+            files.update(parameter_type_files(current))
+        apps.extend(subapp for _, subapp in iterate_commands(current, include_hidden=True))
+    return sorted(files)
@@ -1,5 +1,7 @@
 """MkDocs plugin for automatic Cyclopts CLI documentation."""
 
+import bisect
+import math
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -7,6 +9,7 @@ import yaml
 from attrs import define, field, validators
 
 from cyclopts.docs.markdown import generate_markdown_docs
+from cyclopts.ext._cache import CacheEntry
 from cyclopts.utils import import_app
 
 if TYPE_CHECKING:
@@ -14,6 +17,8 @@ if TYPE_CHECKING:
     from mkdocs.structure.files import Files
     from mkdocs.structure.pages import Page
 
+    from cyclopts.core import App
+
 from mkdocs.config import base
 from mkdocs.config import config_options as c
 from mkdocs.exceptions import PluginError
@@ -110,7 +115,59 @@ DIRECTIVE_PATTERN = re.compile(
 )
 
 
-def process_cyclopts_directives(markdown: str, plugin_config: Any) -> str:
+def _code_block_spans(markdown: str) -> list[tuple[int, int]]:
+    """Sorted, disjoint ``(start, end)`` offsets of the code blocks in ``markdown``, found in one pass.
+
+    Fenced blocks run from a line starting with at least three backticks or tildes to the
+    next such line. Indented blocks start with a line indented by 4 spaces or a tab that
+    follows a blank line, and end at the next non-indented, non-blank line.
+    """
+    spans = []
+    fence_start = indent_start = None
+    prev_blank = True
+    pos = 0
+    for line in markdown.split("\n"):
+        blank = not line.strip()
+        if (fence := len(line) - len(line.lstrip("`~"))) >= 3:
+            if fence_start is None:
+                fence_start = pos
+            else:
+                spans.append((fence_start, pos + fence))
+                fence_start = None
+
+        indented = line.startswith(("    ", "\t")) and not blank
+        if indent_start is None:
+            if prev_blank and indented:
+                indent_start = pos
+        elif not indented and not blank:
+            spans.append((indent_start, pos))
+            indent_start = None
+
+        prev_blank = blank
+        pos += len(line) + 1  # +1 for the newline
+    if indent_start is not None:
+        spans.append((indent_start, pos))
+
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _in_spans(spans: list[tuple[int, int]], pos: int) -> bool:
+    """Whether ``pos`` lies within one of the sorted, disjoint ``spans``."""
+    i = bisect.bisect_right(spans, (pos, math.inf)) - 1
+    return i >= 0 and pos < spans[i][1]
+
+
+def process_cyclopts_directives(
+    markdown: str,
+    plugin_config: Any,
+    cache: "dict[str, tuple[App, CacheEntry]] | None" = None,
+) -> str:
     """Process all ::: cyclopts directives in markdown content.
 
     Parameters
@@ -119,66 +176,21 @@ def process_cyclopts_directives(markdown: str, plugin_config: Any) -> str:
         The markdown content containing ::: cyclopts directives.
     plugin_config : CycloptsPluginConfig
         The plugin configuration with default values. If None, uses DirectiveOptions defaults.
+    cache : dict | None
+        Generated documentation, keyed by directive options. An entry is reused while the
+        directive's module still provides the same app and none of the app's source files
+        changed. Updated in place.
 
     Returns
     -------
     str
         The markdown content with directives replaced by generated documentation.
     """
-    # Find all code blocks to exclude from processing
-    code_blocks = []
-
-    # Find fenced code blocks (triple backticks or tildes)
-    fenced_pattern = re.compile(r"^[`~]{3,}.*?^[`~]{3,}", re.MULTILINE | re.DOTALL)
-    for match in fenced_pattern.finditer(markdown):
-        code_blocks.append((match.start(), match.end()))
-
-    # Find indented code blocks (lines starting with 4 spaces or tab)
-    # Indented code blocks are preceded by a blank line and consist of lines starting with 4 spaces/tab
-    lines = markdown.split("\n")
-    in_indented_block = False
-    block_start = 0
-    current_pos = 0
-
-    for i, line in enumerate(lines):
-        line_len = len(line) + 1  # +1 for the newline
-
-        # Check if this line starts an indented code block
-        if not in_indented_block:
-            # Previous line must be blank (or be the first line)
-            prev_blank = i == 0 or not lines[i - 1].strip()
-            # Current line must start with 4 spaces or a tab and have content
-            is_indented = (line.startswith("    ") or line.startswith("\t")) and line.strip()
-
-            if prev_blank and is_indented:
-                in_indented_block = True
-                block_start = current_pos
-        else:
-            # Check if we're still in the indented block
-            is_indented = (line.startswith("    ") or line.startswith("\t")) and line.strip()
-            is_blank = not line.strip()
-
-            # End block if we hit a non-indented, non-blank line
-            if not is_indented and not is_blank:
-                code_blocks.append((block_start, current_pos))
-                in_indented_block = False
-
-        current_pos += line_len
-
-    # If we ended while still in an indented block, add it
-    if in_indented_block:
-        code_blocks.append((block_start, current_pos))
-
-    def is_in_code_block(pos: int) -> bool:
-        """Check if a position is inside a code block."""
-        for start, end in code_blocks:
-            if start <= pos < end:
-                return True
-        return False
+    code_blocks = _code_block_spans(markdown)
 
     def replace_directive(match: re.Match) -> str:
         # Skip if this match is inside a code block
-        if is_in_code_block(match.start()):
+        if _in_spans(code_blocks, match.start()):
             return match.group(0)
 
         directive_text = match.group(0)
@@ -193,6 +205,10 @@ def process_cyclopts_directives(markdown: str, plugin_config: Any) -> str:
             )
 
             app = import_app(options.module)
+            key = repr(options)
+            cached = cache.get(key) if cache is not None else None
+            if cached is not None and cached[0] is app and cached[1].is_current():
+                return cached[1].content
 
             markdown_docs = generate_markdown_docs(
                 app,
@@ -209,6 +225,8 @@ def process_cyclopts_directives(markdown: str, plugin_config: Any) -> str:
                 skip_preamble=options.skip_preamble,
                 usage_name=options.usage_name,
             )
+            if cache is not None:
+                cache[key] = (app, CacheEntry.create(options.module, app, markdown_docs))
 
             return markdown_docs
 
@@ -242,8 +260,18 @@ class CycloptsPlugin(BasePlugin[CycloptsPluginConfig]):  # type: ignore[misc]
             :recursive: true
             :commands: init, build
             :exclude-commands: debug
+
+    Generated documentation is cached across pages and, since the plugin stays loaded,
+    across ``mkdocs serve`` rebuilds.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache: dict[str, tuple[App, CacheEntry]] = {}
+
+    def on_startup(self, *, command: str, dirty: bool) -> None:
+        """Defining this event keeps the plugin instance (and its cache) across ``mkdocs serve`` rebuilds."""
+
     def on_page_markdown(self, markdown: str, *, page: "Page", config: "MkDocsConfig", files: "Files", **kwargs) -> str:
         """Process ::: cyclopts directives in markdown content.
 
@@ -253,4 +281,4 @@ class CycloptsPlugin(BasePlugin[CycloptsPluginConfig]):  # type: ignore[misc]
         if "::: cyclopts" not in markdown:
             return markdown
 
-        return process_cyclopts_directives(markdown, self.config)
+        return process_cyclopts_directives(markdown, self.config, self._cache)
@@ -1,14 +1,20 @@
 """Sphinx extension for automatic Cyclopts CLI documentation."""
 
+from collections import ChainMap
+from collections.abc import MutableMapping
 from typing import TYPE_CHECKING, Any
 
 import attrs
 
 from cyclopts import __version__
+from cyclopts.ext._cache import CacheEntry
 from cyclopts.utils import import_app
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+    from cyclopts.core import App
 
 from docutils import nodes
 from sphinx.application import Sphinx
@@ -17,6 +23,9 @@ from sphinx.util.docutils import SphinxDirective
 
 logger = logging.getLogger(__name__)
 
+_ENV_ATTR = "cyclopts_rst_cache"
+"""Attribute of the Sphinx ``BuildEnvironment`` holding generated RST; pickled with the environment."""
+
 
 @attrs.define(kw_only=True)
 class DirectiveOptions:
@@ -320,6 +329,19 @@ def _create_section_nodes(lines: list[str], state: Any) -> list["nodes.Node"]:
     return result
 
 
+def _env_cache(env: "BuildEnvironment") -> dict[str, CacheEntry]:
+    cache = getattr(env, _ENV_ATTR, None)
+    if not isinstance(cache, dict):
+        cache = {}
+        setattr(env, _ENV_ATTR, cache)
+    return cache
+
+
+def _merge_env_cache(app: "Sphinx", env: "BuildEnvironment", docnames: Any, other: "BuildEnvironment") -> None:
+    """Collect entries generated by parallel reader processes."""
+    _env_cache(env).update(_env_cache(other))
+
+
 class CycloptsDirective(SphinxDirective):  # type: ignore[misc,valid-type]
     """Sphinx directive for documenting Cyclopts CLI applications."""
 
@@ -341,11 +363,33 @@ class CycloptsDirective(SphinxDirective):  # type: ignore[misc,valid-type]
             return self._error_node(f"Error generating Cyclopts documentation: {e}")
 
     def _generate_documentation(self, module_path: str, opts: DirectiveOptions) -> str:
-        """Generate RST documentation for the app."""
+        """Generate RST documentation for the app.
+
+        Results are cached in the build environment, keyed by the module path and the
+        directive's options, and reused (without importing the app) while none of the app's
+        source files changed. The source files (including those of parameter types) are also
+        recorded as dependencies of the document, so Sphinx re-reads it when the CLI changes.
+        Once they do, only the sections of top-level commands whose definition changed are rendered again.
+        """
+        cache = _env_cache(self.env)
+        key = f"{module_path}\0{opts!r}"
+        entry = cache.get(key)
+        if entry is None or not entry.is_current():
+            app = import_app(module_path)
+            previous = getattr(entry, "sections", {}) if entry is not None and entry.version == __version__ else {}
+            sections: ChainMap[str, list[str]] = ChainMap({}, previous)
+            content = self._generate_rst(app, opts, sections)
+            entry = cache[key] = CacheEntry.create(module_path, app, content, sections.maps[0])
+
+        for path, *_ in entry.sources:
+            self.env.note_dependency(path)
+        return entry.content
+
+    def _generate_rst(
+        self, app: "App", opts: DirectiveOptions, sections: MutableMapping[str, list[str]] | None = None
+    ) -> str:
         from cyclopts.docs.rst import generate_rst_docs
 
-        app = import_app(module_path)
-
         # Call generate_rst_docs directly to access internal no_root_title parameter
         return generate_rst_docs(
             app,
@@ -360,6 +404,7 @@ class CycloptsDirective(SphinxDirective):  # type: ignore[misc,valid-type]
             code_block_title=opts.code_block_title,
             skip_preamble=opts.skip_preamble,
             usage_name=opts.usage_name,
+            section_cache=sections,
         )
 
     def _create_nodes(self, rst_content: str, opts: DirectiveOptions) -> list["nodes.Node"]:
@@ -378,6 +423,7 @@ class CycloptsDirective(SphinxDirective):  # type: ignore[misc,valid-type]
 def setup(app: "Sphinx") -> dict[str, Any]:
     """Setup function for the Sphinx extension."""
     app.add_directive("cyclopts", CycloptsDirective)
+    app.connect("env-merge-info", _merge_env_cache)
     return {
         "version": __version__,
         "parallel_read_safe": True,
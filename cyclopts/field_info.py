@@ -1,5 +1,6 @@
 import inspect
 import sys
+from collections.abc import Callable
 from typing import (  # noqa: F401
     Annotated,
     Any,
@@ -9,6 +10,7 @@ from typing import (  # noqa: F401
     get_origin,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 import attrs
 from attrs import field
@@ -130,6 +132,63 @@ class FieldInfo:
         return attrs.evolve(self, **kwargs)
 
 
+class _DefaultFactory:
+    """Placeholder :attr:`FieldInfo.default` for a default produced by a factory.
+
+    Cached field infos hold this instead of the factory's value, so that the factory
+    is still invoked for every :func:`get_field_infos`/:func:`signature_parameters` call.
+    """
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+
+# Keyed by the introspected callable/type; entries disappear along with their key.
+# ``_cache_generation`` is bumped whenever they're cleared, so that caches derived from them can be invalidated too.
+_cache_generation = 0
+_field_infos_cache: WeakKeyDictionary[Any, dict[str, FieldInfo]] = WeakKeyDictionary()
+_signature_parameters_cache: WeakKeyDictionary[Any, dict[str, FieldInfo]] = WeakKeyDictionary()
+
+
+def _cached(
+    cache: WeakKeyDictionary[Any, dict[str, FieldInfo]],
+    key: Any,
+    build: Callable[[Any], dict[str, FieldInfo]],
+) -> dict[str, FieldInfo]:
+    """Return ``build(key)``, memoized in ``cache`` if ``key`` is hashable and weak-referenceable.
+
+    The returned field infos may be shared and must not be mutated.
+    """
+    try:
+        out = cache.get(key)
+    except TypeError:
+        return build(key)
+    if out is None:
+        out = cache[key] = build(key)
+    return out
+
+
+def _copy_field_infos(field_infos: dict[str, FieldInfo]) -> dict[str, FieldInfo]:
+    """Copy (possibly shared) field infos so that they can be mutated, invoking default factories."""
+    out = {}
+    for name, field_info in field_infos.items():
+        if isinstance(field_info.default, _DefaultFactory):
+            out[name] = field_info.evolve(default=field_info.default.factory())
+        else:
+            out[name] = field_info.evolve()
+    return out
+
+
+def _clear_caches():
+    """Clear the cached results of :func:`get_field_infos` and :func:`signature_parameters`."""
+    global _cache_generation
+    _field_infos_cache.clear()
+    _signature_parameters_cache.clear()
+    _cache_generation += 1
+
+
 def _typed_dict_field_infos(typeddict) -> dict[str, FieldInfo]:
     # The ``__required_keys__`` and ``__optional_keys__`` attributes of TypedDict are kind of broken in <cp3.11.
     out = {}
@@ -153,7 +212,7 @@ def _generic_class_field_infos(
     include_var_keyword=False,
 ) -> dict[str, FieldInfo]:
     out = {}
-    for name, field_info in signature_parameters(f.__init__).items():
+    for name, field_info in _signature_parameters(f.__init__).items():
         if field_info.name == "self":
             continue
         if not include_var_positional and field_info.kind is field_info.VAR_POSITIONAL:
@@ -204,12 +263,7 @@ def _pydantic_field_infos(model) -> dict[str, FieldInfo]:
             annotation = pydantic_field.annotation
 
         if pydantic_field.default_factory is not None:
-            try:
-                default = pydantic_field.get_default(call_default_factory=True)
-            except (TypeError, ValueError):
-                # Factories that require validated data cannot be invoked during introspection;
-                # treat those fields as having no introspectable default.
-                default = FieldInfo.empty
+            default = _DefaultFactory(_pydantic_default_factory(pydantic_field))
         elif pydantic_field.default is PydanticUndefined:
             default = FieldInfo.empty
         else:
@@ -226,6 +280,18 @@ def _pydantic_field_infos(model) -> dict[str, FieldInfo]:
     return out
 
 
+def _pydantic_default_factory(pydantic_field) -> Callable[[], Any]:
+    def factory():
+        try:
+            return pydantic_field.get_default(call_default_factory=True)
+        except (TypeError, ValueError):
+            # Factories that require validated data cannot be invoked during introspection;
+            # treat those fields as having no introspectable default.
+            return FieldInfo.empty
+
+    return factory
+
+
 def _namedtuple_field_infos(hint) -> dict[str, FieldInfo]:
     out = {}
     type_hints = get_type_hints(hint)
@@ -242,7 +308,7 @@ def _namedtuple_field_infos(hint) -> dict[str, FieldInfo]:
 
 def _attrs_field_infos(hint) -> dict[str, FieldInfo]:
     out = {}
-    field_infos = signature_parameters(hint.__init__)
+    field_infos = _signature_parameters(hint.__init__)
     for attribute in hint.__attrs_attrs__:
         if not attribute.init:
             continue
@@ -253,7 +319,7 @@ def _attrs_field_infos(hint) -> dict[str, FieldInfo]:
             required = False
             # ``takes_self`` factories cannot be invoked without an instance; treat those
             # fields as having no introspectable default.
-            default = FieldInfo.empty if attribute.default.takes_self else attribute.default.factory()
+            default = FieldInfo.empty if attribute.default.takes_self else _DefaultFactory(attribute.default.factory)
         elif attribute.default is attrs.NOTHING:
             required = True
             default = FieldInfo.empty
@@ -277,7 +343,7 @@ def _dataclass_field_infos(hint) -> dict[str, FieldInfo]:
     type_hints = get_type_hints(hint, include_extras=True)  # resolves stringified type hints
     for f in fields:
         if f.default_factory is not dataclasses.MISSING:
-            default = f.default_factory()
+            default = _DefaultFactory(f.default_factory)
             required = False
         elif f.default is not dataclasses.MISSING:
             default = f.default
@@ -329,6 +395,11 @@ def _enum_flag_field_infos(enum_flag) -> dict[str, FieldInfo]:
 
 
 def get_field_infos(hint) -> dict[str, FieldInfo]:
+    return _copy_field_infos(_get_field_infos(hint))
+
+
+def _get_field_infos(hint) -> dict[str, FieldInfo]:
+    """Cached :func:`get_field_infos`; the returned field infos are shared and must not be mutated."""
     # Early return for builtin types (int, str, etc.) to avoid expensive introspection.
     # Provides ~5-6x speedup for argument parsing by skipping signature_parameters() calls.
     if is_builtin(hint):
@@ -341,8 +412,12 @@ def get_field_infos(hint) -> dict[str, FieldInfo]:
     # NewType is a runtime identity function that returns its argument unchanged.
     # Use the field_infos of the underlying supertype instead of NewType's misleading __init__.
     if hasattr(hint, "__supertype__"):
-        return get_field_infos(hint.__supertype__)
+        return _get_field_infos(hint.__supertype__)
+
+    return _cached(_field_infos_cache, hint, _build_field_infos)
 
+
+def _build_field_infos(hint) -> dict[str, FieldInfo]:
     if is_dataclass(hint):
         # This must be before ``is_pydantic`` check so that we
         # can handle pydantic dataclasses as vanilla dataclasses.
@@ -366,6 +441,15 @@ def get_field_infos(hint) -> dict[str, FieldInfo]:
 
 
 def signature_parameters(f: Any) -> dict[str, FieldInfo]:
+    return _copy_field_infos(_signature_parameters(f))
+
+
+def _signature_parameters(f: Any) -> dict[str, FieldInfo]:
+    """Cached :func:`signature_parameters`; the returned field infos are shared and must not be mutated."""
+    return _cached(_signature_parameters_cache, f, _build_signature_parameters)
+
+
+def _build_signature_parameters(f: Any) -> dict[str, FieldInfo]:
     if "functools" in sys.modules:
         from functools import partial
 
@@ -386,7 +470,7 @@ def signature_parameters(f: Any) -> dict[str, FieldInfo]:
         # — also reused by pydantic's generated ``__signature__`` — and attrs' ``NOTHING``).
         # ``get_field_infos`` already resolves defaults per-library; merge its
         # default/requiredness over the raw signature values.
-        for name, field_info in get_field_infos(func).items():
+        for name, field_info in _get_field_infos(func).items():
             for candidate in field_info.names or (name,):
                 if candidate in out:
                     out[candidate] = out[candidate].evolve(default=field_info.default, required=field_info.required)
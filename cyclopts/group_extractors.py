@@ -139,6 +139,9 @@ def groups_from_app(app: "App", resolve_lazy: bool = False) -> list[tuple[Group,
                         if mapping[0] is group:
                             break
                         elif mapping[0].name == group.name:
+                            if cmd._group is None:
+                                # Reconstructed from a manifest; merged into the existing group by name.
+                                break
                             raise ValueError(f'Command Group "{group.name}" already exists.')
                     else:
                         group_mapping.append((group, []))
@@ -165,17 +168,15 @@ def groups_from_app(app: "App", resolve_lazy: bool = False) -> list[tuple[Group,
 
 def inverse_groups_from_app(input_app: "App", resolve_lazy: bool = False) -> list[tuple["App", list[Group]]]:
     out = []
-    seen_apps = []
+    # Keyed on ``id`` rather than ``list.index`` so that lookup is O(1) and doesn't invoke ``App.__eq__``.
+    seen_apps: dict[int, int] = {}
     for group, registered_commands in groups_from_app(input_app, resolve_lazy=resolve_lazy):
         for registered_command in registered_commands:
             app = registered_command.app
             if isinstance(app, CommandSpec):
                 continue
-            try:
-                index = seen_apps.index(app)
-            except ValueError:
-                index = len(out)
+            index = seen_apps.setdefault(id(app), len(out))
+            if index == len(out):
                 out.append((app, []))
-                seen_apps.append(app)
             out[index][1].append(group)
     return out
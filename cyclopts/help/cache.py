@@ -0,0 +1,238 @@
+"""On-disk cache of rendered help pages; see :attr:`App.help_cache <cyclopts.App.help_cache>`.
+
+Rendering a help page (usage, docstring parsing, panel layout) dominates the
+time of ``--help`` for large applications. With the cache enabled, the rendered
+output is stored under ``$XDG_CACHE_HOME/cyclopts/help``, keyed by a fingerprint
+of everything that affects it: the command chain, the console (width, color system,
+encoding), the help format and formatter, the definitions of the apps involved, and
+the ``(mtime_ns, size)`` of the files defining their commands and parameter types.
+"""
+
+import hashlib
+import os
+import re
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import attrs
+
+from cyclopts._cache import atomic_write, cache_root
+
+if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderResult
+
+    from cyclopts.core import App
+
+CACHE_ENV_VAR = "CYCLOPTS_HELP_CACHE"
+"""Set to ``"0"`` to disable the help cache, even for apps that enable it."""
+
+_FORMAT = 1
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+# App fields that don't affect the rendered page, or are covered by the console key.
+_IGNORED_FIELDS = frozenset({"_console", "_error_console"})
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_VAR, "1") != "0"
+
+
+def cache_dir() -> Path:
+    """Directory holding rendered help pages: ``$XDG_CACHE_HOME/cyclopts/help`` (default ``~/.cache``)."""
+    return cache_root() / "help"
+
+
+def supports(console: "Console") -> bool:
+    """Whether output of ``console`` can be replayed from a string."""
+    return not (console.is_jupyter or console.record or console.legacy_windows)
+
+
+def _stable_repr(obj: Any) -> str:
+    """:func:`repr` without memory addresses, which differ between processes."""
+    return _ADDRESS.sub("", repr(obj))
+
+
+def _file_fingerprint(path: str | None) -> list | None:
+    if not path:
+        return None
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return [path, stat.st_mtime_ns, stat.st_size]
+
+
+def _source_file(func: Any) -> str | None:
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        return code.co_filename
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    return getattr(module, "__file__", None)
+
+
+def _callable_definition(func: Any) -> list:
+    return [
+        _stable_repr(func),
+        getattr(func, "__doc__", None),
+        _stable_repr(getattr(func, "__defaults__", None)),
+        _stable_repr(getattr(func, "__kwdefaults__", None)),
+        _stable_repr(getattr(func, "__annotations__", None)),
+        _file_fingerprint(_source_file(func)),
+    ]
+
+
+def parameter_type_files(app: "App") -> list[str]:
+    """Source files of the classes (dataclasses, attrs, :class:`~typing.TypedDict`, ...) whose fields are parameters of ``app``.
+
+    Their fields, defaults and docstrings are part of the help page, but not of the command's definition.
+    """
+    from cyclopts.annotations import resolve
+
+    owners = {}
+    for argument in app.assemble_argument_collection():
+        if argument.children:
+            for owner in (argument.hint, *(member for member, _ in argument._union_branches)):
+                owner = resolve(owner)
+                owners[id(owner)] = owner
+    return sorted({path for owner in owners.values() if (path := _source_file(owner))})
+
+
+def _parameter_type_sources(app: "App") -> list:
+    return [_file_fingerprint(path) for path in parameter_type_files(app)]
+
+
+def _app_definition(app: "App") -> list:
+    """The settings of ``app`` (excluding its subcommands) and its command's definition."""
+    out = []
+    for f in attrs.fields(type(app)):
+        if not f.init or f.name in _IGNORED_FIELDS:
+            continue
+        value = getattr(app, f.name)
+        if f.name == "default_command" and value is not None:
+            out.append([_callable_definition(value), _parameter_type_sources(app)])
+        else:
+            out.append(_stable_repr(value))
+    return out
+
+
+def _commands_listing(app: "App") -> list:
+    """Subcommands shown in the help page of ``app``, without resolving lazy commands."""
+    from cyclopts.core import App, _walk_metas
+    from cyclopts.group_extractors import groups_from_app
+
+    out = []
+    for subapp in _walk_metas(app):
+        for group, registered in groups_from_app(subapp):
+            out.append(_stable_repr(group))
+            for command in registered:
+                if isinstance(command.app, App):
+                    # What ``format_command_entries`` shows.
+                    entry = [command.app.show, _stable_repr(command.app.sort_key), command.app.help]
+                    out.append([command.names, entry])
+                else:
+                    out.append([command.names, _stable_repr(command.app)])
+    return out
+
+
+def fingerprint(
+    command_chain: Sequence[str],
+    execution_path: Sequence["App"],
+    console: "Console",
+    help_format: str,
+    help_formatter: Any,
+) -> str:
+    """Cache key of the help page of the command at the end of ``execution_path``.
+
+    Parameters
+    ----------
+    command_chain : Sequence[str]
+        Command names leading to the command.
+    execution_path : Sequence[App]
+        Apps leading to the command, the root first.
+    console : ~rich.console.Console
+        Console the page is rendered for.
+    help_format : str
+        Resolved :attr:`App.help_format`.
+    help_formatter : Any
+        Resolved :attr:`App.help_formatter`.
+
+    Returns
+    -------
+    str
+        Hex digest.
+    """
+    from cyclopts import __version__
+
+    content = [
+        _FORMAT,
+        __version__,
+        sys.executable,
+        [console.width, console.color_system, console.encoding, console.no_color, console.is_terminal],
+        help_format,
+        _stable_repr(help_formatter),
+        definition(command_chain, execution_path),
+    ]
+    return hashlib.sha256(repr(content).encode()).hexdigest()
+
+
+def definition(command_chain: Sequence[str], execution_path: Sequence["App"]) -> list:
+    """Everything about the command at the end of ``execution_path`` that its help page shows.
+
+    Covers the settings of the apps in ``execution_path`` and of the meta apps involved,
+    the definition of the command's function (including docstring, annotations and the
+    ``(mtime_ns, size)`` of its source file and of the files defining its parameter
+    types), and its listed subcommands.
+
+    Parameters
+    ----------
+    command_chain : Sequence[str]
+        Command names leading to the command.
+    execution_path : Sequence[App]
+        Apps leading to the command, the root first.
+
+    Returns
+    -------
+    list
+        A value whose :func:`repr` is stable across processes.
+    """
+    command_app = execution_path[-1]
+    apps = list(execution_path)
+    apps.extend(x for x in command_app._get_resolution_context(execution_path) if not any(x is a for a in apps))
+    return [list(command_chain), [_app_definition(app) for app in apps], _commands_listing(command_app)]
+
+
+class _RenderedPage:
+    """Previously rendered console output, emitted verbatim."""
+
+    def __init__(self, page: str):
+        self.page = page
+
+    def __rich_console__(self, console: "Console", options: "ConsoleOptions") -> "RenderResult":
+        from rich.segment import Segment
+
+        yield Segment(self.page)
+
+
+def replay(console: "Console", page: str) -> None:
+    """Write the rendered help ``page`` to ``console`` without re-rendering it."""
+    console.print(_RenderedPage(page), end="", crop=False, soft_wrap=True)
+
+
+def _cache_file(key: str) -> Path:
+    return cache_dir() / f"{key[:32]}.txt"
+
+
+def lookup(key: str) -> str | None:
+    """Rendered help page stored under ``key``; :obj:`None` on a cache miss."""
+    try:
+        return _cache_file(key).read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        return None
+
+
+def store(key: str, page: str) -> None:
+    """Store the rendered help page under ``key``. Failures are silently ignored."""
+    atomic_write(_cache_file(key), page)
@@ -2,7 +2,6 @@ import inspect
 import sys
 from collections.abc import Iterable, Sequence
 from enum import Enum
-from functools import lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +12,7 @@ from typing import (
 
 from attrs import define, evolve, field
 
+from cyclopts import _docstring_index
 from cyclopts.annotations import resolve_annotated
 from cyclopts.argument.utils import is_short_flag
 from cyclopts.core import _get_root_module_name, _iter_resolution_argument_collections
@@ -29,9 +29,15 @@ if TYPE_CHECKING:
     from cyclopts.core import App
 
 
-@lru_cache(maxsize=16)
 def docstring_parse(doc: str | None, format: str):
-    """Addon to :func:`docstring_parser.parse` that supports multi-line `short_description`."""
+    """Addon to :func:`docstring_parser.parse` that supports multi-line `short_description`.
+
+    Results are shared through the docstring index and must not be mutated.
+    """
+    return _docstring_index.parsed_text(doc or "", _docstring_parse)
+
+
+def _docstring_parse(doc: str):
     import docstring_parser
 
     if not doc:
@@ -260,6 +266,15 @@ def format_usage(
 ):
     from rich.text import Text
 
+    return Text(_usage_string(app, command_chain, execution_path) + "\n", style="bold")
+
+
+def _usage_string(
+    app: "App",
+    command_chain: Iterable[str],
+    execution_path: Sequence["App"] | None = None,
+) -> str:
+    """Unstyled usage line of :func:`format_usage`, without the trailing newline."""
     from cyclopts.annotations import get_hint_name
 
     usage = []
@@ -328,7 +343,7 @@ def format_usage(
         else:
             usage.append("[ARGS]")
 
-    return Text(" ".join(usage) + "\n", style="bold")
+    return " ".join(usage)
 
 
 def _smart_join(strings: Sequence[str]) -> str:
@@ -347,10 +362,17 @@ def _smart_join(strings: Sequence[str]) -> str:
 
 
 def format_doc(app: "App", format: str) -> InlineText | SilentRich:
+    if (doc := _doc_string(app, format)) is None:
+        return SILENT
+    return InlineText.from_format(doc, format=format, force_empty_end=True)
+
+
+def _doc_string(app: "App", format: str) -> str | None:
+    """Short and long description of ``app`` as rendered by :func:`format_doc`; :obj:`None` if there is none."""
     raw_doc_string = app.help
 
     if not raw_doc_string:
-        return SILENT
+        return None
 
     parsed = docstring_parse(raw_doc_string, format)
 
@@ -362,7 +384,7 @@ def format_doc(app: "App", format: str) -> InlineText | SilentRich:
         if parsed.short_description:
             components.append("\n")
         components.append(parsed.long_description + "\n")
-    return InlineText.from_format(_smart_join(components), format=format, force_empty_end=True)
+    return _smart_join(components)
 
 
 def _is_dynamic_structured_dict(argument: "Argument") -> bool:
@@ -553,7 +575,12 @@ def create_parameter_help_panel(
     }
 
     help_panel = HelpPanel(**kwargs)
+    help_panel.entries.extend(_parameter_help_entries(argument_collection, format))
+    return help_panel
 
+
+def _parameter_help_entries(argument_collection: "ArgumentCollection", format: str) -> list[HelpEntry]:
+    """Help entries of the shown arguments in ``argument_collection``; positional arguments first."""
     entries_positional, entries_kw = [], []
     for argument in argument_collection.filter_by(show=True):
         if _is_dynamic_structured_dict(argument):
@@ -564,11 +591,7 @@ def create_parameter_help_panel(
             entries_positional.append(entry)
         else:
             entries_kw.append(entry)
-
-    help_panel.entries.extend(entries_positional)
-    help_panel.entries.extend(entries_kw)
-
-    return help_panel
+    return entries_positional + entries_kw
 
 
 def format_command_entries(apps_with_names: Iterable, format: str) -> list[HelpEntry]:
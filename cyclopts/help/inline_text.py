@@ -13,11 +13,19 @@ if TYPE_CHECKING:
     from rich.text import Text
 
 
+_FORMATS = ("plaintext", "markdown", "md", "restructuredtext", "rst", "rich")
+
+
 class InlineText:
     def __init__(self, primary_renderable: "RenderableType", *, force_empty_end=False):
-        self.primary_renderable = primary_renderable
+        self._primary_renderable = primary_renderable
         self.texts = []
         self.force_empty_end = force_empty_end
+        self.content: str | None = None
+        """Source text when created by :meth:`from_format`."""
+        self.format: str | None = None
+        """Markup language of :attr:`content` when created by :meth:`from_format`."""
+        self._show_errors = False
 
     @classmethod
     def from_format(
@@ -28,33 +36,26 @@ class InlineText:
         force_empty_end: bool = False,
         show_errors: bool = False,
     ) -> Self:
-        if content is None:
-            from rich.text import Text
-
-            primary_renderable = Text(end="")
-        elif format == "plaintext":
-            from rich.text import Text
-
-            primary_renderable = Text(content.rstrip())
-        elif format in ("markdown", "md"):
-            from rich.markdown import Markdown
-
-            primary_renderable = Markdown(content)
-        elif format in ("restructuredtext", "rst"):
-            from rich_rst import RestructuredText
-
-            from cyclopts.help.rst_preprocessor import process_sphinx_directives
+        if format not in _FORMATS:
+            raise ValueError(f'Unknown help_format "{format}"')
 
-            processed_content = process_sphinx_directives(content)
-            primary_renderable = RestructuredText(processed_content, show_errors=show_errors)
-        elif format == "rich":
-            from rich.text import Text
+        # The rich renderable is built on first use, so plain-text output doesn't import rich.
+        out = cls(None, force_empty_end=force_empty_end)
+        out.content = content
+        out.format = format
+        out._show_errors = show_errors
+        return out
 
-            primary_renderable = Text.from_markup(content)
-        else:
-            raise ValueError(f'Unknown help_format "{format}"')
+    @property
+    def primary_renderable(self) -> "RenderableType":
+        if self._primary_renderable is None and self.format is not None:
+            self._primary_renderable = _to_renderable(self.content, self.format, self._show_errors)
+        return self._primary_renderable
 
-        return cls(primary_renderable, force_empty_end=force_empty_end)
+    @primary_renderable.setter
+    def primary_renderable(self, value: "RenderableType"):
+        self._primary_renderable = value
+        self.content = self.format = None
 
     def append(self, text: "Text"):
         self.texts.append(text)
@@ -134,3 +135,29 @@ class InlineText:
                 wrapped_segments.append(newline_segment)
 
             yield from wrapped_segments
+
+
+def _to_renderable(content: str | None, format: str, show_errors: bool) -> "RenderableType":
+    if content is None:
+        from rich.text import Text
+
+        return Text(end="")
+    elif format == "plaintext":
+        from rich.text import Text
+
+        return Text(content.rstrip())
+    elif format in ("markdown", "md"):
+        from rich.markdown import Markdown
+
+        return Markdown(content)
+    elif format in ("restructuredtext", "rst"):
+        from rich_rst import RestructuredText
+
+        from cyclopts.help.rst_preprocessor import process_sphinx_directives
+
+        processed_content = process_sphinx_directives(content)
+        return RestructuredText(processed_content, show_errors=show_errors)
+    else:  # format == "rich"
+        from rich.text import Text
+
+        return Text.from_markup(content)
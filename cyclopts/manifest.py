@@ -0,0 +1,262 @@
+"""Precompiled command-tree manifest.
+
+A manifest captures everything needed to list, describe and complete commands
+(names, help, groups, parameters) so that lazily-registered commands
+(see :class:`.CommandSpec`) don't need to be imported to answer those questions.
+"""
+
+import hashlib
+import importlib.util
+import sys
+import warnings
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from cyclopts.command_spec import CommandSpec
+from cyclopts.group import Group
+from cyclopts.group_extractors import groups_from_app
+
+if TYPE_CHECKING:
+    from cyclopts.argument import Argument
+    from cyclopts.core import App
+
+MANIFEST_FORMAT = 2
+"""Bumped whenever the manifest layout changes incompatibly."""
+
+
+def _is_json_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _parameter_entry(argument: "Argument") -> dict[str, Any]:
+    tokens, consume_all = argument.token_count()
+    choices = argument.get_choices(force=True)
+    return {
+        "names": list(argument.parameter.name),  # pyright: ignore[reportArgumentType]
+        "negatives": list(argument.negatives),
+        "help": argument.parameter.help or "",
+        "required": argument.required,
+        "positional_only": argument.is_positional_only(),
+        "tokens": tokens,
+        "consume_all": consume_all,
+        "choices": list(choices) if choices else None,
+        "show": argument.show,
+        "completer": argument.parameter.completer is not None,
+    }
+
+
+def _group_entry(group: "Group | str") -> dict[str, Any] | str:
+    """Serialize a command group; only JSON-representable attributes are kept."""
+    if isinstance(group, str):
+        return group
+    entry: dict[str, Any] = {"name": group.name, "help": group.help}
+    if group._show is not None:
+        entry["show"] = group._show
+    if group.sort_key is not None and _is_json_scalar(group.sort_key):
+        entry["sort_key"] = group.sort_key
+    if isinstance(group.help_formatter, str):
+        entry["help_formatter"] = group.help_formatter
+    return entry
+
+
+def _command_groups(app: "App | CommandSpec") -> list[dict[str, Any] | str]:
+    group = app.group
+    if group is None:
+        return []
+    if not isinstance(group, tuple):
+        group = (group,)
+    return [_group_entry(x) for x in group]
+
+
+def _load_group(entry: dict[str, Any] | str, groups: dict[str, Group]) -> Group | str:
+    """Inverse of :func:`_group_entry`; groups of the same name share one :class:`.Group`."""
+    if isinstance(entry, str):
+        return entry
+    try:
+        return groups[entry["name"]]
+    except KeyError:
+        pass
+    kwargs = {key: entry[key] for key in ("show", "sort_key", "help_formatter") if key in entry}
+    group = groups[entry["name"]] = Group(entry["name"], entry["help"], **kwargs)
+    return group
+
+
+def _build_node(root: "App", command_path: tuple[str, ...]) -> dict[str, Any]:
+    _, execution_path, _ = root.parse_commands(list(command_path))
+    command_app = execution_path[-1]
+
+    parameters = []
+    if command_app.default_command:
+        with root.app_stack(execution_path):
+            argument_collection = command_app.assemble_argument_collection(parse_docstring=True)
+        parameters = [_parameter_entry(argument) for argument in argument_collection if argument.show]
+
+    commands: dict[str, dict[str, Any]] = {}
+    for _, registered_commands in groups_from_app(command_app, resolve_lazy=True):
+        for registered_command in registered_commands:
+            names = [name for name in registered_command.names if not name.startswith("-")]
+            if not names or names[0] in commands:
+                continue
+            subapp = registered_command.app
+            entry: dict[str, Any] = {
+                "names": names,
+                "help": subapp.help,
+                "show": subapp.show,
+                "group": _command_groups(subapp),
+            }
+            if _is_json_scalar(subapp.sort_key):
+                entry["sort_key"] = subapp.sort_key
+            app_or_spec = command_app._get_item(names[0])
+            if isinstance(app_or_spec, CommandSpec):
+                entry["import_path"] = app_or_spec.import_path
+            entry.update(_build_node(root, command_path + (names[0],)))
+            commands[names[0]] = entry
+
+    return {"parameters": parameters, "commands": commands}
+
+
+def _import_paths(node: dict[str, Any]) -> Iterator[str]:
+    for entry in node.get("commands", {}).values():
+        if "import_path" in entry:
+            yield entry["import_path"]
+        yield from _import_paths(entry)
+
+
+def _module_file(module_name: str) -> str | None:
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return getattr(module, "__file__", None)
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec is not None and spec.has_location else None
+
+
+def _fingerprint(import_paths: Iterable[str]) -> str:
+    """Hash of the Cyclopts version and the source of every lazy command's module.
+
+    The module containing each command is located, but not imported. Source contents are hashed
+    (rather than modification times) so that a manifest shipped inside a wheel remains valid once installed.
+    """
+    from cyclopts import __version__
+
+    digest = hashlib.sha256(__version__.encode())
+    for import_path in sorted(set(import_paths)):
+        digest.update(b"\0" + import_path.encode() + b"\0")
+        path = _module_file(import_path.partition(":")[0])
+        if path is None:
+            continue
+        try:
+            digest.update(hashlib.sha256(Path(path).read_bytes()).digest())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def build_manifest(app: "App") -> dict[str, Any]:
+    """Build a JSON-serializable manifest of ``app``'s full command tree.
+
+    All lazy commands are resolved (imported) in the process.
+
+    Parameters
+    ----------
+    app: App
+        Root application.
+
+    Returns
+    -------
+    dict
+        Manifest; see :meth:`.App.export_manifest`.
+    """
+    node = _build_node(app, ())
+    return {"format": MANIFEST_FORMAT, "fingerprint": _fingerprint(_import_paths(node)), "help": app.help, **node}
+
+
+def _apply_node(app: "App", node: dict[str, Any]):
+    # Groups of already-imported sibling commands are reused, so that help pages
+    # don't see two distinct groups of the same name.
+    groups: dict[str, Group] = {}
+    for command in app._commands.values():
+        if not isinstance(command, CommandSpec):
+            for group in command.group:  # pyright: ignore[reportGeneralTypeIssues]
+                if isinstance(group, Group):
+                    groups.setdefault(group.name, group)
+
+    for entry in node.get("commands", {}).values():
+        name = entry["names"][0]
+        try:
+            app_or_spec = app._get_item(name)
+        except KeyError:
+            continue  # Stale manifest; command no longer exists.
+        if isinstance(app_or_spec, CommandSpec):
+            if app_or_spec.import_path != entry.get("import_path"):
+                continue  # Stale manifest; command was re-pointed.
+            if not app_or_spec.is_resolved:
+                app_or_spec._manifest = {**entry, "group": [_load_group(x, groups) for x in entry.get("group", ())]}
+                continue
+            app_or_spec = app_or_spec.resolve(app)
+        _apply_node(app_or_spec, entry)
+
+
+def apply_manifest(app: "App", manifest: dict[str, Any], *, stacklevel: int = 2):
+    """Attach manifest entries to ``app``'s unresolved lazy commands.
+
+    If the manifest was built by another version of Cyclopts, or the source of any lazy command's
+    module has changed since, a :class:`UserWarning` is emitted and the manifest is ignored;
+    lazy commands are then imported as needed.
+
+    Parameters
+    ----------
+    app: App
+        Root application the manifest was built from.
+    manifest: dict
+        Manifest produced by :func:`build_manifest`.
+    stacklevel: int
+        Passed to :func:`warnings.warn`.
+
+    Raises
+    ------
+    ValueError
+        If the manifest was produced by an incompatible version of Cyclopts.
+    """
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"Unsupported manifest format {manifest.get('format')!r}; expected {MANIFEST_FORMAT}.")
+    if manifest.get("fingerprint") != _fingerprint(_import_paths(manifest)):
+        message = "Manifest is out of date (Cyclopts version or lazy command sources changed); ignoring it."
+        warnings.warn(UserWarning(message), stacklevel=stacklevel + 1)
+        return
+    _apply_node(app, manifest)
+
+
+def find_manifest_entry(app: "App", tokens: list[str]) -> dict[str, Any] | None:
+    """Walk ``tokens`` as a command chain, continuing into manifest entries of unresolved lazy commands.
+
+    Returns
+    -------
+    dict | None
+        Manifest entry of the deepest command reached, if that command is (or is nested
+        inside) an unresolved lazy command. :obj:`None` otherwise; the command chain
+        should then be resolved normally.
+    """
+    from cyclopts.core import _combined_meta_command_mapping
+
+    entry = None
+    for token in tokens:
+        if entry is None:
+            app_or_spec = _combined_meta_command_mapping(app).get(token)
+            if app_or_spec is None:
+                break
+            if isinstance(app_or_spec, CommandSpec):
+                if app_or_spec._manifest is not None and not app_or_spec.is_resolved:
+                    entry = app_or_spec._manifest
+                    continue
+                app_or_spec = app_or_spec.resolve(app)
+            app = app_or_spec
+        else:
+            child = next((x for x in entry["commands"].values() if token in x["names"]), None)
+            if child is None:
+                break
+            entry = child
+    return entry
@@ -5,6 +5,7 @@ import sys
 from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from typing import (  # noqa: UP035
+    TYPE_CHECKING,
     Any,
     List,
     Tuple,
@@ -44,6 +45,9 @@ from cyclopts.utils import (
     to_tuple_converter,
 )
 
+if TYPE_CHECKING:
+    from cyclopts.completion.completer import Completer
+
 ITERATIVE_BOOL_IMPLICIT_VALUE = frozenset(
     {
         Iterable[bool],
@@ -395,6 +399,11 @@ class Parameter:
         kw_only=True,
     )
 
+    completer: "Callable[[str, dict[str, Any]], Iterable[str]] | Completer | None" = field(
+        default=None,
+        kw_only=True,
+    )
+
     # Populated by the record_attrs_init_args decorator.
     _provided_args: tuple[str, ...] = field(factory=tuple, init=False, eq=False)
 
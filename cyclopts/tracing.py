@@ -0,0 +1,217 @@
+"""Per-phase timing and tracing hooks for the parse/dispatch pipeline.
+
+A :class:`Tracer` is activated for the current thread/task via :func:`use_tracer`;
+every instrumented phase then emits a start and a stop event. When no tracer is
+active, instrumentation costs a single :class:`~contextvars.ContextVar` lookup per phase.
+
+.. code-block:: python
+
+    from cyclopts.tracing import TimingRecorder, use_tracer
+
+    recorder = TimingRecorder()
+    with use_tracer(recorder):
+        app(["foo", "--bar", "3"], exit_on_error=False)
+    print(recorder.format_table())
+
+Instrumented phases:
+
+* ``"parse_commands"`` - command-chain resolution.
+* ``"consume_meta_options"`` - skipping meta-app options while resolving commands.
+* ``"assemble_argument_collection"`` - building the command's :class:`.ArgumentCollection`.
+* ``"parse_kw_and_flags"``, ``"parse_pos"``, ``"parse_env"`` - token binding.
+* ``"config"`` - each config callback (see :attr:`.App.config`).
+* ``"convert"`` - token-to-value conversion and parameter validation.
+* ``"group_validators"`` - :attr:`.Group.validator` invocation.
+* ``"dispatch"`` - invoking the resolved command.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Protocol
+
+from attrs import define, field
+
+__all__ = [
+    "Tracer",
+    "TraceEvent",
+    "TimingRecorder",
+    "use_tracer",
+    "span",
+]
+
+
+class Tracer(Protocol):
+    def start(self, phase: str, metadata: dict[str, Any], /) -> None:
+        """Called when ``phase`` begins.
+
+        ``metadata`` is the same (mutable) dict later passed to :meth:`stop`;
+        the phase may add entries to it while running.
+        """
+        ...
+
+    def stop(self, phase: str, duration: float, metadata: dict[str, Any], /) -> None:
+        """Called when ``phase`` ends (successfully or not); ``duration`` is in seconds."""
+        ...
+
+
+_tracer: ContextVar[Tracer | None] = ContextVar("cyclopts_tracer", default=None)
+
+
+@contextmanager
+def use_tracer(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Activate ``tracer`` for the current context.
+
+    Parameters
+    ----------
+    tracer: Tracer | None
+        Tracer to receive phase events. :obj:`None` disables tracing within the block.
+    """
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+
+
+class span:  # noqa: N801
+    """Context manager that reports a phase to the active :class:`Tracer` (if any).
+
+    Entering returns the phase's metadata dict, so the phase can attach information
+    that is only known once it's running.
+
+    Parameters
+    ----------
+    phase: str
+        Phase name.
+    **metadata
+        Additional information about this phase.
+    """
+
+    __slots__ = ("phase", "metadata", "_tracer", "_start")
+
+    def __init__(self, phase: str, **metadata):
+        self.phase = phase
+        self.metadata = metadata
+
+    def __enter__(self) -> dict[str, Any]:
+        self._tracer = tracer = _tracer.get()
+        if tracer is not None:
+            tracer.start(self.phase, self.metadata)
+            self._start = perf_counter()
+        return self.metadata
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        tracer = self._tracer
+        if tracer is not None:
+            duration = perf_counter() - self._start
+            if exc_type is not None:
+                self.metadata["error"] = exc_type.__name__
+            tracer.stop(self.phase, duration, self.metadata)
+
+
+@define(frozen=True)
+class TraceEvent:
+    """A single completed phase recorded by :class:`TimingRecorder`."""
+
+    phase: str
+    duration: float
+    """Seconds."""
+
+    depth: int
+    """Nesting depth; ``0`` for phases that weren't started within another phase."""
+
+    metadata: dict[str, Any] = field(factory=dict)
+
+
+@define
+class TimingRecorder:
+    """In-process :class:`Tracer` that records phase timings and summarizes them.
+
+    Not thread-safe; use one recorder per thread/task.
+    """
+
+    events: list[TraceEvent] = field(factory=list)
+    _depth: int = field(default=0, init=False, repr=False)
+
+    def start(self, phase: str, metadata: dict[str, Any], /) -> None:
+        self._depth += 1
+
+    def stop(self, phase: str, duration: float, metadata: dict[str, Any], /) -> None:
+        self._depth -= 1
+        self.events.append(TraceEvent(phase, duration, self._depth, dict(metadata)))
+
+    def clear(self) -> None:
+        """Discard all recorded events."""
+        self.events.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Aggregate recorded events per phase.
+
+        Returns
+        -------
+        list[dict]
+            One dict per phase with keys ``phase``, ``count``, ``total``, ``mean`` and ``max``
+            (durations in seconds), sorted by descending ``total``.
+        """
+        aggregated: dict[str, list[float]] = {}
+        for event in self.events:
+            aggregated.setdefault(event.phase, []).append(event.duration)
+        out = [
+            {
+                "phase": phase,
+                "count": len(durations),
+                "total": sum(durations),
+                "mean": sum(durations) / len(durations),
+                "max": max(durations),
+            }
+            for phase, durations in aggregated.items()
+        ]
+        out.sort(key=lambda x: x["total"], reverse=True)
+        return out
+
+    def to_json(self, **kwargs) -> str:
+        """Serialize :meth:`summary` and the raw events to JSON.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed along to :func:`json.dumps`.
+        """
+        import json
+
+        kwargs.setdefault("default", repr)
+        return json.dumps(
+            {
+                "summary": self.summary(),
+                "events": [
+                    {"phase": e.phase, "duration": e.duration, "depth": e.depth, "metadata": e.metadata}
+                    for e in self.events
+                ],
+            },
+            **kwargs,
+        )
+
+    def format_table(self) -> str:
+        """Render :meth:`summary` as a plain-text table (durations in milliseconds)."""
+        header = ("phase", "count", "total ms", "mean ms", "max ms")
+        rows = [
+            (
+                row["phase"],
+                str(row["count"]),
+                f"{row['total'] * 1e3:.3f}",
+                f"{row['mean'] * 1e3:.3f}",
+                f"{row['max'] * 1e3:.3f}",
+            )
+            for row in self.summary()
+        ]
+        widths = [max(len(x) for x in column) for column in zip(header, *rows, strict=True)]
+        lines = []
+        for i, row in enumerate((header, *rows)):
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:], strict=True))
+            lines.append("  ".join(cells))
+            if i == 0:
+                lines.append("  ".join("-" * width for width in widths))
+        return "\n".join(lines)
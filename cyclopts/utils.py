@@ -230,6 +230,53 @@ def default_name_transform(s: str) -> str:
     return _pascal_to_snake(s).lower().replace("_", "-").strip("-")
 
 
+def clear_caches():
+    """Clear Cyclopts' introspection caches.
+
+    Cyclopts caches the parameters it extracts from each command's signature and type hints
+    (including dataclass, attrs, pydantic, :class:`~typing.TypedDict` and
+    :class:`~typing.NamedTuple` fields), since they normally never change.
+    Call this after modifying a callable's signature or annotations at runtime,
+    e.g. when monkeypatching in tests.
+
+    Also clears the in-memory docstring index (see :func:`docstring_cache_info`),
+    the directory listings used to find configuration files and the compiled
+    type-hint converters.
+    """
+    from cyclopts import _convert, _docstring_index
+    from cyclopts.config import _search
+    from cyclopts.field_info import _clear_caches
+
+    _clear_caches()
+    _docstring_index.clear()
+    _search.clear()
+    _convert.clear()
+
+
+def docstring_cache_info():
+    """Statistics of Cyclopts' docstring index.
+
+    Parsed docstrings are shared by help pages, shell completion and documentation
+    generation. They are indexed by docstring text (the 1024 most recently used); the parameter descriptions
+    extracted from a function or class are indexed by the object, and re-parsed if
+    its ``__doc__`` (or that of a base class) changes.
+
+    Attribute docstrings of classes (e.g. dataclass fields) are parsed from source code.
+    Set the environment variable ``CYCLOPTS_DOCSTRING_CACHE=1`` to also persist these
+    in ``$XDG_CACHE_HOME/cyclopts/docstrings.json`` across processes, e.g. for
+    documentation or completion-script builds.
+
+    Returns
+    -------
+    DocstringCacheInfo
+        Named tuple of ``hits``, ``misses``, ``disk_hits`` (misses answered from disk)
+        and ``currsize`` (number of indexed entries).
+    """
+    from cyclopts import _docstring_index
+
+    return _docstring_index.cache_info()
+
+
 def grouper(iterable: Sequence[Any], n: int) -> Iterator[tuple[Any, ...]]:
     """Collect data into non-overlapping fixed-length chunks or blocks.
 
@@ -0,0 +1,35 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+class Benchmark:
+    """Collects result rows of a benchmark; printed when the test finishes."""
+
+    def __init__(self):
+        self.rows: list[tuple[str, str]] = []
+
+    def time(self, func: Callable[[], Any], n: int = 1) -> float:
+        """Mean wall time of ``func()`` over ``n`` calls, in seconds."""
+        start = time.perf_counter()
+        for _ in range(n):
+            func()
+        return (time.perf_counter() - start) / n
+
+    def report(self, label: str, result: str):
+        self.rows.append((label, result))
+
+
+@pytest.fixture
+def benchmark(request):
+    """Time workloads and report results; run with ``pytest --run-slow -s tests/benchmarks``."""
+    bench = Benchmark()
+    yield bench
+    if not bench.rows:
+        return
+    width = max(len(label) for label, _ in bench.rows)
+    print(f"\n{request.node.name}")
+    for label, result in bench.rows:
+        print(f"  {label:<{width}}  {result}")
@@ -0,0 +1,394 @@
+"""Benchmarks of optimized code paths.
+
+Deselected by default; run with ``pytest --run-slow -s tests/benchmarks``.
+Behaviour is covered by the regular tests; these only measure.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Literal
+
+import pytest
+from rich.console import Console
+
+from cyclopts import App, Parameter
+
+pytestmark = pytest.mark.slow
+
+
+def test_parse_many(benchmark):
+    """Throughput of :meth:`App.parse_many` vs. :meth:`App.parse_args` in a loop."""
+    app = App()
+
+    @app.command
+    def foo(value: int, name: str = "default", *, flag: bool = False):
+        pass
+
+    @app.command
+    def bar(*paths: str, count: int = 1):
+        pass
+
+    argvs = ["foo 1", "bar a b --count 3", "foo 2 bob --flag", "foo not-an-int", "unknown-command"] * 2000
+
+    def parse_args_loop():
+        for argv in argvs:
+            try:
+                app.parse_args(argv, exit_on_error=False, print_error=False)
+            except Exception:
+                pass
+
+    loop = benchmark.time(parse_args_loop)
+    benchmark.report("parse_args loop", f"{len(argvs) / loop:10.0f} argv/s")
+    for label, kwargs in [("parse_many", {}), ("parse_many workers=4 (threads)", {"workers": 4})]:
+        duration = benchmark.time(lambda kwargs=kwargs: list(app.parse_many(argvs, **kwargs)))
+        benchmark.report(label, f"{len(argvs) / duration:10.0f} argv/s  ({loop / duration:.2f}x)")
+
+
+def _make_completion_app(n_groups: int, n_commands: int) -> App:
+    app = App(name="big")
+
+    def action(
+        target: Literal["alpha", "beta", "gamma"],
+        /,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(help="Run mode.")] = "fast",
+        dry_run: bool = False,
+    ):
+        """Run an action."""
+
+    for g in range(n_groups):
+        group = App(name=f"group{g}", help=f"Group {g}.")
+        for c in range(n_commands):
+            group.command(action, name=f"cmd{c}")
+        app.command(group)
+    return app
+
+
+def _bash_time_per_tab(script: str, words: list[str], n: int) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        comp_file = Path(tmpdir) / "big.bash"
+        comp_file.write_text(script)
+        driver = (
+            'source "$1"\n'
+            "shift\n"
+            'COMP_WORDS=("$@")\n'
+            "COMP_CWORD=$(( ${#COMP_WORDS[@]} - 1 ))\n"
+            "TIMEFORMAT=%R\n"
+            f"time {{ for ((_n=0; _n<{n}; _n++)); do _big; done; }}\n"
+        )
+        result = subprocess.run(
+            ["bash", "-c", driver, "_", str(comp_file), *words],
+            capture_output=True,
+            text=True,
+            timeout=600,
+            check=True,
+        )
+        return float(result.stderr.strip().splitlines()[-1]) / n
+
+
+def _fish_time_per_tab(script: str, partial: str, n: int) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        comp_file = Path(tmpdir) / "big.fish"
+        comp_file.write_text(script)
+
+        def run(count):
+            start = time.perf_counter()
+            subprocess.run(
+                ["fish", "-c", f"source $argv[1]; for i in (seq {count}); complete -C $argv[2] >/dev/null; end"]
+                + [str(comp_file), partial],
+                capture_output=True,
+                timeout=600,
+                check=True,
+            )
+            return time.perf_counter() - start
+
+        return (run(n) - run(1)) / (n - 1)
+
+
+def _zsh_time_per_tab(script: str, partial: str) -> float:
+    from completion.conftest import ZshCompletionTester
+
+    tester = ZshCompletionTester(script, "big")
+    start = time.perf_counter()
+    tester.get_completions(partial)
+    return time.perf_counter() - start  # Includes starting an interactive zsh.
+
+
+@pytest.mark.parametrize("shell", ["bash", "zsh", "fish"])
+def test_completion_table(benchmark, shell):
+    """Per-TAB cost of default vs. table-driven completion scripts for a 2,040-path app."""
+    if not shutil.which(shell):
+        pytest.skip(f"{shell} not available")
+
+    app = _make_completion_app(40, 50)
+    partial = "big group39 cmd49 --mode "
+    n = 50
+    for table in (False, True):
+        start = time.perf_counter()
+        script = app.generate_completion(prog_name="big", shell=shell, table=table)
+        generate = time.perf_counter() - start
+
+        if shell == "bash":
+            per_tab = _bash_time_per_tab(script, [*partial.split(), ""], n)
+        elif shell == "fish":
+            per_tab = _fish_time_per_tab(script, partial, n)
+        else:
+            per_tab = _zsh_time_per_tab(script, partial)
+
+        benchmark.report(
+            "table" if table else "default",
+            f"script {len(script) / 1024:7.1f} KiB, generated in {generate:.2f}s, {per_tab * 1000:8.2f} ms per TAB",
+        )
+
+
+def _make_help_app(n_commands: int) -> App:
+    app = App(name="big", help_cache=True)
+
+    def action(
+        target: Literal["alpha", "beta", "gamma"],
+        /,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(help="Run mode.")] = "fast",
+        count: int = 1,
+        dry_run: bool = False,
+    ):
+        """Run an action.
+
+        Parameters
+        ----------
+        count: int
+            How many times.
+        dry_run: bool
+            Only print what would be done.
+        """
+
+    for c in range(n_commands):
+        app.command(action, name=f"cmd{c}")
+    return app
+
+
+def test_help_cache(benchmark, tmp_path, monkeypatch):
+    """Rendering vs. replaying the help page of a 500-command app."""
+    from cyclopts.help import cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv(cache.CACHE_ENV_VAR, raising=False)
+    console = Console(width=100, force_terminal=True, color_system="truecolor", legacy_windows=False)
+
+    def print_help(tokens: list[str], enabled: bool):
+        app = _make_help_app(500)
+        app.help_cache = enabled
+        with console.capture():
+            app.help_print(tokens, console=console)
+
+    for tokens in ([], ["cmd0"]):
+        for enabled in (False, True):
+            print_help(tokens, True)  # Warm-up; fills the cache.
+            per_call = benchmark.time(lambda tokens=tokens, enabled=enabled: print_help(tokens, enabled), n=20)
+            label = " ".join(tokens) or "(root)"
+            benchmark.report(f"{label} help_cache={enabled}", f"{per_call * 1000:7.2f} ms")
+
+
+def test_plain_output(benchmark):
+    """Wall time of ``--help`` and of an error in a fresh interpreter, plain vs. rich."""
+    script = textwrap.dedent(
+        """
+        from cyclopts import App
+
+        app = App(name="tool")
+
+        @app.default
+        def main(count: int, *, verbose: bool = False):
+            '''Count things.
+
+            Parameters
+            ----------
+            count: int
+                How many things.
+            '''
+
+        try:
+            app()
+        except SystemExit:
+            pass
+        """
+    )
+    for args in (["--help"], ["foo"]):
+        for label, env in (("plain", {}), ("rich", {"TTY_COMPATIBLE": "1"})):
+            per_call = benchmark.time(
+                lambda args=args, env=env: subprocess.run(
+                    [sys.executable, "-c", script, *args],
+                    capture_output=True,
+                    env={**os.environ, "COLUMNS": "80", **env},
+                    timeout=30,
+                    check=True,
+                ),
+                n=10,
+            )
+            benchmark.report(f"{' '.join(args)} {label}", f"{per_call * 1000:7.1f} ms")
+
+
+@dataclass
+class _BaseSettings:
+    """Base settings."""
+
+    host: str = "localhost"
+    """Server host."""
+
+
+@dataclass
+class _Settings(_BaseSettings):
+    """Settings."""
+
+    port: int = 8080
+    """Server port."""
+
+
+def test_docstring_index(benchmark, tmp_path, monkeypatch):
+    """Parameter descriptions of a class, parsed vs. indexed."""
+    from cyclopts import _docstring_index
+    from cyclopts.argument.utils import extract_docstring_help
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv(_docstring_index.CACHE_ENV_VAR, raising=False)
+
+    def parsed():
+        _docstring_index.clear()
+        extract_docstring_help(_Settings)
+
+    for label, func in (("parsed", parsed), ("indexed", lambda: extract_docstring_help(_Settings))):
+        benchmark.report(label, f"{benchmark.time(func, n=200) * 1e6:8.1f} µs")
+    _docstring_index.clear()
+
+
+def _make_docs_app(width: int, depth: int) -> App:
+    """An app with ``width`` commands at each of ``depth`` levels below the root."""
+
+    def action(
+        target: Literal["alpha", "beta"],
+        /,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(help="Run mode.")] = "fast",
+        count: int = 1,
+        dry_run: bool = False,
+    ):
+        """Run an action.
+
+        Parameters
+        ----------
+        count: int
+            How many times.
+        """
+
+    def populate(app: App, level: int):
+        for i in range(width):
+            if level == depth:
+                app.command(action, name=f"cmd{i}")
+            else:
+                sub = App(name=f"group{i}", help=f"Group {i} at level {level}.")
+                populate(sub, level + 1)
+                app.command(sub)
+
+    app = App(name="wide", help="A wide and deep app.")
+    populate(app, 1)
+    return app
+
+
+def test_docs_workers(benchmark):
+    """Markdown docs of a wide-and-deep app (8 x 8 x 8 commands), serial vs. parallel."""
+    app = _make_docs_app(8, 3)
+    app.generate_docs()  # Warm-up: resolve commands and fill caches.
+    for workers in (None, 2, 4, 8):
+        duration = benchmark.time(lambda workers=workers: app.generate_docs(workers=workers))
+        benchmark.report(f"workers={workers}", f"{duration:6.2f} s")
+
+
+def test_mkdocs_directives(benchmark, tmp_path, monkeypatch):
+    """A page with 200 directives of the same app, uncached vs. cached."""
+    pytest.importorskip("mkdocs")
+    from cyclopts.ext.mkdocs import process_cyclopts_directives
+
+    lines = ["from cyclopts import App", "app = App(name='bench')"]
+    lines += [
+        f"@app.command\ndef cmd{i}(value: int, *, flag: bool = False):\n    '''Command {i}.'''" for i in range(20)
+    ]
+    (tmp_path / "bench_mkdocs_app.py").write_text("\n".join(lines) + "\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "bench_mkdocs_app", raising=False)
+    markdown = "\n".join(f"## Section {i}\n\n::: cyclopts\n    module: bench_mkdocs_app:app\n" for i in range(200))
+
+    for label, cache in (("uncached", None), ("cached", {})):
+        duration = benchmark.time(lambda cache=cache: process_cyclopts_directives(markdown, None, cache))
+        benchmark.report(label, f"{duration:6.2f} s")
+    sys.modules.pop("bench_mkdocs_app", None)
+
+
+def test_docs_streaming(benchmark):
+    """Peak memory of documenting 200 commands, as a string vs. streamed to a file."""
+    import tracemalloc
+
+    app = _make_docs_app(200, 1)
+    size = len(app.generate_docs())  # Also a warm-up: resolve commands and fill caches.
+    benchmark.report("document", f"{size / 1e6:6.2f} MB")
+    for label in ("string", "file"):
+        tracemalloc.start()
+        if label == "string":
+            app.generate_docs()
+        else:
+            with Path(os.devnull).open("w") as f:
+                app.generate_docs(file=f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        benchmark.report(label, f"{peak / 1e6:6.2f} MB peak")
+
+
+def test_config_search(benchmark, tmp_path, monkeypatch):
+    """Three config sources searching 20+ ancestors, per-file ``exists()`` vs. shared listings."""
+    from cyclopts.config import _search
+
+    deep = tmp_path.joinpath(*[f"d{i}" for i in range(20)])
+    deep.mkdir(parents=True)
+    monkeypatch.setattr(_search, "RACY_NS", -1)  # pytest's temporary directories were just modified.
+    names = ["pyproject.toml", ".myapp.toml", "myapp.yaml"]
+
+    def exists():
+        for name in names:
+            any((parent / name).exists() for parent in deep.parents)
+
+    def listings():
+        with _search.session():
+            for name in names:
+                list(_search.candidates(deep / name, search_parents=True))
+
+    for label, func in (("exists()", exists), ("listings", listings)):
+        benchmark.report(label, f"{benchmark.time(func, n=1000) * 1e6:8.1f} µs")
+    _search.clear()
+
+
+def test_config_disk_cache(benchmark, tmp_path, monkeypatch):
+    """Loading a ~2 MB YAML file, parsed vs. from the on-disk cache."""
+    pytest.importorskip("yaml")
+    from cyclopts.config import Yaml
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    lines = []
+    for i in range(12000):
+        lines += [f"service{i}:", f"  host: host{i}.example.com", f"  port: {8000 + i}", "  tags: [a, b, c]"]
+        lines += ["  limits:", "    cpu: 2.5", "    memory: 512Mi", f"  description: Service number {i}."]
+    path = tmp_path / "config.yaml"
+    path.write_text("\n".join(lines) + "\n")
+    mtime = time.time() - 60  # Old enough to be cached.
+    os.utime(path, (mtime, mtime))
+    benchmark.report("config", f"{path.stat().st_size / 1e6:.1f} MB")
+
+    Yaml(path, disk_cache=True).config  # noqa: B018  # Fill the cache.
+    for label, disk_cache in (("parsed", False), ("cached", True)):
+        duration = benchmark.time(lambda disk_cache=disk_cache: Yaml(path, disk_cache=disk_cache).config)
+        benchmark.report(label, f"{duration * 1e3:8.1f} ms")
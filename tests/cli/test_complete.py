@@ -1,11 +1,27 @@
 """Tests for the hidden '_complete' command for dynamic completion."""
 
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
 from textwrap import dedent
 from unittest.mock import patch
 
+import pytest
+
 from cyclopts.cli import app as cyclopts_cli
 
 
+@pytest.fixture(autouse=True)
+def completion_cache_dir(tmp_path, monkeypatch):
+    """Keep the on-disk completion cache out of the user's home directory."""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "cyclopts" / "complete"
+
+
 def test_complete_run_subcommand(tmp_path, capsys):
     """Test completion for 'run' subcommand."""
     script = tmp_path / "app.py"
@@ -189,3 +205,405 @@ def test_complete_shows_help_for_default_command(tmp_path, capsys):
     assert "--verbose" in captured.out
     assert "--debug" in captured.out
     assert "Enable verbose mode" in captured.out or "verbose mode" in captured.out.lower()
+
+
+def test_complete_run_from_manifest(tmp_path, capsys):
+    """Completion inside a lazy command is answered from a loaded manifest without importing it."""
+    (tmp_path / "lazy_cmds_for_manifest.py").write_text(
+        dedent(
+            """\
+            def deploy(target: str, *, force: bool = False):
+                '''Deploy the app.
+
+                Parameters
+                ----------
+                force: bool
+                    Skip confirmation.
+                '''
+            """
+        )
+    )
+    script = tmp_path / "app.py"
+    script.write_text(
+        dedent(
+            """\
+            import sys
+            from pathlib import Path
+
+            sys.path.insert(0, str(Path(__file__).parent))
+
+            from cyclopts import App
+
+            app = App(name="testapp")
+            app.command("lazy_cmds_for_manifest:deploy")
+
+            manifest = Path(__file__).with_name("manifest.json")
+            if manifest.exists():
+                app.load_manifest(manifest)
+            """
+        )
+    )
+
+    from cyclopts.loader import load_app_from_script
+
+    app_obj, _ = load_app_from_script(script)
+    app_obj.export_manifest(tmp_path / "manifest.json")
+    sys.modules.pop("lazy_cmds_for_manifest")
+
+    with patch("sys.exit"):
+        cyclopts_cli(["_complete", "run", str(script), "deploy", ""])
+
+    captured = capsys.readouterr()
+    assert "--force:Skip confirmation." in captured.out
+    assert "--no-force" in captured.out
+    assert "lazy_cmds_for_manifest" not in sys.modules
+
+
+def test_complete_run_from_manifest_completer(tmp_path, capsys):
+    """A Parameter.completer of a manifest-described lazy command is still called."""
+    (tmp_path / "lazy_cmds_with_completer.py").write_text(
+        dedent(
+            """\
+            from typing import Annotated
+
+            from cyclopts import Parameter
+
+            def deploy(target: Annotated[str, Parameter(completer=lambda incomplete, context: ["prod", "staging"])]):
+                pass
+            """
+        )
+    )
+    script = tmp_path / "app.py"
+    script.write_text(
+        dedent(
+            """\
+            import sys
+            from pathlib import Path
+
+            sys.path.insert(0, str(Path(__file__).parent))
+
+            from cyclopts import App
+
+            app = App(name="testapp")
+            app.command("lazy_cmds_with_completer:deploy")
+
+            manifest = Path(__file__).with_name("manifest.json")
+            if manifest.exists():
+                app.load_manifest(manifest)
+            """
+        )
+    )
+
+    from cyclopts.loader import load_app_from_script
+
+    app_obj, _ = load_app_from_script(script)
+    app_obj.export_manifest(tmp_path / "manifest.json")
+    sys.modules.pop("lazy_cmds_with_completer")
+
+    with patch("sys.exit"):
+        cyclopts_cli(["_complete", "run", str(script), "deploy", "st"])
+
+    assert capsys.readouterr().out.split() == ["staging"]
+
+
+@pytest.fixture
+def completion_daemon(monkeypatch):
+    """A completion daemon serving on a short-lived socket in a background thread."""
+    from cyclopts.completion.daemon import CompletionServer
+
+    # Unix socket paths are length-limited; pytest's ``tmp_path`` can be too long.
+    socket_dir = Path(tempfile.mkdtemp(prefix="cy"))
+    path = socket_dir / "complete.sock"
+    monkeypatch.setenv("CYCLOPTS_COMPLETE_SOCKET", str(path))
+    monkeypatch.delenv("CYCLOPTS_COMPLETE_DAEMON", raising=False)
+
+    server = CompletionServer(path, idle_timeout=None)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    shutil.rmtree(socket_dir)
+
+
+_DAEMON_SCRIPT = """\
+from cyclopts import App
+
+app = App(name="testapp")
+
+@app.command
+def build(*, {option}: bool = False):
+    '''Build the project.'''
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_keeps_app_resident(tmp_path, capsys, completion_daemon):
+    from cyclopts.completion.daemon import request_completions
+
+    script = tmp_path / "daemon_app.py"
+    script.write_text(_DAEMON_SCRIPT.format(option="fast"))
+
+    assert request_completions(str(script), []) == ["build:Build the project."]
+    assert request_completions(str(script), ["build", ""]) == ["--fast", "--no-fast"]
+    ((fingerprint, app_obj),) = completion_daemon.apps.values()
+
+    with patch("sys.exit"):
+        cyclopts_cli(["_complete", "run", str(script), "build", ""])
+    assert capsys.readouterr().out == "--fast\n--no-fast\n"
+    assert completion_daemon.apps[str(script)][1] is app_obj
+
+    # Editing the script reloads it.
+    script.write_text(_DAEMON_SCRIPT.format(option="quick"))
+    os.utime(script, ns=(fingerprint[0] + 10**9, fingerprint[0] + 10**9))
+    assert request_completions(str(script), ["build", ""]) == ["--quick", "--no-quick"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_relative_script(tmp_path, monkeypatch, completion_daemon):
+    """Relative script paths are resolved against the request's cwd, not the daemon's."""
+    first, second = tmp_path / "first", tmp_path / "second"
+    for directory, option in ((first, "fast"), (second, "quick")):
+        directory.mkdir()
+        (directory / "daemon_app.py").write_text(_DAEMON_SCRIPT.format(option=option))
+    monkeypatch.chdir(tmp_path)  # The daemon chdirs; restore the cwd afterwards.
+
+    assert completion_daemon.complete(str(first), "daemon_app.py", ["build", ""]) == ["--fast", "--no-fast"]
+    assert completion_daemon.complete(str(second), "daemon_app.py", ["build", ""]) == ["--quick", "--no-quick"]
+    assert completion_daemon.complete(str(second), "daemon_app.py:app", ["build", ""]) == ["--quick", "--no-quick"]
+    assert set(completion_daemon.apps) == {
+        str(first / "daemon_app.py"),
+        str(second / "daemon_app.py"),
+        f"{second / 'daemon_app.py'}:app",
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_reloads_changed_modules(tmp_path, monkeypatch, completion_daemon):
+    from cyclopts.completion.daemon import request_completions
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    helper = tmp_path / "daemon_app_options.py"
+    helper.write_text("OPTION = 'fast'\n")
+    script = tmp_path / "daemon_app.py"
+    script.write_text(
+        "from cyclopts import App, Parameter\n"
+        "from typing import Annotated\n"
+        "import daemon_app_options\n\n"
+        "app = App(name='testapp')\n\n"
+        "@app.command\n"
+        "def build(*, flag: Annotated[bool, Parameter(name=daemon_app_options.OPTION)] = False):\n"
+        "    pass\n"
+    )
+    try:
+        assert request_completions(str(script), ["build", ""]) == ["--fast", "--no-fast"]
+        assert "daemon_app_options" in completion_daemon.modules
+
+        # Editing an imported module reloads it, along with the script.
+        mtime = helper.stat().st_mtime_ns
+        helper.write_text("OPTION = 'quick'\n")
+        os.utime(helper, ns=(mtime + 10**9, mtime + 10**9))
+        assert request_completions(str(script), ["build", ""]) == ["--quick", "--no-quick"]
+    finally:
+        sys.modules.pop("daemon_app_options", None)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_single_instance(monkeypatch):
+    """Of two daemons started at the same time on one socket, one serves and the other gives up."""
+    from cyclopts.completion import daemon
+
+    socket_dir = Path(tempfile.mkdtemp(prefix="cy"))
+    path = socket_dir / "complete.sock"
+    barrier = threading.Barrier(2)
+    servers, errors = [], []
+
+    def start():
+        barrier.wait()
+        try:
+            servers.append(daemon.CompletionServer(path, idle_timeout=None))
+        except BlockingIOError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=start) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert (len(servers), len(errors)) == (1, 1)
+        (server,) = servers
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        monkeypatch.setenv("CYCLOPTS_COMPLETE_SOCKET", str(path))
+        assert daemon.request_completions(str(socket_dir / "missing.py"), []) == []
+
+        # A late daemon that missed the running one's socket returns without touching it.
+        monkeypatch.setattr(daemon, "daemon_is_running", lambda path: False)
+        daemon.serve(path, idle_timeout=None)
+        assert daemon.request_completions(str(socket_dir / "missing.py"), []) == []
+        server.shutdown()
+        thread.join()
+    finally:
+        for server in servers:
+            server.server_close()
+        shutil.rmtree(socket_dir)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_invalid_script(tmp_path, completion_daemon):
+    from cyclopts.completion.daemon import request_completions
+
+    assert request_completions(str(tmp_path / "missing.py"), []) == []
+
+    script = tmp_path / "broken.py"
+    script.write_text("def broken(\n")
+    assert request_completions(str(script), []) == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+def test_complete_daemon_unavailable_falls_back(tmp_path, monkeypatch):
+    from cyclopts.completion import daemon
+
+    monkeypatch.setenv("CYCLOPTS_COMPLETE_SOCKET", str(tmp_path / "nope.sock"))
+    monkeypatch.setenv("CYCLOPTS_COMPLETE_DAEMON", "1")
+    with patch.object(daemon, "_spawn_daemon") as spawn:
+        assert daemon.request_completions(str(tmp_path / "app.py"), []) is None
+    spawn.assert_called_once()
+
+    monkeypatch.delenv("CYCLOPTS_COMPLETE_DAEMON")
+    with patch.object(daemon, "_spawn_daemon") as spawn:
+        assert daemon.request_completions(str(tmp_path / "app.py"), []) is None
+    spawn.assert_not_called()
+
+
+def _complete(*words):
+    with patch("sys.exit"):
+        cyclopts_cli(["_complete", "run", *map(str, words)])
+
+
+def test_complete_cache_serves_without_import(tmp_path, capsys, completion_cache_dir):
+    script = tmp_path / "cached_app.py"
+    script.write_text(
+        dedent(
+            """\
+            from cyclopts import App
+
+            app = App(name="testapp")
+            sub = App(name="sub", help="Sub commands.")
+            app.command(sub)
+
+            @sub.command
+            def deploy(*, force: bool = False):
+                '''Deploy the app.'''
+            """
+        )
+    )
+
+    _complete(script, "")
+    first = capsys.readouterr().out
+    assert "sub:Sub commands." in first
+    assert len(list(completion_cache_dir.glob("*.json"))) == 1
+
+    with patch("cyclopts.cli._complete.load_app_from_script", side_effect=AssertionError("imported")):
+        _complete(script, "")
+        assert capsys.readouterr().out == first
+
+        _complete(script, "sub", "")
+        assert capsys.readouterr().out == "deploy:Deploy the app.\n"
+
+        _complete(script, "sub", "deploy", "--f")
+        assert capsys.readouterr().out == "--force\n--no-force\n"
+
+
+def test_complete_cache_fills_in_lazy_commands(tmp_path, capsys, monkeypatch):
+    """Building the cache doesn't import lazy commands; they are cached once a request resolves them."""
+    (tmp_path / "lazy_cache_cmds.py").write_text("def deploy(*, force: bool = False):\n    pass\n")
+    script = tmp_path / "lazy_cached_app.py"
+    script.write_text(
+        dedent(
+            """\
+            import sys
+            from pathlib import Path
+
+            sys.path.insert(0, str(Path(__file__).parent))
+
+            from cyclopts import App
+
+            app = App(name="testapp")
+            app.command("lazy_cache_cmds:deploy")
+            """
+        )
+    )
+    monkeypatch.delitem(sys.modules, "lazy_cache_cmds", raising=False)
+
+    _complete(script, "")
+    capsys.readouterr()
+    assert "lazy_cache_cmds" not in sys.modules
+
+    _complete(script, "deploy", "--f")
+    assert capsys.readouterr().out == "--force\n--no-force\n"
+    assert "lazy_cache_cmds" in sys.modules
+
+    with patch("cyclopts.cli._complete.load_app_from_script", side_effect=AssertionError("imported")):
+        _complete(script, "deploy", "--f")
+        assert capsys.readouterr().out == "--force\n--no-force\n"
+    sys.modules.pop("lazy_cache_cmds")
+
+
+def test_complete_cache_invalidated_by_imported_module(tmp_path, capsys, monkeypatch):
+    helper = tmp_path / "cached_helper_mod.py"
+    helper.write_text("HELP = 'Old help.'\n")
+    script = tmp_path / "cached_app_helper.py"
+    script.write_text(
+        dedent(
+            """\
+            import sys
+            from pathlib import Path
+
+            sys.path.insert(0, str(Path(__file__).parent))
+
+            from cached_helper_mod import HELP
+            from cyclopts import App
+
+            app = App(name="testapp")
+
+            @app.command(help=HELP)
+            def build():
+                pass
+            """
+        )
+    )
+    monkeypatch.delitem(sys.modules, "cached_helper_mod", raising=False)
+
+    _complete(script, "")
+    assert capsys.readouterr().out == "build:Old help.\n"
+
+    helper.write_text("HELP = 'New help, longer.'\n")
+    sys.modules.pop("cached_helper_mod")
+    _complete(script, "")
+    assert capsys.readouterr().out == "build:New help, longer.\n"
+
+
+def test_complete_cache_disabled(tmp_path, capsys, monkeypatch, completion_cache_dir):
+    monkeypatch.setenv("CYCLOPTS_COMPLETE_CACHE", "0")
+    script = tmp_path / "uncached_app.py"
+    script.write_text("from cyclopts import App\napp = App()\n\n@app.command\ndef build():\n    pass\n")
+
+    _complete(script, "")
+    assert capsys.readouterr().out == "build\n"
+    assert not completion_cache_dir.exists()
+
+
+def test_complete_cache_corrupt_file_ignored(tmp_path, capsys, completion_cache_dir):
+    script = tmp_path / "corrupt_app.py"
+    script.write_text("from cyclopts import App\napp = App()\n\n@app.command\ndef build():\n    pass\n")
+
+    _complete(script, "")
+    assert capsys.readouterr().out == "build\n"
+    (cache_file,) = completion_cache_dir.glob("*.json")
+    cache_file.write_text('{"format": 1, "nodes": ')
+
+    _complete(script, "")
+    assert capsys.readouterr().out == "build\n"
@@ -69,6 +69,24 @@ def test_generate_docs_to_file(tmp_path, capsys):
     assert "Test app" in content
 
 
+def test_generate_docs_to_file_failure_keeps_previous(tmp_path):
+    """A failed build leaves the previous output file untouched."""
+    script = tmp_path / "app.py"
+    script.write_text("from cyclopts import App\n\napp = App(name='myapp')\n")
+    output_file = tmp_path / "docs.md"
+    output_file.write_text("previous")
+
+    def generate_docs(self, *, file, **kwargs):
+        file.write("# partial")
+        raise RuntimeError("boom")
+
+    with patch("cyclopts.App.generate_docs", generate_docs), pytest.raises(RuntimeError):
+        cyclopts_cli(["generate-docs", str(script), "--output", str(output_file)], exit_on_error=False)
+
+    assert output_file.read_text() == "previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app.py", "docs.md"]
+
+
 def test_generate_docs_format_inference_md(tmp_path):
     """Test format inference from .md extension."""
     script = tmp_path / "app.py"
@@ -260,3 +278,28 @@ def test_generate_docs_cli_usage_name_override(tmp_path, capsys):
     assert "# cli" in captured.out
     # Usage block shows the override
     assert "uv run cli" in captured.out
+
+
+def test_generate_docs_output_dir(tmp_path):
+    """Test writing one file per command into a directory."""
+    script = tmp_path / "app.py"
+    script.write_text(
+        dedent(
+            """\
+            from cyclopts import App
+
+            app = App(name="myapp")
+
+            @app.command
+            def deploy():
+                '''Deploy it.'''
+            """
+        )
+    )
+    out = tmp_path / "docs"
+
+    with patch("sys.exit"):
+        cyclopts_cli(["generate-docs", str(script), "--format", "md", "--output-dir", str(out)])
+
+    assert sorted(p.name for p in out.iterdir()) == [".cyclopts-docs.json", "myapp-deploy.md", "myapp.md"]
+    assert "Deploy it." in (out / "myapp-deploy.md").read_text()
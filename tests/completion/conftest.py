@@ -19,6 +19,10 @@ Each shell exposes two capabilities:
     *list* matches without modifying the line by sending the
     ``list-choices`` widget (``\e\C-d``). Matches are screen-scraped between
     two prompt sentinels. Skipped if ``pexpect`` is unavailable.
+
+Tests of a missing shell are skipped, unless the shell is listed in
+``$CYCLOPTS_TEST_SHELLS`` (comma-separated, e.g. ``bash,zsh,fish``); then
+they fail. CI sets it so that the real-shell tests can't be skipped silently.
 """
 
 import os
@@ -30,6 +34,14 @@ from pathlib import Path
 
 import pytest
 
+_REQUIRED_SHELLS = set(filter(None, os.environ.get("CYCLOPTS_TEST_SHELLS", "").split(",")))
+
+
+def _require(shell: str, available: bool) -> bool:
+    if not available and shell in _REQUIRED_SHELLS:
+        pytest.fail(f"{shell} is required by CYCLOPTS_TEST_SHELLS but not available")
+    return available
+
 
 class CompletionTesterBase(ABC):
     """Base class for shell completion testers."""
@@ -147,7 +159,7 @@ def _check_bash_available() -> bool:
 
 @pytest.fixture(scope="session")
 def bash_available():
-    return _check_bash_available()
+    return _require("bash", _check_bash_available())
 
 
 @pytest.fixture
@@ -155,8 +167,8 @@ def bash_tester(bash_available):
     if not bash_available:
         pytest.skip("bash not available")
 
-    def _make_tester(app, prog_name="testapp"):
-        script = app.generate_completion(prog_name=prog_name, shell="bash")
+    def _make_tester(app, prog_name="testapp", table=False):
+        script = app.generate_completion(prog_name=prog_name, shell="bash", table=table)
         return BashCompletionTester(script, prog_name)
 
     return _make_tester
@@ -233,7 +245,7 @@ def _check_fish_available() -> bool:
 
 @pytest.fixture(scope="session")
 def fish_available():
-    return _check_fish_available()
+    return _require("fish", _check_fish_available())
 
 
 @pytest.fixture
@@ -241,8 +253,8 @@ def fish_tester(fish_available):
     if not fish_available:
         pytest.skip("fish not available")
 
-    def _make_tester(app, prog_name="testapp"):
-        script = app.generate_completion(prog_name=prog_name, shell="fish")
+    def _make_tester(app, prog_name="testapp", table=False):
+        script = app.generate_completion(prog_name=prog_name, shell="fish", table=table)
         return FishCompletionTester(script, prog_name)
 
     return _make_tester
@@ -308,6 +320,7 @@ class ZshCompletionTester(CompletionTesterBase):
         try:
             import pexpect
         except ImportError:
+            _require("zsh", False)
             pytest.skip("pexpect not available")
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -395,7 +408,7 @@ def _check_zsh_available() -> bool:
 
 @pytest.fixture(scope="session")
 def zsh_available():
-    return _check_zsh_available()
+    return _require("zsh", _check_zsh_available())
 
 
 @pytest.fixture
@@ -403,8 +416,8 @@ def zsh_tester(zsh_available):
     if not zsh_available:
         pytest.skip("zsh not available")
 
-    def _make_tester(app, prog_name="testapp"):
-        script = app.generate_completion(prog_name=prog_name, shell="zsh")
+    def _make_tester(app, prog_name="testapp", table=False):
+        script = app.generate_completion(prog_name=prog_name, shell="zsh", table=table)
         return ZshCompletionTester(script, prog_name)
 
     return _make_tester
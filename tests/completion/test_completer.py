@@ -0,0 +1,295 @@
+"""Dynamic value completion with ``Parameter(completer=...)``."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from typing import Annotated
+
+import pytest
+
+from cyclopts import App, Parameter
+from cyclopts.cli._complete import _completion_tree, get_completions
+from cyclopts.completion import Completer
+from cyclopts.completion.completer import COMPLETE_ENV_VAR, complete_value
+from cyclopts.loader import load_app_from_script
+
+APP_SOURCE = textwrap.dedent(
+    """\
+    import time
+    from pathlib import Path
+    from typing import Annotated
+
+    from cyclopts import App, Parameter
+    from cyclopts.completion import Completer
+
+    CALLS = []
+
+
+    def clusters(incomplete, context):
+        CALLS.append((incomplete, context))
+        region = context.get("region", "eu")
+        return [f"{region}-prod", f"{region}-staging", "other"]
+
+
+    def slow(incomplete, context):
+        time.sleep(5)
+        return ["late"]
+
+
+    app = App(name="dyn")
+
+
+    @app.command
+    def deploy(
+        cluster: Annotated[str, Parameter(completer=clusters)],
+        *files: Path,
+        region: str = "eu",
+        target: Annotated[str, Parameter(completer=clusters)] = "",
+        wait: Annotated[str, Parameter(completer=Completer(slow, timeout=0.2))] = "",
+        force: bool = False,
+    ):
+        pass
+
+
+    @app.command
+    def status(name: str):
+        pass
+
+
+    if __name__ == "__main__":
+        app()
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def completer_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "cyclopts" / "complete" / "values"
+
+
+@pytest.fixture
+def dyn(tmp_path, monkeypatch):
+    """The test application, importable from disk and runnable as ``dyn`` on ``$PATH``."""
+    script = tmp_path / "dyn_app.py"
+    script.write_text(APP_SOURCE)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "dyn"
+    executable.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n')
+    executable.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    app, _ = load_app_from_script(script)
+    return app
+
+
+@pytest.mark.parametrize(
+    ("words", "expected"),
+    [
+        (["deploy", ""], ["eu-prod", "eu-staging", "other"]),
+        (["deploy", "eu-p"], ["eu-prod"]),
+        (["deploy", "--region", "us", "--target", ""], ["us-prod", "us-staging", "other"]),
+        (["deploy", "--region=us", "--target=us-s"], ["us-staging"]),
+        # bash splits ``--opt=value`` at the ``=``.
+        (["deploy", "--region", "=", "us", "--target", "=", "us-s"], ["us-staging"]),
+        (["deploy", "--region", "=", "us", "--target", "="], ["us-prod", "us-staging", "other"]),
+        (["deploy", "--force", "ot"], ["other"]),
+        # Not a value of a parameter with a completer.
+        (["deploy", "c1", ""], None),
+        (["deploy", "--region", ""], None),
+        (["deploy", "--"], None),
+        (["status", ""], None),
+        # Subcommands take precedence over positionals.
+        ([""], None),
+    ],
+)
+def test_complete_value(dyn, words, expected):
+    assert complete_value(dyn, words) == expected
+
+
+def test_complete_value_context(dyn):
+    calls = dyn["deploy"].default_command.__globals__["CALLS"]
+    complete_value(dyn, ["deploy", "c1", "--region", "us", "--force", "--target", ""])
+    assert calls[-1] == ("", {"cluster": "c1", "region": "us", "force": True})
+
+
+def test_completer_ttl_cache(dyn, completer_cache):
+    calls = dyn["deploy"].default_command.__globals__["CALLS"]
+    assert complete_value(dyn, ["deploy", ""])
+    assert complete_value(dyn, ["deploy", ""])
+    assert len(calls) == 1
+    assert len(list(completer_cache.iterdir())) == 1
+
+    # A different command line is a different cache entry.
+    complete_value(dyn, ["deploy", "--region", "us", ""])
+    assert len(calls) == 2
+
+
+def test_completer_ttl_expired(completer_cache):
+    calls = []
+
+    def func(incomplete, context):
+        calls.append(incomplete)
+        return ["a"]
+
+    completer = Completer(func, ttl=0.05)
+    assert completer("", {}) == ["a"]
+    assert completer("", {}) == ["a"]
+    assert len(calls) == 1
+    time.sleep(0.1)
+    assert completer("", {}) == ["a"]
+    assert len(calls) == 2
+
+
+def test_completer_ttl_zero(completer_cache):
+    completer = Completer(lambda incomplete, context: ["a"], ttl=0)
+    assert completer("", {}) == ["a"]
+    assert not completer_cache.exists()
+
+
+def test_completer_timeout(dyn):
+    start = time.perf_counter()
+    assert complete_value(dyn, ["deploy", "--wait", ""]) == []
+    assert time.perf_counter() - start < 2
+
+
+def test_completer_timeout_serves_stale_values(completer_cache):
+    delay = 0.0
+
+    def func(incomplete, context):
+        time.sleep(delay)
+        return ["fresh"] if delay else ["stale"]
+
+    completer = Completer(func, ttl=0.01, timeout=0.2)
+    assert completer("", {}) == ["stale"]
+    time.sleep(0.05)
+    delay = 1.0
+    assert completer("", {}) == ["stale"]
+
+
+def test_completer_timeout_single_thread():
+    """A hung completer isn't called again until it returns, so timeouts don't pile up threads."""
+    release = threading.Event()
+    calls = []
+
+    def func(incomplete, context):
+        calls.append(incomplete)
+        release.wait()
+        return ["late"]
+
+    completer = Completer(func, ttl=0, timeout=0.05)
+    before = set(threading.enumerate())
+    for _ in range(5):
+        assert completer("", {}) == []
+    (thread,) = set(threading.enumerate()) - before
+    assert threading.active_count() <= len(before) + 1
+    assert len(calls) == 1
+
+    release.set()
+    thread.join()
+    assert completer("", {}) == ["late"]
+    assert len(calls) == 2
+
+
+def test_completer_errors_yield_nothing(completer_cache):
+    def func(incomplete, context):
+        raise RuntimeError
+
+    assert Completer(func)("", {}) == []
+    assert not completer_cache.exists()
+
+
+def test_app_answers_completion_request(dyn):
+    result = subprocess.run(
+        ["dyn", "deploy", "--target", "eu"],
+        env={**os.environ, COMPLETE_ENV_VAR: "bash"},
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    assert result.stdout.splitlines() == ["eu-prod", "eu-staging"]
+
+
+def test_get_completions_escapes_colons():
+    app = App(name="hosts")
+
+    @app.default
+    def main(host: Annotated[str, Parameter(completer=lambda incomplete, context: ["db:5432"])]):
+        pass
+
+    assert get_completions(app, [""]) == ["db\\:5432"]
+
+
+def test_completion_tree_marks_dynamic_nodes(dyn):
+    nodes = _completion_tree(dyn)
+    assert nodes is not None
+    deploy = nodes[nodes[0]["commands"]["deploy"]]
+    status = nodes[nodes[0]["commands"]["status"]]
+    assert deploy.get("dynamic") is True
+    assert "dynamic" not in status
+
+
+@pytest.mark.parametrize("table", [False, True])
+@pytest.mark.parametrize(
+    ("partial", "expected"),
+    [
+        ("dyn deploy ", {"eu-prod", "eu-staging", "other"}),
+        ("dyn deploy --region us --target us-", {"us-prod", "us-staging"}),
+        ("dyn deploy --region=us --target=", {"us-prod", "us-staging", "other"}),
+        ("dyn deploy --force o", {"other"}),
+    ],
+)
+def test_bash_callback(dyn, bash_tester, table, partial, expected):
+    tester = bash_tester(dyn, "dyn", table=table)
+    assert set(tester.get_completions(partial)) == expected
+
+
+def test_zsh_script_callback(dyn):
+    script = dyn.generate_completion(prog_name="dyn", shell="zsh")
+    assert "_cyclopts_callback() {" in script
+    assert ":cluster:_cyclopts_callback'" in script
+    assert "--target[" in script and ":target:_cyclopts_callback'" in script
+    assert "compset -P '--target='\n" in script
+
+
+def test_fish_script_callback(dyn):
+    script = dyn.generate_completion(prog_name="dyn", shell="fish")
+    assert "function __cyclopts_callback" in script
+    assert "-l target -x -a '(__cyclopts_callback)'" in script
+    assert "-f -a '(__cyclopts_callback)'" in script
+
+
+def test_scripts_without_completers_unchanged():
+    from .apps import app_basic
+
+    for shell in ("bash", "zsh", "fish"):
+        assert "_CYCLOPTS_COMPLETE" not in app_basic.generate_completion(prog_name="basic", shell=shell)
+
+
+@pytest.mark.parametrize("shell", ["zsh", "fish"])
+def test_shell_callback(dyn, request, shell):
+    tester = request.getfixturevalue(f"{shell}_tester")(dyn, "dyn")
+    assert {"eu-prod", "eu-staging"} <= set(tester.get_completions("dyn deploy --target eu-"))
+
+
+@pytest.mark.parametrize("shell", ["zsh", "fish"])
+def test_shell_callback_table(dyn, request, shell):
+    tester = request.getfixturevalue(f"{shell}_tester")(dyn, "dyn", table=True)
+    assert {"eu-prod", "eu-staging"} <= set(tester.get_completions("dyn deploy --target eu-"))
+
+
+def test_cache_lookup_skips_dynamic_values(tmp_path, dyn):
+    from cyclopts.completion import cache
+
+    script = str(tmp_path / "dyn_app.py")
+    nodes = _completion_tree(dyn)
+    assert nodes is not None
+    cache.store(script, nodes, set(sys.modules))
+    assert cache.is_valid(script)
+    assert cache.lookup(script, ["deploy", "--f"]) is not None
+    assert cache.lookup(script, ["deploy", ""]) is None
+    assert cache.lookup(script, ["status", ""]) is not None
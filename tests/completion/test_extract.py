@@ -0,0 +1,170 @@
+import sys
+import textwrap
+import time
+
+import pytest
+
+from cyclopts import App
+from cyclopts.completion._base import extract_completion_data
+from cyclopts.core import _iter_resolution_argument_collections
+
+from .apps import app_basic, app_deploy, app_multiple_positionals, app_nested
+
+
+def _reference(app, command_path):
+    """Argument names of ``command_path``, resolved from the root like ``App.parse_commands``."""
+    _, execution_path, _ = app.parse_commands(list(command_path))
+    names = []
+    with app.app_stack(execution_path):
+        for _, arguments in _iter_resolution_argument_collections(execution_path, parse_docstring=True):
+            names.extend(argument.name for argument in arguments)
+    return names
+
+
+@pytest.mark.parametrize("app", [app_basic, app_nested, app_deploy, app_multiple_positionals])
+def test_extract_matches_parse_commands(app):
+    completion_data = extract_completion_data(app)
+    assert () in completion_data
+    for command_path, data in completion_data.items():
+        assert [argument.name for argument in data.arguments] == _reference(app, command_path)
+
+
+def test_extract_meta_app():
+    app = App(name="metaapp")
+
+    @app.meta.default
+    def launcher(*tokens: str, verbose: bool = False):
+        pass
+
+    @app.command
+    def build(target: str):
+        pass
+
+    completion_data = extract_completion_data(app)
+    assert set(completion_data) >= {(), ("build",)}
+    assert "--verbose" in [name for argument in completion_data[("build",)].arguments for name in argument.names]
+    assert [argument.name for argument in completion_data[("build",)].own_arguments] == ["--target"]
+
+
+@pytest.fixture
+def slow_lazy_modules(tmp_path, monkeypatch):
+    """Four importable modules, each taking 0.2s to import."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = [f"_cyclopts_slow_lazy_{i}" for i in range(4)]
+    for name in names:
+        (tmp_path / f"{name}.py").write_text(
+            textwrap.dedent(
+                """\
+                import time
+
+                time.sleep(0.2)
+
+
+                def cmd(value: int):
+                    '''Slow command.'''
+                """
+            )
+        )
+    yield names
+    for name in names:
+        sys.modules.pop(name, None)
+
+
+def test_extract_workers_resolves_lazy_commands(slow_lazy_modules):
+    app = App(name="lazyapp")
+    for i, module in enumerate(slow_lazy_modules):
+        app.command(f"{module}:cmd", name=f"cmd{i}")
+
+    start = time.perf_counter()
+    completion_data = extract_completion_data(app, workers=4)
+    elapsed = time.perf_counter() - start
+
+    assert set(completion_data) == {(), *((f"cmd{i}",) for i in range(4))}
+    assert [argument.name for argument in completion_data[("cmd3",)].arguments] == ["--value"]
+    assert elapsed < 0.75  # Serially, the imports alone take 0.8s.
+
+
+def test_extract_cache_reextracts_changed_subtree():
+    app = App(name="cached")
+    one = App(name="one")
+    two = App(name="two")
+    app.command(one)
+    app.command(two)
+
+    @one.command
+    def alpha(value: int):
+        pass
+
+    @two.command
+    def beta(value: int):
+        pass
+
+    cache = {}
+    first = extract_completion_data(app, cache=cache)
+    assert set(cache) == set(first)
+
+    second = extract_completion_data(app, cache=cache)
+    assert all(first[path].arguments is second[path].arguments for path in first)
+
+    @two.command
+    def gamma(value: str):
+        pass
+
+    third = extract_completion_data(app, cache=cache)
+    assert set(third) == set(first) | {("two", "gamma")}
+    # Unrelated subtrees are reused; the changed command listing is re-extracted.
+    assert third[("one",)].arguments is first[("one",)].arguments
+    assert third[("one", "alpha")].arguments is first[("one", "alpha")].arguments
+    assert third[("two", "beta")].arguments is first[("two", "beta")].arguments
+    assert third[("two",)].arguments is not first[("two",)].arguments
+    assert [cmd.names for cmd in third[("two",)].commands][-1] == ("gamma",)
+
+
+def test_extract_cache_detects_changed_function():
+    app = App(name="cached")
+
+    @app.command
+    def alpha(value: int):
+        pass
+
+    cache = {}
+    extract_completion_data(app, cache=cache)
+
+    def alpha_v2(value: int, *, force: bool = False):
+        pass
+
+    app["alpha"].default_command = alpha_v2
+    data = extract_completion_data(app, cache=cache)
+    assert "--force" in [argument.name for argument in data[("alpha",)].arguments]
+
+
+def test_extract_cache_key_ignores_addresses():
+    """Default values without a custom repr don't change the cache key between instances."""
+
+    class Sentinel:
+        pass
+
+    def make_app():
+        app = App(name="cached")
+
+        @app.command
+        def alpha(value: int = Sentinel()):  # noqa: B008
+            pass
+
+        return app
+
+    first, second = {}, {}
+    extract_completion_data(make_app(), cache=first)
+    extract_completion_data(make_app(), cache=second)
+    assert {path: key for path, (key, _) in first.items()} == {path: key for path, (key, _) in second.items()}
+
+
+def test_generate_completion_uses_app_cache():
+    app = App(name="regen")
+
+    @app.command
+    def alpha(value: int):
+        pass
+
+    app.generate_completion(shell="bash")
+    assert set(app._completion_cache) == {(), ("alpha",)}
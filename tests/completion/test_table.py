@@ -0,0 +1,111 @@
+"""Table-driven completion scripts (``generate_completion(table=True)``).
+
+The behavioral scenarios from ``test_behavior.py`` are replayed against the
+table-driven generators of every shell, followed by checks specific to the
+lookup tables.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Annotated, Literal
+
+import pytest
+
+from cyclopts import App, Parameter
+
+from .test_behavior import SCENARIOS
+
+
+@pytest.fixture(params=["bash", "zsh", "fish"])
+def shell_tester_factory(request):
+    return request.getfixturevalue(f"{request.param}_tester")
+
+
+@pytest.mark.parametrize(
+    ("scenario_id", "app", "prog_name", "partial", "contains", "excludes"),
+    SCENARIOS,
+    ids=[s[0] for s in SCENARIOS],
+)
+def test_table_behavior(scenario_id, app, prog_name, partial, contains, excludes, shell_tester_factory):
+    tester = shell_tester_factory(app, prog_name, table=True)
+
+    if contains is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "sample.txt").write_text("x")
+            cwd = Path.cwd()
+            try:
+                os.chdir(tmpdir)
+                results = tester.get_completions(partial)
+            finally:
+                os.chdir(cwd)
+        assert results, f"[{scenario_id}] expected some file-completion result for {partial!r}, got nothing"
+        return
+
+    results = tester.get_completions(partial)
+    assert not (contains - set(results)), f"[{scenario_id}] partial={partial!r} got={results!r}"
+    assert not (excludes & set(results)), f"[{scenario_id}] partial={partial!r} got={results!r}"
+
+
+def _make_big_app(n_groups: int, n_commands: int) -> App:
+    app = App(name="big")
+
+    def action(
+        target: Literal["alpha", "beta", "gamma"],
+        /,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(help="Run mode.")] = "fast",
+        dry_run: bool = False,
+    ):
+        """Run an action."""
+
+    for g in range(n_groups):
+        group = App(name=f"group{g}", help=f"Group {g}.")
+        for c in range(n_commands):
+            group.command(action, name=f"cmd{c}")
+        app.command(group)
+    return app
+
+
+@pytest.fixture(scope="module")
+def big_app():
+    return _make_big_app(8, 12)
+
+
+@pytest.mark.parametrize(
+    ("partial", "expected"),
+    [
+        ("big ", {f"group{g}" for g in range(8)}),
+        ("big group7 cmd1", {"cmd1", "cmd10", "cmd11"}),
+        ("big group7 cmd11 ", {"alpha", "beta", "gamma"}),
+        ("big group7 cmd11 --mode ", {"fast", "slow"}),
+        ("big group7 cmd11 --mode slow --d", {"--dry-run"}),
+        ("big group3 cmd2 --mode fast ", {"alpha", "beta", "gamma"}),
+        # Only one positional slot.
+        ("big group3 cmd2 alpha ", set()),
+    ],
+)
+def test_table_big_tree(big_app, shell_tester_factory, partial, expected):
+    tester = shell_tester_factory(big_app, "big", table=True)
+    assert set(tester.get_completions(partial)) == expected
+
+
+def test_table_bash_script_is_flat(big_app):
+    script = big_app.generate_completion(prog_name="big", shell="bash", table=True)
+    # Every command path appears once as a table row rather than as a nested case branch.
+    assert script.count(" cmd11']=") == 8
+    assert script.count("case ") == 1
+    assert "complete -F _big big" in script
+
+
+def test_table_zsh_script_registers_function(big_app):
+    script = big_app.generate_completion(prog_name="big", shell="zsh", table=True)
+    assert script.startswith("#compdef big\n")
+    assert "typeset -gA _cyclopts_big_t" in script
+    assert "compdef _cyclopts_big big" in script
+
+
+def test_table_fish_script_single_rule(big_app):
+    script = big_app.generate_completion(prog_name="big", shell="fish", table=True)
+    assert script.count("complete -c big") == 1
+    assert "__fish_big_using_command" not in script
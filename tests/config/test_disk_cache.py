@@ -0,0 +1,139 @@
+"""On-disk cache of parsed configuration files (``ConfigFromFile(disk_cache=True)``)."""
+
+import os
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cyclopts.config import Toml
+from cyclopts.config._common import ConfigFromFile
+
+
+class Counting(ConfigFromFile):
+    calls = 0
+
+    def _load_config(self, path: Path) -> dict[str, Any]:
+        Counting.calls += 1
+        return {"value": path.read_text()}
+
+
+class OtherCounting(Counting):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    Counting.calls = 0
+    return tmp_path / "cache" / "cyclopts" / "config"
+
+
+def _write(path: Path, content: str, age: int = 60) -> Path:
+    """Write ``content`` with a modification time old enough to be cached."""
+    path.write_text(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_disk_cache(tmp_path, cache_dir):
+    path = _write(tmp_path / "config.txt", "a")
+    for _ in range(3):
+        assert Counting(path, disk_cache=True).config == {"value": "a"}
+    assert Counting.calls == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_disk_cache_private_directory(tmp_path, cache_dir):
+    Counting(_write(tmp_path / "config.txt", "a"), disk_cache=True).config  # noqa: B018
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_disk_cache_private_entry(tmp_path, cache_dir):
+    Counting(_write(tmp_path / "config.txt", "a"), disk_cache=True).config  # noqa: B018
+    (entry,) = cache_dir.iterdir()
+    assert stat.S_IMODE(entry.stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+@pytest.mark.parametrize("unsafe", ["entry_writable", "directory_writable", "other_owner"])
+def test_disk_cache_untrusted_not_unpickled(tmp_path, cache_dir, monkeypatch, unsafe):
+    """Entries another user could have written are parsed again instead of unpickled."""
+    path = _write(tmp_path / "config.txt", "a")
+    Counting(path, disk_cache=True).config  # noqa: B018
+    (entry,) = cache_dir.iterdir()
+    if unsafe == "entry_writable":
+        entry.chmod(0o620)
+    elif unsafe == "directory_writable":
+        cache_dir.chmod(0o770)
+    else:
+        monkeypatch.setattr(os, "getuid", lambda: entry.stat().st_uid + 1)
+
+    unpickled = []
+    monkeypatch.setattr("cyclopts.config._disk_cache.pickle.load", unpickled.append)
+    assert Counting(path, disk_cache=True).config == {"value": "a"}
+    assert Counting.calls == 2
+    assert unpickled == []
+
+
+def test_disk_cache_disabled_by_default(tmp_path, cache_dir):
+    path = _write(tmp_path / "config.txt", "a")
+    Counting(path).config  # noqa: B018
+    Counting(path).config  # noqa: B018
+    assert Counting.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_disk_cache_invalidated(tmp_path, cache_dir):
+    path = _write(tmp_path / "config.txt", "a")
+    Counting(path, disk_cache=True).config  # noqa: B018
+    _write(path, "bb", age=30)
+    assert Counting(path, disk_cache=True).config == {"value": "bb"}
+    assert Counting.calls == 2
+    assert len(list(cache_dir.iterdir())) == 1  # Replaced, not accumulated.
+
+
+def test_disk_cache_recently_modified(tmp_path, cache_dir):
+    path = tmp_path / "config.txt"
+    path.write_text("a")
+    Counting(path, disk_cache=True).config  # noqa: B018
+    assert not cache_dir.exists()
+
+
+def test_disk_cache_per_loader(tmp_path):
+    path = _write(tmp_path / "config.txt", "a")
+    Counting(path, disk_cache=True).config  # noqa: B018
+    OtherCounting(path, disk_cache=True).config  # noqa: B018
+    assert Counting.calls == 2
+
+
+@pytest.mark.parametrize("content", [b"", b"garbage", b"\x80\x05K\x01."])
+def test_disk_cache_corrupt(tmp_path, cache_dir, content):
+    path = _write(tmp_path / "config.txt", "a")
+    Counting(path, disk_cache=True).config  # noqa: B018
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(content)
+    assert Counting(path, disk_cache=True).config == {"value": "a"}
+    assert Counting.calls == 2
+    assert Counting(path, disk_cache=True).config == {"value": "a"}  # Rewritten.
+    assert Counting.calls == 2
+
+
+def test_disk_cache_unwritable(tmp_path, cache_dir):
+    cache_dir.parent.mkdir(parents=True)
+    cache_dir.write_text("not a directory")
+    path = _write(tmp_path / "config.txt", "a")
+    assert Counting(path, disk_cache=True).config == {"value": "a"}
+
+
+def test_disk_cache_toml(tmp_path):
+    path = _write(tmp_path / "pyproject.toml", "[tool.myapp]\nwhen = 2024-01-02T03:04:05\ncount = 3\n")
+    expected = Toml(path).config
+    Toml(path, disk_cache=True).config  # noqa: B018
+    assert Toml(path, disk_cache=True).config == expected
@@ -0,0 +1,167 @@
+"""Shared, cached search of parent directories for config files (``cyclopts.config._search``)."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from cyclopts import App
+from cyclopts.config import Json, Toml, _search
+
+
+@pytest.fixture(autouse=True)
+def clear_listings():
+    _search.clear()
+    yield
+    _search.clear()
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Directories read with ``os.scandir``, in order."""
+    out = []
+    scandir = os.scandir
+
+    def spy(path):
+        out.append(str(path))
+        return scandir(path)
+
+    monkeypatch.setattr(_search.os, "scandir", spy)
+    return out
+
+
+def _age(path: Path, seconds: int = 60):
+    """Backdate the modification time of ``path`` so its listing is cacheable."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_listing_cached(tmp_path, scans):
+    (tmp_path / "a.toml").touch()
+    _age(tmp_path)
+    assert _search.listing(tmp_path) == {"a.toml"}
+    assert _search.listing(tmp_path) == {"a.toml"}
+    assert scans == [str(tmp_path)]
+
+
+def test_listing_invalidated_by_mtime(tmp_path, scans):
+    _age(tmp_path, 120)
+    assert _search.listing(tmp_path) == frozenset()
+    (tmp_path / "a.toml").touch()
+    _age(tmp_path, 60)
+    assert _search.listing(tmp_path) == {"a.toml"}
+    assert len(scans) == 2
+
+
+def test_listing_recently_modified_not_cached(tmp_path, scans):
+    _search.listing(tmp_path)
+    _search.listing(tmp_path)
+    assert len(scans) == 2
+
+
+def test_listing_missing(tmp_path):
+    assert _search.listing(tmp_path / "missing") is None
+
+
+def test_session(tmp_path, scans):
+    with _search.session():
+        assert _search.listing(tmp_path) == frozenset()
+        (tmp_path / "a.toml").touch()
+        with _search.session():
+            assert _search.listing(tmp_path) == frozenset()
+    assert _search.listing(tmp_path) == {"a.toml"}
+    assert len(scans) == 2
+
+
+def test_candidates(tmp_path):
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    (tmp_path / "c.toml").touch()
+    (tmp_path / "a" / "c.toml").touch()
+    assert list(_search.candidates(deep / "c.toml", search_parents=True))[:2] == [
+        tmp_path / "a" / "c.toml",
+        tmp_path / "c.toml",
+    ]
+
+
+def test_candidates_no_parents(tmp_path, scans):
+    """Without ``search_parents``, the caller's single ``stat()`` is all that's needed."""
+    assert list(_search.candidates(tmp_path / "c.toml", search_parents=False)) == [tmp_path / "c.toml"]
+    assert scans == []
+
+
+@pytest.mark.parametrize("case_insensitive", [False, True])
+def test_candidates_case(tmp_path, monkeypatch, case_insensitive):
+    monkeypatch.setattr(_search, "_CASE_INSENSITIVE", case_insensitive)
+    deep = tmp_path / "a"
+    deep.mkdir()
+    (tmp_path / "config.toml").touch()
+    expected = [tmp_path / "Config.toml"] if case_insensitive else []
+    assert [
+        p for p in _search.candidates(deep / "Config.toml", search_parents=True) if p.parent == tmp_path
+    ] == expected
+
+
+def test_candidates_unlistable(tmp_path, monkeypatch):
+    """A directory with execute but no read permission can't be listed; its file is stat-ed directly."""
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    (tmp_path / "a" / "config.json").write_text('{"value": 1}')
+    scandir = os.scandir
+
+    def scandir_unreadable(path):
+        if Path(path) == tmp_path / "a":
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(_search.os, "scandir", scandir_unreadable)
+    assert _search.listing(tmp_path / "a") is None
+    assert Json(deep / "config.json", search_parents=True).config == {"value": 1}
+
+
+def test_session_per_thread(tmp_path, scans):
+    """A session of one thread doesn't serve (or collect) listings of another."""
+    import threading
+
+    with _search.session():
+        assert _search.listing(tmp_path) == frozenset()
+        (tmp_path / "a.toml").touch()
+        result = []
+        thread = threading.Thread(target=lambda: result.append(_search.listing(tmp_path)))
+        thread.start()
+        thread.join()
+        assert result == [{"a.toml"}]
+        assert _search.listing(tmp_path) == frozenset()
+
+
+def test_dangling_symlink_skipped(tmp_path):
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    (tmp_path / "config.json").write_text('{"value": 1}')
+    (tmp_path / "a" / "config.json").symlink_to(tmp_path / "missing.json")
+    assert Json(deep / "config.json", search_parents=True).config == {"value": 1}
+
+
+def test_sources_share_walk(tmp_path, scans, monkeypatch):
+    deep = tmp_path / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text("[tool.myapp]\nvalue = 1\n")
+    (tmp_path / "a" / ".myapp.toml").write_text("count = 2\n")
+    monkeypatch.chdir(deep)
+
+    app = App(
+        result_action="return_value",
+        config=[
+            Toml(".myapp.toml", search_parents=True),
+            Toml("pyproject.toml", root_keys=["tool", "myapp"], search_parents=True),
+            Toml("missing.toml", search_parents=True),
+        ],
+    )
+
+    @app.default
+    def main(value: int = 0, count: int = 0):
+        return value, count
+
+    assert app([]) == (1, 2)
+    assert len(scans) == len(set(scans))  # Each ancestor is read at most once.
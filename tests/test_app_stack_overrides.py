@@ -1,5 +1,7 @@
 """Tests for AppStack override functionality."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 import pytest
@@ -122,3 +124,38 @@ def test_multiple_override_parameters():
     # Check cleanup
     assert len(app.app_stack.overrides_stack) == 1
     assert app.app_stack.overrides_stack[0] == {}
+
+
+def test_app_stack_concurrent_invocations():
+    """Concurrent invocations of the same App each see only their own stack frames and overrides."""
+    app = App(result_action="return_value")
+    barrier = threading.Barrier(2, timeout=5)
+
+    def snapshot(name):
+        barrier.wait()  # Both commands are executing at the same time.
+        command_app = app[name]
+        other_app = app["bar" if name == "foo" else "foo"]
+        out = (
+            command_app.app_stack.overrides.get("verbose"),
+            len(command_app.app_stack.stack),
+            len(other_app.app_stack.stack),
+        )
+        barrier.wait()  # Don't let either invocation unwind before both have looked.
+        return out
+
+    @app.command
+    def foo():
+        return snapshot("foo")
+
+    @app.command
+    def bar():
+        return snapshot("bar")
+
+    with ThreadPoolExecutor(2) as executor:
+        foo_future = executor.submit(app, ["foo"], verbose=True)
+        bar_future = executor.submit(app, ["bar"], verbose=False)
+        assert foo_future.result() == (True, 2, 1)
+        assert bar_future.result() == (False, 2, 1)
+
+    assert len(app.app_stack.overrides_stack) == 1
+    assert len(app["foo"].app_stack.stack) == 1
@@ -414,6 +414,112 @@ def test_argument_collection_var_keyword_match():
     assert argument.field_info.name == "b"
 
 
+def test_argument_collection_match_indexed():
+    def foo(a: dict[str, int], b: bool = False, *, c_d: Optional[list[int]] = None):
+        pass
+
+    collection = ArgumentCollection._from_callable(foo)
+
+    argument, keys, implicit_value = collection.match("--a.x.y")
+    assert argument.field_info.name == "a"
+    assert keys == ("x", "y")
+    assert implicit_value is UNSET
+
+    assert collection.match("--no-b")[2] is False
+    assert collection.match("--c_d")[0].field_info.name == "c_d"
+    assert collection.match("--empty-c-d")[2] == []
+    with pytest.raises(ValueError):
+        collection.match(0)
+    with pytest.raises(ValueError):
+        collection.match("--a-x")
+    with pytest.raises(ValueError):
+        collection.match("--b.x")
+
+
+def test_argument_collection_match_index_invalidation():
+    def foo(a: int):
+        pass
+
+    collection = ArgumentCollection._from_callable(foo)
+    assert collection.match(0)[0] is collection[0]
+    with pytest.raises(ValueError):
+        collection.match("--new")
+
+    collection.append(Argument(parameter=Parameter(name="--new")))
+    assert collection.match("--new")[0] is collection[-1]
+
+    # The index is rebuilt when the collection is modified, not when an Argument is.
+    renamed = collection[0]
+    renamed.parameter = Parameter.combine(renamed.parameter, Parameter(name="--renamed"))
+    collection[0] = renamed
+    assert collection.match("--renamed")[0] is collection[0]
+    with pytest.raises(ValueError):
+        collection.match("--a")
+
+
+def test_argument_collection_match_index_per_collection():
+    def foo(a: int, b: int):
+        pass
+
+    collection = ArgumentCollection._from_callable(foo)
+    clone = collection._clone()
+    assert clone._keyword_index is collection._keyword_index
+
+    # Shifting positions in the clone must not affect the original collection's index.
+    clone.pop(0)
+    assert clone.match("--b")[0] is clone[0]
+    assert clone.match(1)[0] is clone[0]
+    assert collection.match("--b")[0] is collection[1]
+    assert collection._keyword_index is not None
+
+
+def test_argument_collection_match_index_final(monkeypatch):
+    """Lookups, misses included, are answered by the index without calling ``Argument.match``."""
+
+    def foo(a: dict[str, int], *, b: bool = False, c: Optional[list[int]] = None, **kwargs: int):
+        pass
+
+    collection = ArgumentCollection._from_callable(foo)
+    without_kwargs = collection.copy()
+    del without_kwargs[-1]
+    assert without_kwargs._index is not None  # Built with Argument.match.
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Argument.match called")
+
+    monkeypatch.setattr(Argument, "match", fail)
+    assert collection.match("--a.x")[:2] == (collection[0], ("x",))
+    assert collection.match("--b")[2] is True
+    assert collection.match("--other.x")[1] == ("other", "x")
+    first, second = collection.match("--empty-c")[2], collection.match("--empty-c")[2]
+    assert first == second == [] and first is not second
+
+    for term in ("--unknown", "-abc", "--b.x", 5):
+        with pytest.raises(ValueError):
+            without_kwargs.match(term)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda c, new: c.append(new),
+        lambda c, new: c.extend([new]),
+        lambda c, new: c.insert(0, new),
+        lambda c, new: c.__setitem__(0, new),
+        lambda c, new: c.__setitem__(slice(0, 1), [new]),
+        lambda c, new: c.__iadd__([new]),
+    ],
+)
+def test_argument_collection_match_index_mutation(mutate):
+    def foo(a: int):
+        pass
+
+    collection = ArgumentCollection._from_callable(foo)
+    new = Argument(parameter=Parameter(name="--new"))
+    mutate(collection, new)
+    assert collection.match("--new")[0] is new
+
+
 def test_argument_collection_filter_by_has_tree_tokens():
     """``has_tree_tokens`` must be tree-aware, unlike ``has_tokens``.
 
@@ -877,6 +983,56 @@ def test_assemble_argument_collection_no_default_command():
         app.assemble_argument_collection()
 
 
+def test_assemble_argument_collection_cached_fresh_state():
+    from cyclopts import App
+
+    app = App()
+
+    @dataclass
+    class User:
+        name: str
+        age: int = 0
+
+    @app.default
+    def main(user: User, verbose: bool = False):
+        pass
+
+    first = app.assemble_argument_collection()
+    first["--user.name"].append(Token(keyword="--user.name", value="alice"))
+    first["--verbose"].value = True
+
+    second = app.assemble_argument_collection()
+    assert second is not first
+    assert [a.name for a in second] == [a.name for a in first]
+    assert all(a is not b for a, b in zip(first, second, strict=True))
+    assert not second["--user.name"].tokens
+    assert second["--verbose"].value is UNSET
+    assert not second["--verbose"]._marked
+
+    # Children are remapped onto the cloned arguments.
+    user = second["--user"]
+    assert all(any(child is a for a in second) for child in user.children)
+
+
+def test_assemble_argument_collection_cache_invalidated():
+    from cyclopts import App
+
+    app = App()
+
+    @app.default
+    def main(foo: int = 0):
+        pass
+
+    assert app.assemble_argument_collection()[0].name == "--foo"
+
+    app.default_parameter = Parameter(negative=(), name_transform=lambda s: s.upper())
+    assert app.assemble_argument_collection()[0].name == "--FOO"
+
+    app.default_command = None
+    app.default(lambda bar=0: None)
+    assert app.assemble_argument_collection()[0].name == "--BAR"
+
+
 def test_argument_collection_getitem_by_string():
     def foo(alpha: int, beta: str):
         pass
@@ -859,3 +859,50 @@ def test_bind_dataclass_accepts_keys_default_factory(app, assert_parse_args):
 
     assert_parse_args(cmd, "cmd")
     assert_parse_args(cmd, "cmd --config.numbers=5", Config(numbers=[5]))
+
+
+def test_bind_dataclass_field_infos_cached():
+    """Field infos are cached per class, but each lookup gets its own mutable copies and fresh factory defaults."""
+    from cyclopts.field_info import get_field_infos, signature_parameters
+
+    calls = []
+
+    def factory():
+        calls.append(None)
+        return []
+
+    @dataclass
+    class Config:
+        number: int
+        items: list[int] = field(default_factory=factory)
+
+    first = get_field_infos(Config)
+    second = get_field_infos(Config)
+    assert first == second
+    assert first["number"] is not second["number"]
+    assert first["items"].default is not second["items"].default
+    assert len(calls) == 2
+
+    first["number"].kind = first["number"].KEYWORD_ONLY
+    assert get_field_infos(Config)["number"].kind is first["number"].POSITIONAL_OR_KEYWORD
+
+    assert signature_parameters(Config)["items"].default == []
+
+
+def test_bind_dataclass_clear_caches(app, assert_parse_args):
+    @dataclass
+    class Config:
+        value: int = 0
+
+    @app.default
+    def main(config: Config):
+        pass
+
+    assert_parse_args(main, "--config.value=5", Config(value=5))  # pyright: ignore[reportCallIssue]
+
+    # Monkeypatch the annotation; the cached field infos are stale until cleared.
+    Config.__annotations__["value"] = str
+    Config.__dataclass_fields__["value"].type = str
+    cyclopts.clear_caches()
+
+    assert_parse_args(main, "--config.value=5", Config(value="5"))  # pyright: ignore[reportCallIssue, reportArgumentType]
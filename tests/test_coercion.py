@@ -15,8 +15,8 @@ from unittest.mock import Mock
 
 import pytest
 
-from cyclopts import CoercionError, Token
-from cyclopts._convert import convert, token_count
+from cyclopts import CoercionError, Parameter, Token
+from cyclopts._convert import compile_converter, convert, token_count
 from cyclopts.utils import default_name_transform
 
 
@@ -611,3 +611,83 @@ def test_parse_timedelta_equivalence():
     assert convert(timedelta, ["1w"]) == convert(timedelta, ["7d"])
     assert convert(timedelta, ["1h30m"]) == convert(timedelta, ["90m"])
     assert convert(timedelta, ["1d12h"]) == convert(timedelta, ["36h"])
+
+
+class _Color(Enum):
+    RED = auto()
+    DARK_GREEN = auto()
+
+
+def _positive(type_, value):
+    if value <= 0:
+        raise ValueError("must be positive")
+
+
+@pytest.mark.parametrize(
+    "hint, tokens",
+    [
+        (int, ["0x10"]),
+        (float, ["1.5"]),
+        (bool, ["yes"]),
+        (Optional[int], ["3"]),
+        (Union[int, str], ["foo"]),
+        (list[int], ["1", "2", "3"]),
+        (set[str], ["a", "b", "a"]),
+        (tuple[int, float, Literal["a", "b"]], ["1", "2.5", "b"]),
+        (list[tuple[int, float, Literal["a", "b"]]], ["1", "2.5", "b", "3", "4", "a"]),
+        (tuple[int, ...], ["1", "2"]),
+        (Literal["foo", "bar", 3], ["3"]),
+        (Literal["foo", "bar"], ["bar"]),
+        (_Color, ["dark-green"]),
+        (list[_Color], ["red", "dark-green"]),
+        (Annotated[int, Parameter(validator=_positive)], ["5"]),
+        (list[Annotated[int, Parameter(converter=lambda t, tokens: 2 * int(tokens[0].value))]], ["1", "2"]),
+        (dict[str, int], {"a": ["1"], "b": ["2"]}),
+        (Sequence[int], ["1", "2"]),
+        (Path, ["foo"]),
+        (Any, ["foo"]),
+    ],
+)
+def test_compile_converter_matches_convert(hint, tokens):
+    assert compile_converter(hint)(tokens) == convert(hint, tokens)
+
+
+@pytest.mark.parametrize(
+    "hint, tokens",
+    [
+        (int, ["foo"]),
+        (Literal["foo", "bar"], ["baz"]),
+        (Literal["foo", "bar", 3], ["4"]),
+        (_Color, ["blue"]),
+        (tuple[int, int], ["1"]),
+        (Annotated[int, Parameter(validator=_positive)], ["-5"]),
+    ],
+)
+def test_compile_converter_errors_match_convert(hint, tokens):
+    with pytest.raises(Exception) as expected:
+        convert(hint, tokens)
+    with pytest.raises(type(expected.value)) as actual:
+        compile_converter(hint)(tokens)
+    for attr in ("token", "target_type", "msg"):
+        assert getattr(actual.value, attr, None) == getattr(expected.value, attr, None)
+
+
+def test_compile_converter_union_order():
+    assert compile_converter(Union[int, str])([Token(value="1")]) == 1
+    assert compile_converter(Union[str, int])([Token(value="1")]) == "1"
+
+
+def test_compile_converter_reused_by_argument(app, assert_parse_args):
+    @app.default
+    def main(values: list[tuple[int, float, Literal["a", "b"]]]):
+        pass
+
+    (argument,) = app.assemble_argument_collection()
+    plans = dict(argument._converter_plans)
+    assert plans  # Compiled when assembled.
+
+    assert_parse_args(main, "1 2.5 a 3 4 b", [(1, 2.5, "a"), (3, 4.0, "b")])
+    assert dict(argument._converter_plans) == plans
+
+    assert_parse_args(main, "5 6 b", [(5, 6.0, "b")])
+    assert dict(argument._converter_plans) == plans
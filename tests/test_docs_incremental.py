@@ -0,0 +1,173 @@
+"""One-file-per-command documentation builds (``App.write_docs``)."""
+
+import json
+import time
+from typing import Annotated
+
+import pytest
+
+from cyclopts import App, Parameter
+from cyclopts.docs.incremental import MANIFEST_NAME
+
+
+def _make_app(rm_path_help: str | None = None) -> App:
+    app = App(name="tool", help="Manage tools.")
+    files = App(name="files", help="Manage files.")
+    app.command(files)
+
+    @files.command
+    def cp(src: str, dst: str, *, force: bool = False):
+        """Copy a file.
+
+        Parameters
+        ----------
+        src: str
+            Source path.
+        """
+
+    @files.command
+    def rm(path: Annotated[str, Parameter(help=rm_path_help)]):
+        """Remove a file."""
+
+    @app.command
+    def status():
+        """Show the status."""
+
+    return app
+
+
+def _mtimes(directory) -> dict[str, int]:
+    return {p.name: p.stat().st_mtime_ns for p in directory.iterdir()}
+
+
+def test_write_docs_markdown(tmp_path):
+    written = _make_app().write_docs(tmp_path)
+    names = ["tool.md", "tool-files.md", "tool-files-cp.md", "tool-files-rm.md", "tool-status.md"]
+    assert sorted(p.name for p in written) == sorted(names)
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text())["pages"].keys() == set(names)
+
+    root = (tmp_path / "tool.md").read_text()
+    assert root.startswith("# tool\n")
+    assert "- [`cp`](tool-files-cp.md)" in root  # Table of contents.
+    assert "Copy a file." not in root
+
+    files = (tmp_path / "tool-files.md").read_text()
+    assert files.startswith("# tool files\n")
+    assert "* [`cp`](tool-files-cp.md): Copy a file." in files
+
+    cp = (tmp_path / "tool-files-cp.md").read_text()
+    assert cp.startswith("# tool files cp\n")
+    assert "Source path." in cp
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "rst", "html"])
+def test_write_docs_unchanged(tmp_path, output_format):
+    assert _make_app().write_docs(tmp_path, output_format)
+    mtimes = _mtimes(tmp_path)
+    time.sleep(0.01)
+    assert _make_app().write_docs(tmp_path, output_format) == []
+    assert _mtimes(tmp_path) == mtimes
+
+
+def test_write_docs_html_links(tmp_path):
+    _make_app().write_docs(tmp_path, "html")
+    assert 'href="tool-files-cp.html"' in (tmp_path / "tool.html").read_text()
+
+
+def test_write_docs_changed_command(tmp_path, monkeypatch):
+    _make_app().write_docs(tmp_path)
+
+    app = _make_app()
+    cp = app["files"]["cp"].default_command
+    assert cp is not None
+    monkeypatch.setattr(cp, "__doc__", "Copy a file.\n\nOverwrites nothing.\n")
+    written = app.write_docs(tmp_path)
+    # The parent page lists the unchanged short description; it's re-rendered, but not rewritten.
+    assert [p.name for p in written] == ["tool-files-cp.md"]
+    assert "Overwrites nothing." in (tmp_path / "tool-files-cp.md").read_text()
+
+
+def test_write_docs_changed_parameter(tmp_path):
+    _make_app().write_docs(tmp_path)
+    written = _make_app(rm_path_help="Path to remove.").write_docs(tmp_path)
+    assert [p.name for p in written] == ["tool-files-rm.md"]
+    assert "Path to remove." in (tmp_path / "tool-files-rm.md").read_text()
+
+
+def test_write_docs_changed_parameter_type(tmp_path, monkeypatch):
+    """Editing the file defining a dataclass parameter re-renders the page of the command using it."""
+    import importlib.util
+    import sys
+
+    def make_app(doc):
+        source = tmp_path / "docs_types.py"
+        source.write_text(
+            "from dataclasses import dataclass\n"
+            "@dataclass\n"
+            "class Options:\n"
+            f'    """Options.\n\n    Parameters\n    ----------\n    level: int\n        {doc}\n    """\n'
+            "    level: int = 1\n"
+        )
+        spec = importlib.util.spec_from_file_location("docs_types", source)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "docs_types", module)
+        spec.loader.exec_module(module)
+
+        app = _make_app()
+
+        @app.command
+        def tune(*, options: module.Options):  # pyright: ignore[reportInvalidTypeForm]
+            """Tune the tool."""
+
+        return app
+
+    out = tmp_path / "out"
+    make_app("First level.").write_docs(out)
+    written = make_app("Second level, longer.").write_docs(out)
+    assert [p.name for p in written] == ["tool-tune.md"]
+    assert "Second level, longer." in (out / "tool-tune.md").read_text()
+
+
+def test_write_docs_options_change(tmp_path):
+    _make_app().write_docs(tmp_path)
+    written = _make_app().write_docs(tmp_path, heading_level=2)
+    assert len(written) == 5
+    assert (tmp_path / "tool-status.md").read_text().startswith("## tool status\n")
+
+
+def test_write_docs_removed_command(tmp_path):
+    _make_app().write_docs(tmp_path)
+    (tmp_path / "notes.md").write_text("Not ours.")
+
+    app = _make_app()
+    del app._commands["status"]
+    written = app.write_docs(tmp_path)
+    assert [p.name for p in written] == ["tool.md"]  # Table of contents and command list.
+    assert not (tmp_path / "tool-status.md").exists()
+    assert (tmp_path / "notes.md").exists()
+
+
+def test_write_docs_corrupt_manifest(tmp_path):
+    _make_app().write_docs(tmp_path)
+    (tmp_path / MANIFEST_NAME).write_text("{")
+    mtimes = _mtimes(tmp_path)
+    assert _make_app().write_docs(tmp_path) == []
+    assert {k: v for k, v in _mtimes(tmp_path).items() if k != MANIFEST_NAME} == {
+        k: v for k, v in mtimes.items() if k != MANIFEST_NAME
+    }
+
+
+def test_write_docs_workers(tmp_path):
+    _make_app().write_docs(tmp_path / "serial")
+    _make_app().write_docs(tmp_path / "parallel", workers=2)
+    for path in (tmp_path / "serial").iterdir():
+        assert (tmp_path / "parallel" / path.name).read_text() == path.read_text()
+
+
+def test_write_docs_failed_write_cleans_up(tmp_path):
+    """A page that can't be replaced raises, without leaving its temporary file behind."""
+    (tmp_path / "tool-status.md").mkdir()
+    with pytest.raises(OSError):
+        _make_app().write_docs(tmp_path)
+    assert not list(tmp_path.glob("*.tmp"))
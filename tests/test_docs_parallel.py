@@ -0,0 +1,106 @@
+"""Rendering documentation in worker processes (``generate_docs(workers=...)``)."""
+
+from typing import Annotated, Literal
+
+import pytest
+
+from cyclopts import App, Group, Parameter
+from cyclopts.docs import _parallel, generate_markdown_docs, generate_rst_docs
+
+
+@pytest.fixture(autouse=True)
+def many_cpus(monkeypatch):
+    """Use worker processes even on single-CPU machines."""
+    monkeypatch.setattr(_parallel, "_available_cpus", lambda: 8)
+
+
+def _make_app(width: int, depth: int) -> App:
+    """An app with ``width`` commands at each of ``depth`` levels below the root."""
+
+    def action(
+        target: Literal["alpha", "beta"],
+        /,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(help="Run mode.")] = "fast",
+        count: int = 1,
+        dry_run: bool = False,
+    ):
+        """Run an action.
+
+        Parameters
+        ----------
+        count: int
+            How many times.
+        """
+
+    admin = Group("Admin")
+
+    def populate(app: App, level: int):
+        for i in range(width):
+            if level == depth:
+                app.command(action, name=f"cmd{i}")
+            else:
+                sub = App(name=f"group{i}", help=f"Group {i} at level {level}.", group=admin if i % 2 else ())
+                populate(sub, level + 1)
+                app.command(sub)
+
+    app = App(name="wide", help="A wide and deep app.")
+    populate(app, 1)
+    app.command(App(name="hidden", show=False))
+    return app
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "rst", "html"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"flatten_commands": True}, {"include_hidden": True}],
+)
+def test_workers_match_serial(output_format, kwargs):
+    app = _make_app(3, 2)
+    expected = app.generate_docs(output_format, **kwargs)
+    assert app.generate_docs(output_format, workers=3, **kwargs) == expected
+    assert app.generate_docs(output_format, workers=1, **kwargs) == expected
+
+
+@pytest.mark.parametrize("generate", [generate_markdown_docs, generate_rst_docs])
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"commands_filter": ["group1"]},
+        {"commands_filter": ["group0.cmd1", "group2"]},
+        {"exclude_commands": ["group1", "group0.cmd2"]},
+        {"commands_filter": ["group0.cmd1"], "skip_preamble": True},
+    ],
+)
+def test_workers_match_serial_filtered(generate, filters):
+    app = _make_app(3, 2)
+    assert generate(app, workers=3, **filters) == generate(app, **filters)
+
+
+def test_render_sections_reentrant():
+    """Concurrent calls each render their own sections."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def render(prefix, i):
+        return [f"{prefix}{i}"]
+
+    def run(prefix):
+        return list(_parallel.render_sections(render, [(prefix, i) for i in range(6)], workers=2))
+
+    with ThreadPoolExecutor(2) as executor:
+        a, b = executor.map(run, ["a", "b"])
+    assert a == [[f"a{i}"] for i in range(6)]
+    assert b == [[f"b{i}"] for i in range(6)]
+    assert not _parallel._jobs
+
+
+def test_render_sections_serial_off_linux(monkeypatch):
+    monkeypatch.setattr(_parallel.sys, "platform", "darwin")
+    monkeypatch.setattr(_parallel, "ProcessPoolExecutor", None)  # Fails if used.
+    sections = [(i,) for i in range(4)]
+    assert list(_parallel.render_sections(lambda i: [str(i)], sections, workers=4)) == [["0"], ["1"], ["2"], ["3"]]
+
+
+def test_workers_invalid():
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        _make_app(2, 1).generate_docs(workers=0)
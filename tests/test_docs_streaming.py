@@ -0,0 +1,81 @@
+"""Streaming documentation (``App.iter_docs`` and ``generate_docs(file=...)``)."""
+
+import io
+import re
+
+import pytest
+
+from cyclopts import App
+from cyclopts.docs import iter_html_docs
+from cyclopts.docs.base import join_sections
+
+
+def _make_app(n: int) -> App:
+    app = App(name="tool", help="A tool.")
+
+    for i in range(n):
+        sub = App(name=f"group{i}", help=f"Group {i}.")
+
+        @sub.command
+        def run(value: int, *, verbose: bool = False):
+            """Run something.
+
+            Parameters
+            ----------
+            value: int
+                The value.
+            """
+
+        app.command(sub)
+    return app
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        [],
+        [[]],
+        [["a"], [], ["b"]],
+        [["", ""], [""], ["a", "", "", ""], ["", "", "b", " "], ["  ", ""]],
+        [["x\n\n\n"], ["\n\ny"], [""], ["", ""]],
+    ],
+)
+@pytest.mark.parametrize("collapse_blank_lines", [False, True])
+@pytest.mark.parametrize("strip_end", [False, True])
+def test_join_sections(sections, collapse_blank_lines, strip_end):
+    expected = "\n".join(line for lines in sections for line in lines)
+    if strip_end:
+        expected = expected.rstrip() + "\n"
+    if collapse_blank_lines:
+        expected = re.sub(r"\n{3,}", "\n\n", expected)
+    chunks = list(join_sections(sections, collapse_blank_lines=collapse_blank_lines, strip_end=strip_end))
+    assert "".join(chunks) == expected
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "rst", "html"])
+@pytest.mark.parametrize("kwargs", [{}, {"flatten_commands": True}, {"workers": 2}])
+def test_iter_docs(output_format, kwargs):
+    app = _make_app(3)
+    chunks = list(app.iter_docs(output_format, **kwargs))
+    assert "".join(chunks) == app.generate_docs(output_format, **kwargs)
+    assert len(chunks) >= 4  # Preamble, then one chunk per top-level command.
+
+
+def test_iter_docs_lazy():
+    app = _make_app(3)
+    chunks = app.iter_docs()
+    assert next(chunks).startswith("# tool")
+    assert "group2" in "".join(chunks)
+
+
+def test_iter_html_docs_not_standalone():
+    app = _make_app(2)
+    assert "".join(iter_html_docs(app, standalone=False)).startswith('<div class="cli-documentation">')
+
+
+@pytest.mark.parametrize("output_format", ["markdown", "html"])
+def test_generate_docs_file(output_format):
+    app = _make_app(3)
+    file = io.StringIO()
+    assert app.generate_docs(output_format, file=file) is None
+    assert file.getvalue() == app.generate_docs(output_format)
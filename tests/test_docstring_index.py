@@ -0,0 +1,151 @@
+"""Docstring index shared by help, completion and docs (``cyclopts._docstring_index``)."""
+
+from dataclasses import dataclass
+
+import pytest
+
+import cyclopts
+from cyclopts import App, _docstring_index
+from cyclopts.argument.utils import extract_docstring_help
+from cyclopts.help.help import docstring_parse
+
+
+@pytest.fixture(autouse=True)
+def docstring_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv(_docstring_index.CACHE_ENV_VAR, raising=False)
+    cyclopts.clear_caches()
+    yield tmp_path / "cyclopts" / "docstrings.json"
+    cyclopts.clear_caches()
+
+
+@dataclass
+class Base:
+    """Base settings."""
+
+    host: str = "localhost"
+    """Server host."""
+
+
+@dataclass
+class Settings(Base):
+    """Settings."""
+
+    port: int = 8080
+    """Server port."""
+
+
+def _function(count: int):
+    """Count.
+
+    Parameters
+    ----------
+    count: int
+        How many.
+    """
+
+
+def test_docstring_parse_indexed():
+    doc = "Short.\n\nLong description."
+    first = docstring_parse(doc, "markdown")
+    assert docstring_parse(doc, "plaintext") is first
+    assert cyclopts.docstring_cache_info() == (1, 1, 0, 1)
+    assert docstring_parse(None, "markdown").short_description is None
+
+
+def test_docstring_parse_bounded(monkeypatch):
+    monkeypatch.setattr(_docstring_index, "_MAX_TEXTS", 2)
+    for doc in ("First.", "Second.", "First.", "Third."):
+        docstring_parse(doc, "markdown")
+    assert cyclopts.docstring_cache_info().currsize == 2
+    docstring_parse("First.", "markdown")  # Recently used, kept.
+    docstring_parse("Second.", "markdown")  # Least recently used, dropped.
+    assert cyclopts.docstring_cache_info()[:2] == (2, 4)
+
+
+def test_extract_docstring_help_class():
+    for _ in range(3):
+        result = extract_docstring_help(Settings)
+        assert {k: v.help for k, v in result.items()} == {("host",): "Server host.", ("port",): "Server port."}
+        result.clear()  # Callers may mutate the returned dict.
+    info = cyclopts.docstring_cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
+def test_extract_docstring_help_doc_change(monkeypatch):
+    assert extract_docstring_help(_function)[("count",)].help == "How many."
+    monkeypatch.setattr(_function, "__doc__", "Count.\n\nParameters\n----------\ncount: int\n    How few.\n")
+    assert extract_docstring_help(_function)[("count",)].help == "How few."
+    assert cyclopts.docstring_cache_info().misses == 2
+
+
+def test_extract_docstring_help_bound_method():
+    class Command:
+        def run(self, count: int):
+            """Run.
+
+            Parameters
+            ----------
+            count: int
+                How many.
+            """
+
+    for _ in range(2):
+        assert extract_docstring_help(Command().run)[("count",)].help == "How many."
+    assert cyclopts.docstring_cache_info().hits == 1
+
+
+def test_help_reuses_index(console):
+    app = App(name="tool", result_action="return_value")
+    app.default(_function)
+    with console.capture():
+        app.help_print([], console=console)
+    misses = cyclopts.docstring_cache_info().misses
+    with console.capture():
+        app.help_print([], console=console)
+    assert cyclopts.docstring_cache_info().misses == misses
+
+
+def test_disk_cache(docstring_cache_dir, monkeypatch):
+    monkeypatch.setenv(_docstring_index.CACHE_ENV_VAR, "1")
+    expected = extract_docstring_help(Settings)
+    extract_docstring_help(_function)  # Functions aren't persisted.
+    _docstring_index.save()
+    assert docstring_cache_dir.exists()
+
+    cyclopts.clear_caches()
+    assert extract_docstring_help(Settings) == expected
+    info = cyclopts.docstring_cache_info()
+    assert (info.misses, info.disk_hits) == (1, 1)
+
+
+def test_disk_cache_save_registered_once(docstring_cache_dir, monkeypatch):
+    registered = []
+    monkeypatch.setattr(_docstring_index.atexit, "register", registered.append)
+    monkeypatch.setattr(_docstring_index, "_save_registered", False)
+    monkeypatch.setenv(_docstring_index.CACHE_ENV_VAR, "1")
+    for _ in range(3):
+        cyclopts.clear_caches()
+        extract_docstring_help(Settings)
+    assert registered == [_docstring_index.save]
+
+
+def test_disk_cache_unwritable(docstring_cache_dir, monkeypatch):
+    monkeypatch.setenv(_docstring_index.CACHE_ENV_VAR, "1")
+    extract_docstring_help(Settings)
+    docstring_cache_dir.parent.parent.mkdir(parents=True, exist_ok=True)
+    docstring_cache_dir.parent.write_text("not a directory")
+    _docstring_index.save()  # Doesn't raise.
+
+
+def test_disk_cache_disabled_by_default(docstring_cache_dir):
+    extract_docstring_help(Settings)
+    _docstring_index.save()
+    assert not docstring_cache_dir.exists()
+
+
+def test_disk_cache_corrupt(docstring_cache_dir, monkeypatch):
+    monkeypatch.setenv(_docstring_index.CACHE_ENV_VAR, "1")
+    docstring_cache_dir.parent.mkdir(parents=True)
+    docstring_cache_dir.write_text("not json")
+    assert extract_docstring_help(Settings)[("port",)].help == "Server port."
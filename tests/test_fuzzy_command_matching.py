@@ -230,3 +230,36 @@ def test_fuzzy_matching_excludes_short_flags(app):
     # "h" should NOT match "-h" via fuzzy matching
     with pytest.raises(UnknownCommandError, match="h"):
         app.parse_args(["h"], exit_on_error=False)
+
+
+def test_fuzzy_command_matching_cache_invalidation(app):
+    """The cached command mapping and fuzzy index must track command (de)registration."""
+    sub = App(name="sub")
+    app.command(sub, name="*")
+
+    @app.command
+    def foo_bar():
+        return "foo_bar"
+
+    assert app("fooBar") == "foo_bar"
+    assert "late-command" not in app
+
+    # Registering on a flattened sub-app must invalidate the parent's mapping.
+    @sub.command
+    def late_command():
+        return "late"
+
+    assert "late-command" in app
+    assert app("lateCommand") == "late"
+
+    del app["foo-bar"]
+    assert "foo-bar" not in app
+    with pytest.raises(UnknownCommandError):
+        app("fooBar", exit_on_error=False)
+
+    # Meta commands become visible once the meta app is created.
+    @app.meta.command
+    def meta_only():
+        return "meta"
+
+    assert app.meta("metaOnly") == "meta"
@@ -498,3 +498,44 @@ def test_generate_rst_docs_usage_name_none_is_default_behavior():
         pass
 
     assert app.generate_docs(output_format="rst") == app.generate_docs(output_format="rst", usage_name=None)
+
+
+def _make_sectioned_app(purge_help: str = "Purge it.") -> App:
+    app = App(name="myapp", help="CLI with sections")
+    db = App(name="db", help="Database commands.")
+    app.command(db)
+
+    @app.command
+    def serve(port: int = 8000):
+        """Start the server."""
+
+    @db.command
+    def purge(*, force: bool = False):
+        pass
+
+    purge.__doc__ = purge_help
+    return app
+
+
+def test_generate_rst_docs_section_cache():
+    """Sections of unchanged top-level commands are reused; changed ones are rendered again."""
+    from collections import ChainMap
+
+    from cyclopts.docs.rst import generate_rst_docs
+
+    expected = generate_rst_docs(_make_sectioned_app())
+    cache: dict[str, list[str]] = {}
+    assert generate_rst_docs(_make_sectioned_app(), section_cache=cache) == expected
+    assert len(cache) == 2
+
+    # Cached sections are used as-is.
+    sentinel = dict.fromkeys(cache, ["\nSENTINEL\n"])
+    assert generate_rst_docs(_make_sectioned_app(), section_cache=sentinel).count("SENTINEL") == 2
+
+    # A nested change invalidates only its top-level section; ``maps[0]`` collects the current sections.
+    sections: ChainMap[str, list[str]] = ChainMap({}, sentinel)
+    docs = generate_rst_docs(_make_sectioned_app("Purge everything."), section_cache=sections)
+    assert docs.count("SENTINEL") == 1
+    assert "Purge everything." in docs
+    assert len(sections.maps[0]) == 2
+    assert len(set(sections.maps[0]) & set(cache)) == 1
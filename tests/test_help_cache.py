@@ -0,0 +1,188 @@
+"""Rendered help-page cache (``App(help_cache=True)``)."""
+
+from typing import Annotated, Literal
+
+import pytest
+from rich.console import Console
+
+from cyclopts import App, Parameter
+from cyclopts.help import cache
+
+
+@pytest.fixture(autouse=True)
+def help_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv(cache.CACHE_ENV_VAR, raising=False)
+    return tmp_path / "cyclopts" / "help"
+
+
+def _make_app(help_cache: bool = True) -> App:
+    app = App(name="cached", help="Root help.", help_cache=help_cache)
+
+    @app.command
+    def deploy(
+        cluster: Literal["eu", "us"],
+        *,
+        replicas: Annotated[int, Parameter(help="Number of replicas.")] = 1,
+        dry_run: bool = False,
+    ):
+        """Deploy the service.
+
+        Parameters
+        ----------
+        cluster: Literal["eu", "us"]
+            Target cluster.
+        """
+
+    @app.command
+    def status():
+        """Show the status."""
+
+    return app
+
+
+def _help(app, tokens, console) -> str:
+    with console.capture() as capture:
+        app.help_print(tokens, console=console)
+    return capture.get()
+
+
+@pytest.fixture
+def no_render(monkeypatch):
+    """Fail if a help page is rendered rather than replayed."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("help page was rendered")
+
+    return lambda: monkeypatch.setattr(App, "_render_help", fail)
+
+
+@pytest.mark.parametrize("tokens", [[], ["deploy"], ["status"]])
+def test_help_cache_replays_page(rich_console, help_cache_dir, no_render, tokens):
+    expected = _help(_make_app(help_cache=False), tokens, rich_console)
+    assert "\x1b[" in expected
+
+    assert _help(_make_app(), tokens, rich_console) == expected
+    assert len(list(help_cache_dir.iterdir())) == 1
+
+    no_render()
+    assert _help(_make_app(), tokens, rich_console) == expected
+
+
+def test_help_cache_disabled_by_default(help_cache_dir, console):
+    app = App(name="plain")
+    _help(app, [], console)
+    assert not help_cache_dir.exists()
+
+
+def test_help_cache_env_var_disables(help_cache_dir, console, monkeypatch):
+    monkeypatch.setenv(cache.CACHE_ENV_VAR, "0")
+    _help(_make_app(), [], console)
+    assert not help_cache_dir.exists()
+
+
+def test_help_cache_inherited(help_cache_dir, console):
+    app = App(name="parent", help_cache=True)
+    app.command(App(name="child", help="Child help."))
+    assert "Child help." in _help(app, ["child"], console)
+    assert len(list(help_cache_dir.iterdir())) == 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda app, console: Console(width=100, force_terminal=True, color_system=None, legacy_windows=False),
+        lambda app, console: Console(width=70, force_terminal=True, color_system="256", legacy_windows=False),
+        lambda app, console: setattr(app, "help_format", "plaintext"),
+        lambda app, console: setattr(app, "help_formatter", "plain"),
+        lambda app, console: setattr(app["deploy"], "help", "Changed help."),
+        lambda app, console: app.command(App(name="new")) and None,
+        lambda app, console: setattr(app["deploy"], "show", False),
+    ],
+)
+def test_help_cache_key_changes(console, help_cache_dir, change):
+    app = _make_app()
+    _help(app, [], console)
+    new_console = change(app, console)
+    _help(app, [], new_console or console)
+    assert len(list(help_cache_dir.iterdir())) == 2
+
+
+def test_help_cache_source_change(tmp_path, console, help_cache_dir):
+    """Editing the file defining a command invalidates its page."""
+    import importlib.util
+
+    def load(doc):
+        source = tmp_path / "cached_cli.py"
+        source.write_text(
+            f"from cyclopts import App\napp = App(help_cache=True)\n@app.default\ndef main():\n    {doc!r}\n"
+        )
+        spec = importlib.util.spec_from_file_location("cached_cli", source)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.app
+
+    assert "First version." in _help(load("First version."), [], console)
+    assert "Second one." in _help(load("Second one."), [], console)
+    assert len(list(help_cache_dir.iterdir())) == 2
+
+
+def test_help_cache_parameter_type_source_change(tmp_path, console, help_cache_dir, monkeypatch):
+    """Editing the file defining a dataclass parameter invalidates the page of a command using it."""
+    import importlib.util
+    import sys
+
+    def load(doc):
+        source = tmp_path / "cached_types.py"
+        source.write_text(
+            "from dataclasses import dataclass\n"
+            "@dataclass\n"
+            "class Options:\n"
+            f'    """Options.\n\n    Parameters\n    ----------\n    level: int\n        {doc}\n    """\n'
+            "    level: int = 1\n"
+        )
+        spec = importlib.util.spec_from_file_location("cached_types", source)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "cached_types", module)
+        spec.loader.exec_module(module)
+
+        app = App(name="typed", help_cache=True)
+
+        @app.default
+        def main(*, options: module.Options):  # pyright: ignore[reportInvalidTypeForm]
+            pass
+
+        return app
+
+    assert "First level." in _help(load("First level."), [], console)
+    assert "Second level, longer." in _help(load("Second level, longer."), [], console)
+    assert len(list(help_cache_dir.iterdir())) == 2
+
+
+def test_help_cache_lazy_commands_not_imported(console, help_cache_dir):
+    import sys
+
+    app = App(name="lazy", help_cache=True)
+    app.command("tests.apps.lazy_never_imported:command", name="later")
+    _help(app, [], console)
+    _help(app, [], console)
+    assert "tests.apps.lazy_never_imported" not in sys.modules
+
+
+def test_help_cache_within_outer_capture(console):
+    app = _make_app()
+    expected = _help(_make_app(help_cache=False), [], console)
+    for _ in range(2):
+        with console.capture() as capture:
+            console.print("before")
+            app.help_print([], console=console)
+            console.print("after")
+        assert capture.get() == f"before\n{expected}after\n"
+
+
+def test_help_cache_skips_recording_console(help_cache_dir):
+    console = Console(width=70, record=True, force_terminal=True, color_system=None, legacy_windows=False)
+    _help(_make_app(), [], console)
+    assert not help_cache_dir.exists()
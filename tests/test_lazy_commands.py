@@ -84,6 +84,19 @@ def test_command_spec_caching(app):
     assert resolved1 is resolved2  # Same object, not just equal
 
 
+def test_command_spec_concurrent_resolve(app):
+    """Concurrent resolution configures a single App, and only publishes it once configured."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    spec = CommandSpec(import_path="os.path:join", name="join", help="Joined.")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resolved = set(map(id, executor.map(lambda _: spec.resolve(app), range(32))))
+
+    assert resolved == {id(spec.resolve(app))}
+    assert spec.resolve(app).help == "Joined."
+
+
 def test_lazy_command_registration():
     """Test registering a lazy command via import path."""
     app = App()
@@ -1077,3 +1090,195 @@ def test_iterate_commands_resolve_lazy(lazy_module):
 
     # Lazy command should now be resolved
     assert app._commands["lazy"].is_resolved
+
+
+def _build_manifest_app():
+    app = App(name="myapp", result_action="return_value")
+    user_app = app.command(App(name="user", help="Manage users."))
+    user_app.command("test_lazy_create:create_user", name="create")
+    user_app.command("test_lazy_admin:admin_app", name="admin")
+    return app, user_app
+
+
+@pytest.fixture
+def manifest_modules(lazy_module):
+    mod_create = lazy_module("test_lazy_create")
+    mod_admin = lazy_module("test_lazy_admin")
+
+    def create_user(name: str, *, admin: bool = False):
+        """Create a new user.
+
+        Parameters
+        ----------
+        name: str
+            Name of the user.
+        admin: bool
+            Grant admin rights.
+        """
+        return f"creating {name}"
+
+    admin_app = App(name="admin", help="Administrative commands.", group=Group("Admin"))
+
+    @admin_app.command
+    def purge():
+        """Purge everything."""
+
+    mod_create.create_user = create_user  # type: ignore[attr-defined]
+    mod_admin.admin_app = admin_app  # type: ignore[attr-defined]
+
+
+def test_lazy_command_manifest_roundtrip(tmp_path, console, manifest_modules):
+    """A loaded manifest supplies help/group to parent help pages without resolving lazy commands."""
+    manifest_path = tmp_path / "manifest.json"
+    app, _ = _build_manifest_app()
+    app.export_manifest(manifest_path)
+
+    with console.capture() as capture:
+        app(["user", "--help"], console=console)
+    expected = capture.get()
+
+    # Fresh app, as if in a new process; nothing has been imported yet.
+    app, user_app = _build_manifest_app()
+    app.load_manifest(manifest_path)
+
+    with console.capture() as capture:
+        app(["user", "--help"], console=console)
+
+    assert capture.get() == expected
+    assert "Admin" in expected
+    assert "Create a new user." in expected
+    assert not user_app._commands["create"].is_resolved
+    assert not user_app._commands["admin"].is_resolved
+
+    # Routing still resolves (imports) only the executed command.
+    assert app(["user", "create", "alice"]) == "creating alice"
+    assert user_app._commands["create"].is_resolved
+    assert not user_app._commands["admin"].is_resolved
+
+
+def test_lazy_command_manifest_group_metadata(tmp_path, console, lazy_module):
+    """Group help/sort_key of lazy commands survive the manifest; groups shared by several commands stay merged."""
+    module = lazy_module("test_lazy_ops")
+    operations = Group("Operations", help="Day-to-day operations.", sort_key=1)
+    module.start_app = App(name="start", help="Start it.", group=operations)  # type: ignore[attr-defined]
+    module.stop_app = App(name="stop", help="Stop it.", group=operations)  # type: ignore[attr-defined]
+
+    def build():
+        app = App(name="myapp", result_action="return_value")
+        app.command("test_lazy_ops:start_app", name="start")
+        app.command("test_lazy_ops:stop_app", name="stop")
+        app.command(App(name="status", help="Show status.", group=Group("Info", sort_key=0)))
+        return app
+
+    manifest_path = tmp_path / "manifest.json"
+    app = build()
+    app.export_manifest(manifest_path)
+    with console.capture() as capture:
+        app(["--help"], console=console)
+    expected = capture.get()
+
+    app = build()
+    app.load_manifest(manifest_path)
+    with console.capture() as capture:
+        app(["--help"], console=console)
+
+    assert capture.get() == expected
+    assert "Day-to-day operations." in expected
+    assert not app._commands["start"].is_resolved
+    assert app._commands["start"].group == app._commands["stop"].group
+
+
+def test_command_spec_metadata_setters():
+    spec = CommandSpec("test_lazy_module:cmd")
+    spec._manifest = {"help": "From manifest.", "group": ["Manifest"], "sort_key": 1}
+    assert spec.help == "From manifest."
+
+    spec.help = "Explicit."
+    spec.group = "Explicit"
+    spec.sort_key = 2
+    assert (spec.help, spec.group, spec.sort_key) == ("Explicit.", "Explicit", 2)
+
+
+def test_lazy_command_manifest_contents(tmp_path, manifest_modules):
+    manifest_path = tmp_path / "manifest.json"
+    app, _ = _build_manifest_app()
+    app.export_manifest(manifest_path)
+
+    from cyclopts.manifest import find_manifest_entry
+
+    app, user_app = _build_manifest_app()
+    app.load_manifest(manifest_path)
+
+    entry = find_manifest_entry(app, ["user", "create"])
+    assert entry is not None
+    assert entry["import_path"] == "test_lazy_create:create_user"
+    assert [p["names"] for p in entry["parameters"]] == [["--name"], ["--admin"]]
+    assert entry["parameters"][1]["negatives"] == ["--no-admin"]
+    assert entry["parameters"][1]["tokens"] == 0
+    assert entry["parameters"][0]["help"] == "Name of the user."
+
+    entry = find_manifest_entry(app, ["user", "admin", "purge"])
+    assert entry is not None
+    assert entry["help"] == "Purge everything."
+
+    # Not inside a lazy command; resolve normally.
+    assert find_manifest_entry(app, ["user"]) is None
+    assert not user_app._commands["admin"].is_resolved
+
+
+def test_lazy_command_manifest_stale_and_format(tmp_path, manifest_modules):
+    manifest_path = tmp_path / "manifest.json"
+    app, _ = _build_manifest_app()
+    app.export_manifest(manifest_path)
+
+    # Command re-pointed to a different import path; manifest entry is ignored.
+    app = App(name="myapp")
+    user_app = app.command(App(name="user"))
+    user_app.command("test_lazy_other:create_user", name="create")
+    app.load_manifest(manifest_path)
+    assert user_app._commands["create"].help is None
+
+    manifest_path.write_text('{"format": 0}')
+    with pytest.raises(ValueError):
+        app.load_manifest(manifest_path)
+
+
+def test_lazy_command_manifest_fingerprint(tmp_path, monkeypatch, console):
+    """A manifest is ignored once a lazy command's source or the Cyclopts version changes."""
+    import cyclopts
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module_path = tmp_path / "test_lazy_fingerprint.py"
+    module_path.write_text('def greet():\n    """Say hello."""\n')
+    monkeypatch.delitem(sys.modules, "test_lazy_fingerprint", raising=False)
+
+    def build():
+        app = App(name="myapp", result_action="return_value")
+        app.command("test_lazy_fingerprint:greet")
+        return app
+
+    manifest_path = tmp_path / "manifest.json"
+    build().export_manifest(manifest_path)
+    del sys.modules["test_lazy_fingerprint"]
+
+    app = build()
+    app.load_manifest(manifest_path)
+    assert app._commands["greet"].help == "Say hello."
+    assert "test_lazy_fingerprint" not in sys.modules
+
+    module_path.write_text('def greet():\n    """Say goodbye."""\n')
+    app = build()
+    with pytest.warns(UserWarning, match="out of date"):
+        app.load_manifest(manifest_path)
+    assert app._commands["greet"]._manifest is None
+    with console.capture() as capture:
+        app(["greet", "--help"], console=console)
+    assert "Say goodbye." in capture.get()
+    del sys.modules["test_lazy_fingerprint"]
+
+    module_path.write_text('def greet():\n    """Say hello."""\n')
+    monkeypatch.setattr(cyclopts, "__version__", "0.0.0.other")
+    app = build()
+    with pytest.warns(UserWarning, match="out of date"):
+        app.load_manifest(manifest_path)
+    assert app._commands["greet"]._manifest is None
@@ -426,3 +426,57 @@ def test_nested_meta_app_command_help(console):
     # Should show help for foo command
     assert "foo" in actual.lower()
     assert "value" in actual.lower()
+
+
+def test_meta_parse_commands_context_and_execution_paths(app):
+    """Both ``include_parent_meta`` modes are resolved by a single traversal; they must still diverge correctly."""
+
+    @app.command
+    def foo(x: str):
+        pass
+
+    @app.meta.default
+    def meta(*tokens: Annotated[str, Parameter(show=False, allow_leading_hyphen=True)], verbose: bool = False):
+        pass
+
+    @app.meta.command
+    def info():
+        pass
+
+    command_chain, apps, unused_tokens = app.meta.parse_commands(["--verbose", "foo", "x"])
+    assert command_chain == ("foo",)
+    assert apps == (app, app.meta, app["foo"])
+    assert unused_tokens == ["x"]
+
+    command_chain, apps, unused_tokens = app.meta.parse_commands(["--verbose", "foo", "x"], include_parent_meta=False)
+    assert command_chain == ()
+    assert apps == (app.meta,)
+    assert unused_tokens == ["--verbose", "foo", "x"]
+
+    command_chain, apps, unused_tokens = app.meta.parse_commands(["info"], include_parent_meta=False)
+    assert command_chain == ("info",)
+    assert apps == (app.meta, app.meta["info"])
+    assert unused_tokens == []
+
+
+def test_meta_getitem_cache_invalidation():
+    """``App.__getitem__`` sees commands registered on flattened and meta apps after a lookup."""
+    app = App()
+    sub = App(name="sub")
+    app.command(sub, name="*")
+
+    with pytest.raises(KeyError):
+        app["later"]
+
+    @sub.command
+    def later():
+        pass
+
+    assert app["later"].default_command is later
+
+    @app.meta.command
+    def info():
+        pass
+
+    assert app["info"].default_command is info
+    assert app.meta["later"].default_command is later
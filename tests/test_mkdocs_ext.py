@@ -968,3 +968,92 @@ class TestDirectiveEOFEdgeCases:
 
         matches = list(DIRECTIVE_PATTERN.finditer(markdown))
         assert len(matches) == 1
+
+
+class TestCodeBlockSpans:
+    """Test the code block index used to skip directives."""
+
+    def test_spans(self):
+        from cyclopts.ext.mkdocs import _code_block_spans, _in_spans
+
+        markdown = "text\n```\ncode\n```\n\n    indented\n\n    more\nafter\n"
+        spans = _code_block_spans(markdown)
+        assert spans == [(5, 17), (19, 42)]
+        assert not _in_spans(spans, 0)
+        assert _in_spans(spans, 5)
+        assert _in_spans(spans, 16)
+        assert not _in_spans(spans, 17)
+        assert _in_spans(spans, markdown.index("more"))
+        assert not _in_spans(spans, markdown.index("after"))
+
+    def test_unclosed_fence(self):
+        from cyclopts.ext.mkdocs import _code_block_spans
+
+        assert _code_block_spans("```\n::: cyclopts\n") == []
+
+
+class TestRenderCache:
+    """Test reuse of generated documentation across pages and rebuilds."""
+
+    MARKDOWN = "# Page\n\n::: cyclopts\n    module: cached_app:app\n\nEnd.\n"
+
+    @pytest.fixture
+    def renders(self, monkeypatch):
+        import cyclopts.ext.mkdocs
+
+        calls = []
+
+        def generate(app, **kwargs):
+            calls.append(app)
+            return f"Docs of {app.name[0]}.\n"
+
+        monkeypatch.setattr(cyclopts.ext.mkdocs, "generate_markdown_docs", generate)
+        return calls
+
+    @staticmethod
+    def _write_app(path, name):
+        (path / "cached_app.py").write_text(f"from cyclopts import App\n\napp = App(name={name!r})\n")
+
+    def test_reused_across_pages(self, importable_tmp_path, renders):
+        from cyclopts.ext.mkdocs import process_cyclopts_directives
+
+        self._write_app(importable_tmp_path, "cached")
+        cache = {}
+        for _ in range(3):
+            result = process_cyclopts_directives(self.MARKDOWN, None, cache)
+            assert "Docs of cached." in result
+        assert len(renders) == 1
+
+        # Different options are rendered separately.
+        process_cyclopts_directives(self.MARKDOWN.replace("\n\nEnd", "\n    heading_level: 3\n\nEnd"), None, cache)
+        assert len(renders) == 2
+
+    def test_invalidated_by_source_change(self, importable_tmp_path, renders):
+        from cyclopts.ext.mkdocs import process_cyclopts_directives
+
+        self._write_app(importable_tmp_path, "cached")
+        cache = {}
+        process_cyclopts_directives(self.MARKDOWN, None, cache)
+        self._write_app(importable_tmp_path, "cached-changed")
+        process_cyclopts_directives(self.MARKDOWN, None, cache)
+        assert len(renders) == 2
+
+    def test_invalidated_by_reimport(self, importable_tmp_path, renders):
+        from cyclopts.ext.mkdocs import process_cyclopts_directives
+
+        self._write_app(importable_tmp_path, "first")
+        cache = {}
+        process_cyclopts_directives(self.MARKDOWN, None, cache)
+        del sys.modules["cached_app"]
+        self._write_app(importable_tmp_path, "second")
+        assert "Docs of second." in process_cyclopts_directives(self.MARKDOWN, None, cache)
+
+    def test_plugin_cache(self, importable_tmp_path, renders):
+        from cyclopts.ext.mkdocs import CycloptsPlugin
+
+        self._write_app(importable_tmp_path, "cached")
+        plugin = CycloptsPlugin()
+        plugin.on_startup(command="serve", dirty=False)
+        for _ in range(2):
+            plugin.on_page_markdown(self.MARKDOWN, page=None, config=None, files=None)
+        assert len(renders) == 1
@@ -0,0 +1,144 @@
+import multiprocessing
+from typing import Annotated
+
+import pytest
+
+from cyclopts import App, CoercionError, Parameter, UnknownCommandError, UnusedCliTokensError
+
+process_app = App()
+
+
+@process_app.command
+def process_foo(value: int):
+    pass
+
+
+def _parse_args_results(app, argvs):
+    results = []
+    for argv in argvs:
+        try:
+            command, bound, _ = app.parse_args(argv, exit_on_error=False, print_error=False)
+        except Exception as e:
+            results.append((None, None, type(e)))
+        else:
+            results.append((command, bound.arguments, None))
+    return results
+
+
+def _parse_many_results(app, argvs, **kwargs):
+    return [
+        (command, None if bound is None else bound.arguments, None if error is None else type(error))
+        for command, bound, error in app.parse_many(argvs, **kwargs)
+    ]
+
+
+@pytest.fixture
+def batch_app():
+    app = App()
+
+    @app.command
+    def foo(value: int, name: str = "default", *, flag: bool = False):
+        pass
+
+    @app.command
+    def bar(*paths: str, count: Annotated[int, Parameter(alias="-c")] = 1):
+        pass
+
+    sub = App(name="sub")
+    app.command(sub)
+
+    @sub.command
+    def baz(ratio: float):
+        pass
+
+    return app
+
+
+BATCH_ARGVS = [
+    "foo 1",
+    "bar a b -c 3",
+    "foo 2 bob --flag",
+    "sub baz 0.5",
+    "foo not-an-int",
+    "bar x --count y",
+    "unknown-command",
+    "foo 3 bob extra",
+    "sub baz 1.5",
+    ["foo", "4"],
+    "foo --help",
+]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 512])
+def test_parse_many_matches_parse_args(batch_app, chunksize):
+    expected = _parse_args_results(batch_app, BATCH_ARGVS)
+    assert _parse_many_results(batch_app, BATCH_ARGVS, chunksize=chunksize) == expected
+    assert [x[2] for x in expected[4:8]] == [CoercionError, CoercionError, UnknownCommandError, UnusedCliTokensError]
+
+
+def test_parse_many_error_context(batch_app):
+    results = list(batch_app.parse_many(["foo 1", "sub baz nope"]))
+    assert results[0][2] is None
+    command, bound, error = results[1]
+    assert command is None
+    assert bound is None
+    assert isinstance(error, CoercionError)
+    assert error.app is batch_app["sub"]["baz"]
+    assert error.command_chain == ("sub", "baz")
+    assert error.root_input_tokens == ["sub", "baz", "nope"]
+
+
+def test_parse_many_non_cyclopts_error():
+    """Exceptions other than CycloptsError are yielded for their command line only."""
+    app = App()
+    app.command(lambda: None, name="foo-bar")
+    app.command(lambda: None, name="foo_bar")
+    app.command(lambda value: None, name="ok")
+
+    with pytest.raises(ValueError, match="Ambiguous"):
+        app.parse_args(["fooBar"], exit_on_error=False, print_error=False)
+
+    results = list(app.parse_many(["ok 1", "fooBar", "ok 2"]))
+    assert [error is None for _, _, error in results] == [True, False, True]
+    assert isinstance(results[1][2], ValueError)
+
+
+def test_parse_many_lazy_input(batch_app):
+    consumed = []
+
+    def argvs():
+        for i in range(10):
+            consumed.append(i)
+            yield ["foo", str(i)]
+
+    results = batch_app.parse_many(argvs(), chunksize=2)
+    next(results)
+    assert consumed == [0, 1]
+
+
+def test_parse_many_threads(batch_app):
+    argvs = BATCH_ARGVS * 20
+    expected = _parse_args_results(batch_app, argvs)
+    assert _parse_many_results(batch_app, argvs, workers=3, chunksize=4) == expected
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork.")
+def test_parse_many_processes():
+    argvs = ["process-foo 1", "process-foo bad", "process-foo 2"] * 5
+    results = list(process_app.parse_many(argvs, workers=2, chunksize=4, executor="process"))
+    assert [None if bound is None else bound.arguments for _, bound, _ in results] == [
+        {"value": 1},
+        None,
+        {"value": 2},
+    ] * 5
+    errors = [error for _, _, error in results if error is not None]
+    assert len(errors) == 5
+    assert all(isinstance(error, CoercionError) for error in errors)
+    assert all(error.app is process_app["process-foo"] for error in errors)
+
+
+def test_parse_many_bad_arguments(batch_app):
+    with pytest.raises(ValueError):
+        list(batch_app.parse_many(["foo 1"], chunksize=0))
+    with pytest.raises(ValueError):
+        list(batch_app.parse_many(["foo 1"], workers=2, executor="bogus"))  # pyright: ignore[reportArgumentType]
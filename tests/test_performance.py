@@ -1,5 +1,6 @@
 """Performance and import optimization regression tests."""
 
+import os
 import subprocess
 import sys
 import textwrap
@@ -124,7 +125,7 @@ def test_lazy_modules_not_imported_on_happy_path():
 
 
 def test_rich_is_imported_on_error():
-    """Verify Rich IS imported when displaying errors.
+    """Verify Rich IS imported when displaying errors on a terminal.
 
     This ensures the optimization didn't break error formatting.
     """
@@ -154,6 +155,7 @@ def test_rich_is_imported_on_error():
         [sys.executable, "-c", script],
         capture_output=True,
         text=True,
+        env={**os.environ, "TTY_COMPATIBLE": "1"},
     )
 
     assert result.returncode == 0, f"Script failed:\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
@@ -0,0 +1,291 @@
+"""Help pages and errors built without rich (``cyclopts._plain``)."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from enum import Enum
+from typing import Annotated, Literal
+
+import pytest
+from rich.console import Console
+
+from cyclopts import App, Group, Parameter, _plain
+from cyclopts.exceptions import CycloptsError
+from cyclopts.panel import CycloptsPanel
+
+
+@pytest.fixture(autouse=True)
+def plain_environment(monkeypatch):
+    monkeypatch.setenv("COLUMNS", "80")
+    for name in ("TTY_COMPATIBLE", "FORCE_COLOR"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+
+
+def _make_app(help_format: str = "markdown", **kwargs) -> App:
+    app = App(
+        name="tool",
+        help="Manage the *tools*.\n\nA longer description\nspanning `two` lines.",
+        help_format=help_format,
+        **kwargs,
+    )
+
+    @app.command(alias="mk")
+    def make(
+        name: str,
+        /,
+        color: Color = Color.RED,
+        *,
+        mode: Annotated[Literal["fast", "slow"], Parameter(env_var="TOOL_MODE")] = "fast",
+        tags: tuple[str, ...] = ("a", "b"),
+        dry_run: Annotated[bool, Parameter(alias="-n")] = False,
+    ):
+        """Make a tool.
+
+        Parameters
+        ----------
+        name: str
+            Name of the **tool**.
+        mode: Literal["fast", "slow"]
+            How to make it:
+
+            * fast, the default
+            * slow
+        """
+
+    @app.command(group=Group("Admin", help="Administrative commands."))
+    def purge():
+        """Remove all [b]tools[/b]."""
+
+    return app
+
+
+def _rich_help(app: App, tokens: list[str]) -> str:
+    console = Console(width=80, force_terminal=False, highlight=False, legacy_windows=False)
+    with console.capture() as capture:
+        app.help_print(tokens, console=console)
+    return capture.get()
+
+
+def _strip_lines(text: str) -> str:
+    return "".join(line.rstrip() + "\n" for line in text.splitlines())
+
+
+@pytest.mark.parametrize("help_format", ["markdown", "plaintext", "rich"])
+@pytest.mark.parametrize("tokens", [[], ["make"], ["purge"]])
+def test_plain_help_matches_plain_formatter(capsys, help_format, tokens):
+    app = _make_app(help_format, help_formatter="plain", help_prologue="Before.", help_epilogue="After.")
+    expected = _strip_lines(_rich_help(app, tokens))
+
+    app.help_print(tokens)
+    actual = capsys.readouterr().out
+    assert actual == expected
+    assert "Usage: tool" in actual
+
+
+def _make_wordy_app() -> App:
+    app = App(
+        name="wordy",
+        help="An application whose descriptions are long enough to wrap at every width we test, "
+        "including averyveryveryveryverylongwordthatexceedsthenarrowwidths.",
+        help_formatter="plain",
+    )
+
+    @app.default
+    def main(
+        path: str,
+        /,
+        *,
+        level: Annotated[int, Parameter(help="How much to do, from one (little) to ten (everything at once).")] = 3,
+        names: Annotated[
+            tuple[str, ...], Parameter(help="Names of\tthe things,  separated by  spaces.", negative_iterable=())
+        ] = ("first", "second", "third"),
+        verbose: Annotated[bool, Parameter(help="- Print more.\n- Print even more when repeated.")] = False,
+    ):
+        """Process a path.
+
+        Parameters
+        ----------
+        path: str
+            The path to process; relative paths are resolved against the current working directory.
+        """
+
+    @app.command(group=Group("Maintenance", help="Commands that keep the wordy application in shape."))
+    def clean():
+        """Remove every temporary file the application has ever written, everywhere."""
+
+    return app
+
+
+@pytest.mark.parametrize("width", [30, 45, 60, 80, 120])
+@pytest.mark.parametrize(
+    ("make_app", "tokens"),
+    [
+        pytest.param(lambda: _make_app("markdown", help_formatter="plain"), [], id="markdown"),
+        pytest.param(lambda: _make_app("plaintext", help_formatter="plain"), ["make"], id="plaintext-make"),
+        pytest.param(lambda: _make_app("rich", help_formatter="plain"), ["purge"], id="rich-purge"),
+        pytest.param(_make_wordy_app, [], id="wordy"),
+        pytest.param(_make_wordy_app, ["clean"], id="wordy-clean"),
+    ],
+)
+def test_plain_help_matches_plain_formatter_widths(capsys, monkeypatch, width, make_app, tokens):
+    monkeypatch.setenv("COLUMNS", str(width))
+    app = make_app()
+    console = Console(width=width, force_terminal=False, highlight=False, legacy_windows=False)
+    with console.capture() as capture:
+        app.help_print(tokens, console=console)
+    expected = _strip_lines(capture.get())
+
+    resolution = app._resolve_commands(tokens)
+    with app.app_stack(resolution.context_path):
+        assert _plain.help_page(app, resolution, sys.stdout) == expected
+
+
+def test_plain_help_not_a_terminal(capsys):
+    """Without a configured formatter, help for a non-terminal is plain text."""
+    app = _make_app()
+    app.help_print([])
+    actual = capsys.readouterr().out
+    assert "╭" not in actual
+    app.help_formatter = "plain"
+    assert actual == _strip_lines(_rich_help(app, []))
+
+
+def test_plain_help_terminal(capsys, monkeypatch):
+    monkeypatch.setenv("TTY_COMPATIBLE", "1")
+    _make_app().help_print([])
+    assert "╭─ Commands" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"help_formatter": "default"},
+        {"help_format": "rst"},
+        {"help": "# Heading\n\nText."},
+        {"help": "Code:\n\n```\nx = 1\n```\n"},
+        {"help_formatter": "plain", "console": Console(width=80, force_terminal=False)},
+    ],
+)
+def test_plain_help_falls_back_to_rich(kwargs):
+    app = App(name="tool", **kwargs)
+    resolution = app._resolve_commands([])
+    with app.app_stack(resolution.context_path):
+        assert _plain.help_page(app, resolution, sys.stdout) is None
+
+
+def test_plain_help_wraps_long_lines(capsys, monkeypatch):
+    monkeypatch.setenv("COLUMNS", "40")
+    app = App(name="tool", help_formatter="plain")
+
+    @app.default
+    def main(*, value: Annotated[int, Parameter(help="A long description that doesn't fit on one line.")] = 1):
+        pass
+
+    app.help_print([])
+    lines = capsys.readouterr().out.splitlines()
+    # Like rich: the description is wrapped to the full width, then each indented line again.
+    assert lines[-4:-1] == ["  --value: A long description that", "doesn't fit on", "  one line. [default: 1]"]
+    assert all(len(line) <= 40 for line in lines)
+
+
+@pytest.mark.parametrize("width", [20, 40, 80])
+@pytest.mark.parametrize(
+    "msg",
+    [
+        "Short message.",
+        "",
+        "A message that is long enough to need wrapping, with  two  spaces and "
+        "averyveryveryveryverylongwordthatexceedseverywidthwetest.",
+        "Lines\n\tindented with a tab\n",
+        "Ünïcödé — quotes “here”.",
+    ],
+)
+def test_error_panel_matches_rich(width, msg, monkeypatch):
+    monkeypatch.setenv("COLUMNS", str(width))
+    error = CycloptsError(msg=msg)
+    console = Console(width=width, force_terminal=False, legacy_windows=False)
+    with console.capture() as capture:
+        console.print(CycloptsPanel(error))
+    assert _plain.error_panel(error) == capture.get()
+
+
+def test_error_panel_rich_text_falls_back():
+    from rich.text import Text
+
+    assert _plain.error_panel(CycloptsError(msg=Text.from_markup("[bold]Bold[/bold]"))) is None
+
+
+def test_plain_error(capsys):
+    app = App(name="tool", result_action="return_value")
+
+    @app.default
+    def main(count: int):
+        pass
+
+    with pytest.raises(SystemExit):
+        app(["foo"])
+    err = capsys.readouterr().err
+    assert 'Invalid value for COUNT: unable to convert "foo" into int.' in err
+
+    with pytest.raises(CycloptsError) as exc_info:
+        app(["foo"], exit_on_error=False, help_on_error=True)
+    err = capsys.readouterr().err
+    assert err.startswith("Usage: tool COUNT\n")
+    assert "╭─ Error" in err
+    assert exc_info.value.console is not None
+
+
+def _run(source: str, *args: str, **env: str) -> subprocess.CompletedProcess:
+    script = textwrap.dedent(source) + textwrap.dedent(
+        """
+        import sys
+        try:
+            app()
+        except SystemExit:
+            pass
+        print("rich imported:", "rich" in sys.modules, file=sys.stderr)
+        """
+    )
+    return subprocess.run(
+        [sys.executable, "-c", script, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "COLUMNS": "80", **env},
+        timeout=30,
+    )
+
+
+APP_SOURCE = """
+    from cyclopts import App
+
+    app = App(name="tool")
+
+    @app.default
+    def main(count: int, *, verbose: bool = False):
+        '''Count things.
+
+        Parameters
+        ----------
+        count: int
+            How many things.
+        '''
+"""
+
+
+@pytest.mark.parametrize("args", [["--help"], ["foo"], []])
+def test_rich_not_imported(args):
+    result = _run(APP_SOURCE, *args)
+    assert "rich imported: False" in result.stderr
+    assert "Count things." in result.stdout or "╭─ Error" in result.stderr
+
+
+def test_rich_imported_on_terminal():
+    result = _run(APP_SOURCE, "--help", TTY_COMPATIBLE="1")
+    assert "rich imported: True" in result.stderr
+    assert "╭─ Parameters" in result.stdout
@@ -1140,3 +1140,140 @@ class TestBackwardCompatibility:
             assert CycloptsDirective is not None
             assert DirectiveOptions is not None
             assert setup is not None
+
+
+class TestDirectiveCache:
+    """Generated RST is cached in the Sphinx build environment."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "conf.py").write_text('extensions = ["cyclopts.ext.sphinx"]\n')
+        (src / "index.rst").write_text(
+            "Index\n=====\n\n.. toctree::\n\n   other\n\n.. cyclopts:: cached_cli_module:app\n   :commands: deploy\n"
+        )
+        (src / "other.rst").write_text("Other\n=====\n\n.. cyclopts:: cached_cli_module:app\n   :commands: deploy\n")
+        (tmp_path / "cached_cli_module.py").write_text(
+            "from cyclopts import App\n\napp = App(name='cached')\n\n@app.command\ndef deploy():\n    '''Deploy it.'''\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "cached_cli_module", raising=False)
+
+        from cyclopts.ext.sphinx import CycloptsDirective
+
+        calls = []
+        original = CycloptsDirective._generate_rst
+
+        def counting(self, app, opts, *args):
+            calls.append(self.env.docname)
+            return original(self, app, opts, *args)
+
+        monkeypatch.setattr(CycloptsDirective, "_generate_rst", counting)
+        return tmp_path, calls
+
+    @staticmethod
+    def _build(tmp_path, parallel: int = 0):
+        from sphinx.application import Sphinx
+
+        src = tmp_path / "src"
+        build = tmp_path / "build"
+        app = Sphinx(src, src, build / "out", build / "doctrees", "dummy", status=None, warning=None, parallel=parallel)
+        app.build()
+        return app
+
+    def test_cache_shared_and_persisted(self, project):
+        tmp_path, calls = project
+        sphinx_app = self._build(tmp_path)
+        assert len(calls) == 1  # Both documents use the same app and options.
+        (entry,) = sphinx_app.env.cyclopts_rst_cache.values()
+        assert "Deploy it." in entry.content
+
+        # Editing a document re-reads it; the RST comes from the pickled environment.
+        calls.clear()
+        (tmp_path / "src" / "other.rst").write_text(
+            "Other page\n==========\n\n.. cyclopts:: cached_cli_module:app\n   :commands: deploy\n"
+        )
+        self._build(tmp_path)
+        assert calls == []
+
+    def test_cache_invalidated_by_source_change(self, project):
+        import os
+
+        tmp_path, calls = project
+        self._build(tmp_path)
+        calls.clear()
+
+        module = tmp_path / "cached_cli_module.py"
+        stat = module.stat()
+        os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self._build(tmp_path)  # Both documents depend on the module, and are re-read.
+        assert len(calls) == 1
+
+    def test_cache_parallel_read(self, project):
+        tmp_path, calls = project
+        for i in range(4):
+            (tmp_path / "src" / f"page{i}.rst").write_text(
+                f"Page {i}\n======\n\n.. cyclopts:: cached_cli_module:app\n   :commands: deploy\n"
+            )
+        sphinx_app = self._build(tmp_path, parallel=2)
+        assert len(sphinx_app.env.cyclopts_rst_cache) == 1
+
+    def test_merge(self):
+        from cyclopts.ext._cache import CacheEntry
+        from cyclopts.ext.sphinx import _merge_env_cache
+
+        env, other = MagicMock(), MagicMock()
+        env.cyclopts_rst_cache = {"a": CacheEntry(version="1", sources=(), content="A")}
+        other.cyclopts_rst_cache = {"b": CacheEntry(version="1", sources=(), content="B")}
+        _merge_env_cache(MagicMock(), env, [], other)
+        assert set(env.cyclopts_rst_cache) == {"a", "b"}
+
+    def test_cache_command_sections(self, tmp_path, monkeypatch):
+        """Parameter type modules are dependencies; after a change, only changed commands are rendered."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "conf.py").write_text('extensions = ["cyclopts.ext.sphinx"]\n')
+        (src / "index.rst").write_text("Index\n=====\n\n.. cyclopts:: frag_cli:app\n")
+        (tmp_path / "frag_cli.py").write_text(
+            "from cyclopts import App\nfrom frag_a import deploy\nfrom frag_b import status\n\n"
+            "app = App(name='frag')\napp.command(deploy)\napp.command(status)\n"
+        )
+        (tmp_path / "frag_types.py").write_text(
+            "from dataclasses import dataclass\n\n@dataclass\nclass Target:\n    host: str = 'localhost'\n"
+        )
+        (tmp_path / "frag_a.py").write_text(
+            "from frag_types import Target\n\ndef deploy(target: Target):\n    '''Deploy it.'''\n"
+        )
+        (tmp_path / "frag_b.py").write_text("def status():\n    '''Show status.'''\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        modules = ["frag_cli", "frag_a", "frag_b", "frag_types"]
+        for name in modules:
+            monkeypatch.delitem(sys.modules, name, raising=False)
+
+        import cyclopts.docs.rst
+
+        rendered = []
+        original = cyclopts.docs.rst.generate_rst_docs
+
+        def counting(app, *args, command_chain=None, **kwargs):
+            if command_chain:
+                rendered.append(command_chain[-1])
+            return original(app, *args, command_chain=command_chain, **kwargs)
+
+        monkeypatch.setattr(cyclopts.docs.rst, "generate_rst_docs", counting)
+
+        sphinx_app = self._build(tmp_path)
+        (entry,) = sphinx_app.env.cyclopts_rst_cache.values()
+        assert str(tmp_path / "frag_types.py") in [path for path, *_ in entry.sources]
+        assert sorted(rendered) == ["deploy", "status"]
+
+        rendered.clear()
+        for name in modules:
+            sys.modules.pop(name, None)
+        (tmp_path / "frag_b.py").write_text("def status():\n    '''Show the status.'''\n")
+        sphinx_app = self._build(tmp_path)
+        assert rendered == ["status"]
+        (entry,) = sphinx_app.env.cyclopts_rst_cache.values()
+        assert "Show the status." in entry.content
+        assert len(entry.sections) == 2
@@ -0,0 +1,101 @@
+import json
+from typing import Annotated
+
+import pytest
+
+from cyclopts import Group, Parameter, ValidationError
+from cyclopts.tracing import TimingRecorder, span, use_tracer
+
+
+def test_tracing_phases(app):
+    def config(apps, commands, arguments):
+        pass
+
+    app.config = config
+
+    @app.command
+    def foo(a: int, b: Annotated[int, Parameter(env_var="CYCLOPTS_TRACING_B")] = 2):
+        return a + b
+
+    recorder = TimingRecorder()
+    with use_tracer(recorder):
+        assert app(["foo", "1"]) == 3
+
+    phases = [event.phase for event in recorder.events]
+    assert phases == [
+        "parse_commands",
+        "assemble_argument_collection",
+        "parse_kw_and_flags",
+        "parse_pos",
+        "parse_env",
+        "config",
+        "convert",
+        "group_validators",
+        "dispatch",
+    ]
+    assert all(event.duration >= 0 for event in recorder.events)
+    assert recorder.events[-1].metadata["command"] is foo
+    assert recorder.events[5].metadata["config"] is config
+
+    # Second invocation hits the argument-collection cache.
+    recorder.clear()
+    with use_tracer(recorder):
+        app(["foo", "1"])
+    assert next(e for e in recorder.events if e.phase == "assemble_argument_collection").metadata["cached"] is True
+
+
+def test_tracing_disabled_outside_context(app):
+    @app.default
+    def main():
+        pass
+
+    recorder = TimingRecorder()
+    with use_tracer(recorder):
+        pass
+    app([])
+    assert recorder.events == []
+
+
+def test_tracing_error_metadata(app):
+    def validator(argument_collection):
+        raise ValueError("bad")
+
+    @app.default
+    def main(a: Annotated[int, Parameter(group=Group("Foo", validator=validator))] = 1):
+        pass
+
+    recorder = TimingRecorder()
+    with use_tracer(recorder), pytest.raises(ValidationError):
+        app([], exit_on_error=False)
+
+    event = recorder.events[-1]
+    assert event.phase == "group_validators"
+    assert event.metadata["error"] == "ValidationError"
+
+
+def test_tracing_nesting_and_summary():
+    recorder = TimingRecorder()
+    with use_tracer(recorder):
+        with span("outer", x=1) as metadata:
+            metadata["y"] = 2
+            with span("inner"):
+                pass
+            with span("inner"):
+                pass
+
+    assert [(e.phase, e.depth) for e in recorder.events] == [("inner", 1), ("inner", 1), ("outer", 0)]
+    assert recorder.events[-1].metadata == {"x": 1, "y": 2}
+
+    summary = {row["phase"]: row for row in recorder.summary()}
+    assert summary["inner"]["count"] == 2
+    assert summary["outer"]["count"] == 1
+    assert summary["outer"]["total"] >= summary["inner"]["total"]
+
+    exported = json.loads(recorder.to_json())
+    assert {row["phase"] for row in exported["summary"]} == {"inner", "outer"}
+    assert len(exported["events"]) == 3
+
+    table = recorder.format_table().splitlines()
+    assert table[0].split() == ["phase", "count", "total", "ms", "mean", "ms", "max", "ms"]
+    assert set(table[1]) == {"-", " "}
+    assert len(table) == 4